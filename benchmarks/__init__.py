@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+"""Pandas TA Benchmarks
+
+Times the indicators of pandas_ta.Category and df.ta.strategy("all") on
+synthetic OHLCV data of increasing size. Run from the repository root:
+
+    python -m benchmarks --sizes 1000 100000 1000000
+    python -m benchmarks --save baseline.json
+    python -m benchmarks --compare baseline.json
+
+See python -m benchmarks --help.
+"""
+from .suite import compare, load, ohlcv, run, save
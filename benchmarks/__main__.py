@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+from argparse import ArgumentParser
+from sys import exit
+
+import pandas as pd
+
+from .suite import SIZES, STRATEGY, compare, load, run, save
+
+
+def main(argv: list = None) -> int:
+    parser = ArgumentParser(prog="python -m benchmarks", description="Times the pandas_ta indicators on synthetic OHLCV.")
+    parser.add_argument("-s", "--sizes", type=int, nargs="+", default=SIZES, help="Rows of the synthetic data.")
+    parser.add_argument("-i", "--indicators", nargs="+", help="Only these indicators. Skips the strategy.")
+    parser.add_argument("-c", "--categories", nargs="+", help="Only the indicators of these categories.")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="Timed calls per indicator, the best is kept.")
+    parser.add_argument("--talib", action="store_true", default=None, help="Pass talib=True to the indicators.")
+    parser.add_argument("--no-talib", dest="talib", action="store_false", help="Pass talib=False to the indicators.")
+    parser.add_argument("--no-strategy", dest="strategy", action="store_false", help="Skip df.ta.strategy('all').")
+    parser.add_argument("--cores", type=int, default=0, help="df.ta.cores for the strategy.")
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="Skip the peak memory measurement.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic data.")
+    parser.add_argument("--save", metavar="PATH", help="Save the results as a JSON baseline.")
+    parser.add_argument("--compare", metavar="PATH", help="Compare with a JSON baseline and fail on regressions or failures.")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Relative slow down that is a regression.")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Do not print each measurement.")
+    args = parser.parse_args(argv)
+
+    results = run(
+        sizes=args.sizes, names=args.indicators, categories=args.categories,
+        repeat=args.repeat, talib=args.talib, strategy=args.strategy, cores=args.cores,
+        memory=args.memory, seed=args.seed, verbose=not args.quiet,
+    )
+
+    with pd.option_context("display.max_rows", None, "display.width", 200):
+        table = results.pivot(index=["category", "indicator"], columns="rows", values="rows_per_sec")
+        print("\n[i] Throughput (rows per second)")
+        print(table.to_string(float_format="{:,.0f}".format))
+
+        errors = results[results["error"] != ""]
+        if not errors.empty:
+            print("\n[X] Errors")
+            print(errors[["indicator", "rows", "error"]].to_string(index=False))
+
+    if args.save:
+        save(results, args.save)
+        print(f"\n[+] Saved {args.save}")
+
+    if args.compare:
+        # Only the part of the baseline that this run selected
+        baseline = load(args.compare)
+        selected = baseline["rows"].isin(args.sizes)
+        if args.indicators:
+            selected &= baseline["indicator"].isin(args.indicators)
+        if args.categories:
+            selected &= baseline["category"].isin(args.categories)
+        if not args.strategy:
+            selected &= baseline["indicator"] != STRATEGY
+
+        comparison = compare(results, baseline[selected], threshold=args.threshold)
+        regressions = comparison[comparison["regression"]]
+        failures = comparison[comparison["failure"] != ""]
+        print(f"\n[i] Compared with {args.compare}: {len(regressions)} regressions and {len(failures)} failures of {len(comparison)}")
+        with pd.option_context("display.max_rows", None, "display.width", 200):
+            shown = max(len(failures) + len(regressions), 20)
+            print(comparison.head(shown).to_string(index=False))
+        return 1 if not (regressions.empty and failures.empty) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+from gc import collect
+from json import dump as json_dump
+from json import load as json_load
+from platform import machine, python_version
+from time import perf_counter
+from tracemalloc import get_traced_memory, start, stop
+
+import numpy as np
+import pandas as pd
+
+import pandas_ta as ta
+from pandas_ta.backend import get_backend, to_backend
+
+SIZES = [1_000, 100_000, 1_000_000]
+STRATEGY = "strategy"
+
+
+def ohlcv(rows: int, seed: int = 0):
+    """Synthetic OHLCV of a geometric random walk with one minute bars, in
+    the containers of the active backend. The same seed gives the same data."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, rows)))
+    open_ = np.r_[close[0], close[:-1]] * np.exp(rng.normal(0, 0.0002, rows))
+    spread = np.fabs(rng.normal(0, 0.0005, (2, rows)))
+    df = pd.DataFrame({
+        "open": open_,
+        "high": np.maximum(open_, close) * (1 + spread[0]),
+        "low": np.minimum(open_, close) * (1 - spread[1]),
+        "close": close,
+        "volume": rng.lognormal(10, 1, rows).round(),
+    }, index=pd.date_range("2000-01-03", periods=rows, freq="min", name="date"))
+    return to_backend(df)
+
+
+def indicators(categories: list = None) -> list:
+    """(category, name) of the indicators in ta.Category, optionally only
+    those of the given categories."""
+    return [
+        (category, name)
+        for category, names in ta.Category.items()
+        if not categories or category in categories
+        for name in names
+    ]
+
+
+def _inputs(df) -> dict:
+    """Arguments of the indicators that take series other than OHLCV, which
+    otherwise return the DataFrame untouched."""
+    close = df["close"]
+    fast, slow = ta.ema(close, 10), ta.ema(close, 20)
+    return {
+        "long_run": {"fast": fast, "slow": slow},
+        "short_run": {"fast": fast, "slow": slow},
+        "tsignals": {"trend": (close > ta.sma(close, 50)).astype(int)},
+        "xsignals": {"signal": ta.rsi(close), "xa": 20, "xb": 80},
+    }
+
+
+def _measure(fn, repeat: int, memory: bool) -> tuple:
+    """Best time of repeat calls after a warm up call, which compiles the
+    numba kernels and loads lazy imports, and the peak of the memory
+    allocated by Python and NumPy during one more call."""
+    fn()
+    seconds = []
+    for _ in range(max(repeat, 1)):
+        begin = perf_counter()
+        fn()
+        seconds.append(perf_counter() - begin)
+
+    peak = np.nan
+    if memory:
+        collect()
+        start()
+        try:
+            fn()
+            peak = get_traced_memory()[1] / 2 ** 20
+        finally:
+            stop()
+    return min(seconds), peak
+
+
+def run(sizes: list = None, names: list = None, categories: list = None, repeat: int = 3, talib: bool = None, strategy: bool = True, cores: int = 0, memory: bool = True, seed: int = 0, verbose: bool = False) -> pd.DataFrame:
+    """Times the indicators at each size.
+
+    Args:
+        sizes (list): Rows of synthetic OHLCV. Default: [1_000, 100_000, 1_000_000]
+        names (list): Indicator names. Default: all of ta.Category
+        categories (list): Only the indicators of these categories.
+        repeat (int): Timed calls per indicator, the best is kept. Default: 3
+        talib (bool): Passed to the indicators when not None. Default: None
+        strategy (bool): Also time df.ta.strategy("all"). Default: True
+        cores (int): df.ta.cores for the strategy. Default: 0
+        memory (bool): Measure the peak memory with tracemalloc. It only
+            sees host allocations of this process. Default: True
+        seed (int): Seed of the synthetic data. Default: 0
+        verbose (bool): Print each measurement. Default: False
+
+    Returns:
+        pd.DataFrame: One row per indicator and size with the columns
+            indicator, category, rows, seconds, rows_per_sec, peak_mib
+            and error.
+    """
+    sizes = sizes if sizes else SIZES
+    selected = [x for x in indicators(categories) if not names or x[1] in names]
+    kwargs = {} if talib is None else {"talib": talib}
+
+    records = []
+    for rows in sizes:
+        df = ohlcv(rows, seed)
+        df.ta.cores = cores
+        inputs = _inputs(df)
+        calls = [(category, name, getattr(df.ta, name), {**inputs.get(name, {}), **kwargs}) for category, name in selected]
+        if strategy and not names:
+            calls.append(("all", STRATEGY, lambda: df.ta.strategy("all", append=False, verbose=False, timed=False), {}))
+
+        for category, name, method, args in calls:
+            record = {"indicator": name, "category": category, "rows": rows, "seconds": np.nan, "rows_per_sec": np.nan, "peak_mib": np.nan, "error": ""}
+
+            def call():
+                if method(**args) is None:
+                    raise ValueError("no result")
+
+            try:
+                record["seconds"], record["peak_mib"] = _measure(call, repeat, memory)
+                record["rows_per_sec"] = rows / record["seconds"] if record["seconds"] > 0 else np.inf
+            except Exception as error:
+                record["error"] = f"{type(error).__name__}: {error}"
+            records.append(record)
+
+            if verbose:
+                print(f"[i] {name:>16} {rows:>9} rows {record['seconds']:10.5f}s {record['peak_mib']:9.2f} MiB {record['error']}")
+
+    return pd.DataFrame.from_records(records)
+
+
+def save(results: pd.DataFrame, path: str) -> None:
+    """Saves the results and the environment as a JSON baseline."""
+    meta = {
+        "pandas_ta": ta.version,
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "python": python_version(),
+        "machine": machine(),
+        "backend": get_backend(),
+        "imports": {k: v for k, v in ta.Imports.items() if k in ["numba", "talib", "cudf"]},
+    }
+    with open(path, "w") as f:
+        json_dump({"meta": meta, "results": results.to_dict(orient="records")}, f, indent=1, default=str)
+
+
+def load(path: str) -> pd.DataFrame:
+    """Loads the results of a JSON baseline."""
+    with open(path) as f:
+        return pd.DataFrame.from_records(json_load(f)["results"])
+
+
+def compare(results: pd.DataFrame, baseline: pd.DataFrame, threshold: float = 0.25, floor: float = 1e-3) -> pd.DataFrame:
+    """Compares the results with a baseline by indicator and size.
+
+    Args:
+        results (pd.DataFrame): Results of run.
+        baseline (pd.DataFrame): Results of an earlier run, see load.
+        threshold (float): Relative slow down that is a regression. Default: 0.25
+        floor (float): Seconds of slow down below which timing noise is not
+            a regression. Default: 0.001
+
+    Returns:
+        pd.DataFrame: The seconds and peak_mib of both runs, their ratios,
+            a regression column and a failure column, which explains the
+            rows that could not be compared: an error or no time in either
+            run, or no match in the other run. The failures come first,
+            then the largest slow downs.
+    """
+    keys = ["indicator", "rows"]
+    columns = keys + ["seconds", "peak_mib"]
+    df = results[columns + ["error"]].merge(
+        baseline[columns + ["error"]], on=keys, how="outer",
+        suffixes=("", "_base"), indicator="match"
+    )
+    df["ratio"] = df["seconds"] / df["seconds_base"]
+    df["peak_ratio"] = df["peak_mib"] / df["peak_mib_base"]
+    df["regression"] = (df["ratio"] > 1 + threshold) & (df["seconds"] - df["seconds_base"] > floor)
+
+    error, error_base = df["error"].fillna(""), df["error_base"].fillna("")
+    failure = pd.Series("", index=df.index)
+    failure[df["seconds_base"].isna()] = "no time in the baseline"
+    failure[error_base != ""] = "baseline " + error_base
+    failure[df["seconds"].isna()] = "no time"
+    failure[error != ""] = error
+    failure[df["match"] == "left_only"] = "not in the baseline"
+    failure[df["match"] == "right_only"] = "not in the run"
+    df["failure"] = failure
+
+    df = df.drop(columns=["error", "error_base", "match"])
+    df["failed"] = df["failure"] != ""
+    df = df.sort_values(["failed", "ratio"], ascending=False, ignore_index=True, na_position="first")
+    return df.drop(columns="failed")
@@ -115,3 +115,10 @@ RATE = {
 }
 
 from pandas_ta.core import *
+from pandas_ta import backend, stream
+from pandas_ta.panel import panel_strategy, PANEL_INDICATORS
+from pandas_ta.sweep import sweep
+
+# Indicators of the package namespace return NumPy arrays with the numpy backend
+for _name in [x for v in Category.values() for x in v] + ["ma", "psar_grid", "sweep"]:
+    globals()[_name] = backend.dispatch(globals()[_name])
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+from functools import wraps
+from importlib import import_module
+from os import environ
+from sys import modules
+
+import pandas
+from numpy import ndarray
+
+from pandas_ta import Imports
+
+
+BACKENDS = ["cudf", "numpy", "pandas"]
+_state = {}
+
+
+def set_backend(name: str) -> None:
+    """Sets the array backend of the indicators.
+
+    Args:
+        name (str): One of "cudf", "numpy" or "pandas".
+            "cudf": Indicators compute on cuDF containers (GPU).
+            "pandas": Indicators compute on pandas containers (CPU).
+            "numpy": Computes like "pandas" but the indicators of the package
+                namespace accept and return NumPy arrays.
+
+    The default is "cudf" when cuDF is installed, otherwise "pandas". It can
+    also be set with the PANDAS_TA_BACKEND environment variable.
+    """
+    name = name.lower() if isinstance(name, str) else name
+    if name not in BACKENDS:
+        raise ValueError(f"[X] backend must be one of {BACKENDS}, not {name}")
+    if name == "cudf" and not Imports["cudf"]:
+        raise ImportError("[X] The cudf backend requires cuDF to be installed.")
+    _state["name"] = name
+    _state["library"] = import_module("cudf" if name == "cudf" else "pandas")
+
+    # A backend loaded after pandas_ta also gets the df.ta accessor
+    core = modules.get("pandas_ta.core")
+    if hasattr(core, "_register_accessor"):
+        core._register_accessor()
+
+
+def get_backend() -> str:
+    """Returns the name of the active backend."""
+    return _state["name"]
+
+
+def library():
+    """Returns the DataFrame library of the active backend: cudf or pandas."""
+    return _state["library"]
+
+
+def to_backend(x):
+    """Converts a Series, DataFrame, array or list to the containers of the
+    active backend. Returns None for None."""
+    if x is None:
+        return None
+    lib = _state["library"]
+    if isinstance(x, (lib.Series, lib.DataFrame)):
+        return x
+    if hasattr(x, "to_pandas"):
+        # cuDF container with the pandas or numpy backend
+        return x.to_pandas()
+    if isinstance(x, (pandas.Series, pandas.DataFrame)):
+        # pandas container with the cudf backend
+        return lib.from_pandas(x)
+    if isinstance(x, (ndarray, list, tuple)):
+        return lib.DataFrame(x) if getattr(x, "ndim", 1) > 1 else lib.Series(x)
+    return x
+
+
+def to_numpy(result):
+    """NumPy form of an indicator result. Series and DataFrames return their
+    values, tuples are converted item by item."""
+    if isinstance(result, tuple):
+        return tuple(to_numpy(x) for x in result)
+    if hasattr(result, "to_numpy"):
+        return result.to_numpy()
+    return result
+
+
+def dispatch(fn):
+    """Wraps an indicator so that, with the numpy backend, it returns NumPy
+    arrays. Inputs are converted by verify_series()."""
+    @wraps(fn)
+    def _dispatch(*args, **kwargs):
+        result = fn(*args, **kwargs)
+        return to_numpy(result) if _state["name"] == "numpy" else result
+
+    return _dispatch
+
+
+class _Proxy:
+    """Late bound attribute of the active backend library, i.e. Series.
+
+    Calls and attribute lookups resolve against the backend active at the
+    time of use, so modules may import DataFrame, Series or concat once and
+    follow set_backend(). isinstance() checks accept the classes of every
+    loaded backend library.
+    """
+
+    __slots__ = ("_name",)
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def __call__(self, *args, **kwargs):
+        return getattr(_state["library"], self._name)(*args, **kwargs)
+
+    def __getattr__(self, attr: str):
+        return getattr(getattr(_state["library"], self._name), attr)
+
+    def __instancecheck__(self, obj) -> bool:
+        return isinstance(obj, classes(self._name))
+
+    def __repr__(self) -> str:
+        return f"<backend {self._name}>"
+
+
+def classes(name: str) -> tuple:
+    """The classes named 'name' of the loaded backend libraries."""
+    libs = [pandas] + [modules[x] for x in ("cudf",) if x in modules]
+    return tuple(getattr(lib, name) for lib in libs if isinstance(getattr(lib, name, None), type))
+
+
+concat = _Proxy("concat")
+cut = _Proxy("cut")
+date_range = _Proxy("date_range")
+DataFrame = _Proxy("DataFrame")
+DatetimeIndex = _Proxy("DatetimeIndex")
+RangeIndex = _Proxy("RangeIndex")
+Series = _Proxy("Series")
+
+
+set_backend(environ.get("PANDAS_TA_BACKEND", "cudf" if Imports["cudf"] else "pandas"))
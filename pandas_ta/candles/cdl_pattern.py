@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 from typing import Sequence, Union
-from pandas import Series, DataFrame
+from pandas_ta.backend import Series, DataFrame
 
 from . import cdl_doji, cdl_inside
+from .native import native_patterns, NATIVE_PATTERNS
 from pandas_ta.utils import get_offset, verify_series
 from pandas_ta import Imports
 
@@ -23,7 +24,7 @@ ALL_PATTERNS = [
 ]
 
 
-def cdl_pattern(open_, high, low, close, name: Union[str, Sequence[str]]="all", scalar=None, offset=None, **kwargs) -> DataFrame:
+def cdl_pattern(open_, high, low, close, name: Union[str, Sequence[str]]="all", scalar=None, talib=None, offset=None, **kwargs) -> DataFrame:
     """Candle Pattern"""
     # Validate Arguments
     open_ = verify_series(open_)
@@ -32,6 +33,7 @@ def cdl_pattern(open_, high, low, close, name: Union[str, Sequence[str]]="all",
     close = verify_series(close)
     offset = get_offset(offset)
     scalar = float(scalar) if scalar else 100
+    mode_tal = bool(talib) if isinstance(talib, bool) else True
 
     # Patterns that implemented in pandas-ta
     pta_patterns = {
@@ -43,8 +45,13 @@ def cdl_pattern(open_, high, low, close, name: Union[str, Sequence[str]]="all",
     if type(name) is str:
         name = [name]
 
-    if Imports["talib"]:
+    use_talib = Imports["talib"] and mode_tal
+    if use_talib:
         import talib.abstract as tala
+    else:
+        # All the native patterns at once over the same candle features
+        native = [n for n in name if n in NATIVE_PATTERNS and n not in pta_patterns]
+        native = native_patterns(open_, high, low, close, native, **kwargs)
 
     result = {}
     for n in name:
@@ -56,13 +63,16 @@ def cdl_pattern(open_, high, low, close, name: Union[str, Sequence[str]]="all",
             pattern_result = pta_patterns[n](open_, high, low, close, offset=offset, scalar=scalar, **kwargs)
             result[pattern_result.name] = pattern_result
         else:
-            if not Imports["talib"]:
+            if use_talib:
+                pattern_func = tala.Function(f"CDL{n.upper()}")
+                pattern_result = pattern_func(open_, high, low, close, **kwargs)
+            elif n in native:
+                pattern_result = native[n]
+            else:
                 print(f"[X] Please install TA-Lib to use {n}. (pip install TA-Lib)")
                 continue
 
-            pattern_func = tala.Function(f"CDL{n.upper()}")
-            pattern_result = Series(pattern_func(open_, high, low, close, **kwargs) / 100 * scalar)
-            pattern_result.index = close.index
+            pattern_result = Series(pattern_result / 100 * scalar, index=close.index)
 
             # Offset
             if offset != 0:
@@ -88,7 +98,11 @@ def cdl_pattern(open_, high, low, close, name: Union[str, Sequence[str]]="all",
 cdl_pattern.__doc__ = \
 """Candle Pattern
 
-A wrapper around all candle patterns.
+A wrapper around all candle patterns. Without TA Lib, or with talib=False,
+the patterns are evaluated natively: the candle features (real bodies,
+shadows, ranges, gaps and the averages of TA Lib's candle settings) are
+computed once and every pattern is a vectorized expression of them, with
+the same values as TA Lib's.
 
 Examples:
 
@@ -114,9 +128,13 @@ Args:
     close (pd.Series): Series of 'close's
     name: (Union[str, Sequence[str]]): name of the patterns
     scalar (float): How much to magnify. Default: 100
+    talib (bool): If TA Lib is installed and talib is True, Returns the TA Lib
+        version. Default: True
     offset (int): How many periods to offset the result. Default: 0
 
 Kwargs:
+    penetration (float, optional): Of the patterns that take it, i.e.
+        morningstar. Default: TA Lib's
     fillna (value, optional): pd.DataFrame.fillna(value)
     fill_method (value, optional): Type of fill method
 
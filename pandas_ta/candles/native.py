@@ -0,0 +1,636 @@
+# -*- coding: utf-8 -*-
+from numpy import float64, zeros
+from numpy import where as npWhere
+
+from pandas_ta.utils import Candles, CANDLE_SETTINGS, njit
+
+
+# name: (pattern, settings, candles before the current one)
+NATIVE_PATTERNS = {}
+
+
+def native_patterns(open_, high, low, close, names, **kwargs) -> dict:
+    """Evaluates the candle patterns names without TA Lib. The candle
+    features are computed once and shared by all the patterns, which are
+    vectorized expressions of them.
+
+    Returns:
+        dict: The values of each pattern as a float64 array: 100 or -100
+            where a bullish or bearish pattern completes (200 or -200 when
+            confirmed, 80 or -80 for a weaker match), otherwise 0.
+    """
+    candles = Candles(open_, high, low, close)
+    return {n: evaluate(candles, n, **kwargs) for n in names}
+
+
+def evaluate(candles: Candles, name: str, **kwargs):
+    """The values of the pattern name, like TA Lib's CDL<NAME>."""
+    pattern, settings, n = NATIVE_PATTERNS[name]
+    start = max([CANDLE_SETTINGS[s][1] for s in settings] + [0]) + n
+
+    def avg(setting, k):
+        return candles.average(setting, k, start)
+
+    result = pattern(candles, avg, start=start, **kwargs).astype(float64)
+    result[:start] = 0.0
+    return result
+
+
+def _pattern(name: str, *settings: str, n: int = 0):
+    """Registers a pattern over the candles with the given settings and n
+    previous candles. The pattern returns its values."""
+    def _register(fn):
+        NATIVE_PATTERNS[name] = (fn, settings, n)
+        return fn
+    return _register
+
+
+def _between(x, center, width):
+    return (x <= center + width) & (x >= center - width)
+
+
+@_pattern("2crows", "BodyLong", n=2)
+def _2crows(cs, avg, **kwargs):
+    match = (cs.color(2) == 1) & (cs.body(2) > avg("BodyLong", 2)) \
+        & (cs.color(1) == -1) & cs.gap_up(1, 2) \
+        & (cs.color() == -1) & (cs.o() < cs.o(1)) & (cs.o() > cs.c(1)) \
+        & (cs.c() > cs.o(2)) & (cs.c() < cs.c(2))
+    return npWhere(match, -100, 0)
+
+
+@_pattern("3blackcrows", "ShadowVeryShort", n=3)
+def _3blackcrows(cs, avg, **kwargs):
+    match = (cs.color(3) == 1) \
+        & (cs.color(2) == -1) & (cs.lower(2) < avg("ShadowVeryShort", 2)) \
+        & (cs.color(1) == -1) & (cs.lower(1) < avg("ShadowVeryShort", 1)) \
+        & (cs.color() == -1) & (cs.lower() < avg("ShadowVeryShort", 0)) \
+        & (cs.o(1) < cs.o(2)) & (cs.o(1) > cs.c(2)) \
+        & (cs.o() < cs.o(1)) & (cs.o() > cs.c(1)) \
+        & (cs.h(3) > cs.c(2)) & (cs.c(2) > cs.c(1)) & (cs.c(1) > cs.c())
+    return npWhere(match, -100, 0)
+
+
+@_pattern("3inside", "BodyShort", "BodyLong", n=2)
+def _3inside(cs, avg, **kwargs):
+    match = (cs.body(2) > avg("BodyLong", 2)) \
+        & (cs.body(1) <= avg("BodyShort", 1)) \
+        & (cs.top(1) < cs.top(2)) & (cs.bottom(1) > cs.bottom(2)) \
+        & (((cs.color(2) == 1) & (cs.color() == -1) & (cs.c() < cs.o(2)))
+           | ((cs.color(2) == -1) & (cs.color() == 1) & (cs.c() > cs.o(2))))
+    return npWhere(match, -100 * cs.color(2), 0)
+
+
+@_pattern("3linestrike", "Near", n=3)
+def _3linestrike(cs, avg, **kwargs):
+    c1, c2, c3 = cs.c(1), cs.c(2), cs.c(3)
+    match = (cs.color(3) == cs.color(2)) & (cs.color(2) == cs.color(1)) \
+        & (cs.color() == -cs.color(1)) \
+        & (cs.o(2) >= cs.bottom(3) - avg("Near", 3)) & (cs.o(2) <= cs.top(3) + avg("Near", 3)) \
+        & (cs.o(1) >= cs.bottom(2) - avg("Near", 2)) & (cs.o(1) <= cs.top(2) + avg("Near", 2)) \
+        & (((cs.color(1) == 1) & (c1 > c2) & (c2 > c3) & (cs.o() > c1) & (cs.c() < cs.o(3)))
+           | ((cs.color(1) == -1) & (c1 < c2) & (c2 < c3) & (cs.o() < c1) & (cs.c() > cs.o(3))))
+    return npWhere(match, 100 * cs.color(1), 0)
+
+
+@_pattern("3outside", n=2)
+def _3outside(cs, avg, **kwargs):
+    match = ((cs.color(1) == 1) & (cs.color(2) == -1) & (cs.c(1) > cs.o(2)) & (cs.o(1) < cs.c(2)) & (cs.c() > cs.c(1))) \
+        | ((cs.color(1) == -1) & (cs.color(2) == 1) & (cs.o(1) > cs.c(2)) & (cs.c(1) < cs.o(2)) & (cs.c() < cs.c(1)))
+    return npWhere(match, 100 * cs.color(1), 0)
+
+
+@_pattern("3starsinsouth", "ShadowVeryShort", "ShadowLong", "BodyLong", "BodyShort", n=2)
+def _3starsinsouth(cs, avg, **kwargs):
+    match = (cs.color(2) == -1) & (cs.color(1) == -1) & (cs.color() == -1) \
+        & (cs.body(2) > avg("BodyLong", 2)) & (cs.lower(2) > avg("ShadowLong", 2)) \
+        & (cs.body(1) < cs.body(2)) & (cs.o(1) > cs.c(2)) & (cs.o(1) <= cs.h(2)) \
+        & (cs.l(1) < cs.c(2)) & (cs.l(1) >= cs.l(2)) & (cs.lower(1) > avg("ShadowVeryShort", 1)) \
+        & (cs.body() < avg("BodyShort", 0)) & (cs.lower() < avg("ShadowVeryShort", 0)) \
+        & (cs.upper() < avg("ShadowVeryShort", 0)) & (cs.l() > cs.l(1)) & (cs.h() < cs.h(1))
+    return npWhere(match, 100, 0)
+
+
+@_pattern("3whitesoldiers", "ShadowVeryShort", "BodyShort", "Far", "Near", n=2)
+def _3whitesoldiers(cs, avg, **kwargs):
+    match = (cs.color(2) == 1) & (cs.upper(2) < avg("ShadowVeryShort", 2)) \
+        & (cs.color(1) == 1) & (cs.upper(1) < avg("ShadowVeryShort", 1)) \
+        & (cs.color() == 1) & (cs.upper() < avg("ShadowVeryShort", 0)) \
+        & (cs.c() > cs.c(1)) & (cs.c(1) > cs.c(2)) \
+        & (cs.o(1) > cs.o(2)) & (cs.o(1) <= cs.c(2) + avg("Near", 2)) \
+        & (cs.o() > cs.o(1)) & (cs.o() <= cs.c(1) + avg("Near", 1)) \
+        & (cs.body(1) > cs.body(2) - avg("Far", 2)) \
+        & (cs.body() > cs.body(1) - avg("Far", 1)) \
+        & (cs.body() > avg("BodyShort", 0))
+    return npWhere(match, 100, 0)
+
+
+@_pattern("abandonedbaby", "BodyDoji", "BodyLong", "BodyShort", n=2)
+def _abandonedbaby(cs, avg, penetration=None, **kwargs):
+    penetration = 0.3 if penetration is None else penetration
+    body2 = cs.body(2)
+    match = (body2 > avg("BodyLong", 2)) \
+        & (cs.body(1) <= avg("BodyDoji", 1)) \
+        & (cs.body() > avg("BodyShort", 0)) \
+        & (((cs.color(2) == 1) & (cs.color() == -1) & (cs.c() < cs.c(2) - body2 * penetration)
+            & cs.candle_gap_up(1, 2) & cs.candle_gap_down(0, 1))
+           | ((cs.color(2) == -1) & (cs.color() == 1) & (cs.c() > cs.c(2) + body2 * penetration)
+              & cs.candle_gap_down(1, 2) & cs.candle_gap_up(0, 1)))
+    return npWhere(match, 100 * cs.color(), 0)
+
+
+@_pattern("advanceblock", "ShadowLong", "ShadowShort", "Far", "Near", "BodyLong", n=2)
+def _advanceblock(cs, avg, **kwargs):
+    body0, body1, body2 = cs.body(), cs.body(1), cs.body(2)
+    weakening = ((body1 <= body2 - avg("Far", 2)) & (body0 < body1 + avg("Near", 1))) \
+        | (body0 <= body1 - avg("Far", 1)) \
+        | ((body0 < body1) & (body1 < body2)
+           & ((cs.upper() > avg("ShadowShort", 0)) | (cs.upper(1) > avg("ShadowShort", 1)))) \
+        | ((body0 < body1) & (cs.upper() > avg("ShadowLong", 0)))
+    match = (cs.color(2) == 1) & (cs.color(1) == 1) & (cs.color() == 1) \
+        & (cs.c() > cs.c(1)) & (cs.c(1) > cs.c(2)) \
+        & (cs.o(1) > cs.o(2)) & (cs.o(1) <= cs.c(2) + avg("Near", 2)) \
+        & (cs.o() > cs.o(1)) & (cs.o() <= cs.c(1) + avg("Near", 1)) \
+        & (body2 > avg("BodyLong", 2)) & (cs.upper(2) < avg("ShadowShort", 2)) \
+        & weakening
+    return npWhere(match, -100, 0)
+
+
+@_pattern("belthold", "BodyLong", "ShadowVeryShort")
+def _belthold(cs, avg, **kwargs):
+    match = (cs.body() > avg("BodyLong", 0)) \
+        & (((cs.color() == 1) & (cs.lower() < avg("ShadowVeryShort", 0)))
+           | ((cs.color() == -1) & (cs.upper() < avg("ShadowVeryShort", 0))))
+    return npWhere(match, 100 * cs.color(), 0)
+
+
+@_pattern("breakaway", "BodyLong", n=4)
+def _breakaway(cs, avg, **kwargs):
+    h, l = cs.h, cs.l
+    match = (cs.body(4) > avg("BodyLong", 4)) \
+        & (cs.color(4) == cs.color(3)) & (cs.color(3) == cs.color(1)) & (cs.color(1) == -cs.color()) \
+        & (((cs.color(4) == -1) & cs.gap_down(3, 4) & (h(2) < h(3)) & (l(2) < l(3))
+            & (h(1) < h(2)) & (l(1) < l(2)) & (cs.c() > cs.o(3)) & (cs.c() < cs.c(4)))
+           | ((cs.color(4) == 1) & cs.gap_up(3, 4) & (h(2) > h(3)) & (l(2) > l(3))
+              & (h(1) > h(2)) & (l(1) > l(2)) & (cs.c() < cs.o(3)) & (cs.c() > cs.c(4))))
+    return npWhere(match, 100 * cs.color(), 0)
+
+
+@_pattern("closingmarubozu", "BodyLong", "ShadowVeryShort")
+def _closingmarubozu(cs, avg, **kwargs):
+    match = (cs.body() > avg("BodyLong", 0)) \
+        & (((cs.color() == 1) & (cs.upper() < avg("ShadowVeryShort", 0)))
+           | ((cs.color() == -1) & (cs.lower() < avg("ShadowVeryShort", 0))))
+    return npWhere(match, 100 * cs.color(), 0)
+
+
+@_pattern("concealbabyswall", "ShadowVeryShort", n=3)
+def _concealbabyswall(cs, avg, **kwargs):
+    match = (cs.color(3) == -1) & (cs.color(2) == -1) & (cs.color(1) == -1) & (cs.color() == -1) \
+        & (cs.lower(3) < avg("ShadowVeryShort", 3)) & (cs.upper(3) < avg("ShadowVeryShort", 3)) \
+        & (cs.lower(2) < avg("ShadowVeryShort", 2)) & (cs.upper(2) < avg("ShadowVeryShort", 2)) \
+        & cs.gap_down(1, 2) & (cs.upper(1) > avg("ShadowVeryShort", 1)) & (cs.h(1) > cs.c(2)) \
+        & (cs.h() > cs.h(1)) & (cs.l() < cs.l(1))
+    return npWhere(match, 100, 0)
+
+
+@_pattern("counterattack", "Equal", "BodyLong", n=1)
+def _counterattack(cs, avg, **kwargs):
+    match = (cs.color(1) == -cs.color()) \
+        & (cs.body(1) > avg("BodyLong", 1)) & (cs.body() > avg("BodyLong", 0)) \
+        & _between(cs.c(), cs.c(1), avg("Equal", 1))
+    return npWhere(match, 100 * cs.color(), 0)
+
+
+@_pattern("darkcloudcover", "BodyLong", n=1)
+def _darkcloudcover(cs, avg, penetration=None, **kwargs):
+    penetration = 0.5 if penetration is None else penetration
+    match = (cs.color(1) == 1) & (cs.body(1) > avg("BodyLong", 1)) \
+        & (cs.color() == -1) & (cs.o() > cs.h(1)) & (cs.c() > cs.o(1)) \
+        & (cs.c() < cs.c(1) - cs.body(1) * penetration)
+    return npWhere(match, -100, 0)
+
+
+@_pattern("dojistar", "BodyDoji", "BodyLong", n=1)
+def _dojistar(cs, avg, **kwargs):
+    match = (cs.body(1) > avg("BodyLong", 1)) & (cs.body() <= avg("BodyDoji", 0)) \
+        & (((cs.color(1) == 1) & cs.gap_up(0, 1)) | ((cs.color(1) == -1) & cs.gap_down(0, 1)))
+    return npWhere(match, -100 * cs.color(1), 0)
+
+
+@_pattern("dragonflydoji", "BodyDoji", "ShadowVeryShort")
+def _dragonflydoji(cs, avg, **kwargs):
+    match = (cs.body() <= avg("BodyDoji", 0)) \
+        & (cs.upper() < avg("ShadowVeryShort", 0)) & (cs.lower() > avg("ShadowVeryShort", 0))
+    return npWhere(match, 100, 0)
+
+
+@_pattern("engulfing", n=2)
+def _engulfing(cs, avg, **kwargs):
+    o, c, o1, c1 = cs.o(), cs.c(), cs.o(1), cs.c(1)
+    match = ((cs.color() == 1) & (cs.color(1) == -1)
+             & (((c >= o1) & (o < c1)) | ((c > o1) & (o <= c1)))) \
+        | ((cs.color() == -1) & (cs.color(1) == 1)
+           & (((o >= c1) & (c < o1)) | ((o > c1) & (c <= o1))))
+    strength = npWhere((o != c1) & (c != o1), 100, 80)
+    return npWhere(match, strength * cs.color(), 0)
+
+
+@_pattern("eveningdojistar", "BodyDoji", "BodyLong", "BodyShort", n=2)
+def _eveningdojistar(cs, avg, penetration=None, **kwargs):
+    penetration = 0.3 if penetration is None else penetration
+    match = (cs.body(2) > avg("BodyLong", 2)) & (cs.color(2) == 1) \
+        & (cs.body(1) <= avg("BodyDoji", 1)) & cs.gap_up(1, 2) \
+        & (cs.body() > avg("BodyShort", 0)) & (cs.color() == -1) \
+        & (cs.c() < cs.c(2) - cs.body(2) * penetration)
+    return npWhere(match, -100, 0)
+
+
+@_pattern("eveningstar", "BodyShort", "BodyLong", n=2)
+def _eveningstar(cs, avg, penetration=None, **kwargs):
+    penetration = 0.3 if penetration is None else penetration
+    match = (cs.body(2) > avg("BodyLong", 2)) & (cs.color(2) == 1) \
+        & (cs.body(1) <= avg("BodyShort", 1)) & cs.gap_up(1, 2) \
+        & (cs.body() > avg("BodyShort", 0)) & (cs.color() == -1) \
+        & (cs.c() < cs.c(2) - cs.body(2) * penetration)
+    return npWhere(match, -100, 0)
+
+
+@_pattern("gapsidesidewhite", "Near", "Equal", n=2)
+def _gapsidesidewhite(cs, avg, **kwargs):
+    up = cs.gap_up(1, 2) & cs.gap_up(0, 2)
+    down = cs.gap_down(1, 2) & cs.gap_down(0, 2)
+    match = (up | down) & (cs.color(1) == 1) & (cs.color() == 1) \
+        & _between(cs.body(), cs.body(1), avg("Near", 1)) \
+        & _between(cs.o(), cs.o(1), avg("Equal", 1))
+    return npWhere(match, npWhere(cs.gap_up(1, 2), 100, -100), 0)
+
+
+@_pattern("gravestonedoji", "BodyDoji", "ShadowVeryShort")
+def _gravestonedoji(cs, avg, **kwargs):
+    match = (cs.body() <= avg("BodyDoji", 0)) \
+        & (cs.lower() < avg("ShadowVeryShort", 0)) & (cs.upper() > avg("ShadowVeryShort", 0))
+    return npWhere(match, 100, 0)
+
+
+@_pattern("hammer", "BodyShort", "ShadowLong", "ShadowVeryShort", "Near", n=1)
+def _hammer(cs, avg, **kwargs):
+    match = (cs.body() < avg("BodyShort", 0)) & (cs.lower() > avg("ShadowLong", 0)) \
+        & (cs.upper() < avg("ShadowVeryShort", 0)) \
+        & (cs.bottom() <= cs.l(1) + avg("Near", 1))
+    return npWhere(match, 100, 0)
+
+
+@_pattern("hangingman", "BodyShort", "ShadowLong", "ShadowVeryShort", "Near", n=1)
+def _hangingman(cs, avg, **kwargs):
+    match = (cs.body() < avg("BodyShort", 0)) & (cs.lower() > avg("ShadowLong", 0)) \
+        & (cs.upper() < avg("ShadowVeryShort", 0)) \
+        & (cs.bottom() >= cs.h(1) - avg("Near", 1))
+    return npWhere(match, -100, 0)
+
+
+def _harami(cs, avg, small):
+    match = (cs.body(1) > avg("BodyLong", 1)) & (cs.body() <= small)
+    inside = (cs.top() < cs.top(1)) & (cs.bottom() > cs.bottom(1))
+    touching = (cs.top() <= cs.top(1)) & (cs.bottom() >= cs.bottom(1))
+    strength = npWhere(inside, 100, npWhere(touching, 80, 0))
+    return npWhere(match, -strength * cs.color(1), 0)
+
+
+@_pattern("harami", "BodyShort", "BodyLong", n=1)
+def _harami_(cs, avg, **kwargs):
+    return _harami(cs, avg, avg("BodyShort", 0))
+
+
+@_pattern("haramicross", "BodyDoji", "BodyLong", n=1)
+def _haramicross(cs, avg, **kwargs):
+    return _harami(cs, avg, avg("BodyDoji", 0))
+
+
+@_pattern("highwave", "BodyShort", "ShadowVeryLong")
+def _highwave(cs, avg, **kwargs):
+    match = (cs.body() < avg("BodyShort", 0)) \
+        & (cs.upper() > avg("ShadowVeryLong", 0)) & (cs.lower() > avg("ShadowVeryLong", 0))
+    return npWhere(match, 100 * cs.color(), 0)
+
+
+@njit(cache=True)
+def _hikkake(high, low, close, signal, start):
+    """Confirms the hikkake signals within three candles, over float64
+    arrays. Compiled when numba is installed."""
+    m = close.shape[0]
+    result = zeros(m)
+    index, value = 0, 0.0
+    for i in range(max(start - 3, 0), m):
+        if signal[i] != 0:
+            index, value = i, signal[i]
+            if i >= start:
+                result[i] = value
+        elif i <= index + 3 and ((value > 0 and close[i] > high[index - 1])
+                                 or (value < 0 and close[i] < low[index - 1])):
+            if i >= start:
+                result[i] = value + (100 if value > 0 else -100)
+            index = 0
+    return result
+
+
+@_pattern("hikkake", n=5)
+def _hikkake_(cs, avg, start=0, **kwargs):
+    h, l = cs.h, cs.l
+    inside = (h(1) < h(2)) & (l(1) > l(2))
+    signal = npWhere(inside & (h() < h(1)) & (l() < l(1)), 100,
+                     npWhere(inside & (h() > h(1)) & (l() > l(1)), -100, 0))
+    return _hikkake(h(), l(), cs.c(), signal.astype(float64), start)
+
+
+@_pattern("hikkakemod", "Near", n=5)
+def _hikkakemod(cs, avg, start=0, **kwargs):
+    h, l = cs.h, cs.l
+    # The totals of Near start three candles early for the priming candles
+    near = cs.average("Near", 2, start - 3)
+    inside = (h(2) < h(3)) & (l(2) > l(3)) & (h(1) < h(2)) & (l(1) > l(2))
+    bullish = inside & (h() < h(1)) & (l() < l(1)) & (cs.c(2) <= l(2) + near)
+    bearish = inside & (h() > h(1)) & (l() > l(1)) & (cs.c(2) >= h(2) - near)
+    signal = npWhere(bullish, 100, npWhere(bearish, -100, 0))
+    return _hikkake(h(), l(), cs.c(), signal.astype(float64), start)
+
+
+@_pattern("homingpigeon", "BodyShort", "BodyLong", n=1)
+def _homingpigeon(cs, avg, **kwargs):
+    match = (cs.color(1) == -1) & (cs.color() == -1) \
+        & (cs.body(1) > avg("BodyLong", 1)) & (cs.body() <= avg("BodyShort", 0)) \
+        & (cs.o() < cs.o(1)) & (cs.c() > cs.c(1))
+    return npWhere(match, 100, 0)
+
+
+@_pattern("identical3crows", "ShadowVeryShort", "Equal", n=2)
+def _identical3crows(cs, avg, **kwargs):
+    match = (cs.color(2) == -1) & (cs.lower(2) < avg("ShadowVeryShort", 2)) \
+        & (cs.color(1) == -1) & (cs.lower(1) < avg("ShadowVeryShort", 1)) \
+        & (cs.color() == -1) & (cs.lower() < avg("ShadowVeryShort", 0)) \
+        & (cs.c(2) > cs.c(1)) & (cs.c(1) > cs.c()) \
+        & _between(cs.o(1), cs.c(2), avg("Equal", 2)) \
+        & _between(cs.o(), cs.c(1), avg("Equal", 1))
+    return npWhere(match, -100, 0)
+
+
+@_pattern("inneck", "Equal", "BodyLong", n=1)
+def _inneck(cs, avg, **kwargs):
+    match = (cs.color(1) == -1) & (cs.body(1) > avg("BodyLong", 1)) \
+        & (cs.color() == 1) & (cs.o() < cs.l(1)) \
+        & (cs.c() <= cs.c(1) + avg("Equal", 1)) & (cs.c() >= cs.c(1))
+    return npWhere(match, -100, 0)
+
+
+@_pattern("invertedhammer", "BodyShort", "ShadowLong", "ShadowVeryShort", n=1)
+def _invertedhammer(cs, avg, **kwargs):
+    match = (cs.body() < avg("BodyShort", 0)) & (cs.upper() > avg("ShadowLong", 0)) \
+        & (cs.lower() < avg("ShadowVeryShort", 0)) & cs.gap_down(0, 1)
+    return npWhere(match, 100, 0)
+
+
+def _kicking(cs, avg):
+    def marubozu(k):
+        return (cs.body(k) > avg("BodyLong", k)) \
+            & (cs.upper(k) < avg("ShadowVeryShort", k)) & (cs.lower(k) < avg("ShadowVeryShort", k))
+
+    return (cs.color(1) == -cs.color()) & marubozu(1) & marubozu(0) \
+        & (((cs.color(1) == -1) & cs.candle_gap_up(0, 1))
+           | ((cs.color(1) == 1) & cs.candle_gap_down(0, 1)))
+
+
+@_pattern("kicking", "ShadowVeryShort", "BodyLong", n=1)
+def _kicking_(cs, avg, **kwargs):
+    return npWhere(_kicking(cs, avg), 100 * cs.color(), 0)
+
+
+@_pattern("kickingbylength", "ShadowVeryShort", "BodyLong", n=1)
+def _kickingbylength(cs, avg, **kwargs):
+    longer = npWhere(cs.body() > cs.body(1), cs.color(), cs.color(1))
+    return npWhere(_kicking(cs, avg), 100 * longer, 0)
+
+
+@_pattern("ladderbottom", "ShadowVeryShort", n=4)
+def _ladderbottom(cs, avg, **kwargs):
+    match = (cs.color(4) == -1) & (cs.color(3) == -1) & (cs.color(2) == -1) \
+        & (cs.o(4) > cs.o(3)) & (cs.o(3) > cs.o(2)) \
+        & (cs.c(4) > cs.c(3)) & (cs.c(3) > cs.c(2)) \
+        & (cs.color(1) == -1) & (cs.upper(1) > avg("ShadowVeryShort", 1)) \
+        & (cs.color() == 1) & (cs.o() > cs.o(1)) & (cs.c() > cs.h(1))
+    return npWhere(match, 100, 0)
+
+
+@_pattern("longleggeddoji", "BodyDoji", "ShadowLong")
+def _longleggeddoji(cs, avg, **kwargs):
+    match = (cs.body() <= avg("BodyDoji", 0)) \
+        & ((cs.lower() > avg("ShadowLong", 0)) | (cs.upper() > avg("ShadowLong", 0)))
+    return npWhere(match, 100, 0)
+
+
+@_pattern("longline", "BodyLong", "ShadowShort")
+def _longline(cs, avg, **kwargs):
+    match = (cs.body() > avg("BodyLong", 0)) \
+        & (cs.upper() < avg("ShadowShort", 0)) & (cs.lower() < avg("ShadowShort", 0))
+    return npWhere(match, 100 * cs.color(), 0)
+
+
+@_pattern("marubozu", "BodyLong", "ShadowVeryShort")
+def _marubozu(cs, avg, **kwargs):
+    match = (cs.body() > avg("BodyLong", 0)) \
+        & (cs.upper() < avg("ShadowVeryShort", 0)) & (cs.lower() < avg("ShadowVeryShort", 0))
+    return npWhere(match, 100 * cs.color(), 0)
+
+
+@_pattern("matchinglow", "Equal", n=1)
+def _matchinglow(cs, avg, **kwargs):
+    match = (cs.color(1) == -1) & (cs.color() == -1) \
+        & _between(cs.c(), cs.c(1), avg("Equal", 1))
+    return npWhere(match, 100, 0)
+
+
+@_pattern("mathold", "BodyShort", "BodyLong", n=4)
+def _mathold(cs, avg, penetration=None, **kwargs):
+    penetration = 0.5 if penetration is None else penetration
+    c4, floor = cs.c(4), cs.c(4) - cs.body(4) * penetration
+    match = (cs.body(4) > avg("BodyLong", 4)) \
+        & (cs.body(3) < avg("BodyShort", 3)) & (cs.body(2) < avg("BodyShort", 2)) \
+        & (cs.body(1) < avg("BodyShort", 1)) \
+        & (cs.color(4) == 1) & (cs.color(3) == -1) & (cs.color() == 1) \
+        & cs.gap_up(3, 4) \
+        & (cs.bottom(2) < c4) & (cs.bottom(1) < c4) \
+        & (cs.bottom(2) > floor) & (cs.bottom(1) > floor) \
+        & (cs.top(2) < cs.o(3)) & (cs.top(1) < cs.top(2)) \
+        & (cs.o() > cs.c(1)) & (cs.c() > cs.h(3)) & (cs.c() > cs.h(2)) & (cs.c() > cs.h(1))
+    return npWhere(match, 100, 0)
+
+
+@_pattern("morningdojistar", "BodyDoji", "BodyLong", "BodyShort", n=2)
+def _morningdojistar(cs, avg, penetration=None, **kwargs):
+    penetration = 0.3 if penetration is None else penetration
+    match = (cs.body(2) > avg("BodyLong", 2)) & (cs.color(2) == -1) \
+        & (cs.body(1) <= avg("BodyDoji", 1)) & cs.gap_down(1, 2) \
+        & (cs.body() > avg("BodyShort", 0)) & (cs.color() == 1) \
+        & (cs.c() > cs.c(2) + cs.body(2) * penetration)
+    return npWhere(match, 100, 0)
+
+
+@_pattern("morningstar", "BodyShort", "BodyLong", n=2)
+def _morningstar(cs, avg, penetration=None, **kwargs):
+    penetration = 0.3 if penetration is None else penetration
+    match = (cs.body(2) > avg("BodyLong", 2)) & (cs.color(2) == -1) \
+        & (cs.body(1) <= avg("BodyShort", 1)) & cs.gap_down(1, 2) \
+        & (cs.body() > avg("BodyShort", 0)) & (cs.color() == 1) \
+        & (cs.c() > cs.c(2) + cs.body(2) * penetration)
+    return npWhere(match, 100, 0)
+
+
+@_pattern("onneck", "Equal", "BodyLong", n=1)
+def _onneck(cs, avg, **kwargs):
+    match = (cs.color(1) == -1) & (cs.body(1) > avg("BodyLong", 1)) \
+        & (cs.color() == 1) & (cs.o() < cs.l(1)) \
+        & _between(cs.c(), cs.l(1), avg("Equal", 1))
+    return npWhere(match, -100, 0)
+
+
+@_pattern("piercing", "BodyLong", n=1)
+def _piercing(cs, avg, **kwargs):
+    match = (cs.color(1) == -1) & (cs.body(1) > avg("BodyLong", 1)) \
+        & (cs.color() == 1) & (cs.body() > avg("BodyLong", 0)) \
+        & (cs.o() < cs.l(1)) & (cs.c() < cs.o(1)) & (cs.c() > cs.c(1) + cs.body(1) * 0.5)
+    return npWhere(match, 100, 0)
+
+
+@_pattern("rickshawman", "BodyDoji", "ShadowLong", "Near")
+def _rickshawman(cs, avg, **kwargs):
+    middle = cs.l() + cs.range() / 2
+    match = (cs.body() <= avg("BodyDoji", 0)) \
+        & (cs.lower() > avg("ShadowLong", 0)) & (cs.upper() > avg("ShadowLong", 0)) \
+        & (cs.bottom() <= middle + avg("Near", 0)) & (cs.top() >= middle - avg("Near", 0))
+    return npWhere(match, 100, 0)
+
+
+@_pattern("risefall3methods", "BodyShort", "BodyLong", n=4)
+def _risefall3methods(cs, avg, **kwargs):
+    color4 = cs.color(4)
+    match = (cs.body(4) > avg("BodyLong", 4)) \
+        & (cs.body(3) < avg("BodyShort", 3)) & (cs.body(2) < avg("BodyShort", 2)) \
+        & (cs.body(1) < avg("BodyShort", 1)) & (cs.body() > avg("BodyLong", 0)) \
+        & (color4 == -cs.color(3)) & (cs.color(3) == cs.color(2)) \
+        & (cs.color(2) == cs.color(1)) & (cs.color(1) == -cs.color()) \
+        & (cs.bottom(3) < cs.h(4)) & (cs.top(3) > cs.l(4)) \
+        & (cs.bottom(2) < cs.h(4)) & (cs.top(2) > cs.l(4)) \
+        & (cs.bottom(1) < cs.h(4)) & (cs.top(1) > cs.l(4)) \
+        & (cs.c(2) * color4 < cs.c(3) * color4) & (cs.c(1) * color4 < cs.c(2) * color4) \
+        & (cs.o() * color4 > cs.c(1) * color4) & (cs.c() * color4 > cs.c(4) * color4)
+    return npWhere(match, 100 * color4, 0)
+
+
+@_pattern("separatinglines", "ShadowVeryShort", "BodyLong", "Equal", n=1)
+def _separatinglines(cs, avg, **kwargs):
+    match = (cs.color(1) == -cs.color()) \
+        & _between(cs.o(), cs.o(1), avg("Equal", 1)) \
+        & (cs.body() > avg("BodyLong", 0)) \
+        & (((cs.color() == 1) & (cs.lower() < avg("ShadowVeryShort", 0)))
+           | ((cs.color() == -1) & (cs.upper() < avg("ShadowVeryShort", 0))))
+    return npWhere(match, 100 * cs.color(), 0)
+
+
+@_pattern("shootingstar", "BodyShort", "ShadowLong", "ShadowVeryShort", n=1)
+def _shootingstar(cs, avg, **kwargs):
+    match = (cs.body() < avg("BodyShort", 0)) & (cs.upper() > avg("ShadowLong", 0)) \
+        & (cs.lower() < avg("ShadowVeryShort", 0)) & cs.gap_up(0, 1)
+    return npWhere(match, -100, 0)
+
+
+@_pattern("shortline", "BodyShort", "ShadowShort")
+def _shortline(cs, avg, **kwargs):
+    match = (cs.body() < avg("BodyShort", 0)) \
+        & (cs.upper() < avg("ShadowShort", 0)) & (cs.lower() < avg("ShadowShort", 0))
+    return npWhere(match, 100 * cs.color(), 0)
+
+
+@_pattern("spinningtop", "BodyShort")
+def _spinningtop(cs, avg, **kwargs):
+    match = (cs.body() < avg("BodyShort", 0)) \
+        & (cs.upper() > cs.body()) & (cs.lower() > cs.body())
+    return npWhere(match, 100 * cs.color(), 0)
+
+
+@_pattern("stalledpattern", "BodyLong", "BodyShort", "ShadowVeryShort", "Near", n=2)
+def _stalledpattern(cs, avg, **kwargs):
+    match = (cs.color(2) == 1) & (cs.color(1) == 1) & (cs.color() == 1) \
+        & (cs.c() > cs.c(1)) & (cs.c(1) > cs.c(2)) \
+        & (cs.body(2) > avg("BodyLong", 2)) & (cs.body(1) > avg("BodyLong", 1)) \
+        & (cs.upper(1) < avg("ShadowVeryShort", 1)) \
+        & (cs.o(1) > cs.o(2)) & (cs.o(1) <= cs.c(2) + avg("Near", 2)) \
+        & (cs.body() < avg("BodyShort", 0)) \
+        & (cs.o() >= cs.c(1) - cs.body() - avg("Near", 1))
+    return npWhere(match, -100, 0)
+
+
+@_pattern("sticksandwich", "Equal", n=2)
+def _sticksandwich(cs, avg, **kwargs):
+    match = (cs.color(2) == -1) & (cs.color(1) == 1) & (cs.color() == -1) \
+        & (cs.l(1) > cs.c(2)) & _between(cs.c(), cs.c(2), avg("Equal", 2))
+    return npWhere(match, 100, 0)
+
+
+@_pattern("takuri", "BodyDoji", "ShadowVeryShort", "ShadowVeryLong")
+def _takuri(cs, avg, **kwargs):
+    match = (cs.body() <= avg("BodyDoji", 0)) \
+        & (cs.upper() < avg("ShadowVeryShort", 0)) & (cs.lower() > avg("ShadowVeryLong", 0))
+    return npWhere(match, 100, 0)
+
+
+@_pattern("tasukigap", "Near", n=2)
+def _tasukigap(cs, avg, **kwargs):
+    near = abs(cs.body(1) - cs.body()) < avg("Near", 1)
+    match = (cs.gap_up(1, 2) & (cs.color(1) == 1) & (cs.color() == -1)
+             & (cs.o() < cs.c(1)) & (cs.o() > cs.o(1)) & (cs.c() < cs.o(1))
+             & (cs.c() > cs.top(2)) & near) \
+        | (cs.gap_down(1, 2) & (cs.color(1) == -1) & (cs.color() == 1)
+           & (cs.o() < cs.o(1)) & (cs.o() > cs.c(1)) & (cs.c() > cs.o(1))
+           & (cs.c() < cs.bottom(2)) & near)
+    return npWhere(match, 100 * cs.color(1), 0)
+
+
+@_pattern("thrusting", "Equal", "BodyLong", n=1)
+def _thrusting(cs, avg, **kwargs):
+    match = (cs.color(1) == -1) & (cs.body(1) > avg("BodyLong", 1)) \
+        & (cs.color() == 1) & (cs.o() < cs.l(1)) \
+        & (cs.c() > cs.c(1) + avg("Equal", 1)) & (cs.c() <= cs.c(1) + cs.body(1) * 0.5)
+    return npWhere(match, -100, 0)
+
+
+@_pattern("tristar", "BodyDoji", n=2)
+def _tristar(cs, avg, **kwargs):
+    # All three bodies are compared to the average of the first
+    doji = avg("BodyDoji", 2)
+    match = (cs.body(2) <= doji) & (cs.body(1) <= doji) & (cs.body() <= doji)
+    bearish = cs.gap_up(1, 2) & (cs.top() < cs.top(1))
+    bullish = cs.gap_down(1, 2) & (cs.bottom() > cs.bottom(1))
+    return npWhere(match & bearish, -100, npWhere(match & bullish, 100, 0))
+
+
+@_pattern("unique3river", "BodyShort", "BodyLong", n=2)
+def _unique3river(cs, avg, **kwargs):
+    match = (cs.body(2) > avg("BodyLong", 2)) & (cs.color(2) == -1) \
+        & (cs.color(1) == -1) & (cs.c(1) > cs.c(2)) & (cs.o(1) <= cs.o(2)) & (cs.l(1) < cs.l(2)) \
+        & (cs.body() < avg("BodyShort", 0)) & (cs.color() == 1) & (cs.o() > cs.l(1))
+    return npWhere(match, 100, 0)
+
+
+@_pattern("upsidegap2crows", "BodyShort", "BodyLong", n=2)
+def _upsidegap2crows(cs, avg, **kwargs):
+    match = (cs.color(2) == 1) & (cs.body(2) > avg("BodyLong", 2)) \
+        & (cs.color(1) == -1) & (cs.body(1) <= avg("BodyShort", 1)) & cs.gap_up(1, 2) \
+        & (cs.color() == -1) & (cs.o() > cs.o(1)) & (cs.c() < cs.c(1)) & (cs.c() > cs.c(2))
+    return npWhere(match, -100, 0)
+
+
+@_pattern("xsidegap3methods", n=2)
+def _xsidegap3methods(cs, avg, **kwargs):
+    match = (cs.color(2) == cs.color(1)) & (cs.color() == -cs.color(1)) \
+        & (cs.o() < cs.top(1)) & (cs.o() > cs.bottom(1)) \
+        & (cs.c() < cs.top(2)) & (cs.c() > cs.bottom(2)) \
+        & (((cs.color(2) == 1) & cs.gap_up(1, 2)) | ((cs.color(2) == -1) & cs.gap_down(1, 2)))
+    return npWhere(match, 100 * cs.color(2), 0)
@@ -1,18 +1,18 @@
 # -*- coding: utf-8 -*-
+from contextlib import nullcontext
 from dataclasses import dataclass, field
-from multiprocessing import cpu_count, Pool
+from multiprocessing import cpu_count
 from pathlib import Path
 from time import perf_counter
 from typing import List, Tuple
 from warnings import simplefilter
 
-import cudf
-from cudf import DataFrame, Series
-from numpy import log10 as npLog10
+from pandas_ta.backend import classes, concat, DataFrame, Series
 from numpy import ndarray as npNdarray
 
 from pandas_ta import Category, Imports, version
 from pandas_ta.candles.cdl_pattern import ALL_PATTERNS
+from pandas_ta.executor import select_executor, StrategyExecutor, thread_map
 from pandas_ta.candles import *
 from pandas_ta.cycles import *
 from pandas_ta.momentum import *
@@ -24,6 +24,10 @@ from pandas_ta.volatility import *
 from pandas_ta.volume import *
 from pandas_ta.utils import *
 
+# Indicators, and the df.ta methods calling them, consult the active ResultCache
+for _name in [x for v in Category.values() for x in v] + ["ma", "psar_grid"]:
+    globals()[_name] = cached(globals()[_name])
+
 
 df = DataFrame()
 
@@ -248,8 +252,11 @@ class AnalysisIndicators(BasePandasObject):
     _cores = cpu_count()
     _df = DataFrame()
     _exchange = "NYSE"
+    _executor = None
+    _executor_modes = ["auto", "process", "serial", "thread"]
     _time_range = "years"
     _last_run = get_time(_exchange, to_string=True)
+    _pending = None
 
     def __init__(self, pandas_obj):
         self._validate(pandas_obj)
@@ -318,6 +325,21 @@ class AnalysisIndicators(BasePandasObject):
         else:
             self._cores = cpus
 
+    @property
+    def executor(self) -> StrategyExecutor:
+        """Returns the persistent StrategyExecutor or the execution mode of
+        strategy(). Default: None"""
+        return self._executor
+
+    @executor.setter
+    def executor(self, value: StrategyExecutor) -> None:
+        """property: df.ta.executor = ta.StrategyExecutor() or one of "auto",
+        "process", "serial" or "thread" """
+        if isinstance(value, str) and value.lower() in self._executor_modes:
+            self._executor = value.lower()
+        else:
+            self._executor = value if isinstance(value, StrategyExecutor) else None
+
     @property
     def exchange(self) -> str:
         """Returns the current Exchange. Default: "NYSE"."""
@@ -396,7 +418,8 @@ class AnalysisIndicators(BasePandasObject):
                 result.columns = [prefix + column + suffix for column in result.columns]
 
     def _append(self, result=None, **kwargs) -> None:
-        """Appends a Pandas Series or DataFrame columns to self._df."""
+        """Appends a Pandas Series or DataFrame columns to self._df. During a
+        strategy() the columns are collected and appended at once."""
         if "append" in kwargs and kwargs["append"]:
             df = self._df
             if df is None or result is None: return
@@ -406,25 +429,42 @@ class AnalysisIndicators(BasePandasObject):
                 if "col_names" in kwargs and not isinstance(kwargs["col_names"], tuple):
                     kwargs["col_names"] = (kwargs["col_names"],) # Note: tuple(kwargs["col_names"]) doesn't work
 
+                # Appended columns replace any column a SharedPlan memoized
+                plan = active_plan()
+                if plan is not None:
+                    names = result.columns if isinstance(result, DataFrame) else [result.name]
+                    [plan.invalidate(x) for x in kwargs.get("col_names", names)]
+
                 if isinstance(result, DataFrame):
                     # If specified in kwargs, rename the columns.
                     # If not, use the default names.
                     if "col_names" in kwargs and isinstance(kwargs["col_names"], tuple):
                         if len(kwargs["col_names"]) >= len(result.columns):
-                            for col, ind_name in zip(result.columns, kwargs["col_names"]):
-                                df[ind_name] = result.loc[:, col]
+                            columns = [(ind_name, result.loc[:, col]) for col, ind_name in zip(result.columns, kwargs["col_names"])]
                         else:
                             print(f"Not enough col_names were specified : got {len(kwargs['col_names'])}, expected {len(result.columns)}.")
                             return
                     else:
-                        for i, column in enumerate(result.columns):
-                            df[column] = result.iloc[:, i]
+                        columns = [(column, result.iloc[:, i]) for i, column in enumerate(result.columns)]
                 else:
                     ind_name = (
                         kwargs["col_names"][0] if "col_names" in kwargs and
                         isinstance(kwargs["col_names"], tuple) else result.name
                     )
-                    df[ind_name] = result
+                    columns = [(ind_name, result)]
+
+                if self._pending is not None:
+                    self._pending.update(columns)
+                else:
+                    for ind_name, column in columns:
+                        df[ind_name] = column
+
+    def _block(self, columns: dict) -> DataFrame:
+        """Builds the DataFrame of the collected columns in a single
+        allocation, aligned to the index of self._df."""
+        if len(columns) == 0:
+            return DataFrame(index=self._df.index)
+        return DataFrame(columns, index=self._df.index)
 
     def _check_na_columns(self, stdout: bool = True):
         """Returns the columns in which all it's values are na."""
@@ -443,9 +483,13 @@ class AnalysisIndicators(BasePandasObject):
             return df[self.adjusted] if self.adjusted is not None else None
         # Ok.  So it's a str.
         elif isinstance(series, str):
-            # Return the df column since it's in there.
+            # Return the column collected by strategy() or the df column
+            # since it's in there.
+            if self._pending is not None and series in self._pending:
+                return self._pending[series]
             if series in df.columns:
-                return df[series]
+                plan = active_plan()
+                return plan.column(df, series) if plan is not None else df[series]
             else:
                 # Attempt to match the 'series' because it was likely
                 # misspelled.
@@ -458,7 +502,7 @@ class AnalysisIndicators(BasePandasObject):
 
     def _indicators_by_category(self, name: str) -> list:
         """Returns indicators by Categorical name."""
-        return Category[name] if name in self.categories else None
+        return list(Category[name]) if name in self.categories else None
 
     def _mp_worker(self, arguments: tuple):
         """Multiprocessing Worker to handle different Methods."""
@@ -569,7 +613,7 @@ class AnalysisIndicators(BasePandasObject):
         """
         as_list = kwargs.setdefault("as_list", False)
         # Public non-indicator methods
-        helper_methods = ["constants", "indicators", "strategy"]
+        helper_methods = ["constants", "indicators", "sessions", "strategy", "update"]
         # Public df.ta.properties
         ta_properties = [
             "adjusted",
@@ -577,6 +621,7 @@ class AnalysisIndicators(BasePandasObject):
             "cores",
             "datetime_ordered",
             "exchange",
+            "executor",
             "last_run",
             "reverse",
             "ticker",
@@ -586,10 +631,9 @@ class AnalysisIndicators(BasePandasObject):
         ]
 
         # Public non-indicator methods
-        # Note: cuDF doesn't support register_dataframe_accessor, so we create a dummy DataFrame
-        dummy_df = DataFrame()
-        dummy_df.ta = AnalysisIndicators(dummy_df)
-        ta_indicators = list((x for x in dir(dummy_df.ta) if not x.startswith("_") and not x.endswith("_")))
+        # Note: cuDF doesn't support register_dataframe_accessor, so we inspect a dummy accessor
+        dummy_ta = AnalysisIndicators(DataFrame())
+        ta_indicators = list((x for x in dir(dummy_ta) if not x.startswith("_") and not x.endswith("_")))
 
         # Add Pandas TA methods and properties to be removed
         removed = helper_methods + ta_properties
@@ -614,40 +658,33 @@ class AnalysisIndicators(BasePandasObject):
         else:
             print(s)
 
-    def strategy(self, *args, **kwargs):
-        """Strategy Method
+    def sessions(self, anchor: str = "D") -> npNdarray:
+        """Session Ids
 
-        An experimental method that by default runs all applicable indicators.
-        Future implementations will allow more specific indicator generation
-        with possibly as json, yaml config file or an sqlite3 table.
+        The session of every row for an anchor, see help(ta.session_ids).
+        They are computed once per DataFrame and index and kept with the
+        DataFrame, so anchored indicators like vwap do not convert the index
+        to periods on every call.
 
+        Args:
+            anchor (str): A Timeseries Offset Alias. Default: "D"
 
-        Kwargs:
-            chunksize (bool): Adjust the chunksize for the Multiprocessing Pool.
-                Default: Number of cores of the OS
-            exclude (list): List of indicator names to exclude. Some are
-                excluded by default for various reasons; they require additional
-                sources, performance (td_seq), not a ohlcv chart (vp) etc.
-            name (str): Select all indicators or indicators by
-                Category such as: "candles", "cycles", "momentum", "overlap",
-                "performance", "statistics", "trend", "volatility", "volume", or
-                "all". Default: "all"
-            ordered (bool): Whether to run "all" in order. Default: True
-            timed (bool): Show the process time of the strategy().
-                Default: False
-            verbose (bool): Provide some additional insight on the progress of
-                the strategy() execution. Default: False
+        Returns:
+            np.ndarray: The session ids.
         """
-        # If True, it returns the resultant DataFrame. Default: False
-        returns = kwargs.pop("returns", False)
-        # cpus = cpu_count()
-        # Ensure indicators are appended to the DataFrame
-        kwargs["append"] = True
-        all_ordered = kwargs.pop("ordered", True)
-        mp_chunksize = kwargs.pop("chunksize", self.cores)
-
-        # Initialize
-        initial_column_count = len(self._df.columns)
+        df = self._df
+        anchor = anchor.upper() if anchor and isinstance(anchor, str) else "D"
+        cache = getattr(df, "_ta_sessions", None)
+        if cache is None or cache[0] is not df.index:
+            # Keyed by the index object, which is replaced, not mutated
+            cache = (df.index, {})
+            object.__setattr__(df, "_ta_sessions", cache)
+        if anchor not in cache[1]:
+            cache[1][anchor] = session_ids(df.index, anchor)
+        return cache[1][anchor]
+
+    def _strategy_indicators(self, *args, exclude: list = None) -> tuple:
+        """Helper method to collect the indicators of a strategy. Returns tuple: (name:str, mode:dict, excluded:list, ta:list) where ta is None if it is not an available strategy."""
         excluded = [
             "above",
             "above_value",
@@ -658,7 +695,6 @@ class AnalysisIndicators(BasePandasObject):
             # "data", # reserved
             "long_run",
             "short_run",
-            "td_seq", # Performance exclusion
             "tsignals",
             "vp",
             "xsignals",
@@ -668,9 +704,8 @@ class AnalysisIndicators(BasePandasObject):
         name, mode = self._strategy_mode(*args)
 
         # If All or a Category, exclude user list if any
-        user_excluded = kwargs.pop("exclude", [])
-        if mode["all"] or mode["category"]:
-            excluded += user_excluded
+        if (mode["all"] or mode["category"]) and exclude is not None:
+            excluded += exclude
 
         # Collect the indicators, remove excluded or include kwarg["append"]
         if mode["category"]:
@@ -683,8 +718,7 @@ class AnalysisIndicators(BasePandasObject):
         elif mode["all"]:
             ta = self.indicators(as_list=True, exclude=excluded)
         else:
-            print(f"[X] Not an available strategy.")
-            return None
+            return name, mode, excluded, None
 
         # Remove Custom indicators with "length" keyword when larger than the DataFrame
         # Possible to have other indicator main window lengths to be included
@@ -695,6 +729,66 @@ class AnalysisIndicators(BasePandasObject):
             if _: removal.append(kwds)
         if len(removal) > 0: [ta.remove(x) for x in removal]
 
+        return name, mode, excluded, ta
+
+    def strategy(self, *args, **kwargs):
+        """Strategy Method
+
+        An experimental method that by default runs all applicable indicators.
+        Future implementations will allow more specific indicator generation
+        with possibly as json, yaml config file or an sqlite3 table.
+
+
+        Kwargs:
+            append (bool): If False, the DataFrame is left untouched and the
+                indicators are returned as a separate DataFrame. Default: True
+            chunksize (int): Number of indicators per chunk sent to a
+                Multiprocessing worker. Default: Total indicators / cores
+            executor (StrategyExecutor, str): A persistent pool of workers to
+                use instead of starting a new Pool for this call. See
+                help(ta.StrategyExecutor). Or how to evaluate the indicators:
+                "process" (a temporary Pool), "thread" (a pool of threads
+                sharing the DataFrame without pickling), "serial" or "auto"
+                to choose by the number of rows and indicators. See
+                help(ta.select_executor). Default: df.ta.executor or
+                "process" if df.ta.cores > 0 else "serial"
+            exclude (list): List of indicator names to exclude. Some are
+                excluded by default for various reasons; they require additional
+                sources, not a ohlcv chart (vp) etc.
+            name (str): Select all indicators or indicators by
+                Category such as: "candles", "cycles", "momentum", "overlap",
+                "performance", "statistics", "trend", "volatility", "volume", or
+                "all". Default: "all"
+            ordered (bool): Whether to run "all" in order. Default: True
+            shared (bool): Without multiprocessing, evaluate the primitives
+                shared by the indicators (atr, ema, hl2, rma, true_range, ...)
+                only once. See help(ta.SharedPlan). Default: True
+            timed (bool): Show the process time of the strategy().
+                Default: False
+            verbose (bool): Provide some additional insight on the progress of
+                the strategy() execution. Default: False
+        """
+        # If True, it returns the resultant DataFrame. Default: False
+        returns = kwargs.pop("returns", False)
+        # If False, returns the indicators without appending them. Default: True
+        append = kwargs.pop("append", True)
+        # cpus = cpu_count()
+        # Ensure indicators are collected for the DataFrame
+        kwargs["append"] = True
+        all_ordered = kwargs.pop("ordered", True)
+        mp_chunksize = kwargs.pop("chunksize", None)
+        executor = kwargs.pop("executor", self.executor)
+        shared = kwargs.pop("shared", True)
+
+        # Initialize
+        initial_column_count = len(self._df.columns)
+
+        # Get the Strategy Name, mode and indicators
+        name, mode, excluded, ta = self._strategy_indicators(*args, exclude=kwargs.pop("exclude", []))
+        if ta is None:
+            print(f"[X] Not an available strategy.")
+            return None
+
         verbose = kwargs.pop("verbose", False)
         if verbose:
             print(f"[+] Strategy: {name}\n[i] Indicator arguments: {kwargs}")
@@ -704,13 +798,22 @@ class AnalysisIndicators(BasePandasObject):
 
         timed = kwargs.pop("timed", False)
         results = []
-        use_multiprocessing = True if self.cores > 0 else False
+        if isinstance(executor, str) and executor.lower() in self._executor_modes:
+            execution = executor.lower()
+            executor = None
+        elif isinstance(executor, StrategyExecutor):
+            execution = "process"
+        else:
+            executor = None
+            execution = "process" if self.cores > 0 else "serial"
+        if execution == "auto":
+            execution = select_executor(self._df.shape[0], len(ta), self.cores)
         has_col_names = False
 
         if timed:
             stime = perf_counter()
 
-        if use_multiprocessing and mode["custom"]:
+        if execution != "serial" and mode["custom"]:
             # Determine if the Custom Model has 'col_names' parameter
             has_col_names = (True if len([
                 True for x in ta
@@ -718,93 +821,176 @@ class AnalysisIndicators(BasePandasObject):
             ]) else False)
 
             if has_col_names:
-                use_multiprocessing = False
+                execution = "serial"
 
         if Imports["tqdm"]:
             # from tqdm import tqdm
             from tqdm import tqdm
 
-        if use_multiprocessing:
-            _total_ta = len(ta)
-            with Pool(self.cores) as pool:
-                # Some magic to optimize chunksize for speed based on total ta indicators
-                _chunksize = mp_chunksize - 1 if mp_chunksize > _total_ta else int(npLog10(_total_ta)) + 1
-                if verbose:
-                    print(f"[i] Multiprocessing {_total_ta} indicators with {_chunksize} chunks and {self.cores}/{cpu_count()} cpus.")
-
-                results = None
+        # Collect the columns of the indicators and append them at once
+        self._pending = {}
+        try:
+            if execution != "serial":
+                # Create a list of all the indicators as (method, args, kwargs)
                 if mode["custom"]:
-                    # Create a list of all the custom indicators into a list
-                    custom_ta = [(
+                    tasks = [(
                         ind["kind"],
                         ind["params"] if "params" in ind and isinstance(ind["params"], tuple) else (),
                         {**ind, **kwargs},
                     ) for ind in ta]
-                    # Custom multiprocessing pool. Must be ordered for Chained Strategies
-                    # May fix this to cpus if Chaining/Composition if it remains
-                    results = pool.imap(self._mp_worker, custom_ta, _chunksize)
                 else:
-                    default_ta = [(ind, tuple(), kwargs) for ind in ta]
-                    # All and Categorical multiprocessing pool.
-                    if all_ordered:
-                        if Imports["tqdm"]:
-                            results = tqdm(pool.imap(self._mp_worker, default_ta, _chunksize)) # Order over Speed
-                        else:
-                            results = pool.imap(self._mp_worker, default_ta, _chunksize) # Order over Speed
-                    else:
-                        if Imports["tqdm"]:
-                            results = tqdm(pool.imap_unordered(self._mp_worker, default_ta, _chunksize)) # Speed over Order
-                        else:
-                            results = pool.imap_unordered(self._mp_worker, default_ta, _chunksize) # Speed over Order
-                if results is None:
-                    print(f"[X] ta.strategy('{name}') has no results.")
-                    return
+                    tasks = [(ind, tuple(), kwargs) for ind in ta]
 
-                pool.close()
-                pool.join()
+            if execution == "thread":
+                # The threads share self._df, the results are appended afterwards
+                tasks = [(method, args, {**kwds, "append": False}) for method, args, kwds in tasks]
+                cores = self.cores if self.cores > 0 else cpu_count()
+                if verbose:
+                    print(f"[i] Multithreading {len(tasks)} indicators with {min(cores, len(tasks))} threads.")
+
+                results = thread_map(
+                    self, tasks, cores=cores, shared=shared,
+                    # Custom must be ordered for Chained Strategies
+                    ordered=all_ordered or mode["custom"],
+                    progress=not mode["custom"],
+                )
                 self._last_run = get_time(self.exchange, to_string=True)
 
-        else:
-            # Without multiprocessing:
-            if verbose:
-                _col_msg = f"[i] No mulitproccessing (cores = 0)."
-                if has_col_names:
-                    _col_msg = f"[i] No mulitproccessing support for 'col_names' option."
-                print(_col_msg)
-
-            if mode["custom"]:
-                if Imports["tqdm"] and verbose:
-                    pbar = tqdm(ta, f"[i] Progress")
-                    for ind in pbar:
-                        params = ind["params"] if "params" in ind and isinstance(ind["params"], tuple) else tuple()
-                        getattr(self, ind["kind"])(*params, **{**ind, **kwargs})
-                else:
-                    for ind in ta:
-                        params = ind["params"] if "params" in ind and isinstance(ind["params"], tuple) else tuple()
-                        getattr(self, ind["kind"])(*params, **{**ind, **kwargs})
-            else:
-                if Imports["tqdm"] and verbose:
-                    pbar = tqdm(ta, f"[i] Progress")
-                    for ind in pbar:
-                        getattr(self, ind)(*tuple(), **kwargs)
-                else:
-                    for ind in ta:
-                        getattr(self, ind)(*tuple(), **kwargs)
+            elif execution == "process":
+                # Use the persistent executor if given, otherwise a temporary one
+                transient = executor is None
+                if transient:
+                    executor = StrategyExecutor(self.cores)
+                if verbose:
+                    _pool = "persistent" if not transient else "temporary"
+                    print(f"[i] Multiprocessing {len(tasks)} indicators with a {_pool} pool of {executor.cores}/{cpu_count()} cpus.")
+
+                try:
+                    results = executor.map(
+                        self._df, tasks, chunksize=mp_chunksize, shared=shared,
+                        # Custom must be ordered for Chained Strategies
+                        ordered=all_ordered or mode["custom"],
+                        progress=not mode["custom"],
+                    )
+                finally:
+                    if transient: executor.close()
                 self._last_run = get_time(self.exchange, to_string=True)
 
-        # Apply prefixes/suffixes and appends indicator results to the  DataFrame
-        [self._post_process(r, **kwargs) for r in results]
+            else:
+                # Without multiprocessing:
+                if verbose:
+                    _col_msg = f"[i] No mulitproccessing (cores = 0 or executor = 'serial')."
+                    if has_col_names:
+                        _col_msg = f"[i] No mulitproccessing support for 'col_names' option."
+                    print(_col_msg)
+
+                # Evaluate the primitives shared by the indicators only once
+                plan = SharedPlan() if shared else nullcontext()
+                with plan:
+                    if mode["custom"]:
+                        if Imports["tqdm"] and verbose:
+                            pbar = tqdm(ta, f"[i] Progress")
+                            for ind in pbar:
+                                params = ind["params"] if "params" in ind and isinstance(ind["params"], tuple) else tuple()
+                                getattr(self, ind["kind"])(*params, **{**ind, **kwargs})
+                        else:
+                            for ind in ta:
+                                params = ind["params"] if "params" in ind and isinstance(ind["params"], tuple) else tuple()
+                                getattr(self, ind["kind"])(*params, **{**ind, **kwargs})
+                    else:
+                        if Imports["tqdm"] and verbose:
+                            pbar = tqdm(ta, f"[i] Progress")
+                            for ind in pbar:
+                                getattr(self, ind)(*tuple(), **kwargs)
+                        else:
+                            for ind in ta:
+                                getattr(self, ind)(*tuple(), **kwargs)
+                        self._last_run = get_time(self.exchange, to_string=True)
+
+                if verbose and shared:
+                    print(f"[i] Shared Plan: {plan.summary()}")
+
+            # Append the indicator results of the workers to the DataFrame.
+            # Prefixes/suffixes and col_numbers were applied by the workers.
+            [self._append(result=r, **kwargs) for r in results]
+        finally:
+            columns, self._pending = self._pending, None
+        block = self._block(columns)
+        if append:
+            # Assign the finished block to the DataFrame in place with one
+            # concat, so the DataFrame is not fragmented column by column.
+            # Overwritten columns keep their position, new ones are appended.
+            df = self._df
+            if len(block.columns):
+                added = [x for x in block.columns if x not in df.columns]
+                kept = df.drop(columns=[x for x in block.columns if x in df.columns])
+                _update_inplace(df, concat([kept, block], axis=1)[list(df.columns) + added])
 
         if verbose:
             print(f"[i] Total indicators: {len(ta)}")
-            print(f"[i] Columns added: {len(self._df.columns) - initial_column_count}")
+            _added = len(self._df.columns) - initial_column_count if append else len(block.columns)
+            print(f"[i] Columns added: {_added}")
             print(f"[i] Last Run: {self._last_run}")
         if timed:
             print(f"[i] Runtime: {final_time(stime)}")
 
+        if not append: return block
         if returns: return self._df
 
 
+    def update(self, new_rows: DataFrame, *args, **kwargs) -> DataFrame:
+        """Update Method
+
+        Appends new bars to a DataFrame whose indicators were calculated by
+        strategy() and calculates the indicators of the new bars. The state
+        of the indicators is a ta.stream.StrategyStream that is kept with
+        the returned DataFrame, so the next update() continues from it:
+        * Indicators with a Stream (adx, atr, bbands, ema, hwma, jma, kama,
+          macd, mcgd, psar, rma, rsi, rsx, sma, ssf, stdev, stoch,
+          supertrend, t3, td_seq, vidya, willr) only calculate the new bars,
+          with the values of strategy() on the whole history.
+        * All other indicators are recalculated on a tail of the history
+          long enough for the values of strategy() on the whole history up
+          to rounding, or on the whole history if none is. The first
+        update() of a DataFrame, or of one changed since, builds the state
+        from the history.
+
+        The returned DataFrame is a copy of the history with the new bars.
+        To get only the new bars without copying the history, use the
+        StrategyStream directly.
+
+        Example:
+        >>> df.ta.strategy("Momentum")
+        >>> df = df.ta.update(new_bars, "Momentum")
+
+        Args:
+            new_rows (DataFrame): The new bars with the same source columns
+                (open, high, low, close, volume, ...) as the DataFrame.
+            args: The Strategy or its name as in strategy().
+
+        Kwargs:
+            All kwargs are passed to the indicators as in strategy().
+
+        Returns:
+            DataFrame: A new DataFrame with the new rows and their indicators
+                appended.
+        """
+        from pandas_ta.stream import StrategyStream
+
+        df = self._df
+        if new_rows is None or new_rows.shape[0] == 0:
+            return df
+
+        key = repr((args, sorted(kwargs.items())))
+        state = getattr(df, "_ta_stream", None)
+        if state is None or state[0] != key or state[1].rows != df.shape[0] or not df.index[-1:].equals(state[2]):
+            state = (key, StrategyStream(df, *args, **kwargs))
+        key, stream = state[:2]
+
+        result = concat([df, stream.update(new_rows)])
+        object.__setattr__(result, "_ta_stream", (key, stream, result.index[-1:]))
+        return result
+
     def ticker(self, ticker: str, **kwargs):
         """ticker
 
@@ -1313,6 +1499,9 @@ class AnalysisIndicators(BasePandasObject):
 
         if not self.datetime_ordered:
             volume.index = self._df.index
+        if volume.index is self._df.index and "sessions" not in kwargs:
+            anchors = anchor if isinstance(anchor, (list, tuple)) else [anchor]
+            kwargs["sessions"] = {x: self.sessions(x) for x in anchors}
 
         result = vwap(high=high, low=low, close=close, volume=volume, anchor=anchor, offset=offset, **kwargs)
         return self._post_process(result, **kwargs)
@@ -1758,12 +1947,26 @@ class AnalysisIndicators(BasePandasObject):
         return self._post_process(result, **kwargs)
 
 
-# Register the 'ta' accessor for cuDF DataFrames
+def _update_inplace(df: DataFrame, result: DataFrame) -> None:
+    """Replaces the data of df by the data of result, keeping the df object
+    that the caller holds."""
+    if hasattr(df, "_mimic_inplace"):
+        # cuDF
+        df._mimic_inplace(result, inplace=True)
+    else:
+        df._update_inplace(result._consolidate())
+
+
+# Register the 'ta' accessor for pandas and cuDF DataFrames
 # Since cuDF doesn't support register_dataframe_accessor, we monkey-patch it
 def _get_ta_accessor(self):
-    """Returns the Technical Analysis accessor for cuDF DataFrames"""
+    """Returns the Technical Analysis accessor for pandas and cuDF DataFrames"""
     return AnalysisIndicators(self)
 
-# Add the 'ta' property to cuDF DataFrame class
-if not hasattr(DataFrame, 'ta'):
-    DataFrame.ta = property(_get_ta_accessor)
+def _register_accessor():
+    """Adds the 'ta' property to the DataFrame class of each loaded backend"""
+    for _DataFrame in classes("DataFrame"):
+        if not hasattr(_DataFrame, "ta"):
+            _DataFrame.ta = property(_get_ta_accessor)
+
+_register_accessor()
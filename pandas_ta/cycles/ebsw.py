@@ -5,7 +5,7 @@ from numpy import nan as npNaN
 from numpy import pi as npPi
 from numpy import sin as npSin
 from numpy import sqrt as npSqrt
-from pandas import Series
+from pandas_ta.backend import Series
 from pandas_ta.utils import get_offset, verify_series
 
 
@@ -0,0 +1,408 @@
+# -*- coding: utf-8 -*-
+from concurrent.futures import as_completed, ThreadPoolExecutor
+from contextlib import nullcontext
+from multiprocessing import cpu_count, Pool
+from sys import getrefcount
+
+from numpy import array_split, asarray, ndarray
+from numpy import dtype as npDtype
+
+from pandas_ta import Imports
+from pandas_ta.utils import SharedPlan
+
+try:
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:
+    SharedMemory = None
+
+
+class StrategyExecutor:
+    """Strategy Executor
+
+    A long-lived pool of worker processes for ta.strategy(). The workers are
+    started on first use and stay warm between strategy() calls so that
+    running a Strategy over thousands of DataFrames does not pay the process
+    spawn for each one.
+
+    Instead of pickling the accessor (and its DataFrame) into every indicator
+    task, the indicators are split into chunks. With the default "shm"
+    transport, the numeric columns and the index are published once per
+    DataFrame in shared memory and the workers read them through zero-copy
+    NumPy views. Each worker writes the numeric results of its chunk into a
+    single shared output block, so only names and offsets are pickled. With
+    the "pickle" transport the DataFrame is shipped once per chunk and the
+    results are pickled back. Each worker evaluates its chunk in a SharedPlan.
+
+    Example:
+    >>> executor = ta.StrategyExecutor(cores=4)
+    >>> for df in frames:
+    ...     df.ta.strategy("All", executor=executor)
+    >>> executor.close()
+
+    Or as a context manager:
+    >>> with ta.StrategyExecutor() as executor:
+    ...     for df in frames:
+    ...         df.ta.strategy("Momentum", executor=executor)
+
+    Args:
+        cores (int): Number of worker processes. Default: cpu_count()
+        chunks (int): Number of chunks per worker. More chunks balance the
+            load better at the cost of more transfers. Default: 1
+        transport (str): How the DataFrame and the results are exchanged with
+            the workers: "shm" (shared memory) or "pickle". Default: "shm" if
+            multiprocessing.shared_memory is available.
+    """
+
+    def __init__(self, cores: int = None, chunks: int = None, transport: str = None):
+        cpus = cpu_count()
+        self.cores = int(cores) if isinstance(cores, int) and 0 < cores <= cpus else cpus
+        self.chunks = int(chunks) if isinstance(chunks, int) and chunks > 0 else 1
+        transport = transport.lower() if isinstance(transport, str) else "shm"
+        self.transport = "shm" if transport == "shm" and SharedMemory is not None else "pickle"
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    @property
+    def pool(self) -> Pool:
+        """The worker pool. Started on first use."""
+        if self._pool is None:
+            self._pool = Pool(self.cores)
+        return self._pool
+
+    @property
+    def running(self) -> bool:
+        return self._pool is not None
+
+    def close(self) -> None:
+        """Waits for the workers to finish and stops them."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def terminate(self) -> None:
+        """Stops the workers immediately."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def map(self, df, tasks: list, **kwargs) -> list:
+        """Evaluates the (method, args, kwargs) tasks of a Strategy on df.
+
+        Args:
+            df (DataFrame): The DataFrame the indicators are calculated on.
+            tasks (list): List of (method, args, kwargs) tuples.
+
+        Kwargs:
+            chunksize (int): Tasks per chunk. Default: len(tasks) / (cores * chunks)
+            ordered (bool): Return the results in the order of the tasks.
+                Default: True
+            progress (bool): Show a progress bar if tqdm is installed.
+                Default: False
+            shared (bool): Evaluate each chunk in a SharedPlan. Default: True
+
+        Returns:
+            list: The result of each task.
+        """
+        if len(tasks) == 0: return []
+        chunksize = kwargs.pop("chunksize", None)
+        ordered = kwargs.pop("ordered", True)
+        progress = kwargs.pop("progress", False)
+        shared = kwargs.pop("shared", True)
+
+        if isinstance(chunksize, int) and chunksize > 0:
+            total_chunks = -(-len(tasks) // chunksize)
+        else:
+            total_chunks = min(len(tasks), self.cores * self.chunks)
+        chunks = [list(_) for _ in array_split(range(len(tasks)), total_chunks)]
+
+        with _SharedFrame(df) if self.transport == "shm" else nullcontext(df) as frame:
+            jobs = [(frame, [tasks[i] for i in chunk], shared) for chunk in chunks]
+
+            imap = self.pool.imap if ordered else self.pool.imap_unordered
+            results = imap(_run_chunk, jobs)
+            if progress and Imports["tqdm"]:
+                from tqdm import tqdm
+                results = tqdm(results, total=len(jobs))
+
+            if self.transport == "shm":
+                results = (_receive(chunk, df.index) for chunk in results)
+            return [result for chunk in results for result in chunk]
+
+
+# Thresholds of select_executor()
+SERIAL_WORK = 250_000 # rows * indicators
+PROCESS_ROWS = 100_000
+
+
+def select_executor(rows: int, indicators: int, cores: int = None) -> str:
+    """Picks how a Strategy is evaluated: "serial", "thread" or "process".
+
+    Small workloads (rows * indicators < SERIAL_WORK) or a single core run
+    serially. Medium-sized DataFrames (rows < PROCESS_ROWS) run in threads,
+    which share the DataFrame without pickling while the NumPy kernels
+    release the GIL. Larger DataFrames run in worker processes where the
+    pure Python indicators do not contend for the GIL.
+
+    Args:
+        rows (int): Number of rows of the DataFrame.
+        indicators (int): Number of indicators of the Strategy.
+        cores (int): Available cores. Default: cpu_count()
+
+    Returns:
+        str: "serial", "thread" or "process"
+    """
+    cores = cores if isinstance(cores, int) and cores > 0 else cpu_count()
+    if cores < 2 or indicators < 2 or rows * indicators < SERIAL_WORK:
+        return "serial"
+    if rows < PROCESS_ROWS:
+        return "thread"
+    return "process"
+
+
+def thread_map(ta, tasks: list, **kwargs) -> list:
+    """Evaluates the (method, args, kwargs) tasks of a Strategy in a pool of
+    threads sharing the accessor ta. The tasks must not append their results;
+    the caller appends them once all threads are done.
+
+    Args:
+        ta (AnalysisIndicators): The accessor of the DataFrame.
+        tasks (list): List of (method, args, kwargs) tuples.
+
+    Kwargs:
+        cores (int): Number of threads. Default: cpu_count()
+        ordered (bool): Return the results in the order of the tasks.
+            Default: True
+        progress (bool): Show a progress bar if tqdm is installed.
+            Default: False
+        shared (bool): Evaluate the tasks in one SharedPlan shared by the
+            threads. Default: True
+
+    Returns:
+        list: The result of each task.
+    """
+    if len(tasks) == 0: return []
+    cores = kwargs.pop("cores", None)
+    cores = cores if isinstance(cores, int) and cores > 0 else cpu_count()
+    ordered = kwargs.pop("ordered", True)
+    progress = kwargs.pop("progress", False)
+    plan = SharedPlan() if kwargs.pop("shared", True) else nullcontext()
+
+    def _run(task):
+        with plan:
+            result = ta._mp_worker(task)
+        return None if result is ta._df else result
+
+    with plan, ThreadPoolExecutor(min(cores, len(tasks))) as pool:
+        futures = [pool.submit(_run, task) for task in tasks]
+        done = futures if ordered else as_completed(futures)
+        if progress and Imports["tqdm"]:
+            from tqdm import tqdm
+            done = tqdm(done, total=len(futures))
+        return [future.result() for future in done]
+
+
+def _run_chunk(job: tuple) -> list:
+    """Worker: Evaluates a chunk of Strategy tasks on its copy of the DataFrame."""
+    from pandas_ta.core import AnalysisIndicators
+
+    frame, tasks, shared = job
+    is_shared = isinstance(frame, _SharedFrame)
+    _release_attached()
+    ta = AnalysisIndicators(frame.attach() if is_shared else frame)
+    # Appended results are collected like in strategy() rather than inserted
+    # column by column into the copy of the DataFrame
+    ta._pending = {}
+
+    results = []
+    with SharedPlan() if shared else nullcontext():
+        for task in tasks:
+            result = ta._mp_worker(task)
+            # Indicators without a result return the DataFrame itself
+            results.append(None if result is ta._df else result)
+
+    if is_shared:
+        results = _send(results, ta._df.index)
+        _attached.append(frame.detach())
+    return results
+
+
+# Shared Memory Transport
+# Worker: Blocks attached by previous chunks. NumPy views of a block keep a
+# reference to its mmap but do not prevent SharedMemory.close() from unmapping
+# it, so a block is only closed once no view (i.e. in a result that is still
+# being pickled back) refers to it anymore.
+_attached = []
+
+
+def _release_attached() -> None:
+    for shm in _attached[:]:
+        # References: shm._mmap, shm.buf and the argument of getrefcount
+        if getrefcount(shm._mmap) <= 3:
+            shm.close()
+            _attached.remove(shm)
+
+
+def _is_shareable(x) -> bool:
+    return isinstance(x, ndarray) and x.ndim == 1 and x.dtype.kind in "biufmM"
+
+
+def _values(x) -> ndarray:
+    """Host NumPy array of a Series or an Index."""
+    return asarray(x.to_numpy() if hasattr(x, "to_numpy") else x)
+
+
+class _Layout:
+    """Places 1-D arrays back to back (8 byte aligned) in one shared block."""
+
+    def __init__(self):
+        self.fields, self.size = [], 0
+
+    def add(self, x: ndarray) -> tuple:
+        field = (x.dtype.str, x.shape[0], self.size)
+        self.size += -(-x.nbytes // 8) * 8
+        self.fields.append(field)
+        return field
+
+    def allocate(self) -> SharedMemory:
+        return SharedMemory(create=True, size=max(self.size, 8))
+
+
+def _view(shm: SharedMemory, field: tuple, readonly: bool = False) -> ndarray:
+    dtype, n, offset = field
+    x = ndarray((n,), dtype=npDtype(dtype), buffer=shm.buf, offset=offset)
+    if readonly: x.flags.writeable = False
+    return x
+
+
+class _SharedFrame:
+    """A DataFrame published in shared memory.
+
+    Main process: creates the block, copies the shareable columns and the
+    index into it and unlinks it on exit. Workers: attach() returns a
+    DataFrame of zero-copy, read-only views into the block.
+    """
+
+    def __init__(self, df):
+        layout, columns, other = _Layout(), [], {}
+        for name in df.columns:
+            x = _values(df[name])
+            if _is_shareable(x):
+                columns.append((name, layout.add(x), x))
+            else:
+                other[name] = df[name]
+
+        index = _values(df.index)
+        index_field = layout.add(index) if _is_shareable(index) else None
+
+        self._shm = layout.allocate()
+        for _, field, x in columns:
+            _view(self._shm, field)[:] = x
+        if index_field is not None:
+            _view(self._shm, index_field)[:] = index
+
+        self.name = self._shm.name
+        self.columns = [(name, field) for name, field, _ in columns]
+        self.order = list(df.columns)
+        self.other = other
+        self.index = index_field if index_field is not None else df.index
+        self.index_name = df.index.name
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._shm.close()
+        self._shm.unlink()
+        return False
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_shm"] = None
+        return state
+
+    def attach(self):
+        from pandas_ta.core import DataFrame
+
+        self._shm = SharedMemory(name=self.name)
+        shared = {name: _view(self._shm, field, readonly=True) for name, field in self.columns}
+        data = {name: shared[name] if name in shared else self.other[name] for name in self.order}
+        index = self.index
+        if isinstance(index, tuple):
+            index = _view(self._shm, index, readonly=True)
+        df = DataFrame(data, index=index, copy=False)
+        df.index.name = self.index_name
+        return df
+
+    def detach(self) -> SharedMemory:
+        """Worker: Hands over the attached block without closing it."""
+        shm, self._shm = self._shm, None
+        return shm
+
+
+def _send(results: list, index) -> tuple:
+    """Worker: Writes the columns of the results that share the index of the
+    DataFrame into a single shared output block. Returns the block name and,
+    for each result, either its layout or the result itself to be pickled."""
+    layout, sent, arrays = _Layout(), [], []
+    for result in results:
+        columns = None
+        if hasattr(result, "index") and len(result.index) == len(index) and \
+                (result.index is index or result.index.equals(index)):
+            is_frame = hasattr(result, "columns")
+            series = [result[c] for c in result.columns] if is_frame else [result]
+            values = [_values(_) for _ in series]
+            if all(_is_shareable(_) for _ in values):
+                columns = [(_.name, layout.add(x)) for _, x in zip(series, values)]
+                arrays.extend(values)
+
+        if columns is None:
+            sent.append(("pickle", result))
+        else:
+            meta = {_: getattr(result, _) for _ in ("name", "category") if hasattr(result, _)}
+            sent.append(("frame" if is_frame else "series", columns, meta))
+
+    if not arrays: return None, sent
+    shm = layout.allocate()
+    for field, x in zip(layout.fields, arrays):
+        _view(shm, field)[:] = x
+    name = shm.name
+    shm.close()
+    return name, sent
+
+
+def _receive(chunk: tuple, index) -> list:
+    """Main process: Rebuilds the results of a worker from its shared output
+    block and frees the block."""
+    from pandas_ta.core import DataFrame, Series
+
+    name, sent = chunk
+    shm = SharedMemory(name=name) if name is not None else None
+    try:
+        results = []
+        for item in sent:
+            if item[0] == "pickle":
+                results.append(item[1])
+                continue
+
+            kind, columns, meta = item
+            data = {c: Series(_view(shm, field).copy(), index=index, name=c) for c, field in columns}
+            if kind == "series":
+                result = next(iter(data.values()))
+            else:
+                result = DataFrame(data, index=index)
+            for attr, value in meta.items():
+                setattr(result, attr, value)
+            results.append(result)
+        return results
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
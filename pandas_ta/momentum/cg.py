@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, verify_series, weights
+from numpy import float64
+from pandas_ta.backend import Series
+from pandas_ta.utils import get_offset, verify_series, weighted_window
 
 
 def cg(close, length=None, offset=None, **kwargs):
@@ -13,7 +15,8 @@ def cg(close, length=None, offset=None, **kwargs):
 
     # Calculate Result
     coefficients = [length - i for i in range(0, length)]
-    numerator = -close.rolling(length).apply(weights(coefficients), raw=True)
+    numerator = -weighted_window(close.to_numpy(dtype=float64), coefficients)
+    numerator = Series(numerator, index=close.index)
     cg = numerator / close.rolling(length).sum()
 
     # Offset
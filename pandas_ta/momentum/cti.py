@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas import Series
+from pandas_ta.backend import Series
 from pandas_ta.overlap import linreg
 from pandas_ta.utils import get_offset, verify_series
 
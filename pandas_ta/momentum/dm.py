@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
-from pandas import DataFrame
+from pandas_ta.backend import DataFrame
 from pandas_ta import Imports
 from pandas_ta.overlap import ma
-from pandas_ta.utils import get_offset, verify_series, get_drift, zero
+from pandas_ta.utils import get_offset, verify_series, get_drift, zero_clip
 
 
 def dm(high, low, length=None, mamode=None, talib=None, drift=None, offset=None, **kwargs):
@@ -30,8 +30,8 @@ def dm(high, low, length=None, mamode=None, talib=None, drift=None, offset=None,
         pos_ = ((up > dn) & (up > 0)) * up
         neg_ = ((dn > up) & (dn > 0)) * dn
 
-        pos_ = pos_.apply(zero)
-        neg_ = neg_.apply(zero)
+        pos_ = zero_clip(pos_)
+        neg_ = zero_clip(neg_)
 
         # Not the same values as TA Lib's -+DM (Good First Issue)
         pos = ma(mamode, pos_, length=length)
@@ -77,8 +77,8 @@ Calculation:
         pos_ = ((up > dn) & (up > 0)) * up
         neg_ = ((dn > up) & (dn > 0)) * dn
 
-        pos_ = pos_.apply(zero)
-        neg_ = neg_.apply(zero)
+        pos_ = zero_clip(pos_)
+        neg_ = zero_clip(neg_)
 
         # Not the same values as TA Lib's -+DM
         pos = ma(mamode, pos_, length=length)
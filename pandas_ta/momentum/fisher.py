@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from numpy import log as nplog
 from numpy import nan as npNaN
-from pandas import DataFrame, Series
+from pandas_ta.backend import DataFrame, Series
 from pandas_ta.overlap import hl2
 from pandas_ta.utils import get_offset, high_low_range, verify_series
 
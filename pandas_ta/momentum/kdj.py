@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
-from pandas import DataFrame
+from pandas_ta.backend import DataFrame
 from pandas_ta.overlap import rma
-from pandas_ta.utils import get_offset, non_zero_range, verify_series
+from pandas_ta.utils import get_offset, non_zero_range, rolling_extremes, verify_series
 
 
 def kdj(high=None, low=None, close=None, length=None, signal=None, offset=None, **kwargs):
@@ -18,8 +18,7 @@ def kdj(high=None, low=None, close=None, length=None, signal=None, offset=None,
     if high is None or low is None or close is None: return
 
     # Calculate Result
-    highest_high = high.rolling(length).max()
-    lowest_low = low.rolling(length).min()
+    highest_high, lowest_low = rolling_extremes(high, low, length)
 
     fastk = 100 * (close - lowest_low) / non_zero_range(highest_high, lowest_low)
 
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from cudf import concat, DataFrame
+from pandas_ta.backend import concat, DataFrame
 from pandas_ta import Imports
 from pandas_ta.overlap import ema
 from pandas_ta.utils import get_offset, verify_series, signals
@@ -1,12 +1,56 @@
 # -*- coding: utf-8 -*-
+from numpy import float64, full, zeros
 from numpy import maximum as npMaximum
 from numpy import minimum as npMinimum
 from numpy import nan as npNaN
-from pandas import DataFrame, Series
+from pandas_ta.backend import DataFrame, Series
 
 from .rsi import rsi
 from pandas_ta.overlap import ma
-from pandas_ta.utils import get_drift, get_offset, verify_series
+from pandas_ta.utils import get_drift, get_offset, njit, verify_series
+
+
+@njit(cache=True)
+def _qqe(rsi_ma, upperband, lowerband):
+    """QQE long and short lines and the QQE over float64 arrays. Compiled
+    when numba is installed."""
+    m = rsi_ma.shape[0]
+    long, short = zeros(m), zeros(m)
+    trend = 1
+    qqe = full(m, rsi_ma[0])
+    qqe_long, qqe_short = full(m, npNaN), full(m, npNaN)
+
+    for i in range(1, m):
+        c_rsi, p_rsi = rsi_ma[i], rsi_ma[i - 1]
+        # At i = 1 the prior lines are the last ones, still zero
+        c_long, p_long = long[i - 1], long[i - 2]
+        c_short, p_short = short[i - 1], short[i - 2]
+
+        # Long Line
+        if p_rsi > c_long and c_rsi > c_long:
+            long[i] = npMaximum(c_long, lowerband[i])
+        else:
+            long[i] = lowerband[i]
+
+        # Short Line
+        if p_rsi < c_short and c_rsi < c_short:
+            short[i] = npMinimum(c_short, upperband[i])
+        else:
+            short[i] = upperband[i]
+
+        # Trend & QQE Calculation
+        # Long: Current RSI_MA value Crosses the Prior Short Line Value
+        # Short: Current RSI_MA Crosses the Prior Long Line Value
+        if (c_rsi > c_short and p_rsi < p_short) or (c_rsi <= c_short and p_rsi >= p_short):
+            trend = 1
+        elif (c_rsi > c_long and p_rsi < p_long) or (c_rsi <= c_long and p_rsi >= p_long):
+            trend = -1
+
+        if trend == 1:
+            qqe[i] = qqe_long[i] = long[i]
+        else:
+            qqe[i] = qqe_short[i] = short[i]
+    return long, short, qqe, qqe_long, qqe_short
 
 
 def qqe(close, length=None, smooth=None, factor=None, mamode=None, drift=None, offset=None, **kwargs):
@@ -40,46 +84,16 @@ def qqe(close, length=None, smooth=None, factor=None, mamode=None, drift=None, o
     upperband = rsi_ma + dar
     lowerband = rsi_ma - dar
 
-    m = close.size
-    long = Series(0, index=close.index)
-    short = Series(0, index=close.index)
-    trend = Series(1, index=close.index)
-    qqe = Series(rsi_ma.iloc[0], index=close.index)
-    qqe_long = Series(npNaN, index=close.index)
-    qqe_short = Series(npNaN, index=close.index)
-
-    for i in range(1, m):
-        c_rsi, p_rsi = rsi_ma.iloc[i], rsi_ma.iloc[i - 1]
-        c_long, p_long = long.iloc[i - 1], long.iloc[i - 2]
-        c_short, p_short = short.iloc[i - 1], short.iloc[i - 2]
-
-        # Long Line
-        if p_rsi > c_long and c_rsi > c_long:
-            long.iloc[i] = npMaximum(c_long, lowerband.iloc[i])
-        else:
-            long.iloc[i] = lowerband.iloc[i]
-
-        # Short Line
-        if p_rsi < c_short and c_rsi < c_short:
-            short.iloc[i] = npMinimum(c_short, upperband.iloc[i])
-        else:
-            short.iloc[i] = upperband.iloc[i]
-
-        # Trend & QQE Calculation
-        # Long: Current RSI_MA value Crosses the Prior Short Line Value
-        # Short: Current RSI_MA Crosses the Prior Long Line Value
-        if (c_rsi > c_short and p_rsi < p_short) or (c_rsi <= c_short and p_rsi >= p_short):
-            trend.iloc[i] = 1
-            qqe.iloc[i] = qqe_long.iloc[i] = long.iloc[i]
-        elif (c_rsi > c_long and p_rsi < p_long) or (c_rsi <= c_long and p_rsi >= p_long):
-            trend.iloc[i] = -1
-            qqe.iloc[i] = qqe_short.iloc[i] = short.iloc[i]
-        else:
-            trend.iloc[i] = trend.iloc[i - 1]
-            if trend.iloc[i] == 1:
-                qqe.iloc[i] = qqe_long.iloc[i] = long.iloc[i]
-            else:
-                qqe.iloc[i] = qqe_short.iloc[i]  = short.iloc[i]
+    long, short, qqe, qqe_long, qqe_short = _qqe(
+        rsi_ma.to_numpy(dtype=float64),
+        upperband.to_numpy(dtype=float64),
+        lowerband.to_numpy(dtype=float64),
+    )
+    long = Series(long, index=close.index)
+    short = Series(short, index=close.index)
+    qqe = Series(qqe, index=close.index)
+    qqe_long = Series(qqe_long, index=close.index)
+    qqe_short = Series(qqe_short, index=close.index)
 
     # Offset
     if offset != 0:
@@ -1,8 +1,20 @@
 # -*- coding: utf-8 -*-
-from cudf import DataFrame, concat
+from pandas_ta.backend import DataFrame, concat
 from pandas_ta import Imports
 from pandas_ta.overlap import rma
-from pandas_ta.utils import get_drift, get_offset, verify_series, signals
+from pandas_ta.utils import get_drift, get_offset, shared, verify_series, signals
+
+
+@shared(drift=1)
+def _gains_losses(close, drift=None):
+    """The positive and negative changes of close over drift periods."""
+    negative = close.diff(periods=drift)
+    positive = negative.copy()
+
+    # cudf: use where() for conditional assignment
+    positive = positive.where(positive >= 0, 0)  # Make negatives 0 for the positive series
+    negative = negative.where(negative <= 0, 0)  # Make positives 0 for the negative series
+    return positive, negative
 
 
 def rsi(close, length=None, scalar=None, talib=None, drift=None, offset=None, **kwargs):
@@ -22,12 +34,7 @@ def rsi(close, length=None, scalar=None, talib=None, drift=None, offset=None, **
         from talib import RSI
         rsi = RSI(close, length)
     else:
-        negative = close.diff(periods=drift)
-        positive = negative.copy()
-
-        # cudf: use where() for conditional assignment
-        positive = positive.where(positive >= 0, 0)  # Make negatives 0 for the positive series
-        negative = negative.where(negative <= 0, 0)  # Make positives 0 for the negative series
+        positive, negative = _gains_losses(close, drift=drift)
 
         positive_avg = rma(positive, length=length)
         negative_avg = rma(negative, length=length)
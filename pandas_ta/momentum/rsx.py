@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from numpy import nan as npNaN
-from pandas import concat, DataFrame, Series
+from pandas_ta.backend import concat, DataFrame, Series
 from pandas_ta.utils import get_drift, get_offset, verify_series, signals
 
 
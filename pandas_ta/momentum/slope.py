@@ -18,7 +18,7 @@ def slope( close, length=None, as_angle=None, to_degrees=None, vertical=None, of
     # Calculate Result
     slope = close.diff(length) / length
     if as_angle:
-        slope = slope.apply(npAtan)
+        slope = npAtan(slope)
         if to_degrees:
             slope *= 180 / npPi
 
@@ -53,7 +53,7 @@ Calculation:
     slope = close.diff(length) / length
 
     if as_angle:
-        slope = slope.apply(atan)
+        slope = atan(slope)
         if to_degrees:
             slope *= 180 / PI
 
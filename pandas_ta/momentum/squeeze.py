@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from numpy import nan as npNaN
-from pandas import DataFrame
+from pandas_ta.backend import DataFrame
 from pandas_ta.momentum import mom
 from pandas_ta.overlap import ema, linreg, sma
 from pandas_ta.trend import decreasing, increasing
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas import DataFrame, Series
+from pandas_ta.backend import DataFrame, Series
 from pandas_ta.overlap import ema
 from pandas_ta.utils import get_offset, non_zero_range, verify_series
 
@@ -152,12 +152,15 @@ def schaff_tc(close, xmacd, tclength, factor):
     xmacd_range = non_zero_range(xmacd.rolling(tclength).max(), lowest_xmacd)
     m = len(xmacd)
 
+    # The loops read arrays, the elements are the NumPy scalars of the Series
+    xmacd_, lowest_xmacd, xmacd_range = (x.to_numpy() for x in (xmacd, lowest_xmacd, xmacd_range))
+
     # %Fast K of MACD
-    stoch1, pf = list(xmacd), list(xmacd)
+    stoch1, pf = list(xmacd_), list(xmacd_)
     stoch1[0], pf[0] = 0, 0
     for i in range(1, m):
         if lowest_xmacd[i] > 0:
-            stoch1[i] = 100 * ((xmacd[i] - lowest_xmacd[i]) / xmacd_range[i])
+            stoch1[i] = 100 * ((xmacd_[i] - lowest_xmacd[i]) / xmacd_range[i])
         else:
             stoch1[i] = stoch1[i - 1]
         # Smoothed Calculation for % Fast D of MACD
@@ -168,13 +171,14 @@ def schaff_tc(close, xmacd, tclength, factor):
     # 2nd : Stochastic of smoothed Percent Fast D, 'PF', above
     lowest_pf = pf.rolling(tclength).min()
     pf_range = non_zero_range(pf.rolling(tclength).max(), lowest_pf)
+    pf_, lowest_pf, pf_range = (x.to_numpy() for x in (pf, lowest_pf, pf_range))
 
     # % of Fast K of PF
-    stoch2, pff = list(xmacd), list(xmacd)
+    stoch2, pff = list(xmacd_), list(xmacd_)
     stoch2[0], pff[0] = 0, 0
     for i in range(1, m):
         if pf_range[i] > 0:
-            stoch2[i] = 100 * ((pf[i] - lowest_pf[i]) / pf_range[i])
+            stoch2[i] = 100 * ((pf_[i] - lowest_pf[i]) / pf_range[i])
         else:
             stoch2[i] = stoch2[i - 1]
         # Smoothed Calculation for % Fast D of PF
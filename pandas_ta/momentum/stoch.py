@@ -1,7 +1,17 @@
 # -*- coding: utf-8 -*-
-from pandas import DataFrame
+from pandas_ta.backend import DataFrame
 from pandas_ta.overlap import ma
-from pandas_ta.utils import get_offset, non_zero_range, verify_series
+from pandas_ta.utils import get_offset, non_zero_range, rolling_extremes, shared, verify_series
+
+
+@shared
+def _fast_k(high, low, close, k):
+    """The unsmoothed %K of the last k periods."""
+    highest_high, lowest_low = rolling_extremes(high, low, k)
+
+    stoch = 100 * (close - lowest_low)
+    stoch /= non_zero_range(highest_high, lowest_low)
+    return stoch
 
 
 def stoch(high, low, close, k=None, d=None, smooth_k=None, mamode=None, offset=None, **kwargs):
@@ -20,11 +30,7 @@ def stoch(high, low, close, k=None, d=None, smooth_k=None, mamode=None, offset=N
     if high is None or low is None or close is None: return
 
     # Calculate Result
-    lowest_low = low.rolling(k).min()
-    highest_high = high.rolling(k).max()
-
-    stoch = 100 * (close - lowest_low)
-    stoch /= non_zero_range(highest_high, lowest_low)
+    stoch = _fast_k(high, low, close, k)
 
     stoch_k = ma(mamode, stoch.loc[stoch.first_valid_index():,], length=smooth_k)
     stoch_d = ma(mamode, stoch_k.loc[stoch_k.first_valid_index():,], length=d)
@@ -1,10 +1,21 @@
 # -*- coding: utf-8 -*-
-# import numpy as np
+from numpy import arange, float64, maximum, minimum
 from numpy import where as npWhere
-from pandas import DataFrame, Series
+from pandas_ta.backend import DataFrame, Series
 from pandas_ta.utils import get_offset, verify_series
 
 
+def _sequence_count(td_bool, length: int = 13):
+    """The number of consecutive Trues up to and including each value of
+    td_bool, at most length, and 0 where it is False. Every count is the
+    distance to the last False, found with a running maximum, so the pass
+    is O(n)."""
+    td_bool = td_bool.to_numpy(dtype=bool) if hasattr(td_bool, "to_numpy") else td_bool
+    index = arange(td_bool.shape[0])
+    last_false = maximum.accumulate(npWhere(td_bool, -1, index))
+    return npWhere(td_bool, minimum(index - last_false, length), 0).astype(float64)
+
+
 def td_seq(close, asint=None, offset=None, **kwargs):
     """Indicator: Tom Demark Sequential (TD_SEQ)"""
     # Validate arguments
@@ -13,21 +24,9 @@ def td_seq(close, asint=None, offset=None, **kwargs):
     asint = asint if isinstance(asint, bool) else False
     show_all = kwargs.setdefault("show_all", True)
 
-    def true_sequence_count(series: Series):
-        index = series.where(series == False).last_valid_index()
-
-        if index is None:
-            return series.count()
-        else:
-            s = series[series.index > index]
-            return s.count()
-
     def calc_td(series: Series, direction: str, show_all: bool):
         td_bool = series.diff(4) > 0 if direction=="up" else series.diff(4) < 0
-        td_num = npWhere(
-            td_bool, td_bool.rolling(13, min_periods=0).apply(true_sequence_count), 0
-        )
-        td_num = Series(td_num)
+        td_num = Series(_sequence_count(td_bool), index=series.index)
 
         if show_all:
             td_num = td_num.mask(td_num == 0)
@@ -87,6 +86,11 @@ Calculation:
     consecutive ascending or descending price sequence, display 6th to 9th day
     value.
 
+    up = close.diff(4) > 0
+    TD_SEQ_UP = consecutive Trues of up ending at each bar, at most 13
+    down = close.diff(4) < 0
+    TD_SEQ_DN = consecutive Trues of down ending at each bar, at most 13
+
 Args:
     close (pd.Series): Series of 'close's
     asint (bool): If True, fillnas with 0 and change type to int. Default: False
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, rolling_extremes, verify_series
 
 
 def willr(high, low, close, length=None, talib=None, offset=None, **kwargs):
@@ -22,8 +22,7 @@ def willr(high, low, close, length=None, talib=None, offset=None, **kwargs):
         from talib import WILLR
         willr = WILLR(high, low, close, length)
     else:
-        lowest_low = low.rolling(length, min_periods=min_periods).min()
-        highest_high = high.rolling(length, min_periods=min_periods).max()
+        highest_high, lowest_low = rolling_extremes(high, low, length, min_periods)
 
         willr = 100 * ((close - lowest_low) / (highest_high - lowest_low) - 1)
 
@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
+from numpy import empty, float64
 from numpy import exp as npExp
 from numpy import nan as npNaN
-from pandas import Series
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.backend import Series
+from pandas_ta.utils import get_offset, verify_series, weighted_window
 
 
 def alma(close, length=None, sigma=None, distribution_offset=None, offset=None, **kwargs):
@@ -19,23 +20,14 @@ def alma(close, length=None, sigma=None, distribution_offset=None, offset=None,
     # Pre-Calculations
     m = distribution_offset * (length - 1)
     s = length / sigma
-    wtd = list(range(length))
+    wtd = empty(length)
     for i in range(0, length):
         wtd[i] = npExp(-1 * ((i - m) * (i - m)) / (2 * s * s))
 
     # Calculate Result
-    result = [npNaN for _ in range(0, length - 1)] + [0]
-    for i in range(length, close.size):
-        window_sum = 0
-        cum_sum = 0
-        for j in range(0, length):
-            # wtd = math.exp(-1 * ((j - m) * (j - m)) / (2 * s * s))        # moved to pre-calc for efficiency
-            window_sum = window_sum + wtd[j] * close.iloc[i - j]
-            cum_sum = cum_sum + wtd[j]
-
-        almean = window_sum / cum_sum
-        result.append(npNaN) if i == length else result.append(almean)
-
+    # wtd[0] weighs the latest value
+    result = weighted_window(close.to_numpy(dtype=float64), wtd[::-1]) / wtd.sum()
+    result[length - 1], result[length:length + 1] = 0.0, npNaN
     alma = Series(result, index=close.index)
 
     # Offset
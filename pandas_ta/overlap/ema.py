@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 from numpy import nan as npNaN
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, shared, verify_series
 
 
+@shared(length=10, talib=True, offset=0)
 def ema(close, length=None, talib=None, offset=None, **kwargs):
     """Indicator: Exponential Moving Average (EMA)"""
     # Validate Arguments
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import fibonacci, get_offset, verify_series, weights
+from numpy import float64
+from pandas_ta.backend import Series
+from pandas_ta.utils import fibonacci, get_offset, verify_series, weighted_window
 
 
 def fwma(close, length=None, asc=None, offset=None, **kwargs):
@@ -14,7 +16,8 @@ def fwma(close, length=None, asc=None, offset=None, **kwargs):
 
     # Calculate Result
     fibs = fibonacci(n=length, weighted=True)
-    fwma = close.rolling(length, min_periods=length).apply(weights(fibs), raw=True)
+    fwma = weighted_window(close.to_numpy(dtype=float64), fibs)
+    fwma = Series(fwma, index=close.index)
 
     # Offset
     if offset != 0:
@@ -45,13 +48,9 @@ Calculation:
     Default Inputs:
         length=10,
 
-    def weights(w):
-        def _compute(x):
-            return np.dot(w * x)
-        return _compute
-
     fibs = utils.fibonacci(length - 1)
-    FWMA = close.rolling(length)_.apply(weights(fibs), raw=True)
+    # The dot product of fibs with every window, as one convolution
+    FWMA = utils.weighted_window(close, fibs)
 
 Args:
     close (pd.Series): Series of 'close's
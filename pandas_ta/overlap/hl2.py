@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, shared, verify_series
 
 
+@shared(offset=0)
 def hl2(high, low, offset=None, **kwargs):
     """Indicator: HL2 """
     # Validate Arguments
@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, shared, verify_series
 
 
+@shared(talib=True, offset=0)
 def hlc3(high, low, close, talib=None, offset=None, **kwargs):
     """Indicator: HLC3"""
     # Validate Arguments
@@ -1,6 +1,23 @@
 # -*- coding: utf-8 -*-
-from pandas import Series
-from pandas_ta.utils import get_offset, verify_series
+from numpy import empty, float64
+from pandas_ta.backend import Series
+from pandas_ta.utils import get_offset, njit, verify_series
+
+
+@njit(cache=True)
+def _hwma(x, na, nb, nc):
+    """HWMA recursion over a float64 array. Compiled when numba is installed."""
+    m = x.shape[0]
+    result = empty(m)
+    last_a = last_v = 0.0
+    last_f = x[0]
+    for i in range(m):
+        F = (1.0 - na) * (last_f + last_v + 0.5 * last_a) + na * x[i]
+        V = (1.0 - nb) * (last_v + last_a) + nb * (F - last_f)
+        A = (1.0 - nc) * last_a + nc * (V - last_v)
+        result[i] = F + V + 0.5 * A
+        last_a, last_f, last_v = A, F, V # update values
+    return result
 
 
 def hwma(close, na=None, nb=None, nc=None, offset=None, **kwargs):
@@ -13,18 +30,7 @@ def hwma(close, na=None, nb=None, nc=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    last_a = last_v = 0
-    last_f = close.iloc[0]
-
-    result = []
-    m = close.size
-    for i in range(m):
-        F = (1.0 - na) * (last_f + last_v + 0.5 * last_a) + na * close.iloc[i]
-        V = (1.0 - nb) * (last_v + last_a) + nb * (F - last_f)
-        A = (1.0 - nc) * last_a + nc * (V - last_v)
-        result.append((F + V + 0.5 * A))
-        last_a, last_f, last_v = A, F, V # update values
-
+    result = _hwma(close.to_numpy(dtype=float64), na, nb, nc)
     hwma = Series(result, index=close.index)
 
     # Offset
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
-from pandas import date_range, DataFrame, RangeIndex, Timedelta
+from pandas import Timedelta
+from pandas_ta.backend import date_range, DataFrame, RangeIndex
 from .midprice import midprice
 from pandas_ta.utils import get_offset, verify_series
 
@@ -1,65 +1,47 @@
 # -*- coding: utf-8 -*-
-from numpy import average as npAverage
+from math import sqrt as msqrt
+
+from numpy import float64, zeros
 from numpy import nan as npNaN
 from numpy import log as npLog
-from numpy import power as npPower
 from numpy import sqrt as npSqrt
-from numpy import zeros_like as npZeroslike
-from pandas import Series
-from pandas_ta.utils import get_offset, verify_series
-
+from pandas_ta.backend import Series
+from pandas_ta.utils import get_offset, njit, verify_series
 
-def jma(close, length=None, phase=None, offset=None, **kwargs):
-    """Indicator: Jurik Moving Average (JMA)"""
-    # Validate Arguments
-    _length = int(length) if length and length > 0 else 7
-    phase = float(phase) if phase and phase != 0 else 0
-    close = verify_series(close, _length)
-    offset = get_offset(offset)
-    if close is None: return
 
-    # Define base variables
-    jma = npZeroslike(close)
-    volty = npZeroslike(close)
-    v_sum = npZeroslike(close)
+@njit(cache=True)
+def _jma(x, max_volty, pow1, bet, beta, pr):
+    """JMA recursion over a float64 array. Compiled when numba is installed."""
+    m, sum_length = x.shape[0], 10
+    jma, volty, v_sum = zeros(m), zeros(m), zeros(m)
 
-    kv = det0 = det1 = ma2 = 0.0
-    jma[0] = ma1 = uBand = lBand = close[0]
-
-    # Static variables
-    sum_length = 10
-    length = 0.5 * (_length - 1)
-    pr = 0.5 if phase < -100 else 2.5 if phase > 100 else 1.5 + phase * 0.01
-    length1 = max((npLog(npSqrt(length)) / npLog(2.0)) + 2.0, 0)
-    pow1 = max(length1 - 2.0, 0.5)
-    length2 = length1 * npSqrt(length)
-    bet = length2 / (length2 + 1)
-    beta = 0.45 * (_length - 1) / (0.45 * (_length - 1) + 2.0)
-
-    m = close.shape[0]
+    det0 = det1 = 0.0
+    jma[0] = ma1 = uBand = lBand = x[0]
     for i in range(1, m):
-        price = close[i]
+        price = x[i]
 
         # Price volatility
         del1 = price - uBand
         del2 = price - lBand
-        volty[i] = max(abs(del1),abs(del2)) if abs(del1)!=abs(del2) else 0
+        volty[i] = max(abs(del1), abs(del2)) if abs(del1) != abs(del2) else 0.0
 
         # Relative price volatility factor
         v_sum[i] = v_sum[i - 1] + (volty[i] - volty[max(i - sum_length, 0)]) / sum_length
-        avg_volty = npAverage(v_sum[max(i - 65, 0):i + 1])
-        d_volty = 0 if avg_volty ==0 else volty[i] / avg_volty
-        r_volty = max(1.0, min(npPower(length1, 1 / pow1), d_volty))
+        start, avg_volty = max(i - 65, 0), 0.0
+        for j in range(start, i + 1):
+            avg_volty += v_sum[j]
+        avg_volty /= i + 1 - start
+        d_volty = 0.0 if avg_volty == 0 else volty[i] / avg_volty
+        r_volty = max(1.0, min(max_volty, d_volty))
 
         # Jurik volatility bands
-        pow2 = npPower(r_volty, pow1)
-        kv = npPower(bet, npSqrt(pow2))
+        pow2 = r_volty ** pow1
+        kv = bet ** msqrt(pow2)
         uBand = price if (del1 > 0) else price - (kv * del1)
         lBand = price if (del2 < 0) else price - (kv * del2)
 
         # Jurik Dynamic Factor
-        power = npPower(r_volty, pow1)
-        alpha = npPower(beta, power)
+        alpha = beta ** pow2
 
         # 1st stage - prelimimary smoothing by adaptive EMA
         ma1 = ((1 - alpha) * price) + (alpha * ma1)
@@ -70,7 +52,31 @@ def jma(close, length=None, phase=None, offset=None, **kwargs):
 
         # 3rd stage - final smoothing by unique Jurik adaptive filter
         det1 = ((ma2 - jma[i - 1]) * (1 - alpha) * (1 - alpha)) + (alpha * alpha * det1)
-        jma[i] = jma[i-1] + det1
+        jma[i] = jma[i - 1] + det1
+
+    return jma
+
+
+def jma(close, length=None, phase=None, offset=None, **kwargs):
+    """Indicator: Jurik Moving Average (JMA)"""
+    # Validate Arguments
+    _length = int(length) if length and length > 0 else 7
+    phase = float(phase) if phase and phase != 0 else 0
+    close = verify_series(close, _length)
+    offset = get_offset(offset)
+    if close is None: return
+
+    # Static variables
+    length = 0.5 * (_length - 1)
+    pr = 0.5 if phase < -100 else 2.5 if phase > 100 else 1.5 + phase * 0.01
+    length1 = float(max((npLog(npSqrt(length)) / npLog(2.0)) + 2.0, 0))
+    pow1 = max(length1 - 2.0, 0.5)
+    length2 = float(length1 * npSqrt(length))
+    bet = length2 / (length2 + 1)
+    beta = 0.45 * (_length - 1) / (0.45 * (_length - 1) + 2.0)
+
+    # Calculate Result
+    jma = _jma(close.to_numpy(dtype=float64), length1 ** (1 / pow1), pow1, bet, beta, pr)
 
     # Remove initial lookback data and convert to pandas frame
     jma[0:_length - 1] = npNaN
@@ -1,7 +1,20 @@
 # -*- coding: utf-8 -*-
+from numpy import empty, float64
 from numpy import nan as npNaN
-from pandas import Series
-from pandas_ta.utils import get_drift, get_offset, non_zero_range, verify_series
+from pandas_ta.backend import Series
+from pandas_ta.utils import get_drift, get_offset, njit, non_zero_range, verify_series
+
+
+@njit(cache=True)
+def _kama(x, sc, length):
+    """KAMA recursion over float64 arrays. Compiled when numba is installed."""
+    m = x.shape[0]
+    result = empty(m)
+    result[:length - 1] = npNaN
+    result[length - 1] = 0.0
+    for i in range(length, m):
+        result[i] = sc[i] * x[i] + (1 - sc[i]) * result[i - 1]
+    return result
 
 
 def kama(close, length=None, fast=None, slow=None, drift=None, offset=None, **kwargs):
@@ -30,11 +43,7 @@ def kama(close, length=None, fast=None, slow=None, drift=None, offset=None, **kw
     x = er * (fr - sr) + sr
     sc = x * x
 
-    m = close.size
-    result = [npNaN for _ in range(0, length - 1)] + [0]
-    for i in range(length, m):
-        result.append(sc.iloc[i] * close.iloc[i] + (1 - sc.iloc[i]) * result[i - 1])
-
+    result = _kama(close.to_numpy(dtype=float64), sc.to_numpy(dtype=float64), length)
     kama = Series(result, index=close.index)
 
     # Offset
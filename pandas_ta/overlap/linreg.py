@@ -1,11 +1,55 @@
 # -*- coding: utf-8 -*-
-from numpy import array as npArray
 from numpy import arctan as npAtan
+from numpy import errstate, float64, full
 from numpy import nan as npNaN
 from numpy import pi as npPi
-from numpy.version import version as npVersion
-from pandas import Series
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.backend import DataFrame, Series
+from pandas_ta.utils import get_offset, njit, verify_series
+
+
+@njit(cache=True)
+def _linreg(x, length):
+    """Rolling sums of y, x * y and y * y, with x = 1, ..., length, over a
+    float64 array in O(1) per window. The sums are of y less an anchor, the
+    first value of every length-th window, where they are recomputed so
+    that rounding errors neither accumulate nor cancel. Windows with NaNs
+    are NaN. Compiled when numba is installed."""
+    m = x.shape[0]
+    y_sum, xy_sum, y2_sum = full(m, npNaN), full(m, npNaN), full(m, npNaN)
+    anchors = full(m, npNaN)
+
+    anchor = sy = sxy = syy = 0.0
+    nans = 0
+    for i in range(length - 1, m):
+        start = i - length + 1
+        if start % length == 0:
+            anchor = x[start] if x[start] == x[start] else 0.0
+            sy = sxy = syy = 0.0
+            nans = 0
+            for j in range(length):
+                y = x[start + j] - anchor
+                if y != y:
+                    nans += 1
+                else:
+                    sy += y
+                    sxy += (j + 1) * y
+                    syy += y * y
+        else:
+            # Slide the window: every x decreases by one
+            dropped, y = x[start - 1] - anchor, x[i] - anchor
+            if dropped != dropped:
+                nans -= 1
+                dropped = 0.0
+            if y != y:
+                nans += 1
+                y = 0.0
+            sxy += length * y - sy
+            sy += y - dropped
+            syy += y * y - dropped * dropped
+
+        if nans == 0:
+            y_sum[i], xy_sum[i], y2_sum[i], anchors[i] = sy, sxy, syy, anchor
+    return y_sum, xy_sum, y2_sum, anchors
 
 
 def linreg(close, length=None, offset=None, **kwargs):
@@ -17,6 +61,7 @@ def linreg(close, length=None, offset=None, **kwargs):
     angle = kwargs.pop("angle", False)
     intercept = kwargs.pop("intercept", False)
     degrees = kwargs.pop("degrees", False)
+    detailed = kwargs.pop("detailed", False)
     r = kwargs.pop("r", False)
     slope = kwargs.pop("slope", False)
     tsf = kwargs.pop("tsf", False)
@@ -24,50 +69,43 @@ def linreg(close, length=None, offset=None, **kwargs):
     if close is None: return
 
     # Calculate Result
-    x = range(1, length + 1)  # [1, 2, ..., n] from 1 to n keeps Sum(xy) low
+    # x = [1, 2, ..., n] from 1 to n keeps Sum(xy) low
     x_sum = 0.5 * length * (length + 1)
     x2_sum = x_sum * (2 * length + 1) / 3
     divisor = length * x2_sum - x_sum * x_sum
 
-    def linear_regression(series):
-        y_sum = series.sum()
-        xy_sum = (x * series).sum()
-
-        m = (length * xy_sum - x_sum * y_sum) / divisor
-        if slope:
-            return m
-        b = (y_sum * x2_sum - x_sum * xy_sum) / divisor
-        if intercept:
-            return b
-
-        if angle:
-            theta = npAtan(m)
-            if degrees:
-                theta *= 180 / npPi
-            return theta
-
-        if r:
-            y2_sum = (series * series).sum()
-            rn = length * xy_sum - x_sum * y_sum
-            rd = (divisor * (length * y2_sum - y_sum * y_sum)) ** 0.5
-            return rn / rd
-
-        return m * length + b if tsf else m * (length - 1) + b
-
-    def rolling_window(array, length):
-        """https://github.com/twopirllc/pandas-ta/issues/285"""
-        strides = array.strides + (array.strides[-1],)
-        shape = array.shape[:-1] + (array.shape[-1] - length + 1, length)
-        return as_strided(array, shape=shape, strides=strides)
-
-    if npVersion >= "1.20.0":
-        from numpy.lib.stride_tricks import sliding_window_view
-        linreg_ = [linear_regression(_) for _ in sliding_window_view(npArray(close), length)]
+    # The sums are of close less an anchor, which only shifts the intercept
+    y_sum, xy_sum, y2_sum, anchor = _linreg(close.to_numpy(dtype=float64), length)
+
+    m = (length * xy_sum - x_sum * y_sum) / divisor
+    b = (y_sum * x2_sum - x_sum * xy_sum) / divisor + anchor
+    theta = npAtan(m)
+    if degrees:
+        theta *= 180 / npPi
+    with errstate(divide="ignore", invalid="ignore"):
+        rn = length * xy_sum - x_sum * y_sum
+        rd = (divisor * (length * y2_sum - y_sum * y_sum)) ** 0.5
+        r_ = rn / rd
+
+    _props = f"_{length}"
+    if detailed:
+        # All the variants at once
+        data = {
+            f"LR{_props}": m * (length - 1) + b,
+            f"LRm{_props}": m,
+            f"LRb{_props}": b,
+            f"LRa{_props}": theta,
+            f"LRr{_props}": r_,
+            f"LRt{_props}": m * length + b,
+        }
+        linreg = DataFrame(data, index=close.index)
     else:
-        from numpy.lib.stride_tricks import as_strided
-        linreg_ = [linear_regression(_) for _ in rolling_window(npArray(close), length)]
-
-    linreg = Series([npNaN] * (length - 1) + linreg_, index=close.index)
+        if slope: result = m
+        elif intercept: result = b
+        elif angle: result = theta
+        elif r: result = r_
+        else: result = m * length + b if tsf else m * (length - 1) + b
+        linreg = Series(result, index=close.index)
 
     # Offset
     if offset != 0:
@@ -80,13 +118,18 @@ def linreg(close, length=None, offset=None, **kwargs):
         linreg.fillna(method=kwargs["fill_method"], inplace=True)
 
     # Name and Categorize it
+    if detailed:
+        linreg.name = f"LR{_props}"
+        linreg.category = "overlap"
+        return linreg
+
     linreg.name = f"LR"
     if slope: linreg.name += "m"
     if intercept: linreg.name += "b"
     if angle: linreg.name += "a"
     if r: linreg.name += "r"
 
-    linreg.name += f"_{length}"
+    linreg.name += _props
     linreg.category = "overlap"
 
     return linreg
@@ -109,16 +152,15 @@ Calculation:
     x2_sum = length * (length + 1) * (2 * length + 1) / 6
     divisor = length * x2_sum - x_sum * x_sum
 
-    lr(series):
-        y_sum = series.sum()
-        y2_sum = (series* series).sum()
-        xy_sum = (x * series).sum()
-
-        m = (length * xy_sum - x_sum * y_sum) / divisor
-        b = (y_sum * x2_sum - x_sum * xy_sum) / divisor
-        return m * (length - 1) + b
+    Rolling sums, updated in O(1) per window:
+        y_sum = close.rolling(length).sum()
+        y2_sum = (close * close).rolling(length).sum()
+        xy_sum = (x * window).sum()
+               = prev xy_sum - prev y_sum + length * close
 
-    linreg = close.rolling(length).apply(lr)
+    m = (length * xy_sum - x_sum * y_sum) / divisor
+    b = (y_sum * x2_sum - x_sum * xy_sum) / divisor
+    linreg = m * (length - 1) + b
 
 Args:
     close (pd.Series): Series of 'close's
@@ -136,9 +178,12 @@ Kwargs:
     slope (bool, optional): If True, returns the slope. Default: False.
     tsf (bool, optional): If True, returns the Time Series Forecast value.
         Default: False.
+    detailed (bool, optional): If True, returns all of the above at once as
+        a DataFrame: LR, LRm (slope), LRb (intercept), LRa (angle), LRr and
+        LRt (tsf). Default: False.
     fillna (value, optional): pd.DataFrame.fillna(value)
     fill_method (value, optional): Type of fill method
 
 Returns:
-    pd.Series: New feature generated.
+    pd.Series: New feature generated. pd.DataFrame if detailed.
 """
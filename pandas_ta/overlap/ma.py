@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas import Series
+from pandas_ta.backend import Series
 
 from .dema import dema
 from .ema import ema
@@ -1,5 +1,26 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, verify_series
+from numpy import empty, errstate, float64
+from numpy import nan as npNaN
+from pandas_ta.backend import Series
+from pandas_ta.utils import get_offset, njit, verify_series
+
+
+@njit(cache=True, error_model="numpy")
+def _mcgd(x, length, c):
+    """McGinley Dynamic recursion over a float64 array: each value moves the
+    previous one towards x. A missing input skips its window and restarts
+    the recursion at the next x. Compiled when numba is installed."""
+    m = x.shape[0]
+    result = empty(m)
+    if m == 0: return result
+    last = result[0] = x[0]
+    for i in range(1, m):
+        if x[i - 1] != x[i - 1] or x[i] != x[i]:
+            last, result[i] = x[i], npNaN
+        else:
+            last = last + (x[i] - last) / (c * length * (x[i] / last) ** 4.0)
+            result[i] = last
+    return result
 
 
 def mcgd(close, length=None, offset=None, c=None, **kwargs):
@@ -13,15 +34,9 @@ def mcgd(close, length=None, offset=None, c=None, **kwargs):
     if close is None: return
 
     # Calculate Result
-    close = close.copy()
-
-    def mcg_(series):
-        denom = (c * length * (series.iloc[1] / series.iloc[0]) ** 4)
-        series.iloc[1] = (series.iloc[0] + ((series.iloc[1] - series.iloc[0]) / denom))
-        return series.iloc[1]
-
-    mcg_cell = close[0:].rolling(2, min_periods=2).apply(mcg_, raw=False)
-    mcg_ds = close[:1].append(mcg_cell[1:])
+    with errstate(divide="ignore", invalid="ignore"):
+        mcg_ds = _mcgd(close.to_numpy(dtype=float64), length, float(c))
+    mcg_ds = Series(mcg_ds, index=close.index)
 
     # Offset
     if offset != 0:
@@ -49,7 +64,8 @@ and hugs prices much more closely. Because of the calculation, the Dynamic Line
 speeds up in down markets as it follows prices yet moves more slowly in up
 markets. The indicator was designed by John R. McGinley, a Certified Market
 Technician and former editor of the Market Technicians Association's Journal
-of Technical Analysis.
+of Technical Analysis. It is evaluated as a recursion in a single pass, see
+ta.stream.MCGD for its streaming state.
 
 Sources:
     https://www.investopedia.com/articles/forex/09/mcginley-dynamic-indicator.asp
@@ -60,12 +76,8 @@ Calculation:
         offset=0
         c=1
 
-    def mcg_(series):
-        denom = (constant * length * (series.iloc[1] / series.iloc[0]) ** 4)
-        series.iloc[1] = (series.iloc[0] + ((series.iloc[1] - series.iloc[0]) / denom))
-        return series.iloc[1]
-    mcg_cell = close[0:].rolling(2, min_periods=2).apply(mcg_, raw=False)
-    mcg_ds = close[:1].append(mcg_cell[1:])
+    MCGD[0] = close[0]
+    MCGD[i] = MCGD[i-1] + (close[i] - MCGD[i-1]) / (c * length * (close[i] / MCGD[i-1]) ** 4)
 
 Args:
     close (pd.Series): Series of 'close's
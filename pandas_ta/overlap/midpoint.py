@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, rolling_extremes, verify_series
 
 
 def midpoint(close, length=None, talib=None, offset=None, **kwargs):
@@ -19,8 +19,7 @@ def midpoint(close, length=None, talib=None, offset=None, **kwargs):
         from talib import MIDPOINT
         midpoint = MIDPOINT(close, length)
     else:
-        lowest = close.rolling(length, min_periods=min_periods).min()
-        highest = close.rolling(length, min_periods=min_periods).max()
+        highest, lowest = rolling_extremes(close, close, length, min_periods)
         midpoint = 0.5 * (lowest + highest)
 
     # Offset
@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, rolling_extremes, shared, verify_series
 
 
+@shared(length=2, talib=True, offset=0)
 def midprice(high, low, length=None, talib=None, offset=None, **kwargs):
     """Indicator: Midprice"""
     # Validate arguments
@@ -21,8 +22,7 @@ def midprice(high, low, length=None, talib=None, offset=None, **kwargs):
         from talib import MIDPRICE
         midprice = MIDPRICE(high, low, length)
     else:
-        lowest_low = low.rolling(length, min_periods=min_periods).min()
-        highest_high = high.rolling(length, min_periods=min_periods).max()
+        highest_high, lowest_low = rolling_extremes(high, low, length, min_periods)
         midprice = 0.5 * (lowest_low + highest_high)
 
     # Offset
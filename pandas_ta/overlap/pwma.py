@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, pascals_triangle, verify_series, weights
+from numpy import float64
+from pandas_ta.backend import Series
+from pandas_ta.utils import get_offset, pascals_triangle, verify_series, weighted_window
 
 
 def pwma(close, length=None, asc=None, offset=None, **kwargs):
@@ -14,7 +16,8 @@ def pwma(close, length=None, asc=None, offset=None, **kwargs):
 
     # Calculate Result
     triangle = pascals_triangle(n=length - 1, weighted=True)
-    pwma = close.rolling(length, min_periods=length).apply(weights(triangle), raw=True)
+    pwma = weighted_window(close.to_numpy(dtype=float64), triangle)
+    pwma = Series(pwma, index=close.index)
 
     # Offset
     if offset != 0:
@@ -45,13 +48,9 @@ Calculation:
     Default Inputs:
         length=10
 
-    def weights(w):
-        def _compute(x):
-            return np.dot(w * x)
-        return _compute
-
     triangle = utils.pascals_triangle(length + 1)
-    PWMA = close.rolling(length)_.apply(weights(triangle), raw=True)
+    # The dot product of triangle with every window, as one convolution
+    PWMA = utils.weighted_window(close, triangle)
 
 Args:
     close (pd.Series): Series of 'close's
@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, shared, verify_series
 
 
+@shared(length=10, offset=0)
 def rma(close, length=None, offset=None, **kwargs):
     """Indicator: wildeR's Moving Average (RMA)"""
     # Validate Arguments
@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
+from numpy import float64
 from numpy import pi as npPi
 from numpy import sin as npSin
-from pandas import Series
-from pandas_ta.utils import get_offset, verify_series, weights
+from pandas_ta.backend import Series
+from pandas_ta.utils import get_offset, verify_series, weighted_window
 
 
 def sinwma(close, length=None, offset=None, **kwargs):
@@ -18,7 +19,8 @@ def sinwma(close, length=None, offset=None, **kwargs):
     sines = Series([npSin((i + 1) * npPi / (length + 1)) for i in range(0, length)])
     w = sines / sines.sum()
 
-    sinwma = close.rolling(length, min_periods=length).apply(weights(w), raw=True)
+    sinwma = weighted_window(close.to_numpy(dtype=float64), w.to_numpy())
+    sinwma = Series(sinwma, index=close.index)
 
     # Offset
     if offset != 0:
@@ -51,14 +53,10 @@ Calculation:
     Default Inputs:
         length=10
 
-    def weights(w):
-        def _compute(x):
-            return np.dot(w * x)
-        return _compute
-
     sines = Series([sin((i + 1) * pi / (length + 1)) for i in range(0, length)])
     w = sines / sines.sum()
-    SINWMA = close.rolling(length, min_periods=length).apply(weights(w), raw=True)
+    # The dot product of w with every window, as one convolution
+    SINWMA = utils.weighted_window(close, w)
 
 Args:
     close (pd.Series): Series of 'close's
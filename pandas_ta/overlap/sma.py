@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, shared, verify_series
 
 
+@shared(length=10, talib=True, offset=0)
 def sma(close, length=None, talib=None, offset=None, **kwargs):
     """Indicator: Simple Moving Average (SMA)"""
     # Validate Arguments
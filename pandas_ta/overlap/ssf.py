@@ -2,8 +2,30 @@
 from numpy import cos as npCos
 from numpy import exp as npExp
 from numpy import pi as npPi
+from numpy import float64
 from numpy import sqrt as npSqrt
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.backend import Series
+from pandas_ta.utils import get_offset, njit, verify_series
+
+
+@njit(cache=True)
+def _ssf2(x, a1, b1, c1):
+    """2 pole SSF recursion over a float64 array. Compiled when numba is
+    installed."""
+    result = x.copy()
+    for i in range(2, x.shape[0]):
+        result[i] = c1 * x[i] + b1 * result[i - 1] + a1 * result[i - 2]
+    return result
+
+
+@njit(cache=True)
+def _ssf3(x, c1, c2, c3, c4):
+    """3 pole SSF recursion over a float64 array. Compiled when numba is
+    installed."""
+    result = x.copy()
+    for i in range(3, x.shape[0]):
+        result[i] = c1 * x[i] + c2 * result[i - 1] + c3 * result[i - 2] + c4 * result[i - 3]
+    return result
 
 
 def ssf(close, length=None, poles=None, offset=None, **kwargs):
@@ -17,9 +39,7 @@ def ssf(close, length=None, poles=None, offset=None, **kwargs):
     if close is None: return
 
     # Calculate Result
-    m = close.size
-    ssf = close.copy()
-
+    x_ = close.to_numpy(dtype=float64)
     if poles == 3:
         x = npPi / length # x = PI / n
         a0 = npExp(-x) # e^(-x)
@@ -31,8 +51,7 @@ def ssf(close, length=None, poles=None, offset=None, **kwargs):
         c2 = c0 + b0 # e^(-2x) + 2e^(-x)*cos(3^(.5) * x)
         c1 = 1 - c2 - c3 - c4
 
-        for i in range(0, m):
-            ssf.iloc[i] = c1 * close.iloc[i] + c2 * ssf.iloc[i - 1] + c3 * ssf.iloc[i - 2] + c4 * ssf.iloc[i - 3]
+        result = _ssf3(x_, c1, c2, c3, c4)
 
     else: # poles == 2
         x = npPi * npSqrt(2) / length # x = PI * 2^(.5) / n
@@ -41,8 +60,9 @@ def ssf(close, length=None, poles=None, offset=None, **kwargs):
         b1 = 2 * a0 * npCos(x) # 2e^(-x)*cos(x)
         c1 = 1 - a1 - b1 # e^(-2x) - 2e^(-x)*cos(x) + 1
 
-        for i in range(0, m):
-            ssf.iloc[i] = c1 * close.iloc[i] + b1 * ssf.iloc[i - 1] + a1 * ssf.iloc[i - 2]
+        result = _ssf2(x_, a1, b1, c1)
+
+    ssf = Series(result, index=close.index)
 
     # Offset
     if offset != 0:
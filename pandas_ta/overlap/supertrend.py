@@ -1,9 +1,37 @@
 # -*- coding: utf-8 -*-
+from numpy import float64, full, int64, ones, zeros
 from numpy import nan as npNaN
-from pandas import DataFrame
+from pandas_ta.backend import DataFrame
 from pandas_ta.overlap import hl2
 from pandas_ta.volatility import atr
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, njit, verify_series
+
+
+@njit(cache=True)
+def _supertrend(x, upperband, lowerband):
+    """Supertrend bands and direction over float64 arrays. The bands are
+    carried forward in place. Compiled when numba is installed."""
+    m = x.shape[0]
+    dir_, trend = ones(m, dtype=int64), zeros(m)
+    long, short = full(m, npNaN), full(m, npNaN)
+
+    for i in range(1, m):
+        if x[i] > upperband[i - 1]:
+            dir_[i] = 1
+        elif x[i] < lowerband[i - 1]:
+            dir_[i] = -1
+        else:
+            dir_[i] = dir_[i - 1]
+            if dir_[i] > 0 and lowerband[i] < lowerband[i - 1]:
+                lowerband[i] = lowerband[i - 1]
+            if dir_[i] < 0 and upperband[i] > upperband[i - 1]:
+                upperband[i] = upperband[i - 1]
+
+        if dir_[i] > 0:
+            trend[i] = long[i] = lowerband[i]
+        else:
+            trend[i] = short[i] = upperband[i]
+    return trend, dir_, long, short
 
 
 def supertrend(high, low, close, length=None, multiplier=None, offset=None, **kwargs):
@@ -19,31 +47,16 @@ def supertrend(high, low, close, length=None, multiplier=None, offset=None, **kw
     if high is None or low is None or close is None: return
 
     # Calculate Results
-    m = close.size
-    dir_, trend = [1] * m, [0] * m
-    long, short = [npNaN] * m, [npNaN] * m
-
     hl2_ = hl2(high, low)
     matr = multiplier * atr(high, low, close, length)
     upperband = hl2_ + matr
     lowerband = hl2_ - matr
 
-    for i in range(1, m):
-        if close.iloc[i] > upperband.iloc[i - 1]:
-            dir_[i] = 1
-        elif close.iloc[i] < lowerband.iloc[i - 1]:
-            dir_[i] = -1
-        else:
-            dir_[i] = dir_[i - 1]
-            if dir_[i] > 0 and lowerband.iloc[i] < lowerband.iloc[i - 1]:
-                lowerband.iloc[i] = lowerband.iloc[i - 1]
-            if dir_[i] < 0 and upperband.iloc[i] > upperband.iloc[i - 1]:
-                upperband.iloc[i] = upperband.iloc[i - 1]
-
-        if dir_[i] > 0:
-            trend[i] = long[i] = lowerband.iloc[i]
-        else:
-            trend[i] = short[i] = upperband.iloc[i]
+    trend, dir_, long, short = _supertrend(
+        close.to_numpy(dtype=float64),
+        upperband.to_numpy(dtype=float64),
+        lowerband.to_numpy(dtype=float64),
+    )
 
     # Prepare DataFrame to return
     _props = f"_{length}_{multiplier}"
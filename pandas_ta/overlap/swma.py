@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, symmetric_triangle, verify_series, weights
+from numpy import float64
+from pandas_ta.backend import Series
+from pandas_ta.utils import get_offset, symmetric_triangle, verify_series, weighted_window
 
 
 def swma(close, length=None, asc=None, offset=None, **kwargs):
@@ -15,8 +17,8 @@ def swma(close, length=None, asc=None, offset=None, **kwargs):
 
     # Calculate Result
     triangle = symmetric_triangle(length, weighted=True)
-    swma = close.rolling(length, min_periods=length).apply(weights(triangle), raw=True)
-    # swma = close.rolling(length).apply(weights(triangle), raw=True)
+    swma = weighted_window(close.to_numpy(dtype=float64), triangle)
+    swma = Series(swma, index=close.index)
 
     # Offset
     if offset != 0:
@@ -50,13 +52,9 @@ Calculation:
     Default Inputs:
         length=10
 
-    def weights(w):
-        def _compute(x):
-            return np.dot(w * x)
-        return _compute
-
     triangle = utils.symmetric_triangle(length - 1)
-    SWMA = close.rolling(length)_.apply(weights(triangle), raw=True)
+    # The dot product of triangle with every window, as one convolution
+    SWMA = utils.weighted_window(close, triangle)
 
 Args:
     close (pd.Series): Series of 'close's
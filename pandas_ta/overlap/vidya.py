@@ -1,7 +1,18 @@
 # -*- coding: utf-8 -*-
+from numpy import float64, zeros
 from numpy import nan as npNaN
-from pandas import Series
-from pandas_ta.utils import get_drift, get_offset, verify_series
+from pandas_ta.backend import Series
+from pandas_ta.utils import get_drift, get_offset, njit, verify_series
+
+
+@njit(cache=True)
+def _vidya(x, abs_cmo, length, alpha):
+    """VIDYA recursion over float64 arrays. Compiled when numba is installed."""
+    m = x.shape[0]
+    result = zeros(m)
+    for i in range(length, m):
+        result[i] = alpha * abs_cmo[i] * x[i] + result[i - 1] * (1 - alpha * abs_cmo[i])
+    return result
 
 
 def vidya(close, length=None, drift=None, offset=None, **kwargs):
@@ -29,12 +40,10 @@ def vidya(close, length=None, drift=None, offset=None, **kwargs):
         return (pos_sum - neg_sum) / (pos_sum + neg_sum)
 
     # Calculate Result
-    m = close.size
     alpha = 2 / (length + 1)
     abs_cmo = _cmo(close, length, drift).abs()
-    vidya = Series(0, index=close.index)
-    for i in range(length, m):
-        vidya.iloc[i] = alpha * abs_cmo.iloc[i] * close.iloc[i] + vidya.iloc[i - 1] * (1 - alpha * abs_cmo.iloc[i])
+    result = _vidya(close.to_numpy(dtype=float64), abs_cmo.to_numpy(dtype=float64), length, alpha)
+    vidya = Series(result, index=close.index)
     vidya.replace({0: npNaN}, inplace=True)
 
     # Offset
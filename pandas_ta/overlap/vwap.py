@@ -1,6 +1,16 @@
 # -*- coding: utf-8 -*-
+from numpy import column_stack, errstate, float64, maximum, sqrt
+from numpy import nan as npNaN
 from .hlc3 import hlc3
+from pandas_ta.backend import DataFrame, Series
 from pandas_ta.utils import get_offset, is_datetime_ordered, verify_series
+from pandas_ta.utils import session_cumsum, session_ids
+
+
+def _anchor(anchor) -> str:
+    """The Timeseries Offset Alias of an anchor, "D" by default."""
+    return anchor.upper() if anchor and isinstance(anchor, str) and len(anchor) >= 1 else "D"
+
 
 def vwap(high, low, close, volume, anchor=None, offset=None, **kwargs):
     """Indicator: Volume Weighted Average Price (VWAP)"""
@@ -9,7 +19,11 @@ def vwap(high, low, close, volume, anchor=None, offset=None, **kwargs):
     low = verify_series(low)
     close = verify_series(close)
     volume = verify_series(volume)
-    anchor = anchor.upper() if anchor and isinstance(anchor, str) and len(anchor) >= 1 else "D"
+    anchors = [_anchor(x) for x in (anchor if isinstance(anchor, (list, tuple)) else [anchor])]
+    bands = kwargs.pop("bands", None)
+    bands = [float(x) for x in (bands if isinstance(bands, (list, tuple)) else [bands]) if x] if bands else []
+    sessions = kwargs.pop("sessions", None)
+    sessions = {_anchor(k): v for k, v in sessions.items()} if isinstance(sessions, dict) else {}
     offset = get_offset(offset)
 
     typical_price = hlc3(high=high, low=low, close=close)
@@ -19,9 +33,31 @@ def vwap(high, low, close, volume, anchor=None, offset=None, **kwargs):
         print(f"[!] VWAP price series is not datetime ordered. Results may not be as expected.")
 
     # Calculate Result
-    wp = typical_price * volume
-    vwap  = wp.groupby(wp.index.to_period(anchor)).cumsum()
-    vwap /= volume.groupby(volume.index.to_period(anchor)).cumsum()
+    # Session cumulative sums of tp * volume, volume and, for the bands,
+    # tp^2 * volume of every anchor in one pass over the rows
+    tp = typical_price.to_numpy(dtype=float64)
+    wp = tp * volume.to_numpy(dtype=float64)
+    sums = column_stack([wp, volume.to_numpy(dtype=float64)] + ([wp * tp] if bands else []))
+
+    result = {}
+    for anchor in anchors:
+        ids = sessions.get(anchor)
+        ids = session_ids(volume.index, anchor) if ids is None else ids
+        cumulative = session_cumsum(sums, ids)
+        with errstate(divide="ignore", invalid="ignore"):
+            vwap = cumulative[:, 0] / cumulative[:, 1]
+            vwap[cumulative[:, 1] == 0] = npNaN
+            result[f"VWAP_{anchor}"] = vwap
+            if bands:
+                stdev = sqrt(maximum(cumulative[:, 2] / cumulative[:, 1] - vwap * vwap, 0))
+                for k in bands:
+                    result[f"VWAPL_{anchor}_{k}"] = vwap - k * stdev
+                    result[f"VWAPU_{anchor}_{k}"] = vwap + k * stdev
+
+    if len(result) == 1:
+        vwap = Series(vwap, index=volume.index)
+    else:
+        vwap = DataFrame(result, index=volume.index)
 
     # Offset
     if offset != 0:
@@ -34,7 +70,7 @@ def vwap(high, low, close, volume, anchor=None, offset=None, **kwargs):
         vwap.fillna(method=kwargs["fill_method"], inplace=True)
 
     # Name & Category
-    vwap.name = f"VWAP_{anchor}"
+    vwap.name = f"VWAP_{'_'.join(anchors)}"
     vwap.category = "overlap"
 
     return vwap
@@ -45,7 +81,10 @@ vwap.__doc__ = \
 
 The Volume Weighted Average Price that measures the average typical price
 by volume.  It is typically used with intraday charts to identify general
-direction.
+direction. The sessions of the anchors are numbered once (df.ta.sessions
+keeps them with the DataFrame) and the cumulative sums restart at their
+boundaries, so several anchors and the standard deviation bands take a
+single pass over the rows each.
 
 Sources:
     https://www.tradingview.com/wiki/Volume_Weighted_Average_Price_(VWAP)
@@ -55,7 +94,12 @@ Sources:
 Calculation:
     tp = typical_price = hlc3(high, low, close)
     tpv = tp * volume
-    VWAP = tpv.cumsum() / volume.cumsum()
+    VWAP = tpv.cumsum() / volume.cumsum()  # per session of the anchor
+
+    if bands:
+        STDEV = sqrt((tp * tpv).cumsum() / volume.cumsum() - VWAP^2)
+        VWAPL = VWAP - band * STDEV, for each band
+        VWAPU = VWAP + band * STDEV, for each band
 
 Args:
     high (pd.Series): Series of 'high's
@@ -65,13 +109,19 @@ Args:
     anchor (str): How to anchor VWAP. Depending on the index values, it will
         implement various Timeseries Offset Aliases as listed here:
         https://pandas.pydata.org/pandas-docs/stable/user_guide/timeseries.html#timeseries-offset-aliases
+        A list of anchors computes each of them, i.e. ["D", "W", "M"].
         Default: "D".
     offset (int): How many periods to offset the result. Default: 0
 
 Kwargs:
     fillna (value, optional): pd.DataFrame.fillna(value)
     fill_method (value, optional): Type of fill method
+    bands (float | list, optional): Standard deviation multiples of the
+        lower and upper bands, i.e. [1, 2]. Default: None
+    sessions (dict, optional): Precomputed session_ids of the index by
+        anchor. Default: None
 
 Returns:
-    pd.Series: New feature generated.
+    pd.Series: New feature generated. pd.DataFrame with several anchors or
+        with bands.
 """
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
-from pandas import Series
+from numpy import arange as npArange
+from numpy import float64
+from pandas_ta.backend import Series
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, verify_series, weighted_window
 
 
 def wma(close, length=None, asc=None, talib=None, offset=None, **kwargs):
@@ -20,20 +22,12 @@ def wma(close, length=None, asc=None, talib=None, offset=None, **kwargs):
         from talib import WMA
         wma = WMA(close, length)
     else:
-        from numpy import arange as npArange
-        from numpy import dot as npDot
-
         total_weight = 0.5 * length * (length + 1)
-        weights_ = Series(npArange(1, length + 1))
+        weights_ = npArange(1, length + 1)
         weights = weights_ if asc else weights_[::-1]
 
-        def linear(w):
-            def _compute(x):
-                return npDot(x, w) / total_weight
-            return _compute
-
-        close_ = close.rolling(length, min_periods=length)
-        wma = close_.apply(linear(weights), raw=True)
+        wma = weighted_window(close.to_numpy(dtype=float64), weights)
+        wma = Series(wma / total_weight, index=close.index)
 
     # Offset
     if offset != 0:
@@ -68,12 +62,8 @@ Calculation:
     weights_ = [1, 2, ..., length + 1]  # Ascending
     weights = weights if asc else weights[::-1]
 
-    def linear_weights(w):
-        def _compute(x):
-            return (w * x).sum() / total_weight
-        return _compute
-
-    WMA = close.rolling(length)_.apply(linear_weights(weights), raw=True)
+    # The dot product of weights with every window, as one convolution
+    WMA = utils.weighted_window(close, weights) / total_weight
 
 Args:
     close (pd.Series): Series of 'close's
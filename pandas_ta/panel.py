@@ -0,0 +1,544 @@
+# -*- coding: utf-8 -*-
+from inspect import signature
+
+from numpy import abs as npAbs
+from numpy import bincount, column_stack, float64, fmax, full, nan as npNaN, unique
+from numpy import split as npSplit
+from numpy import stack as npStack
+from numpy import log as nplog
+from numpy import sqrt as npSqrt
+
+from pandas_ta import Category
+from pandas_ta.backend import concat, DataFrame, RangeIndex
+from pandas_ta.core import Strategy
+from pandas_ta.utils import get_drift, non_zero_range, rolling_moments
+
+
+def panel_strategy(data, strategy=None, by: str = "symbol", **kwargs):
+    """Panel Strategy
+
+    Runs a Strategy over many symbols at once. Symbols with the same index
+    (equal length histories) are stacked into 2-D arrays, one column per
+    symbol, and the rolling and ewm indicators with a panel kernel (see
+    ta.PANEL_INDICATORS) are evaluated column-wise in one pass. Symbols with
+    ragged histories form panels of their own. The remaining indicators, and
+    indicators with arguments the kernels do not support, are evaluated per
+    symbol with df.ta.strategy().
+
+    The kernels are the native implementations of the indicators, as with
+    talib=False.
+
+    Example:
+    >>> frames = {"AAPL": aapl_df, "MSFT": msft_df, ...}
+    >>> ta.panel_strategy(frames, ta.CommonStrategy)
+
+    Or with a long DataFrame of OHLCV rows, in time order per symbol:
+    >>> result = ta.panel_strategy(df, "momentum", by="symbol", append=False)
+
+    Args:
+        data (dict, DataFrame): Either a dict of DataFrames by symbol or a
+            long DataFrame whose column or index level 'by' holds the
+            symbol of each row.
+        strategy (Strategy, str): The Strategy or its name as in
+            df.ta.strategy(). Default: "all"
+        by (str): The column or index level of the symbols of a long
+            DataFrame. Default: "symbol"
+
+    Kwargs:
+        append (bool): If True, the indicators are appended to the DataFrames
+            of data. If False, they are returned in the same layout as data.
+            Default: True
+        exclude (list): Indicators to exclude from "all" or a Category.
+        All other kwargs are passed to df.ta.strategy() for the indicators
+        evaluated per symbol. Default executor: "serial"
+
+    Returns:
+        dict, DataFrame: data with the indicators appended or, if append is
+            False, the indicators in the layout of data.
+    """
+    append = kwargs.pop("append", True)
+    exclude = kwargs.pop("exclude", None)
+    exclude = list(exclude) if isinstance(exclude, (list, tuple)) else []
+    kwargs.setdefault("executor", "serial")
+    for _ in ("returns", "verbose"): kwargs.pop(_, None)
+    # Like strategy(), the other kwargs apply to every indicator
+    common = {k: v for k, v in kwargs.items() if k not in _OPTIONS}
+
+    panel = _Panel(data, by)
+    entries, name = _entries(strategy, exclude)
+
+    # Column-wise pass over the panels, in Strategy order
+    computed, grouped = [], []
+    for entry in entries:
+        task = _task({**entry, **common}, panel, computed)
+        if task is None:
+            grouped.append(entry)
+            continue
+        try:
+            names = panel.evaluate(*task)
+        except _Unsupported:
+            grouped.append(entry)
+            continue
+        computed.extend(x for x in names if x not in computed)
+
+    # Grouped pass over the symbols for everything else
+    if name is None:
+        if len(grouped):
+            panel.strategy((Strategy(strategy.name, grouped, strategy.description),), **kwargs)
+    else:
+        done = [x["kind"] for x in entries if x not in grouped]
+        panel.strategy((name,), exclude=exclude + done, **kwargs)
+
+    return panel.result(append)
+
+
+# Column-wise Indicator Kernels
+# Each takes the sources as 2-D DataFrames with a column per symbol, validates
+# its arguments like the indicator, and returns {name: DataFrame} or None when
+# the panel is shorter than the indicator requires.
+class _Unsupported(Exception):
+    """Arguments that only the indicator itself supports."""
+
+
+def _hl2(high, low):
+    return {"HL2": 0.5 * (high + low)}
+
+
+def _hlc3(high, low, close):
+    return {"HLC3": (high + low + close) / 3.0}
+
+
+def _ohlc4(open_, high, low, close):
+    return {"OHLC4": 0.25 * (open_ + high + low + close)}
+
+
+def _log_return(close, length=None, cumulative=None):
+    length = int(length) if length and length > 0 else 1
+    cumulative = bool(cumulative) if cumulative is not None and cumulative else False
+    if close.shape[0] < length: return
+    if cumulative:
+        log_return = nplog(close / close.iloc[0])
+    else:
+        log_return = nplog(close / close.shift(length))
+    return {f"{'CUM' if cumulative else ''}LOGRET_{length}": log_return}
+
+
+def _percent_return(close, length=None, cumulative=None):
+    length = int(length) if length and length > 0 else 1
+    cumulative = bool(cumulative) if cumulative is not None and cumulative else False
+    if close.shape[0] < length: return
+    if cumulative:
+        pct_return = (close / close.iloc[0]) - 1
+    else:
+        pct_return = close.pct_change(length)
+    return {f"{'CUM' if cumulative else ''}PCTRET_{length}": pct_return}
+
+
+def _mom(close, length=None):
+    length = int(length) if length and length > 0 else 10
+    if close.shape[0] < length: return
+    return {f"MOM_{length}": close.diff(length)}
+
+
+def _roc(close, length=None, scalar=None):
+    length = int(length) if length and length > 0 else 10
+    scalar = float(scalar) if scalar and scalar > 0 else 100
+    if close.shape[0] < length: return
+    return {f"ROC_{length}": scalar * close.diff(length) / close.shift(length)}
+
+
+def _sma(close, length=None, min_periods=None):
+    length = int(length) if length and length > 0 else 10
+    min_periods = int(min_periods) if min_periods is not None else length
+    if close.shape[0] < max(length, min_periods): return
+    return {f"SMA_{length}": close.rolling(length, min_periods=min_periods).mean()}
+
+
+def _ema(close, length=None, adjust=False, sma=True):
+    length = int(length) if length and length > 0 else 10
+    if close.shape[0] < length: return
+    if sma:
+        close = close.copy()
+        sma_nth = close.iloc[0:length].mean()
+        close.iloc[:length - 1] = npNaN
+        close.iloc[length - 1] = sma_nth
+    return {f"EMA_{length}": close.ewm(span=length, adjust=adjust).mean()}
+
+
+def _rma(close, length=None):
+    length = int(length) if length and length > 0 else 10
+    alpha = (1.0 / length) if length > 0 else 0.5
+    if close.shape[0] < length: return
+    return {f"RMA_{length}": close.ewm(alpha=alpha, min_periods=length).mean()}
+
+
+def _ma(mamode, close, length):
+    """The moving averages of the kernels."""
+    kernel = {"ema": _ema, "rma": _rma, "sma": _sma}.get(mamode)
+    if kernel is None:
+        raise _Unsupported(mamode)
+    result = kernel(close, length=length)
+    return result.popitem()[1] if result is not None else None
+
+
+def _moments(close, length, min_periods=None, ddof=1):
+    """The rolling mean and variance of each column, from the same
+    ta.utils.rolling_moments pass as the indicators."""
+    moments = [rolling_moments(close[c], length, min_periods, ddof)[:2] for c in close.columns]
+    mean, variance = (
+        DataFrame(column_stack([x[k].to_numpy() for x in moments]), index=close.index, columns=close.columns)
+        for k in range(2)
+    )
+    return mean, variance
+
+
+def _rsi(close, length=None, scalar=None, drift=None):
+    length = int(length) if length and length > 0 else 14
+    scalar = float(scalar) if scalar else 100
+    drift = get_drift(drift)
+    if close.shape[0] < length: return
+    negative = close.diff(periods=drift)
+    positive = negative.where(negative >= 0, 0)
+    negative = negative.where(negative <= 0, 0)
+    positive_avg = _ma("rma", positive, length)
+    negative_avg = _ma("rma", negative, length)
+    return {f"RSI_{length}": scalar * positive_avg / (positive_avg + negative_avg.abs())}
+
+
+def _macd(close, fast=None, slow=None, signal=None, asmode=False):
+    fast = int(fast) if fast and fast > 0 else 12
+    slow = int(slow) if slow and slow > 0 else 26
+    signal = int(signal) if signal and signal > 0 else 9
+    if slow < fast:
+        fast, slow = slow, fast
+    if close.shape[0] < max(fast, slow, signal): return
+
+    def signal_ma(x):
+        # The signal of each symbol starts at its first MACD value
+        first = x.notna().to_numpy().argmax(axis=0)
+        parts = []
+        for start in unique(first):
+            columns = x.columns[first == start]
+            part = _ma("ema", x[columns].iloc[start:], signal)
+            parts.append(part if part is not None else x[columns].iloc[start:] * npNaN)
+        return concat(parts, axis=1).reindex(index=x.index, columns=x.columns)
+
+    macd = _ma("ema", close, fast) - _ma("ema", close, slow)
+    signalma = signal_ma(macd)
+    histogram = macd - signalma
+    if asmode:
+        macd = macd - signalma
+        signalma = signal_ma(macd)
+        histogram = macd - signalma
+
+    _asmode = "AS" if asmode else ""
+    _props = f"_{fast}_{slow}_{signal}"
+    return {f"MACD{_asmode}{_props}": macd, f"MACD{_asmode}h{_props}": histogram, f"MACD{_asmode}s{_props}": signalma}
+
+
+def _variance(close, length=None, ddof=None, min_periods=None):
+    length = int(length) if length and length > 1 else 30
+    ddof = int(ddof) if isinstance(ddof, int) and ddof >= 0 and ddof < length else 1
+    min_periods = int(min_periods) if min_periods is not None else length
+    if close.shape[0] < max(length, min_periods): return
+    return {f"VAR_{length}": _moments(close, length, min_periods, ddof)[1]}
+
+
+def _stdev(close, length=None, ddof=None):
+    length = int(length) if length and length > 0 else 30
+    ddof = int(ddof) if isinstance(ddof, int) and ddof >= 0 and ddof < length else 1
+    if close.shape[0] < length: return
+    variance = _variance(close, length=length, ddof=ddof)
+    if variance is None: return
+    return {f"STDEV_{length}": npSqrt(variance.popitem()[1])}
+
+
+def _zscore(close, length=None, std=None, ddof=None):
+    length = int(length) if length and length > 1 else 30
+    std = float(std) if std and std > 1 else 1
+    if close.shape[0] < length: return
+    ddof = int(ddof) if isinstance(ddof, int) and ddof >= 0 and ddof < length else 1
+    mean, variance = _moments(close, length, ddof=ddof)
+    std *= npSqrt(variance)
+    return {f"ZS_{length}": (close - mean) / std}
+
+
+def _bbands(close, length=None, std=None, ddof=0, mamode=None):
+    length = int(length) if length and length > 0 else 5
+    std = float(std) if std and std > 0 else 2.0
+    mamode = mamode if isinstance(mamode, str) else "sma"
+    ddof = int(ddof) if ddof >= 0 and ddof < length else 1
+    if mamode not in ("ema", "sma"):
+        raise _Unsupported(mamode)
+    if close.shape[0] < length: return
+
+    mean, variance = _moments(close, length, ddof=ddof)
+    deviations = std * npSqrt(variance)
+    mid = mean if mamode == "sma" else _ma(mamode, close, length)
+    lower = mid - deviations
+    upper = mid + deviations
+    ulr = non_zero_range(upper, lower)
+    bandwidth = 100 * ulr / mid
+    percent = non_zero_range(close, lower) / ulr
+
+    _props = f"_{length}_{std}"
+    return {
+        f"BBL{_props}": lower, f"BBM{_props}": mid, f"BBU{_props}": upper,
+        f"BBB{_props}": bandwidth, f"BBP{_props}": percent,
+    }
+
+
+def _true_range(high, low, close, drift=None):
+    drift = get_drift(drift)
+    high_low_range = non_zero_range(high, low)
+    prev_close = close.shift(drift)
+    # Row-wise maximum of the absolute ranges, ignoring NaNs
+    true_range = fmax(fmax(npAbs(high_low_range), npAbs(high - prev_close)), npAbs(prev_close - low))
+    true_range.iloc[:drift] = npNaN
+    return {f"TRUERANGE_{drift}": true_range}
+
+
+def _atr(high, low, close, length=None, mamode=None, drift=None, percent=False):
+    length = int(length) if length and length > 0 else 14
+    mamode = mamode.lower() if mamode and isinstance(mamode, str) else "rma"
+    if mamode not in ("ema", "rma", "sma"):
+        raise _Unsupported(mamode)
+    if close.shape[0] < length: return
+    tr = _true_range(high, low, close, drift=drift).popitem()[1]
+    atr = _ma(mamode, tr, length)
+    if percent:
+        atr *= 100 / close
+    return {f"ATR{mamode[0]}_{length}{'p' if percent else ''}": atr}
+
+
+def _obv(close, volume):
+    sign = close.diff(periods=1)
+    sign = sign.where(sign <= 0, 1)
+    sign = sign.where(sign >= 0, -1)
+    sign.iloc[0] = 1
+    return {"OBV": (sign * volume).cumsum()}
+
+
+PANEL_KERNELS = {
+    "atr": _atr, "bbands": _bbands, "ema": _ema, "hl2": _hl2, "hlc3": _hlc3,
+    "log_return": _log_return, "macd": _macd, "mom": _mom, "obv": _obv,
+    "ohlc4": _ohlc4, "percent_return": _percent_return, "rma": _rma,
+    "roc": _roc, "rsi": _rsi, "sma": _sma, "stdev": _stdev,
+    "true_range": _true_range, "variance": _variance, "zscore": _zscore,
+}
+PANEL_INDICATORS = sorted(PANEL_KERNELS)
+
+# Source parameters of the kernels and their default columns
+_SOURCES = {"open_": "open", "high": "high", "low": "low", "close": "close", "volume": "volume"}
+# Strategy keys that do not change the values of an indicator
+_NAMING = ("append", "delimiter", "kind", "prefix", "suffix")
+# Options of strategy() that are not indicator arguments
+_OPTIONS = ("chunksize", "executor", "ordered", "shared", "timed")
+
+
+def _entries(strategy, exclude: list) -> tuple:
+    """The indicators of a Strategy as ta dicts and the name of the Strategy
+    for "all" and Categories, None for a custom Strategy."""
+    if isinstance(strategy, Strategy):
+        if strategy.ta is not None and strategy.name.lower() != "all" \
+                and strategy.name.lower() not in Category:
+            return [dict(x) for x in strategy.ta], None
+        strategy = strategy.name
+    name = strategy.lower() if isinstance(strategy, str) else "all"
+    if name != "all" and name not in Category:
+        raise ValueError(f"[X] Not an available strategy: {strategy}")
+    kinds = [x for v in Category.values() for x in v] if name == "all" else Category[name]
+    return [{"kind": x} for x in PANEL_INDICATORS if x in kinds and x not in exclude], name
+
+
+def _task(entry: dict, panel, computed: list):
+    """The kernel, its source columns and arguments for a ta dict or None
+    if it has to be evaluated per symbol."""
+    kernel = PANEL_KERNELS.get(entry.get("kind"))
+    if kernel is None or entry.get("talib") or "params" in entry \
+            or "col_names" in entry or "col_numbers" in entry:
+        return None
+    parameters = signature(kernel).parameters
+    sources, arguments = {}, {}
+    for key, value in entry.items():
+        if key in _NAMING or key == "talib":
+            continue
+        if key in _SOURCES.values():
+            if not isinstance(value, str): return None
+            continue
+        if key not in parameters or key in _SOURCES:
+            return None
+        arguments[key] = value
+
+    for parameter in parameters:
+        if parameter in _SOURCES:
+            column = entry.get(_SOURCES[parameter], _SOURCES[parameter])
+            column = panel.column_name(column, computed)
+            if column is None: return None
+            sources[parameter] = column
+
+    delimiter = entry.get("delimiter", "_")
+    prefix = f"{entry['prefix']}{delimiter}" if "prefix" in entry else ""
+    suffix = f"{delimiter}{entry['suffix']}" if "suffix" in entry else ""
+    return kernel, sources, arguments, prefix, suffix
+
+
+class _Panel:
+    """The symbols of panel_strategy() grouped into panels of the same
+    index, with the sources and results of each symbol."""
+
+    def __init__(self, data, by: str):
+        if isinstance(data, dict):
+            self.data, self.long = data, False
+            self.symbols = list(data.keys())
+            self.columns = list(next(iter(data.values())).columns) if len(data) else []
+            indexes = {s: data[s].index for s in self.symbols}
+        elif isinstance(data, DataFrame):
+            self.data, self.long = data, True
+            self.columns = list(data.columns)
+            if by in data.columns:
+                keys = data[by].to_numpy()
+                index = data.index
+            elif by in data.index.names:
+                keys = data.index.get_level_values(by).to_numpy()
+                index = data.index.droplevel(by) if data.index.nlevels > 1 else None
+            else:
+                raise ValueError(f"[X] '{by}' is not a column or index level of the DataFrame")
+            # Row positions of each symbol, in order of appearance
+            symbols, first, inverse = unique(keys, return_index=True, return_inverse=True)
+            symbols = symbols.tolist()
+            rows = npSplit(inverse.argsort(kind="stable"), bincount(inverse).cumsum()[:-1])
+            self.symbols = [symbols[i] for i in first.argsort()]
+            self.positions = {symbols[i]: rows[i] for i in first.argsort()}
+            indexes = {
+                s: index.take(p) if index is not None else RangeIndex(p.size)
+                for s, p in self.positions.items()
+            }
+        else:
+            raise TypeError("[X] data must be a dict of DataFrames or a DataFrame")
+
+        # Symbols with the same index form a panel
+        self.panels, candidates = [], {}
+        for symbol in self.symbols:
+            index = indexes[symbol]
+            key = (len(index), index[0] if len(index) else None, index[-1] if len(index) else None)
+            for panel in candidates.setdefault(key, []):
+                if panel["index"].equals(index):
+                    panel["symbols"].append(symbol)
+                    break
+            else:
+                panel = {"index": index, "symbols": [symbol], "results": {}, "sources": {}}
+                candidates[key].append(panel)
+                self.panels.append(panel)
+        self.indexes = indexes
+        self.grouped = {}  # {symbol: DataFrame}
+
+    def column_name(self, column: str, computed: list):
+        """The source column matching 'column' or None."""
+        if column in self.columns or column in computed:
+            return column
+        matches = [x for x in self.columns if isinstance(x, str) and x.lower() == column.lower()]
+        return matches[0] if len(matches) else None
+
+    def source(self, panel: dict, column: str):
+        """The 2-D DataFrame of a column of the symbols of a panel."""
+        if column in panel["results"]:
+            return panel["results"][column]
+        if column in panel["sources"]:
+            return panel["sources"][column]
+        if self.long:
+            values = self.data[column].to_numpy(dtype=float64)
+            values = column_stack([values[self.positions[s]] for s in panel["symbols"]])
+        else:
+            values = column_stack([self.data[s][column].to_numpy(dtype=float64) for s in panel["symbols"]])
+        panel["sources"][column] = DataFrame(values, index=panel["index"])
+        return panel["sources"][column]
+
+    def evaluate(self, kernel, sources: dict, arguments: dict, prefix: str, suffix: str) -> list:
+        """Evaluates a kernel on every panel. Returns the names of its
+        results."""
+        names = []
+        for panel in self.panels:
+            if any(x not in self.columns and x not in panel["results"] for x in sources.values()):
+                continue
+            result = kernel(**{k: self.source(panel, v) for k, v in sources.items()}, **arguments)
+            if result is None:
+                continue
+            for name, values in result.items():
+                name = prefix + name + suffix
+                panel["results"][name] = values
+                panel.pop("stack", None)
+                if name not in names: names.append(name)
+        return names
+
+    def strategy(self, args: tuple, **kwargs) -> None:
+        """Evaluates the Strategy args per symbol, on its sources and the
+        results of its panel."""
+        for panel in self.panels:
+            for j, symbol in enumerate(panel["symbols"]):
+                frame = self.frame(symbol, panel, j)
+                block = frame.ta.strategy(*args, append=False, **kwargs)
+                if block is not None and block.shape[1] > 0:
+                    self.grouped[symbol] = block
+
+    def frame(self, symbol, panel: dict, j: int) -> DataFrame:
+        """The sources of a symbol and the panel results."""
+        if self.long:
+            frame = self.data.take(self.positions[symbol])
+            frame.index = self.indexes[symbol]
+        else:
+            frame = self.data[symbol]
+        results = self._results(panel, j, frame.index)
+        return concat([frame, results], axis=1) if results.shape[1] > 0 else frame
+
+    def _results(self, panel: dict, j: int, index) -> DataFrame:
+        """The panel results of the j-th symbol of a panel."""
+        if "stack" not in panel:
+            # (rows, results, symbols) array of the results
+            values = [x.to_numpy(dtype=float64) for x in panel["results"].values()]
+            panel["stack"] = npStack(values, axis=1) if len(values) else None
+        if panel["stack"] is None:
+            return DataFrame(index=index)
+        return DataFrame(panel["stack"][:, :, j], index=index, columns=list(panel["results"]))
+
+    def result(self, append: bool):
+        """The results in the layout of the data."""
+        if self.long:
+            n = self.data.shape[0]
+            columns = {}
+            for panel in self.panels:
+                rows = [self.positions[s] for s in panel["symbols"]]
+                for name, values in panel["results"].items():
+                    column = columns.setdefault(name, full(n, npNaN))
+                    values = values.to_numpy(dtype=float64)
+                    for j, p in enumerate(rows):
+                        column[p] = values[:, j]
+            for symbol, block in self.grouped.items():
+                p = self.positions[symbol]
+                for name in block.columns:
+                    column = columns.setdefault(name, full(n, npNaN))
+                    column[p] = block[name].to_numpy(dtype=float64, na_value=npNaN)
+            block = DataFrame(columns, index=self.data.index)
+            if not append:
+                return block
+            for name in block.columns:
+                self.data[name] = block[name]
+            return self.data
+
+        blocks = {}
+        for panel in self.panels:
+            for j, symbol in enumerate(panel["symbols"]):
+                block = self._results(panel, j, self.data[symbol].index)
+                if symbol in self.grouped:
+                    # Columns of the grouped pass replace those of the panel
+                    grouped = self.grouped[symbol]
+                    block = block[[x for x in block.columns if x not in grouped.columns]]
+                    block = concat([block, grouped], axis=1)
+                blocks[symbol] = block
+        if not append:
+            return blocks
+        for symbol, block in blocks.items():
+            frame = self.data[symbol]
+            for name in block.columns:
+                frame[name] = block[name]
+        return self.data
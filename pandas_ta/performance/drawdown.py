@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from numpy import log as nplog
 from numpy import seterr
-from pandas import DataFrame
+from pandas_ta.backend import DataFrame
 from pandas_ta.utils import get_offset, verify_series
 
 
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, rolling_moments, verify_series
 
 
 def kurtosis(close, length=None, offset=None, **kwargs):
@@ -13,7 +13,7 @@ def kurtosis(close, length=None, offset=None, **kwargs):
     if close is None: return
 
     # Calculate Result
-    kurtosis = close.rolling(length, min_periods=min_periods).kurt()
+    kurtosis = rolling_moments(close, length, min_periods)[3]
 
     # Offset
     if offset != 0:
@@ -42,6 +42,8 @@ Calculation:
         length=30
     KURTOSIS = close.rolling(length).kurt()
 
+    The excess kurtosis of ta.utils.rolling_moments.
+
 Args:
     close (pd.Series): Series of 'close's
     length (int): It's period. Default: 30
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
-from numpy import fabs as npfabs
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, rolling_order_stats, verify_series
 
 
 def mad(close, length=None, offset=None, **kwargs):
@@ -14,11 +13,7 @@ def mad(close, length=None, offset=None, **kwargs):
     if close is None: return
 
     # Calculate Result
-    def mad_(series):
-        """Mean Absolute Deviation"""
-        return npfabs(series - series.mean()).mean()
-
-    mad = close.rolling(length, min_periods=min_periods).apply(mad_, raw=True)
+    mad = rolling_order_stats(close, length, min_periods=min_periods, mad=True)[0]
 
     # Offset
     if offset != 0:
@@ -40,12 +35,17 @@ def mad(close, length=None, offset=None, **kwargs):
 mad.__doc__ = \
 """Rolling Mean Absolute Deviation
 
+The mean absolute deviation of each window from its mean. The window is
+kept sorted by the rolling order statistics engine, so the deviation is the
+sum of the values above the mean less those below it, without a Python call
+per window. See help(ta.utils.rolling_order_stats).
+
 Sources:
 
 Calculation:
     Default Inputs:
         length=30
-    mad = close.rolling(length).mad()
+    mad = close.rolling(length).apply(lambda x: abs(x - x.mean()).mean())
 
 Args:
     close (pd.Series): Series of 'close's
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, rolling_order_stats, verify_series
 
 
 def median(close, length=None, offset=None, **kwargs):
@@ -13,7 +13,7 @@ def median(close, length=None, offset=None, **kwargs):
     if close is None: return
 
     # Calculate Result
-    median = close.rolling(length, min_periods=min_periods).median()
+    median = rolling_order_stats(close, length, min_periods=min_periods, median=True)[0]
 
     # Offset
     if offset != 0:
@@ -36,6 +36,8 @@ median.__doc__ = \
 """Rolling Median
 
 Rolling Median of over 'n' periods. Sibling of a Simple Moving Average.
+Computed by the rolling order statistics engine, see
+help(ta.utils.rolling_order_stats).
 
 Sources:
     https://www.incrediblecharts.com/indicators/median_price.php
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.backend import DataFrame
+from pandas_ta.utils import get_offset, rolling_order_stats, verify_series
 
 
 def quantile(close, length=None, q=None, offset=None, **kwargs):
@@ -7,14 +8,20 @@ def quantile(close, length=None, q=None, offset=None, **kwargs):
     # Validate Arguments
     length = int(length) if length and length > 0 else 30
     min_periods = int(kwargs["min_periods"]) if "min_periods" in kwargs and kwargs["min_periods"] is not None else length
-    q = float(q) if q and q > 0 and q < 1 else 0.5
+    qs = q if isinstance(q, (list, tuple)) else [q]
+    qs = [float(x) if x and x > 0 and x < 1 else 0.5 for x in qs]
     close = verify_series(close, max(length, min_periods))
     offset = get_offset(offset)
 
     if close is None: return
 
     # Calculate Result
-    quantile = close.rolling(length, min_periods=min_periods).quantile(q)
+    # Every quantile from one pass over the sorted windows
+    quantiles = rolling_order_stats(close, length, qs, min_periods=min_periods)
+    if isinstance(q, (list, tuple)):
+        quantile = DataFrame({f"QTL_{length}_{x}": y for x, y in zip(qs, quantiles)})
+    else:
+        quantile, q = quantiles[0], qs[0]
 
     # Offset
     if offset != 0:
@@ -27,7 +34,7 @@ def quantile(close, length=None, q=None, offset=None, **kwargs):
         quantile.fillna(method=kwargs["fill_method"], inplace=True)
 
     # Name & Category
-    quantile.name = f"QTL_{length}_{q}"
+    quantile.name = f"QTL_{length}_{q}" if not isinstance(q, (list, tuple)) else f"QTL_{length}"
     quantile.category = "statistics"
 
     return quantile
@@ -36,6 +43,10 @@ def quantile(close, length=None, q=None, offset=None, **kwargs):
 quantile.__doc__ = \
 """Rolling Quantile
 
+Rolling Quantiles with linear interpolation. Any number of quantiles, i.e.
+q=[0.05, 0.25, 0.5, 0.75, 0.95], is computed from a single pass of the
+rolling order statistics engine. See help(ta.utils.rolling_order_stats).
+
 Sources:
 
 Calculation:
@@ -46,7 +57,7 @@ Calculation:
 Args:
     close (pd.Series): Series of 'close's
     length (int): It's period. Default: 30
-    q (float): The quantile. Default: 0.5
+    q (float | list): The quantile or a list of quantiles. Default: 0.5
     offset (int): How many periods to offset the result. Default: 0
 
 Kwargs:
@@ -54,5 +65,5 @@ Kwargs:
     fill_method (value, optional): Type of fill method
 
 Returns:
-    pd.Series: New feature generated.
+    pd.Series: New feature generated. pd.DataFrame for a list of quantiles.
 """
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, rolling_moments, verify_series
 
 
 def skew(close, length=None, offset=None, **kwargs):
@@ -13,7 +13,7 @@ def skew(close, length=None, offset=None, **kwargs):
     if close is None: return
 
     # Calculate Result
-    skew = close.rolling(length, min_periods=min_periods).skew()
+    skew = rolling_moments(close, length, min_periods)[2]
 
     # Offset
     if offset != 0:
@@ -42,6 +42,8 @@ Calculation:
         length=30
     SKEW = close.rolling(length).skew()
 
+    Computed with the stable moments of ta.utils.rolling_moments.
+
 Args:
     close (pd.Series): Series of 'close's
     length (int): It's period. Default: 30
@@ -1,10 +1,10 @@
 # -*- coding: utf-8 -*-
 from numpy import sqrt as npsqrt
-from .variance import variance
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, rolling_moments, shared, verify_series
 
 
+@shared(length=30, ddof=1, talib=True, offset=0)
 def stdev(close, length=None, ddof=None, talib=None, offset=None, **kwargs):
     """Indicator: Standard Deviation"""
     # Validate Arguments
@@ -21,7 +21,7 @@ def stdev(close, length=None, ddof=None, talib=None, offset=None, **kwargs):
         from talib import STDDEV
         stdev = STDDEV(close, length)
     else:
-        stdev = variance(close=close, length=length, ddof=ddof).apply(npsqrt)
+        stdev = npsqrt(rolling_moments(close, length, ddof=ddof)[1])
 
     # Offset
     if offset != 0:
@@ -49,7 +49,7 @@ Calculation:
     Default Inputs:
         length=30
     VAR = Variance
-    STDEV = variance(close, length).apply(np.sqrt)
+    STDEV = np.sqrt(VAR(close, length, ddof))
 
 Args:
     close (pd.Series): Series of 'close's
@@ -3,7 +3,7 @@ from numpy import array as npArray
 from numpy import arange as npArange
 from numpy import polyfit as npPolyfit
 from numpy import std as npStd
-from pandas import DataFrame, DatetimeIndex, Series
+from pandas_ta.backend import DataFrame, DatetimeIndex, Series
 from .stdev import stdev as stdev
 from pandas_ta.utils import get_offset, verify_series
 
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, rolling_moments, verify_series
 
 
 def variance(close, length=None, ddof=None, talib=None, offset=None, **kwargs):
@@ -20,7 +20,7 @@ def variance(close, length=None, ddof=None, talib=None, offset=None, **kwargs):
         from talib import VAR
         variance = VAR(close, length)
     else:
-        variance = close.rolling(length, min_periods=min_periods).var(ddof)
+        variance = rolling_moments(close, length, min_periods, ddof)[1]
 
     # Offset
     if offset != 0:
@@ -42,6 +42,9 @@ def variance(close, length=None, ddof=None, talib=None, offset=None, **kwargs):
 variance.__doc__ = \
 """Rolling Variance
 
+Without TA Lib, the variance comes from the rolling central moments of
+ta.utils.rolling_moments, which stay precise across jumps in price level.
+
 Sources:
 
 Calculation:
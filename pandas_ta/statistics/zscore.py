@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
+from numpy import sqrt as npsqrt
+from pandas_ta import Imports
 from pandas_ta.overlap import sma
 from .stdev import stdev
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, rolling_moments, verify_series
 
 
 def zscore(close, length=None, std=None, offset=None, **kwargs):
@@ -15,8 +17,13 @@ def zscore(close, length=None, std=None, offset=None, **kwargs):
     if close is None: return
 
     # Calculate Result
-    std *= stdev(close=close, length=length, **kwargs)
-    mean = sma(close=close, length=length, **kwargs)
+    if Imports["talib"] and kwargs.get("talib", True) is not False:
+        std *= stdev(close=close, length=length, **kwargs)
+        mean = sma(close=close, length=length, **kwargs)
+    else:
+        # The mean and the variance from a single pass
+        mean, variance = rolling_moments(close, length, ddof=kwargs.get("ddof", 1))[:2]
+        std *= npsqrt(variance)
     zscore = (close - mean) / std
 
     # Offset
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+from ._base import Stream
+from .adx import ADX
+from .atr import ATR
+from .bbands import BBANDS
+from .ema import EMA
+from .hwma import HWMA
+from .jma import JMA
+from .kama import KAMA
+from .macd import MACD
+from .mcgd import MCGD
+from .psar import PSAR
+from .rma import RMA
+from .rsi import RSI
+from .rsx import RSX
+from .sma import SMA
+from .ssf import SSF
+from .stdev import STDEV
+from .stoch import STOCH
+from .supertrend import SUPERTREND
+from .t3 import T3
+from .td_seq import TD_SEQ
+from .vidya import VIDYA
+from .willr import WILLR
+from .strategy import StrategyStream
@@ -0,0 +1,382 @@
+# -*- coding: utf-8 -*-
+from collections import deque
+from functools import lru_cache
+from math import copysign, isnan
+
+from numpy import array as npArray
+from numpy import asarray, float64
+from numpy import nan as npNaN
+from numpy import ndarray
+
+
+class Stream:
+    """Stream
+
+    Base class of the stateful indicators of pandas_ta.stream. A Stream
+    consumes one value at a time and keeps only the state the recursion of
+    its indicator needs, so each update is O(1) in the length of the history.
+    The values are identical to the batch indicator evaluated on the same
+    history.
+
+    Example:
+    >>> ema = ta.stream.EMA(length=10)
+    >>> for price in ticks:
+    ...     value = ema.update(price)
+
+    Attributes:
+        count (int): Number of values consumed.
+        inputs (tuple): The source columns update takes, in order.
+        value (float): The last value. NaN while warming up.
+    """
+    inputs = ("close",)
+
+    def __init__(self):
+        self.reset()
+
+    def __repr__(self) -> str:
+        params = ", ".join(f"{k}={v}" for k, v in self.params().items())
+        return f"{self.__class__.__name__}({params})"
+
+    def params(self) -> dict:
+        """The parameters of the indicator."""
+        return {}
+
+    def reset(self) -> None:
+        """Forgets the consumed values."""
+        self.count = 0
+        self.value = npNaN
+
+    def update(self, x: float) -> float:
+        """Consumes the next value and returns the indicator value."""
+        raise NotImplementedError
+
+    def batch_update(self, *values) -> ndarray:
+        """Consumes an array of values per input and returns the indicator
+        values, as columns if the indicator has several."""
+        values = [asarray(x.to_numpy() if hasattr(x, "to_numpy") else x, dtype=float64) for x in values]
+        update = self.update
+        if len(values) == 1:
+            return npArray([update(x) for x in values[0].tolist()], dtype=float64)
+        return npArray([update(*x) for x in zip(*[x.tolist() for x in values])], dtype=float64)
+
+
+def _divide(a: float, b: float) -> float:
+    """a / b with the IEEE 754 semantics of NumPy and pandas."""
+    if b != 0:
+        return a / b
+    if a == 0 or isnan(a):
+        return npNaN
+    return copysign(float("inf"), a) * copysign(1.0, b)
+
+
+try:
+    from math import fma as _fma
+except ImportError:
+    def _fma(a: float, b: float, c: float) -> float:
+        """a * b + c with a single rounding (math.fma of Python 3.13)."""
+        try:
+            na, da = float(a).as_integer_ratio()
+            nb, db = float(b).as_integer_ratio()
+            nc, dc = float(c).as_integer_ratio()
+            result = (na * nb * dc + nc * da * db) / (da * db * dc)
+        except (OverflowError, ValueError):
+            return a * b + c
+        return result if result != 0 else a * b + c
+
+
+@lru_cache(maxsize=None)
+def _talib_fused() -> bool:
+    """Whether the installed TA-Lib was compiled with fused multiply-adds.
+    They change the last bit of its recursions, so the streams that follow
+    TA-Lib do the same."""
+    from talib import EMA
+    probe, k = [0.91, 0.45, -0.54, 0.58], 2.0 / 3
+    fused = (probe[0] + probe[1]) / 2
+    for x in probe[2:]:
+        fused = _fma(x - fused, k, fused)
+    return bool(EMA(npArray(probe), 2)[-1] == fused)
+
+
+class _EWM:
+    """pandas Series.ewm(com, adjust, ignore_na, min_periods).mean() one value
+    at a time. Mirrors ewm() of pandas/_libs/window/aggregations.pyx."""
+
+    def __init__(self, com: float, adjust: bool = True, ignore_na: bool = False, min_periods: int = 0):
+        self.alpha = 1. / (1. + com)
+        self.old_wt_factor = 1. - self.alpha
+        self.new_wt = 1. if adjust else self.alpha
+        self.adjust = adjust
+        self.ignore_na = ignore_na
+        self.minp = max(int(min_periods), 1)
+        self.nobs = 0
+        self.weighted = None
+
+    def update(self, cur: float) -> float:
+        is_observation = cur == cur
+        if self.weighted is None:
+            self.weighted = cur
+            self.nobs = int(is_observation)
+            self.old_wt = 1.
+        else:
+            self.nobs += is_observation
+            weighted = self.weighted
+            if weighted == weighted:
+                if is_observation or not self.ignore_na:
+                    self.old_wt *= self.old_wt_factor
+                    if is_observation:
+                        # avoid numerical errors on constant series
+                        if weighted != cur:
+                            weighted = self.old_wt * weighted + self.new_wt * cur
+                            weighted /= (self.old_wt + self.new_wt)
+                        if self.adjust:
+                            self.old_wt += self.new_wt
+                        else:
+                            self.old_wt = 1.
+            elif is_observation:
+                weighted = cur
+            self.weighted = weighted
+        return self.weighted if self.nobs >= self.minp else npNaN
+
+
+class _RollingSum:
+    """pandas Series.rolling(window, min_periods).sum() one value at a time.
+    Mirrors the Kahan summation of roll_sum() of
+    pandas/_libs/window/aggregations.pyx."""
+
+    def __init__(self, window: int, min_periods: int = None):
+        self.window = int(window)
+        self.minp = self.window if min_periods is None else int(min_periods)
+        self.values = deque(maxlen=self.window)
+
+    def _add(self, val: float) -> None:
+        if val == val:
+            self.nobs += 1
+            y = val - self.compensation_add
+            t = self.sum_x + y
+            self.compensation_add = t - self.sum_x - y
+            self.sum_x = t
+            if val == self.prev_value:
+                self.num_consecutive_same_value += 1
+            else:
+                self.num_consecutive_same_value = 1
+            self.prev_value = val
+
+    def _remove(self, val: float) -> None:
+        if val == val:
+            self.nobs -= 1
+            y = - val - self.compensation_remove
+            t = self.sum_x + y
+            self.compensation_remove = t - self.sum_x - y
+            self.sum_x = t
+
+    def update(self, val: float) -> float:
+        if len(self.values) == 0 or self.window == 1:
+            # setup
+            self.prev_value = val
+            self.num_consecutive_same_value = 0
+            self.sum_x = self.compensation_add = self.compensation_remove = 0.0
+            self.nobs = 0
+        elif len(self.values) == self.window:
+            self._remove(self.values[0])
+        self._add(val)
+        self.values.append(val)
+
+        if self.nobs == 0 == self.minp:
+            return 0
+        elif self.nobs >= self.minp:
+            if self.num_consecutive_same_value >= self.nobs:
+                return self.prev_value * self.nobs
+            return self.sum_x
+        return npNaN
+
+
+class _RollingMean(_RollingSum):
+    """pandas Series.rolling(window, min_periods).mean() one value at a time.
+    Mirrors roll_mean() of pandas/_libs/window/aggregations.pyx, the sums of
+    roll_sum() and the count of negative values."""
+
+    def _add(self, val: float) -> None:
+        super()._add(val)
+        if val == val and copysign(1.0, val) < 0:
+            self.neg_ct += 1
+
+    def _remove(self, val: float) -> None:
+        super()._remove(val)
+        if val == val and copysign(1.0, val) < 0:
+            self.neg_ct -= 1
+
+    def update(self, val: float) -> float:
+        if len(self.values) == 0 or self.window == 1:
+            self.neg_ct = 0
+        super().update(val)
+        if self.nobs >= self.minp and self.nobs > 0:
+            if self.num_consecutive_same_value >= self.nobs:
+                return self.prev_value
+            result = self.sum_x / self.nobs
+            if self.neg_ct == 0 and result < 0:
+                return 0.0
+            if self.neg_ct == self.nobs and result > 0:
+                return 0.0
+            return result
+        return npNaN
+
+
+class _Extremes:
+    """The highest high and the lowest low of the last window values, one pair
+    at a time, with a monotonic deque per side. Mirrors _rolling_extremes()
+    of pandas_ta.utils, NaNs are skipped like pandas' rolling."""
+
+    def __init__(self, window: int, min_periods: int = None):
+        self.window = int(window)
+        self.minp = max(self.window if min_periods is None else int(min_periods), 1)
+        self.values = deque(maxlen=self.window)
+        self.highs, self.lows = deque(), deque()
+        self.count = self.h_count = self.l_count = 0
+
+    def update(self, high: float, low: float) -> tuple:
+        i = self.count
+        self.count += 1
+        if high == high:
+            self.h_count += 1
+            while self.highs and self.highs[-1][1] <= high:
+                self.highs.pop()
+            self.highs.append((i, high))
+        if low == low:
+            self.l_count += 1
+            while self.lows and self.lows[-1][1] >= low:
+                self.lows.pop()
+            self.lows.append((i, low))
+
+        if len(self.values) == self.window:
+            h, l = self.values[0]
+            self.h_count -= h == h
+            self.l_count -= l == l
+        self.values.append((high, low))
+        start = i - self.window + 1
+        while self.highs and self.highs[0][0] < start:
+            self.highs.popleft()
+        while self.lows and self.lows[0][0] < start:
+            self.lows.popleft()
+
+        highest = self.highs[0][1] if self.h_count >= self.minp and self.highs else npNaN
+        lowest = self.lows[0][1] if self.l_count >= self.minp and self.lows else npNaN
+        return highest, lowest
+
+
+class _Moments:
+    """The rolling mean and variance of the last window values, one value at
+    a time. Mirrors _rolling_moments() of pandas_ta.utils, the Welford sums
+    updated as values enter and leave the window and recomputed from it."""
+
+    def __init__(self, window: int, min_periods: int = None, ddof: int = 1):
+        self.window = int(window)
+        self.minp = max(self.window if min_periods is None else int(min_periods), 1)
+        self.ddof = int(ddof)
+        self.values = deque(maxlen=self.window)
+        self.n, self.mean, self.m2 = 0, 0.0, 0.0
+        self.same, self.previous, self.removed = 0, npNaN, 0
+
+    def update(self, v: float) -> tuple:
+        if v == v:
+            self.n += 1
+            n = self.n
+            delta = v - self.mean
+            dn = delta / n
+            t = delta * dn * (n - 1)
+            self.mean += dn
+            self.m2 += t
+            self.same = self.same + 1 if v == self.previous else 1
+            self.previous = v
+
+        leaving = self.values[0] if len(self.values) == self.window else npNaN
+        self.values.append(v)
+        if leaving == leaving:
+            before = self.m2
+            if self.n == 1:
+                self.n, self.mean, self.m2 = 0, 0.0, 0.0
+            else:
+                n = self.n
+                self.mean = self.mean + (self.mean - leaving) / (n - 1)
+                delta = leaving - self.mean
+                dn = delta / n
+                self.m2 -= delta * dn * (n - 1)
+                self.n -= 1
+            self.removed += 1
+            if self.removed >= self.window or self.m2 < 1e-4 * before:
+                window = [x for x in self.values if x == x]
+                total = 0.0
+                for x in window:
+                    total += x
+                self.n = len(window)
+                self.mean = total / self.n if self.n > 0 else 0.0
+                self.m2 = 0.0
+                for x in window:
+                    d = x - self.mean
+                    self.m2 += d * d
+                self.removed = 0
+
+        n = self.n
+        if n < self.minp or n == 0:
+            return npNaN, npNaN
+        variance = npNaN
+        if n > self.ddof:
+            variance = 0.0 if n == 1 or self.same >= n else max(self.m2 / (n - self.ddof), 0.0)
+        return self.mean, variance
+
+
+class _TalibVar:
+    """TA-Lib's VAR(x, window) one value at a time. The sums are of the
+    values less a reference, which becomes the mean of the window whenever
+    they would cancel, and every 32 windows."""
+
+    def __init__(self, window: int):
+        self.window = int(window)
+        self.inv = 1.0 / self.window
+        self.values = deque(maxlen=self.window)
+        self.reference = None
+
+    def update(self, x: float) -> float:
+        values, inv = self.values, self.inv
+        if self.reference is None:
+            # TA-Lib starts at the first non NaN value
+            if x != x:
+                return npNaN
+            self.reference, self.s1, self.s2 = x, 0.0, 0.0
+            self.countdown = 32 * self.window
+        values.append(x)
+        d = x - self.reference
+        self.s1 += d
+        self.s2 += d * d
+        if len(values) < self.window:
+            return npNaN
+
+        m = inv * self.s1
+        var = inv * self.s2 - m * m
+        r = values[0] - self.reference
+        self.s2 -= r * r
+        recenter = (inv * self.s2) * 1e-6 > var or r * r > self.s2 * 1e6
+        if not recenter:
+            self.countdown -= 1
+            recenter = self.countdown == 0
+        if not recenter:
+            self.s1 -= r
+            return var
+
+        reference = 0.0
+        for v in values:
+            reference += v
+        self.reference = reference * inv
+        self.s1 = self.s2 = 0.0
+        for v in values:
+            d = v - self.reference
+            self.s1 += d
+            self.s2 += d * d
+        m, a = inv * self.s1, inv * self.s2
+        var = a - m * m
+        if var < a * 1e-12:
+            var = 0.0
+        r = values[0] - self.reference
+        self.s1 -= r
+        self.s2 -= r * r
+        self.countdown = 32 * self.window
+        return var
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+from collections import deque
+from sys import float_info as sflt
+
+from numpy import nan as npNaN
+
+from pandas_ta.utils import get_drift
+from ._base import _divide, Stream
+from .atr import ATR
+from .ma import _ma
+
+
+class ADX(Stream):
+    """Streaming Average Directional Movement (ADX)
+
+    Same values as ta.adx(high, low, close, length, lensig, scalar, mamode,
+    drift): the ADX, the +DI and the -DI.
+
+    Args:
+        length (int): It's period. Default: 14
+        lensig (int): Signal Length. Like TradingView's default ADX. Default: length
+        scalar (float): How much to magnify. Default: 100
+        mamode (str): "ema", "rma" or "sma". Default: "rma"
+        drift (int): The difference period. Default: 1
+    """
+    inputs = ("high", "low", "close")
+
+    def __init__(self, length: int = None, lensig: int = None, scalar: float = None, mamode: str = None, drift: int = None):
+        self.length = length if length and length > 0 else 14
+        self.lensig = lensig if lensig and lensig > 0 else self.length
+        self.mamode = mamode if isinstance(mamode, str) else "rma"
+        self.scalar = float(scalar) if scalar else 100
+        self.drift = get_drift(drift)
+        _ma(self.mamode, self.length)
+        super().__init__()
+
+    def params(self) -> dict:
+        return {"length": self.length, "lensig": self.lensig, "scalar": self.scalar, "mamode": self.mamode, "drift": self.drift}
+
+    def reset(self) -> None:
+        super().reset()
+        self.value = (npNaN, npNaN, npNaN)
+        self._atr = ATR(self.length)
+        self._pos, self._neg = _ma(self.mamode, self.length), _ma(self.mamode, self.length)
+        self._adx = _ma(self.mamode, self.lensig)
+        self._bars = deque(maxlen=self.drift)
+
+    def update(self, high: float, low: float, close: float) -> tuple:
+        self.count += 1
+        atr = self._atr.update(high, low, close)
+        prev_high, prev_low = self._bars[0] if len(self._bars) == self.drift else (npNaN, npNaN)
+        self._bars.append((high, low))
+
+        up, dn = high - prev_high, prev_low - low
+        pos = up if up > dn and up > 0 else 0.0 * up
+        neg = dn if dn > up and dn > 0 else 0.0 * dn
+        pos = 0.0 if abs(pos) < sflt.epsilon else pos
+        neg = 0.0 if abs(neg) < sflt.epsilon else neg
+
+        k = _divide(self.scalar, atr)
+        dmp = k * self._pos.update(pos)
+        dmn = k * self._neg.update(neg)
+        dx = _divide(self.scalar * abs(dmp - dmn), dmp + dmn)
+        self.value = (self._adx.update(dx), dmp, dmn)
+        return self.value
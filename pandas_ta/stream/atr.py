@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+from collections import deque
+from sys import float_info as sflt
+
+from numpy import nan as npNaN
+
+from pandas_ta import Imports
+from pandas_ta.utils import get_drift
+from ._base import _fma, _talib_fused, Stream
+from .ma import _ma
+
+
+class ATR(Stream):
+    """Streaming Average True Range (ATR)
+
+    Same values as ta.atr(high, low, close, length, mamode, talib, drift,
+    percent=percent). With TA-Lib installed and talib not False it follows
+    TA-Lib's ATR, otherwise the moving average of the true range of ta.atr.
+
+    Args:
+        length (int): It's period. Default: 14
+        mamode (str): "ema", "rma" or "sma". Default: "rma"
+        talib (bool): If TA Lib is installed and talib is True, follows TA
+            Lib's ATR. Default: True
+        drift (int): The difference period. Default: 1
+
+    Kwargs:
+        percent (bool, optional): Return as percentage. Default: False
+    """
+    inputs = ("high", "low", "close")
+
+    def __init__(self, length: int = None, mamode: str = None, talib: bool = None, drift: int = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 14
+        self.mamode = mamode.lower() if mamode and isinstance(mamode, str) else "rma"
+        self.drift = get_drift(drift)
+        self.percent = kwargs.pop("percent", False)
+        mode_tal = bool(talib) if isinstance(talib, bool) else True
+        self.talib = Imports["talib"] and mode_tal
+        if not self.talib:
+            _ma(self.mamode, self.length)
+        super().__init__()
+
+    def params(self) -> dict:
+        return {"length": self.length, "mamode": self.mamode, "talib": self.talib, "drift": self.drift}
+
+    def reset(self) -> None:
+        super().reset()
+        self._prev, self._ranges, self._total, self._atr = None, 0, 0.0, npNaN
+        self._closes = deque(maxlen=self.drift)
+        if not self.talib:
+            self._ma = _ma(self.mamode, self.length)
+
+    def update(self, high: float, low: float, close: float) -> float:
+        self.count += 1
+        if self.talib:
+            self._atr = self._update_talib(high, low, close)
+        else:
+            self._atr = self._ma.update(self._true_range(high, low, close))
+        self.value = self._atr * (100 / close) if self.percent else self._atr
+        return self.value
+
+    def _update_talib(self, high: float, low: float, close: float) -> float:
+        # TA-Lib starts at the first bar without NaN
+        if self._prev is None:
+            if high == high and low == low and close == close:
+                self._prev = close
+            return npNaN
+        prev, self._prev = self._prev, close
+        true_range = _talib_range(high, low, prev)
+
+        # Wilder's average seeded with the mean of the first true ranges
+        n = self.length
+        self._ranges += 1
+        if self._ranges <= n:
+            self._total += true_range
+            return self._total / n if self._ranges == n else npNaN
+        w = (n - 1) / n
+        if _talib_fused():
+            return _fma(self._atr, w, true_range * (1 - w))
+        return self._atr * w + true_range * (1 - w)
+
+    def _true_range(self, high: float, low: float, close: float) -> float:
+        if Imports["talib"]:
+            # ta.true_range follows TA-Lib's TRANGE when it is installed
+            if self._prev is None:
+                if high == high and low == low and close == close:
+                    self._prev = close
+                return npNaN
+            prev, self._prev = self._prev, close
+            return _talib_range(high, low, prev)
+
+        prev = self._closes[0] if len(self._closes) == self.drift else npNaN
+        self._closes.append(close)
+        if self.count <= self.drift:
+            return npNaN
+        high_low = high - low
+        high_low = high_low if high_low != 0 else sflt.epsilon
+        ranges = [abs(x) for x in (high_low, high - prev, prev - low) if x == x]
+        return max(ranges) if ranges else npNaN
+
+
+def _talib_range(high: float, low: float, prev: float) -> float:
+    """TA-Lib's true range of a bar and the previous close."""
+    greatest = high - low
+    value = abs(prev - high)
+    if value > greatest:
+        greatest = value
+    value = abs(prev - low)
+    if value > greatest:
+        greatest = value
+    return greatest
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+from math import sqrt
+from sys import float_info as sflt
+
+from numpy import nan as npNaN
+
+from pandas_ta import Imports
+from ._base import _divide, _Moments, _TalibVar, Stream
+from .sma import SMA
+
+
+class BBANDS(Stream):
+    """Streaming Bollinger Bands (BBANDS)
+
+    Same values as ta.bbands(close, length, std, ddof, "sma", talib): the lower,
+    mid and upper bands, the bandwidth and the percent. With TA-Lib installed
+    and talib not False it follows TA-Lib's BBANDS, otherwise the rolling
+    moments of ta.bbands.
+
+    Args:
+        length (int): It's period. Default: 5
+        std (float): Number of standard deviations. Default: 2.0
+        ddof (int): Delta Degrees of Freedom. Default: 0
+        mamode (str): Only "sma". Default: "sma"
+        talib (bool): If TA Lib is installed and talib is True, follows TA
+            Lib's BBANDS. Default: True
+    """
+
+    def __init__(self, length: int = None, std: float = None, ddof: int = 0, mamode: str = None, talib: bool = None):
+        self.length = int(length) if length and length > 0 else 5
+        self.std = float(std) if std and std > 0 else 2.0
+        self.ddof = int(ddof) if ddof >= 0 and ddof < self.length else 1
+        if isinstance(mamode, str) and mamode != "sma":
+            raise ValueError(f"[X] There is no Stream of bbands with {mamode}")
+        mode_tal = bool(talib) if isinstance(talib, bool) else True
+        self.talib = Imports["talib"] and mode_tal
+        super().__init__()
+
+    def params(self) -> dict:
+        return {"length": self.length, "std": self.std, "ddof": self.ddof, "talib": self.talib}
+
+    def reset(self) -> None:
+        super().reset()
+        self.value = (npNaN,) * 5
+        if self.talib:
+            self._mid, self._var = SMA(self.length, talib=True), _TalibVar(self.length)
+        else:
+            self._moments = _Moments(self.length, ddof=self.ddof)
+
+    def update(self, x: float) -> tuple:
+        self.count += 1
+        if self.talib:
+            mid, variance = self._mid.update(x), self._var.update(x)
+            deviations = sqrt(variance) * self.std if variance >= 0 else npNaN
+        else:
+            mid, variance = self._moments.update(x)
+            deviations = self.std * sqrt(variance) if variance >= 0 else npNaN
+        lower, upper = mid - deviations, mid + deviations
+
+        ulr = upper - lower
+        ulr = ulr if ulr != 0 else sflt.epsilon
+        percent = x - lower
+        percent = percent if percent != 0 else sflt.epsilon
+        self.value = (lower, mid, upper, _divide(100 * ulr, mid), _divide(percent, ulr))
+        return self.value
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+from numpy import array as npArray
+from numpy import isnan as npIsnan
+from numpy import nan as npNaN
+
+from pandas_ta import Imports
+from ._base import _EWM, _fma, _talib_fused, Stream
+
+
+class EMA(Stream):
+    """Streaming Exponential Moving Average (EMA)
+
+    Same values as ta.ema(close, length, talib, sma=sma, adjust=adjust). With
+    TA-Lib installed and talib not False it follows TA-Lib's EMA, otherwise
+    the pandas ewm() of ta.ema.
+
+    Args:
+        length (int): It's period. Default: 10
+        talib (bool): If TA Lib is installed and talib is True, follows TA
+            Lib's EMA. Default: True
+
+    Kwargs:
+        adjust (bool, optional): Default: False
+        sma (bool, optional): If True, uses SMA for initial value. Default: True
+    """
+
+    def __init__(self, length: int = None, talib: bool = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 10
+        self.adjust = kwargs.pop("adjust", False)
+        self.sma = kwargs.pop("sma", True)
+        mode_tal = bool(talib) if isinstance(talib, bool) else True
+        self.talib = Imports["talib"] and mode_tal
+        super().__init__()
+
+    def params(self) -> dict:
+        return {"length": self.length, "talib": self.talib}
+
+    def reset(self) -> None:
+        super().reset()
+        self._seed = []
+        self._total = 0.0
+        self._ewm = _EWM((self.length - 1) / 2, adjust=self.adjust)
+
+    def update(self, x: float) -> float:
+        self.count += 1
+        if self.talib:
+            self.value = self._update_talib(x)
+        elif self.sma:
+            self.value = self._update_sma(x)
+        else:
+            self.value = self._ewm.update(x)
+        return self.value
+
+    def _update_talib(self, x: float) -> float:
+        # TA-Lib returns the values of a period of 1 as they are
+        if self.length == 1:
+            return x
+        # TA-Lib starts at the first non NaN value
+        if not self._seed and x != x:
+            return npNaN
+        if len(self._seed) < self.length:
+            self._seed.append(x)
+            self._total += x
+            if len(self._seed) < self.length:
+                return npNaN
+            return self._total / self.length
+        k = 2.0 / (self.length + 1)
+        if _talib_fused():
+            return _fma(x - self.value, k, self.value)
+        return ((x - self.value) * k) + self.value
+
+    def _update_sma(self, x: float) -> float:
+        if len(self._seed) < self.length:
+            self._seed.append(x)
+            if len(self._seed) < self.length:
+                return self._ewm.update(npNaN)
+            # Series.mean() of the first 'length' values
+            seed = npArray(self._seed)
+            mask = npIsnan(seed)
+            count = (~mask).sum()
+            seed[mask] = 0
+            x = seed.sum() / count if count > 0 else npNaN
+        return self._ewm.update(float(x))
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+from ._base import Stream
+
+
+class HWMA(Stream):
+    """Streaming Holt-Winter Moving Average (HWMA)
+
+    Same values as ta.hwma(close, na, nb, nc).
+
+    Args:
+        na (float): Smoothed series parameter (from 0 to 1). Default: 0.2
+        nb (float): Trend parameter (from 0 to 1). Default: 0.1
+        nc (float): Seasonality parameter (from 0 to 1). Default: 0.1
+    """
+
+    def __init__(self, na: float = None, nb: float = None, nc: float = None):
+        self.na = float(na) if na and na > 0 and na < 1 else 0.2
+        self.nb = float(nb) if nb and nb > 0 and nb < 1 else 0.1
+        self.nc = float(nc) if nc and nc > 0 and nc < 1 else 0.1
+        super().__init__()
+
+    def params(self) -> dict:
+        return {"na": self.na, "nb": self.nb, "nc": self.nc}
+
+    def reset(self) -> None:
+        super().reset()
+        self._last_a = self._last_v = 0
+        self._last_f = None
+
+    def update(self, x: float) -> float:
+        na, nb, nc = self.na, self.nb, self.nc
+        last_a, last_v = self._last_a, self._last_v
+        last_f = x if self._last_f is None else self._last_f
+
+        F = (1.0 - na) * (last_f + last_v + 0.5 * last_a) + na * x
+        V = (1.0 - nb) * (last_v + last_a) + nb * (F - last_f)
+        A = (1.0 - nc) * last_a + nc * (V - last_v)
+        self._last_a, self._last_f, self._last_v = A, F, V
+
+        self.count += 1
+        self.value = F + V + 0.5 * A
+        return self.value
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+from collections import deque
+from math import sqrt as msqrt
+
+from numpy import log as npLog
+from numpy import nan as npNaN
+from numpy import sqrt as npSqrt
+
+from ._base import Stream
+
+
+class JMA(Stream):
+    """Streaming Jurik Moving Average (JMA)
+
+    Same values as ta.jma(close, length, phase).
+
+    Args:
+        length (int): Period of calculation. Default: 7
+        phase (float): How heavy/light the average is [-100, 100]. Default: 0
+    """
+
+    def __init__(self, length: int = None, phase: float = None):
+        self.length = int(length) if length and length > 0 else 7
+        self.phase = float(phase) if phase and phase != 0 else 0
+
+        # Static variables
+        self._sum_length = 10
+        length = 0.5 * (self.length - 1)
+        phase = self.phase
+        self._pr = 0.5 if phase < -100 else 2.5 if phase > 100 else 1.5 + phase * 0.01
+        self._length1 = float(max((npLog(npSqrt(length)) / npLog(2.0)) + 2.0, 0))
+        self._pow1 = max(self._length1 - 2.0, 0.5)
+        self._max_volty = self._length1 ** (1 / self._pow1)
+        length2 = float(self._length1 * npSqrt(length))
+        self._bet = length2 / (length2 + 1)
+        self._beta = 0.45 * (self.length - 1) / (0.45 * (self.length - 1) + 2.0)
+        super().__init__()
+
+    def params(self) -> dict:
+        return {"length": self.length, "phase": self.phase}
+
+    def reset(self) -> None:
+        super().reset()
+        self._volty = deque(maxlen=self._sum_length + 1)
+        self._v_sum = deque(maxlen=66)
+        self._det0 = self._det1 = 0.0
+        self._jma = self._ma1 = self._uBand = self._lBand = None
+
+    def update(self, price: float) -> float:
+        volty, v_sum = self._volty, self._v_sum
+        if self._jma is None:
+            self._jma = self._ma1 = self._uBand = self._lBand = price
+            volty.append(0.0)
+            v_sum.append(0.0)
+        else:
+            pow1, beta = self._pow1, self._beta
+
+            # Price volatility
+            del1 = price - self._uBand
+            del2 = price - self._lBand
+            volty.append(max(abs(del1), abs(del2)) if abs(del1) != abs(del2) else 0.0)
+
+            # Relative price volatility factor
+            v_sum.append(v_sum[-1] + (volty[-1] - volty[0]) / self._sum_length)
+            avg_volty = 0.0
+            for v in v_sum:
+                avg_volty += v
+            avg_volty /= len(v_sum)
+            d_volty = 0 if avg_volty == 0 else volty[-1] / avg_volty
+            r_volty = max(1.0, min(self._max_volty, d_volty))
+
+            # Jurik volatility bands
+            pow2 = r_volty ** pow1
+            kv = self._bet ** msqrt(pow2)
+            self._uBand = price if (del1 > 0) else price - (kv * del1)
+            self._lBand = price if (del2 < 0) else price - (kv * del2)
+
+            # Jurik Dynamic Factor
+            alpha = beta ** pow2
+
+            # 1st stage - prelimimary smoothing by adaptive EMA
+            self._ma1 = ((1 - alpha) * price) + (alpha * self._ma1)
+
+            # 2nd stage - one more prelimimary smoothing by Kalman filter
+            self._det0 = ((price - self._ma1) * (1 - beta)) + (beta * self._det0)
+            ma2 = self._ma1 + self._pr * self._det0
+
+            # 3rd stage - final smoothing by unique Jurik adaptive filter
+            self._det1 = ((ma2 - self._jma) * (1 - alpha) * (1 - alpha)) + (alpha * alpha * self._det1)
+            self._jma = self._jma + self._det1
+
+        self.count += 1
+        self.value = float(self._jma) if self.count >= self.length else npNaN
+        return self.value
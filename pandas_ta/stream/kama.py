@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+from collections import deque
+from sys import float_info as sflt
+
+from numpy import nan as npNaN
+
+from pandas_ta.utils import get_drift
+from ._base import _divide, _RollingSum, Stream
+
+
+class KAMA(Stream):
+    """Streaming Kaufman's Adaptive Moving Average (KAMA)
+
+    Same values as ta.kama(close, length, fast, slow, drift).
+
+    Args:
+        length (int): It's period. Default: 10
+        fast (int): Fast MA period. Default: 2
+        slow (int): Slow MA period. Default: 30
+        drift (int): The difference period. Default: 1
+    """
+
+    def __init__(self, length: int = None, fast: int = None, slow: int = None, drift: int = None):
+        self.length = int(length) if length and length > 0 else 10
+        self.fast = int(fast) if fast and fast > 0 else 2
+        self.slow = int(slow) if slow and slow > 0 else 30
+        self.drift = get_drift(drift)
+        super().__init__()
+
+    def params(self) -> dict:
+        return {"length": self.length, "fast": self.fast, "slow": self.slow, "drift": self.drift}
+
+    def reset(self) -> None:
+        super().reset()
+        self._close = deque(maxlen=max(self.length, self.drift) + 1)
+        self._peer_diff_sum = _RollingSum(self.length)
+
+    def update(self, x: float) -> float:
+        close, length, i = self._close, self.length, self.count
+        close.append(x)
+        abs_diff = abs(_non_zero(x - close[-1 - length])) if i >= length else npNaN
+        peer_diff = abs(_non_zero(x - close[-1 - self.drift])) if i >= self.drift else npNaN
+        peer_diff_sum = self._peer_diff_sum.update(peer_diff)
+
+        fr, sr = 2 / (self.fast + 1), 2 / (self.slow + 1)
+        er = _divide(abs_diff, peer_diff_sum)
+        sc = er * (fr - sr) + sr
+        sc = sc * sc
+
+        self.count += 1
+        if i < length - 1:
+            self.value = npNaN
+        elif i == length - 1:
+            self.value = 0.0
+        else:
+            self.value = sc * x + (1 - sc) * self.value
+        return self.value
+
+
+def _non_zero(diff: float) -> float:
+    """ta.utils.non_zero_range() of a single difference."""
+    return diff if diff != 0 else sflt.epsilon
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+from ._base import Stream
+from .ema import EMA
+from .rma import RMA
+from .sma import SMA
+
+
+def _ma(name: str, length: int) -> Stream:
+    """The Stream of ta.ma(name, x, length=length). Like ma, other names than
+    those of a moving average are "ema"."""
+    mas = {"ema": EMA, "rma": RMA, "sma": SMA}
+    name = name.lower() if isinstance(name, str) else "ema"
+    if name in mas:
+        return mas[name](length)
+
+    from pandas_ta.overlap import ma
+    if name in ma():
+        raise ValueError(f"[X] There is no Stream of {name}")
+    return EMA(length)
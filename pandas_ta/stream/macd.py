@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+from numpy import nan as npNaN
+
+from pandas_ta import Imports
+from ._base import _fma, _talib_fused, Stream
+from .ema import EMA
+
+
+class MACD(Stream):
+    """Streaming Moving Average Convergence Divergence (MACD)
+
+    Same values as ta.macd(close, fast, slow, signal, talib): the MACD, the
+    histogram and the signal. With TA-Lib installed and talib not False it
+    follows TA-Lib's MACD, otherwise the EMAs of ta.macd.
+
+    Args:
+        fast (int): The short period. Default: 12
+        slow (int): The long period. Default: 26
+        signal (int): The signal period. Default: 9
+        talib (bool): If TA Lib is installed and talib is True, follows TA
+            Lib's MACD. Default: True
+    """
+
+    def __init__(self, fast: int = None, slow: int = None, signal: int = None, talib: bool = None):
+        self.fast = int(fast) if fast and fast > 0 else 12
+        self.slow = int(slow) if slow and slow > 0 else 26
+        self.signal = int(signal) if signal and signal > 0 else 9
+        if self.slow < self.fast:
+            self.fast, self.slow = self.slow, self.fast
+        mode_tal = bool(talib) if isinstance(talib, bool) else True
+        self.talib = Imports["talib"] and mode_tal
+        super().__init__()
+
+    def params(self) -> dict:
+        return {"fast": self.fast, "slow": self.slow, "signal": self.signal, "talib": self.talib}
+
+    def reset(self) -> None:
+        super().reset()
+        self.value = (npNaN, npNaN, npNaN)
+        self._seed, self._signal_seed = [], []
+        self._fast_ema = self._slow_ema = self._signal_ema = npNaN
+        self._fast_ma, self._slow_ma, self._signal_ma = EMA(self.fast), EMA(self.slow), EMA(self.signal)
+        self._started = False
+
+    def update(self, x: float) -> tuple:
+        self.count += 1
+        self.value = self._update_talib(x) if self.talib else self._update_ema(x)
+        return self.value
+
+    def _update_talib(self, x: float) -> tuple:
+        # TA-Lib starts at the first non NaN value and seeds the EMAs with
+        # the means of the values of the slow period
+        if len(self._seed) < self.slow:
+            if not self._seed and x != x:
+                return npNaN, npNaN, npNaN
+            self._seed.append(x)
+            if len(self._seed) < self.slow:
+                return npNaN, npNaN, npNaN
+            self._slow_ema = _mean(self._seed)
+            self._fast_ema = _mean(self._seed[self.slow - self.fast:])
+        else:
+            self._slow_ema = _ema(x, self._slow_ema, self.slow)
+            self._fast_ema = _ema(x, self._fast_ema, self.fast)
+        macd = self._fast_ema - self._slow_ema
+
+        if len(self._signal_seed) < self.signal:
+            self._signal_seed.append(macd)
+            if len(self._signal_seed) < self.signal:
+                return npNaN, npNaN, npNaN
+            self._signal_ema = _mean(self._signal_seed)
+        else:
+            self._signal_ema = _ema(macd, self._signal_ema, self.signal)
+        return macd, macd - self._signal_ema, self._signal_ema
+
+    def _update_ema(self, x: float) -> tuple:
+        macd = self._fast_ma.update(x) - self._slow_ma.update(x)
+        # The signal starts at the first valid MACD
+        self._started = self._started or macd == macd
+        signal = self._signal_ma.update(macd) if self._started else npNaN
+        return macd, macd - signal, signal
+
+
+def _mean(values: list) -> float:
+    total = 0.0
+    for x in values:
+        total += x
+    return total / len(values)
+
+
+def _ema(x: float, prev: float, length: int) -> float:
+    """A step of TA-Lib's EMA."""
+    k = 2.0 / (length + 1)
+    if _talib_fused():
+        return _fma(x - prev, k, prev)
+    return ((x - prev) * k) + prev
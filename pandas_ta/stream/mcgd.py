@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+from ._base import _divide, Stream
+
+
+class MCGD(Stream):
+    """Streaming McGinley Dynamic Indicator
+
+    Same values as ta.mcgd(close, length, c=c).
+
+    Args:
+        length (int): It's period. Default: 10
+        c (float): Multiplier for the denominator, sometimes set to 0.6.
+            Default: 1
+    """
+
+    def __init__(self, length: int = None, c: float = None):
+        self.length = int(length) if length and length > 0 else 10
+        self.c = float(c) if c and 0 < c <= 1 else 1
+        super().__init__()
+
+    def params(self) -> dict:
+        return {"length": self.length, "c": self.c}
+
+    def reset(self) -> None:
+        super().reset()
+        self._last = self._last_input = None
+
+    def update(self, x: float) -> float:
+        last, last_input = self._last, self._last_input
+        self._last_input, self.count = x, self.count + 1
+        if last is None:
+            self._last = self.value = x
+        elif last_input != last_input or x != x:
+            # Windows with a missing input are skipped, restarting at x
+            self._last, self.value = x, float("nan")
+        else:
+            denom = (self.c * self.length * _divide(x, last) ** 4)
+            self._last = self.value = last + _divide(x - last, denom)
+        return self.value
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+from numpy import nan as npNaN
+
+from pandas_ta.utils import zero
+from ._base import Stream
+
+
+class PSAR(Stream):
+    """Streaming Parabolic Stop and Reverse (PSAR)
+
+    Same values as ta.psar(high, low, af0=af0, af=af, max_af=max_af): the
+    long and short SAR, the acceleration factor and the reversals.
+
+    Args:
+        af0 (float): Initial Acceleration Factor. Default: 0.02
+        af (float): Acceleration Factor. Default: 0.02
+        max_af (float): Maximum Acceleration Factor. Default: 0.2
+    """
+    inputs = ("high", "low")
+
+    def __init__(self, af0: float = None, af: float = None, max_af: float = None):
+        self.af = float(af) if af and af > 0 else 0.02
+        self.af0 = float(af0) if af0 and af0 > 0 else self.af
+        self.max_af = float(max_af) if max_af and max_af > 0 else 0.2
+        super().__init__()
+
+    def params(self) -> dict:
+        return {"af0": self.af0, "af": self.af, "max_af": self.max_af}
+
+    def reset(self) -> None:
+        super().reset()
+        self.value = (npNaN, npNaN, npNaN, npNaN)
+        self._bars = []
+
+    def update(self, high: float, low: float) -> tuple:
+        self.count += 1
+        if self.count == 1:
+            self._bars = [(high, low)]
+            self.value = (npNaN, npNaN, self.af0, 0.0)
+            return self.value
+        if self.count == 2:
+            # Falling if the first NaN -DM is positive
+            high0, low0 = self._bars[0]
+            up, dn = high - high0, low0 - low
+            self._falling = bool(dn > up and zero(dn) > 0)
+            self._sar = high0 if self._falling else low0
+            self._ep = low0 if self._falling else high0
+            self._acc = self.af
+
+        (high1, low1), (high2, low2) = self._bars[-1], self._bars[0]
+        sar = self._sar + self._acc * (self._ep - self._sar)
+        if self._falling:
+            reverse = high > sar
+            if low < self._ep:
+                self._ep = low
+                self._acc = min(self._acc + self.af0, self.max_af)
+            sar = max(high1, high2, sar)
+        else:
+            reverse = low < sar
+            if high > self._ep:
+                self._ep = high
+                self._acc = min(self._acc + self.af0, self.max_af)
+            sar = min(low1, low2, sar)
+
+        if reverse:
+            sar = self._ep
+            self._acc = self.af0
+            self._falling = not self._falling
+            self._ep = low if self._falling else high
+        self._sar = sar
+        self._bars = [self._bars[-1], (high, low)]
+
+        long, short = (npNaN, sar) if self._falling else (sar, npNaN)
+        self.value = (long, short, self._acc, float(reverse))
+        return self.value
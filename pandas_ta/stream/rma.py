@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+from ._base import _EWM, Stream
+
+
+class RMA(Stream):
+    """Streaming wildeR's Moving Average (RMA)
+
+    Same values as ta.rma(close, length).
+
+    Args:
+        length (int): It's period. Default: 10
+    """
+
+    def __init__(self, length: int = None):
+        self.length = int(length) if length and length > 0 else 10
+        super().__init__()
+
+    def params(self) -> dict:
+        return {"length": self.length}
+
+    def reset(self) -> None:
+        super().reset()
+        alpha = (1.0 / self.length) if self.length > 0 else 0.5
+        self._ewm = _EWM(float((1 - alpha) / alpha), min_periods=self.length)
+
+    def update(self, x: float) -> float:
+        self.count += 1
+        self.value = self._ewm.update(x)
+        return self.value
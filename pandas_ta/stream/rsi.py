@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+from collections import deque
+
+from numpy import nan as npNaN
+
+from pandas_ta import Imports
+from pandas_ta.utils import get_drift
+from ._base import _divide, Stream
+from .rma import RMA
+
+
+class RSI(Stream):
+    """Streaming Relative Strength Index (RSI)
+
+    Same values as ta.rsi(close, length, scalar, talib, drift). With TA-Lib
+    installed and talib not False it follows TA-Lib's RSI, otherwise the RMAs
+    of the gains and losses of ta.rsi.
+
+    Args:
+        length (int): It's period. Default: 14
+        scalar (float): How much to magnify. Default: 100
+        talib (bool): If TA Lib is installed and talib is True, follows TA
+            Lib's RSI. Default: True
+        drift (int): The difference period. Default: 1
+    """
+
+    def __init__(self, length: int = None, scalar: float = None, talib: bool = None, drift: int = None):
+        self.length = int(length) if length and length > 0 else 14
+        self.scalar = float(scalar) if scalar else 100
+        self.drift = get_drift(drift)
+        mode_tal = bool(talib) if isinstance(talib, bool) else True
+        self.talib = Imports["talib"] and mode_tal
+        super().__init__()
+
+    def params(self) -> dict:
+        return {"length": self.length, "scalar": self.scalar, "talib": self.talib, "drift": self.drift}
+
+    def reset(self) -> None:
+        super().reset()
+        self._prev, self._diffs = None, 0
+        self._gain = self._loss = 0.0
+        self._closes = deque(maxlen=self.drift)
+        self._positive, self._negative = RMA(self.length), RMA(self.length)
+
+    def update(self, x: float) -> float:
+        self.count += 1
+        self.value = self._update_talib(x) if self.talib else self._update_rma(x)
+        return self.value
+
+    def _update_talib(self, x: float) -> float:
+        # TA-Lib starts at the first non NaN value
+        if self._prev is None:
+            if x == x:
+                self._prev = x
+            return npNaN
+        diff, self._prev = x - self._prev, x
+        gain = diff if 0 < diff else 0.0
+        n = self.length
+
+        # Wilder's averages seeded with the means of the first changes
+        self._diffs += 1
+        if self._diffs <= n:
+            self._gain += gain
+            self._loss += gain - diff
+            if self._diffs < n:
+                return npNaN
+            self._gain *= 1.0 / n
+            self._loss *= 1.0 / n
+        else:
+            self._gain = (self._gain * float(n - 1) + gain) * (1.0 / n)
+            self._loss = ((gain - diff) + self._loss * float(n - 1)) * (1.0 / n)
+        total = self._loss + self._gain
+        return self._gain / total * 100.0 if total > 0 else 0.0
+
+    def _update_rma(self, x: float) -> float:
+        prev = self._closes[0] if len(self._closes) == self.drift else npNaN
+        self._closes.append(x)
+        diff = x - prev
+        positive = self._positive.update(diff if diff >= 0 else 0.0)
+        negative = self._negative.update(diff if diff <= 0 else 0.0)
+        return _divide(self.scalar * positive, positive + abs(negative))
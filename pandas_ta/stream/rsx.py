@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+from numpy import nan as npNaN
+
+from ._base import Stream
+
+
+class RSX(Stream):
+    """Streaming Relative Strength Xtra (RSX)
+
+    Same values as ta.rsx(close, length).
+
+    Args:
+        length (int): It's period. Default: 14
+    """
+
+    def __init__(self, length: int = None):
+        self.length = int(length) if length and length > 0 else 14
+        super().__init__()
+
+    def params(self) -> dict:
+        return {"length": self.length}
+
+    def reset(self) -> None:
+        super().reset()
+        self._f = dict.fromkeys((
+            "f0", "f8", "f10", "f18", "f20", "f28", "f30", "f38", "f40", "f48",
+            "f50", "f58", "f60", "f68", "f70", "f78", "f80", "f88", "f90"
+        ), 0)
+        self._v = dict.fromkeys(("v4", "v14", "v20"), 0)
+
+    def update(self, x: float) -> float:
+        i, length = self.count, self.length
+        self.count += 1
+        if i < length - 1:
+            self.value = npNaN
+            return self.value
+        if i == length - 1:
+            self.value = 0.0
+            return self.value
+
+        f, v = self._f, self._v
+        if f["f90"] == 0:
+            f["f90"] = 1.0
+            f["f0"] = 0.0
+            if length - 1.0 >= 5:
+                f["f88"] = length - 1.0
+            else:
+                f["f88"] = 5.0
+            f["f8"] = 100.0 * x
+            f["f18"] = 3.0 / (length + 2.0)
+            f["f20"] = 1.0 - f["f18"]
+        else:
+            if f["f88"] <= f["f90"]:
+                f["f90"] = f["f88"] + 1
+            else:
+                f["f90"] = f["f90"] + 1
+            f18, f20 = f["f18"], f["f20"]
+            f["f10"] = f["f8"]
+            f["f8"] = 100 * x
+            v8 = f["f8"] - f["f10"]
+            f["f28"] = f20 * f["f28"] + f18 * v8
+            f["f30"] = f18 * f["f28"] + f20 * f["f30"]
+            vC = 1.5 * f["f28"] - 0.5 * f["f30"]
+            f["f38"] = f20 * f["f38"] + f18 * vC
+            f["f40"] = f18 * f["f38"] + f20 * f["f40"]
+            v10 = 1.5 * f["f38"] - 0.5 * f["f40"]
+            f["f48"] = f20 * f["f48"] + f18 * v10
+            f["f50"] = f18 * f["f48"] + f20 * f["f50"]
+            v["v14"] = 1.5 * f["f48"] - 0.5 * f["f50"]
+            f["f58"] = f20 * f["f58"] + f18 * abs(v8)
+            f["f60"] = f18 * f["f58"] + f20 * f["f60"]
+            v18 = 1.5 * f["f58"] - 0.5 * f["f60"]
+            f["f68"] = f20 * f["f68"] + f18 * v18
+            f["f70"] = f18 * f["f68"] + f20 * f["f70"]
+            v1C = 1.5 * f["f68"] - 0.5 * f["f70"]
+            f["f78"] = f20 * f["f78"] + f18 * v1C
+            f["f80"] = f18 * f["f78"] + f20 * f["f80"]
+            v["v20"] = 1.5 * f["f78"] - 0.5 * f["f80"]
+
+            if f["f88"] >= f["f90"] and f["f8"] != f["f10"]:
+                f["f0"] = 1.0
+            if f["f88"] == f["f90"] and f["f0"] == 0.0:
+                f["f90"] = 0.0
+
+        if f["f88"] < f["f90"] and v["v20"] > 0.0000000001:
+            v4 = (v["v14"] / v["v20"] + 1.0) * 50.0
+            if v4 > 100.0:
+                v4 = 100.0
+            if v4 < 0.0:
+                v4 = 0.0
+        else:
+            v4 = 50.0
+        self.value = float(v4)
+        return self.value
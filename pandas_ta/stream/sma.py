@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+from collections import deque
+
+from numpy import nan as npNaN
+
+from pandas_ta import Imports
+from ._base import _RollingMean, Stream
+
+
+class SMA(Stream):
+    """Streaming Simple Moving Average (SMA)
+
+    Same values as ta.sma(close, length, talib, min_periods=min_periods). With
+    TA-Lib installed and talib not False it follows TA-Lib's SMA, otherwise
+    the pandas rolling().mean() of ta.sma.
+
+    Args:
+        length (int): It's period. Default: 10
+        talib (bool): If TA Lib is installed and talib is True, follows TA
+            Lib's SMA. Default: True
+
+    Kwargs:
+        min_periods (int, optional): Minimum number of values of a window.
+            Default: length
+    """
+
+    def __init__(self, length: int = None, talib: bool = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 10
+        min_periods = kwargs.pop("min_periods", None)
+        self.min_periods = int(min_periods) if min_periods is not None else self.length
+        mode_tal = bool(talib) if isinstance(talib, bool) else True
+        self.talib = Imports["talib"] and mode_tal
+        super().__init__()
+
+    def params(self) -> dict:
+        return {"length": self.length, "talib": self.talib}
+
+    def reset(self) -> None:
+        super().reset()
+        self._window = deque()
+        self._started, self._total = False, 0.0
+        self._mean = _RollingMean(self.length, self.min_periods)
+
+    def update(self, x: float) -> float:
+        self.count += 1
+        self.value = self._update_talib(x) if self.talib else self._mean.update(x)
+        return self.value
+
+    def _update_talib(self, x: float) -> float:
+        # TA-Lib starts at the first non NaN value
+        if not self._started:
+            if x != x:
+                return npNaN
+            self._started = True
+        self._window.append(x)
+        self._total += x
+        if len(self._window) < self.length:
+            return npNaN
+        value = self._total / self.length
+        self._total -= self._window.popleft()
+        return value
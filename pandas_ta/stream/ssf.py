@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+from collections import deque
+
+from numpy import cos as npCos
+from numpy import exp as npExp
+from numpy import pi as npPi
+from numpy import sqrt as npSqrt
+
+from ._base import Stream
+
+
+class SSF(Stream):
+    """Streaming Ehler's Super Smoother Filter (SSF)
+
+    Same values as ta.ssf(close, length, poles).
+
+    Args:
+        length (int): It's period. Default: 10
+        poles (int): The number of poles to use, either 2 or 3. Default: 2
+    """
+
+    def __init__(self, length: int = None, poles: int = None):
+        self.length = int(length) if length and length > 0 else 10
+        self.poles = int(poles) if poles in [2, 3] else 2
+
+        if self.poles == 3:
+            x = npPi / self.length
+            a0 = npExp(-x)
+            b0 = 2 * a0 * npCos(npSqrt(3) * x)
+            c0 = a0 * a0
+
+            c4 = c0 * c0
+            c3 = -c0 * (1 + b0)
+            c2 = c0 + b0
+            c1 = 1 - c2 - c3 - c4
+            self._coefficients = (c1, c2, c3, c4)
+        else:
+            x = npPi * npSqrt(2) / self.length
+            a0 = npExp(-x)
+            a1 = -a0 * a0
+            b1 = 2 * a0 * npCos(x)
+            c1 = 1 - a1 - b1
+            self._coefficients = (c1, b1, a1)
+        super().__init__()
+
+    def params(self) -> dict:
+        return {"length": self.length, "poles": self.poles}
+
+    def reset(self) -> None:
+        super().reset()
+        self._last = deque(maxlen=self.poles)
+
+    def update(self, x: float) -> float:
+        last = self._last
+        if len(last) < self.poles:
+            result = x
+        elif self.poles == 3:
+            c1, c2, c3, c4 = self._coefficients
+            result = c1 * x + c2 * last[-1] + c3 * last[-2] + c4 * last[-3]
+        else:
+            c1, b1, a1 = self._coefficients
+            result = c1 * x + b1 * last[-1] + a1 * last[-2]
+        last.append(result)
+
+        self.count += 1
+        self.value = float(result)
+        return self.value
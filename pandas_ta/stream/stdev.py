@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+from math import sqrt
+
+from numpy import nan as npNaN
+
+from pandas_ta import Imports
+from ._base import _Moments, _TalibVar, Stream
+
+
+class STDEV(Stream):
+    """Streaming Rolling Standard Deviation (STDEV)
+
+    Same values as ta.stdev(close, length, ddof, talib). With TA-Lib installed
+    and talib not False it follows TA-Lib's STDDEV, otherwise the rolling
+    moments of ta.stdev.
+
+    Args:
+        length (int): It's period. Default: 30
+        ddof (int): Delta Degrees of Freedom. Default: 1
+        talib (bool): If TA Lib is installed and talib is True, follows TA
+            Lib's STDDEV. Default: True
+    """
+
+    def __init__(self, length: int = None, ddof: int = 1, talib: bool = None):
+        self.length = int(length) if length and length > 0 else 30
+        self.ddof = int(ddof) if isinstance(ddof, int) and ddof >= 0 and ddof < self.length else 1
+        mode_tal = bool(talib) if isinstance(talib, bool) else True
+        self.talib = Imports["talib"] and mode_tal
+        super().__init__()
+
+    def params(self) -> dict:
+        return {"length": self.length, "ddof": self.ddof, "talib": self.talib}
+
+    def reset(self) -> None:
+        super().reset()
+        self._var = _TalibVar(self.length) if self.talib else _Moments(self.length, ddof=self.ddof)
+
+    def update(self, x: float) -> float:
+        self.count += 1
+        variance = self._var.update(x) if self.talib else self._var.update(x)[1]
+        self.value = sqrt(variance) if variance >= 0 else npNaN
+        return self.value
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+from sys import float_info as sflt
+
+from numpy import nan as npNaN
+
+from ._base import _Extremes, Stream
+from .ma import _ma
+
+
+class STOCH(Stream):
+    """Streaming Stochastic Oscillator (STOCH)
+
+    Same values as ta.stoch(high, low, close, k, d, smooth_k, mamode): the
+    %K and the %D.
+
+    Args:
+        k (int): The Fast %K period. Default: 14
+        d (int): The Slow %K period. Default: 3
+        smooth_k (int): The Slow %D period. Default: 3
+        mamode (str): "ema", "rma" or "sma". Default: "sma"
+    """
+    inputs = ("high", "low", "close")
+
+    def __init__(self, k: int = None, d: int = None, smooth_k: int = None, mamode: str = None):
+        self.k = k if k and k > 0 else 14
+        self.d = d if d and d > 0 else 3
+        self.smooth_k = smooth_k if smooth_k and smooth_k > 0 else 3
+        self.mamode = mamode if isinstance(mamode, str) else "sma"
+        _ma(self.mamode, self.d)
+        super().__init__()
+
+    def params(self) -> dict:
+        return {"k": self.k, "d": self.d, "smooth_k": self.smooth_k, "mamode": self.mamode}
+
+    def reset(self) -> None:
+        super().reset()
+        self.value = (npNaN, npNaN)
+        self._extremes = _Extremes(self.k)
+        self._smooth, self._signal = _ma(self.mamode, self.smooth_k), _ma(self.mamode, self.d)
+        self._started_k = self._started_d = False
+
+    def update(self, high: float, low: float, close: float) -> tuple:
+        self.count += 1
+        highest, lowest = self._extremes.update(high, low)
+        diff = highest - lowest
+        fast_k = 100 * (close - lowest) / (diff if diff != 0 else sflt.epsilon)
+
+        # The averages start at the first valid value
+        stoch_k = stoch_d = npNaN
+        self._started_k = self._started_k or fast_k == fast_k
+        if self._started_k:
+            stoch_k = self._smooth.update(fast_k)
+            self._started_d = self._started_d or stoch_k == stoch_k
+            if self._started_d:
+                stoch_d = self._signal.update(stoch_k)
+        self.value = (stoch_k, stoch_d)
+        return self.value
@@ -0,0 +1,388 @@
+# -*- coding: utf-8 -*-
+from numpy import array_equal, asarray, column_stack, empty, errstate, full, isclose, isfinite, isnan, result_type
+from numpy import nan as npNaN
+from numpy import ndarray
+
+from pandas_ta.backend import DataFrame, Series, concat
+from pandas_ta.utils import SharedPlan
+
+from .adx import ADX
+from .atr import ATR
+from .bbands import BBANDS
+from .ema import EMA
+from .hwma import HWMA
+from .jma import JMA
+from .kama import KAMA
+from .macd import MACD
+from .mcgd import MCGD
+from .psar import PSAR
+from .rma import RMA
+from .rsi import RSI
+from .rsx import RSX
+from .sma import SMA
+from .ssf import SSF
+from .stdev import STDEV
+from .stoch import STOCH
+from .supertrend import SUPERTREND
+from .t3 import T3
+from .td_seq import TD_SEQ
+from .vidya import VIDYA
+from .willr import WILLR
+
+# The indicators with a Stream and the arguments the Stream takes
+STREAMS = {
+    "adx": (ADX, ("length", "lensig", "scalar", "mamode", "drift")),
+    "atr": (ATR, ("length", "mamode", "talib", "drift", "percent")),
+    "bbands": (BBANDS, ("length", "std", "ddof", "mamode", "talib")),
+    "ema": (EMA, ("length", "talib", "adjust", "sma")),
+    "hwma": (HWMA, ("na", "nb", "nc")),
+    "jma": (JMA, ("length", "phase")),
+    "kama": (KAMA, ("length", "fast", "slow", "drift")),
+    "macd": (MACD, ("fast", "slow", "signal", "talib")),
+    "mcgd": (MCGD, ("length", "c")),
+    "psar": (PSAR, ("af0", "af", "max_af")),
+    "rma": (RMA, ("length",)),
+    "rsi": (RSI, ("length", "scalar", "talib", "drift")),
+    "rsx": (RSX, ("length",)),
+    "sma": (SMA, ("length", "talib", "min_periods")),
+    "ssf": (SSF, ("length", "poles")),
+    "stdev": (STDEV, ("length", "ddof", "talib")),
+    "stoch": (STOCH, ("k", "d", "smooth_k", "mamode")),
+    "supertrend": (SUPERTREND, ("length", "multiplier")),
+    "t3": (T3, ("length", "a", "talib")),
+    "td_seq": (TD_SEQ, ("show_all",)),
+    "vidya": (VIDYA, ("length", "drift")),
+    "willr": (WILLR, ("length", "talib", "min_periods")),
+}
+# Arguments that only name or place the columns
+_NAMING = ("kind", "params", "append", "open", "high", "low", "close", "volume", "prefix", "suffix", "delimiter", "col_names", "offset")
+# Relative tolerance of the values of a tail to those of the whole history
+_RTOL = 1e-9
+# Arguments of strategy() that are not passed to the indicators
+_STRATEGY = ("append", "returns", "executor", "shared", "verbose", "timed", "ordered", "chunksize")
+
+
+class StrategyStream:
+    """Strategy Stream
+
+    Keeps the state of the indicators of a Strategy so that new bars cost
+    only their own calculation. The indicators with a Stream (adx, atr,
+    bbands, ema, hwma, jma, kama, macd, mcgd, psar, rma, rsi, rsx, sma, ssf,
+    stdev, stoch, supertrend, t3, td_seq, vidya, willr) continue from their
+    state in O(1) per bar with the values of strategy() on the whole history.
+    The other indicators are recalculated on a tail of the history and the
+    new bars. The tail of each is the shortest, doubling from twice its
+    lookback, whose values on the history are those of the whole history up
+    to rounding; the indicators that never forget, like the cumulative ones,
+    are recalculated on the whole history.
+
+    Example:
+    >>> state = ta.stream.StrategyStream(df, "Momentum")
+    >>> for bars in feed:
+    ...     bars = state.update(bars)
+
+    Args:
+        df (DataFrame): The history with the source columns (open, high, low,
+            close, volume, ...).
+        args: The Strategy or its name as in df.ta.strategy().
+
+    Kwargs:
+        exclude (list): See help(df.ta.strategy).
+        All other kwargs are passed to the indicators as in df.ta.strategy().
+
+    Attributes:
+        columns (list): The indicator columns in the order of strategy().
+        rows (int): Number of rows of the history and the updates.
+        sources (list): The source columns.
+        streams (list): The indicators that continue from a Stream.
+        tails (dict): The rows the other indicators, by their first column,
+            are recalculated on besides the new bars. None for the whole
+            history.
+    """
+
+    def __init__(self, df: DataFrame, *args, **kwargs):
+        # Lazy import, pandas_ta.core imports pandas_ta.stream
+        from pandas_ta.core import AnalysisIndicators
+
+        [kwargs.pop(x, None) for x in _STRATEGY]
+        ta = AnalysisIndicators(df)
+        _, mode, _, indicators = ta._strategy_indicators(*args, exclude=kwargs.pop("exclude", []))
+        if indicators is None:
+            raise ValueError(f"[X] Not an available strategy: {args}")
+
+        if mode["custom"]:
+            self._tasks = [(
+                ind["kind"],
+                ind["params"] if "params" in ind and isinstance(ind["params"], tuple) else (),
+                {**ind, **kwargs},
+            ) for ind in indicators]
+        else:
+            self._tasks = [(ind, (), {**kwargs, "append": True}) for ind in indicators]
+
+        # Evaluate the Strategy on the history as strategy() does and keep
+        # the columns each indicator produces
+        ta._pending = {}
+        self._names, self._streams = [], []
+        try:
+            with SharedPlan():
+                for kind, params, kwds in self._tasks:
+                    result = ta._mp_worker((kind, params, kwds))
+                    names = _names(result, kwds)
+                    self._names.append(names)
+                    self._streams.append(self._stream(ta, kind, params, kwds, names))
+        finally:
+            columns, ta._pending = ta._pending, None
+
+        self.columns = list(columns)
+        self.sources = [x for x in df.columns if x not in columns]
+        self.streams = [task[0] for task, stream in zip(self._tasks, self._streams) if stream is not None]
+        self.rows = df.shape[0]
+        self._index, self._indexes = df.index, []
+        self._buffers = {x: _Buffer(_aligned(df[x], df.index)) for x in self.sources}
+        self._buffers.update({x: _Buffer(_aligned(y, df.index)) for x, y in columns.items()})
+        self._tails = self._calibration()
+        self.tails = {
+            names[0]: tail for names, stream, tail in zip(self._names, self._streams, self._tails)
+            if stream is None and len(names)
+        }
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(rows={self.rows}, columns={len(self.columns)}, streams={len(self.streams)})"
+
+    def _stream(self, ta, kind: str, params: tuple, kwds: dict, names: list):
+        """The Stream of an indicator warmed up with the history, or None if
+        it has none or it does not reproduce the calculated values."""
+        if kind not in STREAMS or len(params) or len(names) == 0:
+            return None
+        cls, arguments = STREAMS[kind]
+        if any(x not in arguments and x not in _NAMING for x in kwds):
+            return None
+        sources = [kwds.get(x, x) for x in cls.inputs]
+        if kwds.get("offset") not in (None, 0) or not all(isinstance(x, str) for x in sources):
+            return None
+
+        inputs = []
+        for source in sources:
+            if source in ta._pending:
+                inputs.append(_aligned(ta._pending[source], ta._df.index))
+            elif source in ta._df.columns:
+                inputs.append(_aligned(ta._df[source], ta._df.index))
+            else:
+                return None
+
+        arguments = {x: kwds[x] for x in arguments if x in kwds}
+        if kind == "td_seq":
+            # df.ta.td_seq passes show_all=None, which td_seq takes as False
+            arguments["show_all"] = bool(arguments.get("show_all"))
+        try:
+            stream = cls(**arguments)
+        except ValueError:
+            return None
+        warm = stream.batch_update(*inputs)
+        warm = warm.reshape(warm.shape[0], -1)
+        if warm.shape[1] != len(names):
+            return None
+        calculated = column_stack([_aligned(ta._pending[x], ta._df.index) for x in names])
+        if not array_equal(warm, calculated.astype(warm.dtype), equal_nan=True):
+            return None
+        return sources, stream
+
+    def _calibration(self) -> list:
+        """The tail of each indicator without a Stream, None if it needs the
+        whole history."""
+        tails, updated = [], {}
+        with SharedPlan():
+            for (kind, params, kwds), names, stream in zip(self._tasks, self._names, self._streams):
+                tail = None
+                if stream is None and len(names):
+                    expected = [self._buffers[x].values for x in names]
+                    lookback = max(_leading(x) for x in expected) + 1
+                    tail = 32
+                    while tail < 2 * lookback:
+                        tail *= 2
+                    while tail is not None:
+                        if 2 * tail >= self.rows:
+                            tail = None
+                        else:
+                            values = self._tail_values(kind, params, kwds, names, self._tail(2 * tail, updated), tail)
+                            if all(_close(x, y[-tail:]) for x, y in zip(values.T, expected)):
+                                break
+                            tail *= 2
+                    # A doubling more for the bars to come, it squares what
+                    # is left of a fading memory
+                    if tail is not None:
+                        tail = 2 * tail if 4 * tail < self.rows else None
+                tails.append(tail)
+                updated.update({x: self._buffers[x] for x in names})
+        return tails
+
+    def _tail_values(self, kind: str, params: tuple, kwds: dict, names: list, ta, rows: int) -> ndarray:
+        """The last rows values of the columns of an indicator on ta."""
+        result = ta._mp_worker((kind, params, {**kwds, "append": False}))
+        values = full((rows, len(names)), npNaN)
+        if isinstance(result, (Series, DataFrame)):
+            result = result.to_frame() if isinstance(result, Series) else result
+            for i in range(min(len(names), result.shape[1])):
+                column = _aligned(result.iloc[:, i], ta._df.index)[-rows:]
+                values = values.astype(result_type(values.dtype, column.dtype), copy=False)
+                values[:, i] = column
+        return values
+
+    def update(self, new_rows: DataFrame) -> DataFrame:
+        """Calculates the indicators of new bars.
+
+        Args:
+            new_rows (DataFrame): The new bars with the source columns. Missing
+                source columns are NaN.
+
+        Returns:
+            DataFrame: The new bars with their indicators.
+        """
+        rows = new_rows.shape[0]
+        if rows == 0:
+            return concat([new_rows, DataFrame(columns=self.columns, index=new_rows.index)], axis=1)
+        for x in self.sources:
+            self._buffers[x].extend(new_rows[x].to_numpy() if x in new_rows.columns else full(rows, npNaN))
+        self._indexes.append(new_rows.index)
+        self.rows += rows
+
+        # The recalculations of the indicators without a Stream see their
+        # tail, the new bars and the columns updated so far
+        recalculations, updated = {}, {}
+        with SharedPlan():
+            for (kind, params, kwds), names, stream, tail in zip(self._tasks, self._names, self._streams, self._tails):
+                if not len(names):
+                    continue
+                if stream is not None:
+                    sources, stream = stream
+                    values = stream.batch_update(*[self._buffers[x].values[-rows:] for x in sources])
+                    values = values.reshape(rows, -1)
+                else:
+                    size = None if tail is None or tail + rows >= self.rows else tail + rows
+                    if size not in recalculations:
+                        recalculations[size] = self._tail(size, updated)
+                    values = self._tail_values(kind, params, kwds, names, recalculations[size], rows)
+
+                for i, x in enumerate(names):
+                    buffer = self._buffers[x]
+                    if x in updated:
+                        buffer.values[-rows:] = values[:, i]
+                    else:
+                        buffer.extend(values[:, i])
+                    updated[x] = buffer
+
+        indicators = DataFrame({x: self._buffers[x].values[-rows:] for x in self.columns}, index=new_rows.index)
+        return concat([new_rows.drop(columns=[x for x in self.columns if x in new_rows.columns]), indicators], axis=1)
+
+    def _tail(self, size: int, updated: dict):
+        """An AnalysisIndicators of the last size rows, all if size is None."""
+        from pandas_ta.core import AnalysisIndicators
+
+        if len(self._indexes) and (size is None or len(self._indexes) >= 64):
+            self._index, self._indexes = self._index.append(self._indexes), []
+        index = self._index
+        if len(self._indexes):
+            recent = self._indexes[0].append(self._indexes[1:])
+            index = recent if size <= recent.shape[0] else self._index[recent.shape[0] - size:].append(recent)
+        index = index[-size:] if size is not None else index
+
+        size = index.shape[0]
+        df = DataFrame({x: self._buffers[x].values[-size:] for x in self.sources}, index=index)
+        ta = AnalysisIndicators(df)
+        ta._pending = _Pending(updated, index)
+        return ta
+
+
+class _Buffer:
+    """An array that grows by doubling, so appending k values is O(k)."""
+
+    def __init__(self, values: ndarray):
+        self.size = values.shape[0]
+        self.data = empty(max(2 * self.size, 16), dtype=values.dtype)
+        self.data[:self.size] = values
+
+    @property
+    def values(self) -> ndarray:
+        return self.data[:self.size]
+
+    def extend(self, values: ndarray) -> None:
+        values = _keep(asarray(values), self.data.dtype)
+        size = self.size + values.shape[0]
+        dtype = result_type(self.data.dtype, values.dtype)
+        if size > self.data.shape[0] or dtype != self.data.dtype:
+            data = empty(max(2 * size, 16), dtype=dtype)
+            data[:self.size] = self.data[:self.size]
+            self.data = data
+        self.data[self.size:size] = values
+        self.size = size
+
+
+class _Pending(dict):
+    """The columns updated so far, which grow with updated, as Series of the
+    last rows of index. A Series is only made when an indicator reads it."""
+
+    def __init__(self, updated: dict, index):
+        super().__init__()
+        self.updated, self.index = updated, index
+
+    def __contains__(self, name) -> bool:
+        return name in self.updated
+
+    def __getitem__(self, name) -> Series:
+        size = self.index.shape[0]
+        return Series(self.updated[name].values[-size:], index=self.index, name=name)
+
+
+def _aligned(x: Series, index) -> ndarray:
+    """The values of x in the order of index."""
+    if not x.index.equals(index):
+        x = x.reindex(index)
+    return x.to_numpy()
+
+
+def _keep(values: ndarray, dtype) -> ndarray:
+    """values as dtype if they are exactly representable, like the integer
+    columns of td_seq or the flags of the signals."""
+    if values.dtype == dtype or dtype.kind not in "biu" or values.dtype.kind != "f":
+        return values
+    with errstate(invalid="ignore"):
+        cast = values.astype(dtype)
+    return cast if array_equal(cast, values) else values
+
+
+def _close(values: ndarray, expected: ndarray) -> bool:
+    """Whether values are those expected up to rounding."""
+    if values.dtype.kind not in "biuf" or expected.dtype.kind not in "biuf":
+        return array_equal(values, expected)
+    values, expected = values.astype(float), expected.astype(float)
+    nans = isnan(expected)
+    if not array_equal(isnan(values), nans):
+        return False
+    finite = expected[isfinite(expected)]
+    scale = abs(finite).max() if finite.shape[0] else 0.0
+    return bool(isclose(values, expected, rtol=_RTOL, atol=_RTOL * scale, equal_nan=True).all())
+
+
+def _leading(values: ndarray) -> int:
+    """Number of leading NaNs."""
+    if values.dtype.kind != "f":
+        return 0
+    valid = (~isnan(values)).nonzero()[0]
+    return int(valid[0]) if valid.shape[0] else values.shape[0]
+
+
+def _names(result, kwds: dict) -> list:
+    """The names of the columns strategy() collects of a result."""
+    if isinstance(result, DataFrame):
+        names = list(result.columns)
+    elif isinstance(result, Series):
+        names = [result.name]
+    else:
+        return []
+    col_names = kwds.get("col_names")
+    col_names = (col_names,) if col_names is not None and not isinstance(col_names, tuple) else col_names
+    if isinstance(col_names, tuple):
+        if len(col_names) < len(names):
+            return []
+        names = list(col_names[:len(names)])
+    return names
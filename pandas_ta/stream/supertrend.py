@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+from numpy import nan as npNaN
+
+from ._base import Stream
+from .atr import ATR
+
+
+class SUPERTREND(Stream):
+    """Streaming Supertrend (SUPERTREND)
+
+    Same values as ta.supertrend(high, low, close, length, multiplier): the
+    trend, the direction and the long and short trends.
+
+    Args:
+        length (int): Length for ATR calculation. Default: 7
+        multiplier (float): Coefficient for upper and lower band distance to
+            midrange. Default: 3.0
+    """
+    inputs = ("high", "low", "close")
+
+    def __init__(self, length: int = None, multiplier: float = None):
+        self.length = int(length) if length and length > 0 else 7
+        self.multiplier = float(multiplier) if multiplier and multiplier > 0 else 3.0
+        super().__init__()
+
+    def params(self) -> dict:
+        return {"length": self.length, "multiplier": self.multiplier}
+
+    def reset(self) -> None:
+        super().reset()
+        self.value = (npNaN, npNaN, npNaN, npNaN)
+        self._atr = ATR(self.length)
+        self._dir, self._bands = 1, None
+
+    def update(self, high: float, low: float, close: float) -> tuple:
+        self.count += 1
+        hl2 = 0.5 * (high + low)
+        matr = self.multiplier * self._atr.update(high, low, close)
+        upper, lower = hl2 + matr, hl2 - matr
+        if self._bands is None:
+            self._bands = upper, lower
+            self.value = (0.0, 1.0, npNaN, npNaN)
+            return self.value
+
+        # The bands are carried forward while the direction holds
+        prev_upper, prev_lower = self._bands
+        if close > prev_upper:
+            self._dir = 1
+        elif close < prev_lower:
+            self._dir = -1
+        else:
+            if self._dir > 0 and lower < prev_lower:
+                lower = prev_lower
+            if self._dir < 0 and upper > prev_upper:
+                upper = prev_upper
+        self._bands = upper, lower
+
+        if self._dir > 0:
+            self.value = (lower, 1.0, lower, npNaN)
+        else:
+            self.value = (upper, -1.0, npNaN, upper)
+        return self.value
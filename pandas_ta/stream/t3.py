@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+from numpy import nan as npNaN
+
+from pandas_ta import Imports
+from ._base import _fma, _talib_fused, Stream
+from .ema import EMA
+
+
+class T3(Stream):
+    """Streaming Tim Tillson's T3 Moving Average (T3)
+
+    Same values as ta.t3(close, length, a, talib). With TA-Lib installed and
+    talib not False it follows TA-Lib's T3, otherwise the six chained ema of
+    ta.t3.
+
+    Args:
+        length (int): It's period. Default: 10
+        a (float): 0 < a < 1. Default: 0.7
+        talib (bool): If TA Lib is installed and talib is True, follows TA
+            Lib's T3. Default: True
+    """
+
+    def __init__(self, length: int = None, a: float = None, talib: bool = None):
+        self.length = int(length) if length and length > 0 else 10
+        self.a = float(a) if a and a > 0 and a < 1 else 0.7
+        mode_tal = bool(talib) if isinstance(talib, bool) else True
+        self.talib = Imports["talib"] and mode_tal
+        super().__init__()
+
+    def params(self) -> dict:
+        return {"length": self.length, "a": self.a, "talib": self.talib}
+
+    def reset(self) -> None:
+        super().reset()
+        self._ema = [EMA(self.length) for _ in range(6)]
+        self._stage, self._n, self._total = 0, 0, 0.0
+        self._e = [0.0] * 6
+
+    def update(self, x: float) -> float:
+        self.count += 1
+        if self.talib:
+            self.value = self._update_talib(x)
+            return self.value
+
+        a = self.a
+        c1 = -a * a**2
+        c2 = 3 * a**2 + 3 * a**3
+        c3 = -6 * a**2 - 3 * a - 3 * a**3
+        c4 = a**3 + 3 * a**2 + 3 * a + 1
+
+        e = []
+        for ema in self._ema:
+            x = ema.update(x)
+            e.append(x)
+        self.value = c1 * e[5] + c2 * e[4] + c3 * e[3] + c4 * e[2]
+        return self.value
+
+    def _update_talib(self, x: float) -> float:
+        # TA-Lib starts at the first non NaN value. Each ema is initialized
+        # in turn with the average of its first 'length' values.
+        n, e, stage = self.length, self._e, self._stage
+        if n == 1:
+            return x
+        if stage == 0 and self._n == 0 and x != x:
+            return npNaN
+        k = 2.0 / (n + 1.0)
+        one_minus_k = 1.0 - k
+        fused = _talib_fused()
+
+        def _ema(x, e):
+            if fused:
+                return _fma(one_minus_k, e, k * x)
+            return (k * x) + (one_minus_k * e)
+
+        if stage == 0:
+            self._total = x if self._n == 0 else self._total + x
+        else:
+            e[0] = _ema(x, e[0])
+            for j in range(1, min(stage, 6)):
+                e[j] = _ema(e[j - 1], e[j])
+            if stage < 6:
+                self._total += e[stage - 1]
+        self._n += 1
+
+        # Initialize the next ema(s)
+        while stage < 6 and self._n == (n if stage == 0 else n - 1):
+            e[stage] = self._total / n
+            self._total, self._n = e[stage], 0
+            stage += 1
+        self._stage = stage
+        if stage < 6:
+            return npNaN
+
+        a = self.a
+        temp = a * a
+        c1 = -temp * a
+        c2 = 3.0 * (temp - c1)
+        c3 = -6.0 * temp - 3.0 * (a - c1)
+        c4 = 1.0 + 3.0 * a - c1 + 3.0 * temp
+        if fused:
+            return _fma(c4, e[2], _fma(c3, e[3], _fma(c1, e[5], c2 * e[4])))
+        return c1 * e[5] + c2 * e[4] + c3 * e[3] + c4 * e[2]
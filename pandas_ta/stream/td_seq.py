@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+from collections import deque
+
+from numpy import empty, float64
+from numpy import nan as npNaN
+from numpy import ndarray
+
+from ._base import Stream
+
+
+class TD_SEQ(Stream):
+    """Streaming TD Sequential (TD_SEQ)
+
+    Same values as ta.td_seq(close, show_all=show_all). The state is the
+    last four closes and the running counts, so update returns the pair
+    (up, down) and value is the last pair.
+
+    Args:
+        show_all (bool): Show 1 - 13. If set to False, show 6 - 9.
+            Default: True
+    """
+
+    def __init__(self, show_all: bool = None):
+        self.show_all = show_all if isinstance(show_all, bool) else True
+        super().__init__()
+
+    def params(self) -> dict:
+        return {"show_all": self.show_all}
+
+    def reset(self) -> None:
+        super().reset()
+        self.value = (npNaN, npNaN)
+        self._closes = deque(maxlen=4)
+        self._up = self._down = 0
+
+    def update(self, x: float) -> tuple:
+        closes = self._closes
+        diff = x - closes[0] if len(closes) == 4 else npNaN
+        closes.append(x)
+        self.count += 1
+
+        # NaN differences are neither up nor down
+        self._up = min(self._up + 1, 13) if diff > 0 else 0
+        self._down = min(self._down + 1, 13) if diff < 0 else 0
+        self.value = (self._masked(self._up), self._masked(self._down))
+        return self.value
+
+    def batch_update(self, values) -> ndarray:
+        """Consumes an array of values and returns the (up, down) values as
+        the columns of an array."""
+        values = values.to_numpy() if hasattr(values, "to_numpy") else values
+        result = empty((len(values), 2), dtype=float64)
+        update = self.update
+        for i, x in enumerate(values.tolist() if hasattr(values, "tolist") else values):
+            result[i] = update(x)
+        return result
+
+    def _masked(self, count: int) -> float:
+        if self.show_all:
+            return float(count) if count > 0 else npNaN
+        return float(count) if 6 <= count <= 9 else npNaN
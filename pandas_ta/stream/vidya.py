@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+from collections import deque
+
+from numpy import nan as npNaN
+
+from pandas_ta.utils import get_drift
+from ._base import _divide, _RollingSum, Stream
+
+
+class VIDYA(Stream):
+    """Streaming Variable Index Dynamic Average (VIDYA)
+
+    Same values as ta.vidya(close, length, drift).
+
+    Args:
+        length (int): It's period. Default: 14
+        drift (int): The difference period. Default: 1
+    """
+
+    def __init__(self, length: int = None, drift: int = None):
+        self.length = int(length) if length and length > 0 else 14
+        self.drift = get_drift(drift)
+        super().__init__()
+
+    def params(self) -> dict:
+        return {"length": self.length, "drift": self.drift}
+
+    def reset(self) -> None:
+        super().reset()
+        self._close = deque(maxlen=self.drift + 1)
+        self._pos_sum = _RollingSum(self.length)
+        self._neg_sum = _RollingSum(self.length)
+        self._last = 0
+
+    def update(self, x: float) -> float:
+        i = self.count
+        self._close.append(x)
+
+        # Chande Momentum Oscillator
+        mom = x - self._close[0] if i >= self.drift else npNaN
+        positive = mom if mom != mom or mom >= 0 else 0.0
+        negative = abs(mom) if mom != mom or mom <= 0 else 0.0
+        pos_sum = self._pos_sum.update(positive)
+        neg_sum = self._neg_sum.update(negative)
+        abs_cmo = abs(_divide(pos_sum - neg_sum, pos_sum + neg_sum))
+
+        self.count += 1
+        if i >= self.length:
+            alpha = 2 / (self.length + 1)
+            self._last = alpha * abs_cmo * x + self._last * (1 - alpha * abs_cmo)
+        # ta.vidya replaces zeros with NaN
+        self.value = npNaN if self._last == 0 else float(self._last)
+        return self.value
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+from numpy import nan as npNaN
+
+from pandas_ta import Imports
+from ._base import _divide, _Extremes, Stream
+
+
+class WILLR(Stream):
+    """Streaming William's Percent R (WILLR)
+
+    Same values as ta.willr(high, low, close, length, talib,
+    min_periods=min_periods). With TA-Lib installed and talib not False it
+    follows TA-Lib's WILLR, otherwise the rolling extremes of ta.willr.
+
+    Args:
+        length (int): It's period. Default: 14
+        talib (bool): If TA Lib is installed and talib is True, follows TA
+            Lib's WILLR. Default: True
+
+    Kwargs:
+        min_periods (int, optional): Minimum number of values of a window.
+            Default: length
+    """
+    inputs = ("high", "low", "close")
+
+    def __init__(self, length: int = None, talib: bool = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 14
+        min_periods = kwargs.pop("min_periods", None)
+        self.min_periods = int(min_periods) if min_periods is not None else self.length
+        mode_tal = bool(talib) if isinstance(talib, bool) else True
+        self.talib = Imports["talib"] and mode_tal
+        super().__init__()
+
+    def params(self) -> dict:
+        return {"length": self.length, "talib": self.talib}
+
+    def reset(self) -> None:
+        super().reset()
+        self._started = False
+        if self.talib:
+            self._extremes = _Extremes(self.length)
+        else:
+            self._extremes = _Extremes(self.length, self.min_periods)
+
+    def update(self, high: float, low: float, close: float) -> float:
+        self.count += 1
+        if self.talib:
+            # TA-Lib starts at the first bar without NaN
+            if not self._started:
+                if high != high or low != low or close != close:
+                    return npNaN
+                self._started = True
+            highest, lowest = self._extremes.update(high, low)
+            # TA-Lib takes a range within rounding of the prices as flat and
+            # clips the closes outside of the range
+            diff, value = highest - lowest, 0.0
+            if (abs(highest) + abs(lowest)) * 1e-14 < abs(diff) or diff != diff:
+                value = (highest - close) / diff * -100.0
+                value = 0.0 if value > 0 else (-100.0 if -100.0 > value else value)
+            self.value = value
+        else:
+            highest, lowest = self._extremes.update(high, low)
+            self.value = 100 * (_divide(close - lowest, highest - lowest) - 1)
+        return self.value
@@ -0,0 +1,426 @@
+# -*- coding: utf-8 -*-
+from contextlib import nullcontext
+from inspect import unwrap
+from itertools import product
+from math import copysign
+from sys import float_info
+
+from numpy import array, errstate, float64, full, int64, isnan, ndarray, ones, zeros
+from numpy import nan as npNaN
+from numpy import sqrt as npSqrt
+
+from pandas_ta import Category, Imports, core
+from pandas_ta.backend import DataFrame, Series
+from pandas_ta.utils import active_plan, get_drift, njit, rolling_moments, SharedPlan, verify_series
+
+
+@njit(cache=True)
+def _rolling_means(x, lengths, min_periods):
+    """x.rolling(length, min_periods).mean() of every length, as rows, in one
+    pass over x. Each length keeps the compensated sums of roll_mean() of
+    pandas/_libs/window/aggregations.pyx, so the values are identical.
+    Compiled when numba is installed."""
+    m, k = x.shape[0], lengths.shape[0]
+    result = full((k, m), npNaN)
+    total, add, remove = zeros(k), zeros(k), zeros(k)
+    nobs, negative, same = zeros(k, dtype=int64), zeros(k, dtype=int64), zeros(k, dtype=int64)
+    previous = full(k, npNaN)
+
+    for i in range(m):
+        v = x[i]
+        for j in range(k):
+            length = lengths[j]
+            if i == 0 or length == 1:
+                # The window does not overlap the previous one
+                total[j] = add[j] = remove[j] = 0.0
+                nobs[j] = negative[j] = same[j] = 0
+                previous[j] = v
+            elif i >= length:
+                r = x[i - length]
+                if r == r:
+                    nobs[j] -= 1
+                    y = -r - remove[j]
+                    t = total[j] + y
+                    remove[j] = t - total[j] - y
+                    total[j] = t
+                    if copysign(1.0, r) < 0: negative[j] -= 1
+
+            if v == v:
+                nobs[j] += 1
+                y = v - add[j]
+                t = total[j] + y
+                add[j] = t - total[j] - y
+                total[j] = t
+                if copysign(1.0, v) < 0: negative[j] += 1
+                same[j] = same[j] + 1 if v == previous[j] else 1
+                previous[j] = v
+
+            n = nobs[j]
+            if n >= min_periods[j] and n > 0:
+                mean = total[j] / n
+                if same[j] >= n:
+                    mean = previous[j]
+                elif negative[j] == 0 and mean < 0:
+                    mean = 0.0
+                elif negative[j] == n and mean > 0:
+                    mean = 0.0
+                result[j, i] = mean
+    return result
+
+
+@njit(cache=True)
+def _ewm_means(x, coms, min_periods):
+    """x.ewm(com, min_periods=min_periods).mean() of every com, as rows, in
+    one pass over x, the adjusted weighted mean of ewm() of
+    pandas/_libs/window/aggregations.pyx, so the values are identical.
+    Compiled when numba is installed."""
+    m, k = x.shape[0], coms.shape[0]
+    result = full((k, m), npNaN)
+    if m == 0: return result
+    factor = 1.0 - 1.0 / (1.0 + coms)
+    weighted, old_wt = full(k, x[0]), ones(k)
+
+    nobs = 0
+    for i in range(m):
+        cur = x[i]
+        observed = cur == cur
+        nobs += observed
+        for j in range(k):
+            if i > 0:
+                w = weighted[j]
+                if w == w:
+                    old_wt[j] *= factor[j]
+                    if observed:
+                        # avoid numerical errors on constant series
+                        if w != cur:
+                            w = old_wt[j] * w + cur
+                            w /= old_wt[j] + 1.0
+                        old_wt[j] += 1.0
+                elif observed:
+                    w = cur
+                weighted[j] = w
+            if nobs >= min_periods[j]:
+                result[j, i] = weighted[j]
+    return result
+
+
+def _rma(x: Series, lengths: list) -> dict:
+    """rma(x, length) of every length, as arrays by length."""
+    lengths = sorted(set(lengths))
+    coms = array([(1 - 1.0 / n) / (1.0 / n) for n in lengths], dtype=float64)
+    minp = array([max(n, 1) for n in lengths], dtype=int64)
+    return dict(zip(lengths, _ewm_means(x.to_numpy(dtype=float64), coms, minp)))
+
+
+def _sma(x: ndarray, windows: list, talib: bool = False) -> dict:
+    """x.rolling(length, min_periods).mean(), or TA Lib's SMA, of every
+    (length, min_periods), as arrays by (length, min_periods)."""
+    windows = sorted(set(windows))
+    if talib:
+        from talib import SMA
+        return {n: SMA(x, n[0]) for n in windows}
+    lengths = array([n for n, _ in windows], dtype=int64)
+    minp = array([p for _, p in windows], dtype=int64)
+    return dict(zip(windows, _rolling_means(x, lengths, minp)))
+
+
+def _series(index, category: str, columns: dict) -> list:
+    """The columns of a result as a list of Series, which sweep collects
+    without building a DataFrame for each combination."""
+    result = []
+    for name, values in columns.items():
+        result.append(Series(values, index=index, name=name))
+        result[-1].category = category
+    return result
+
+
+def _talib(kwargs: dict) -> bool:
+    """Whether the indicator would use TA Lib."""
+    talib = kwargs.get("talib")
+    return Imports["talib"] and (talib if isinstance(talib, bool) else True)
+
+
+def _combinations(args: tuple, fixed: dict, grid: list, inputs: list, known: tuple) -> tuple:
+    """The input series and the keyword arguments of every combination, or
+    None if a batch path does not know them all."""
+    if len(args) > len(inputs): return
+    series = [verify_series(x) for x in list(args) + [fixed.get(x) for x in inputs[len(args):]]]
+    if any(x is None for x in series): return
+    others = {k: v for k, v in fixed.items() if k not in inputs}
+    combinations = [{**others, **params} for params in grid]
+    for kwargs in combinations:
+        if any(k not in known for k in kwargs) or kwargs.get("offset") not in (None, 0):
+            return
+    return series, combinations
+
+
+def _sweep_sma(args: tuple, fixed: dict, grid: list) -> list:
+    """sma of every length from one pass over close."""
+    known = _combinations(args, fixed, grid, ["close"], ("length", "min_periods", "talib", "offset"))
+    if known is None or not Imports["numba"]: return
+    (close,), combinations = known
+    if any(_talib(x) for x in combinations): return
+
+    windows = []
+    for kwargs in combinations:
+        length = int(kwargs["length"]) if kwargs.get("length") and kwargs["length"] > 0 else 10
+        min_periods = int(kwargs["min_periods"]) if kwargs.get("min_periods") is not None else length
+        windows.append((length, min_periods) if close.size >= max(length, min_periods) else None)
+    means = _sma(close.to_numpy(dtype=float64), [x for x in windows if x is not None])
+
+    results = []
+    for window in windows:
+        result = None
+        if window is not None:
+            result = Series(means[window], index=close.index, name=f"SMA_{window[0]}")
+            result.category = "overlap"
+        results.append(result)
+    return results
+
+
+def _sweep_rsi(args: tuple, fixed: dict, grid: list) -> list:
+    """rsi of every length from one split of the gains and losses per drift
+    and their rma of every length in one pass."""
+    from pandas_ta.momentum.rsi import _gains_losses
+
+    known = _combinations(args, fixed, grid, ["close"], ("length", "scalar", "talib", "drift", "offset"))
+    if known is None or not Imports["numba"]: return
+    (close,), combinations = known
+    if any(_talib(x) for x in combinations): return
+
+    params = []
+    for kwargs in combinations:
+        length = int(kwargs["length"]) if kwargs.get("length") and kwargs["length"] > 0 else 14
+        scalar = float(kwargs["scalar"]) if kwargs.get("scalar") else 100
+        params.append((length, scalar, get_drift(kwargs.get("drift"))) if close.size >= length else None)
+
+    averages = {}
+    for drift in set(x[2] for x in params if x is not None):
+        lengths = [x[0] for x in params if x is not None and x[2] == drift]
+        positive, negative = _gains_losses(close, drift=drift)
+        averages[drift] = _rma(positive, lengths), _rma(negative, lengths)
+
+    results = []
+    for param in params:
+        result = None
+        if param is not None:
+            length, scalar, drift = param
+            positive, negative = averages[drift][0][length], averages[drift][1][length]
+            with errstate(divide="ignore", invalid="ignore"):
+                values = scalar * positive / (positive + abs(negative))
+            result = Series(values, index=close.index, name=f"RSI_{length}")
+            result.category = "momentum"
+        results.append(result)
+    return results
+
+
+def _sweep_atr(args: tuple, fixed: dict, grid: list) -> list:
+    """atr of every length from one true range per drift and its rma of
+    every length in one pass."""
+    from pandas_ta.volatility import true_range
+
+    known = _combinations(args, fixed, grid, ["high", "low", "close"], ("length", "mamode", "talib", "drift", "offset"))
+    if known is None or not Imports["numba"]: return
+    (high, low, close), combinations = known
+    if any(_talib(x) for x in combinations): return
+
+    params = []
+    for kwargs in combinations:
+        length = int(kwargs["length"]) if kwargs.get("length") and kwargs["length"] > 0 else 14
+        mamode = kwargs["mamode"].lower() if kwargs.get("mamode") and isinstance(kwargs["mamode"], str) else "rma"
+        if mamode != "rma": return
+        params.append((length, get_drift(kwargs.get("drift"))) if min(high.size, low.size, close.size) >= length else None)
+
+    averages = {}
+    for drift in set(x[1] for x in params if x is not None):
+        tr = true_range(high=high, low=low, close=close, drift=drift)
+        averages[drift] = _rma(tr, [x[0] for x in params if x is not None and x[1] == drift])
+
+    results = []
+    for param in params:
+        result = None
+        if param is not None:
+            length, drift = param
+            result = Series(averages[drift][length], index=high.index, name=f"ATRr_{length}")
+            result.category = "volatility"
+        results.append(result)
+    return results
+
+
+def _sweep_bbands(args: tuple, fixed: dict, grid: list) -> list:
+    """bbands of every combination from one mean and variance per length
+    and ddof, shared by every std."""
+    known = _combinations(args, fixed, grid, ["close"], ("length", "std", "ddof", "mamode", "talib", "offset"))
+    if known is None: return
+    (close,), combinations = known
+    if any(_talib(x) or x.get("mamode", "sma") not in ("sma", None) for x in combinations): return
+
+    x, eps = close.to_numpy(dtype=float64), float_info.epsilon
+    results, moments = [], {}
+    for kwargs in combinations:
+        length = int(kwargs["length"]) if kwargs.get("length") and kwargs["length"] > 0 else 5
+        std = float(kwargs["std"]) if kwargs.get("std") and kwargs["std"] > 0 else 2.0
+        ddof = kwargs.get("ddof", 0)
+        ddof = int(ddof) if ddof >= 0 and ddof < length else 1
+        if close.size < length:
+            results.append(None)
+            continue
+        if (length, ddof) not in moments:
+            mean, variance = rolling_moments(close, length, ddof=ddof)[:2]
+            moments[length, ddof] = mean.to_numpy(dtype=float64), npSqrt(variance.to_numpy(dtype=float64))
+        mid, deviation = moments[length, ddof]
+
+        with errstate(divide="ignore", invalid="ignore"):
+            deviations = std * deviation
+            lower, upper = mid - deviations, mid + deviations
+            ulr = upper - lower
+            ulr[ulr == 0] = eps
+            bandwidth = 100 * ulr / mid
+            percent = x - lower
+            percent[percent == 0] = eps
+            percent /= ulr
+
+        _props = f"_{length}_{std}"
+        results.append(_series(close.index, "volatility", {
+            f"BBL{_props}": lower, f"BBM{_props}": mid, f"BBU{_props}": upper,
+            f"BBB{_props}": bandwidth, f"BBP{_props}": percent,
+        }))
+    return results
+
+
+def _sweep_stoch(args: tuple, fixed: dict, grid: list) -> list:
+    """stoch of every combination from one %K per k, its sma of every
+    smooth_k and their sma of every d in one pass each, or with TA Lib's
+    SMA like stoch."""
+    from pandas_ta.momentum.stoch import _fast_k
+
+    known = _combinations(args, fixed, grid, ["high", "low", "close"], ("k", "d", "smooth_k", "mamode", "offset"))
+    if known is None or not (Imports["numba"] or Imports["talib"]): return
+    (high, low, close), combinations = known
+    if any(x.get("mamode", "sma") not in ("sma", None) for x in combinations): return
+    if not (close.index.is_unique and close.index.is_monotonic_increasing): return
+
+    params = []
+    for kwargs in combinations:
+        k = kwargs["k"] if kwargs.get("k") and kwargs["k"] > 0 else 14
+        d = kwargs["d"] if kwargs.get("d") and kwargs["d"] > 0 else 3
+        smooth_k = kwargs["smooth_k"] if kwargs.get("smooth_k") and kwargs["smooth_k"] > 0 else 3
+        if min(high.size, low.size, close.size) < max(k, d, smooth_k):
+            params.append(None)
+        else:
+            params.append((k, d, smooth_k))
+
+    # %K from its first value, its sma and their sma from their first value
+    smoothed = {}
+    for k in set(x[0] for x in params if x is not None):
+        fast = _fast_k(high, low, close, k).to_numpy(dtype=float64)
+        if isnan(fast).all(): return
+        first = int((~isnan(fast)).argmax())
+        fast = fast[first:]
+        smooths = set(x[2] for x in params if x is not None and x[0] == k)
+        if fast.size < max(smooths): return
+        stoch_k = _sma(fast, [(n, n) for n in smooths], Imports["talib"])
+        for smooth_k in smooths:
+            values = stoch_k[smooth_k, smooth_k]
+            if isnan(values).all(): return
+            second = int((~isnan(values)).argmax())
+            ds = set(x[1] for x in params if x is not None and x[0] == k and x[2] == smooth_k)
+            if values.size - second < max(ds): return
+            stoch_d = _sma(values[second:], [(n, n) for n in ds], Imports["talib"])
+            for d in ds:
+                values_d = full(values.size, npNaN)
+                values_d[second:] = stoch_d[d, d]
+                smoothed[k, d, smooth_k] = close.index[first:], values, values_d
+
+    results = []
+    for param in params:
+        result = None
+        if param is not None:
+            index, values_k, values_d = smoothed[param]
+            _props = "_{}_{}_{}".format(*param)
+            result = _series(index, "momentum", {f"STOCHk{_props}": values_k, f"STOCHd{_props}": values_d})
+        results.append(result)
+    return results
+
+
+# The indicators with a batch path over the swept values
+_BATCH = {
+    "atr": _sweep_atr,
+    "bbands": _sweep_bbands,
+    "rsi": _sweep_rsi,
+    "sma": _sweep_sma,
+    "stoch": _sweep_stoch,
+}
+
+
+def sweep(kind: str, *args, **kwargs) -> DataFrame:
+    """Parameter Sweep
+
+    Evaluates an indicator for many parameter values at once and returns
+    their results side by side. Every keyword argument given as a list,
+    tuple, range or array is swept; several of them are combined as their
+    product. The results match the indicator exactly.
+
+    sma, rsi, atr, bbands and stoch have batch paths that evaluate what
+    does not depend on the swept values once and run the moving averages
+    of every length in one pass over the data: the rolling means of sma
+    and of the %K and %D of stoch, the rma of the gains and losses of rsi
+    and of the true range of atr, the mean and variance of bbands shared by
+    every std. The paths need numba, except for bbands, and are skipped
+    when TA Lib would be used. Other indicators, or other arguments, are
+    called for each combination within a SharedPlan, so that their shared
+    primitives are evaluated only once.
+
+    Example:
+    >>> rsis = ta.sweep("rsi", df["close"], length=range(2, 101))
+    >>> bands = ta.sweep("bbands", df["close"], length=20, std=[1.5, 2, 2.5])
+    >>> stochs = ta.sweep("stoch", df["high"], df["low"], df["close"], k=14, d=range(2, 10))
+
+    Args:
+        kind (str): The name of the indicator, i.e. "rsi".
+        args: The positional arguments of the indicator, i.e. close.
+
+    Kwargs:
+        The keyword arguments of the indicator. Lists, tuples, ranges and
+        arrays are swept.
+
+    Returns:
+        pd.DataFrame: The columns of the results of every combination, in
+            order. Columns the indicator names alike are suffixed with the
+            swept values.
+    """
+    kind = kind.lower() if isinstance(kind, str) else kind
+    if kind not in [x for v in Category.values() for x in v] + ["ma"]:
+        raise ValueError(f"[X] sweep requires an indicator, not {kind}")
+    # The combinations differ, so only the primitives of the indicator are
+    # worth sharing, not its results
+    indicator = unwrap(getattr(core, kind))
+
+    swept = {k: list(v) for k, v in kwargs.items() if isinstance(v, (list, tuple, range, ndarray))}
+    fixed = {k: v for k, v in kwargs.items() if k not in swept}
+    grid = [dict(zip(swept.keys(), values)) for values in product(*swept.values())]
+
+    columns, category = {}, None
+    plan = SharedPlan() if active_plan() is None else nullcontext()
+    with plan:
+        batch = _BATCH[kind](args, fixed, grid) if kind in _BATCH else None
+        results = batch if batch is not None else (indicator(*args, **fixed, **params) for params in grid)
+        for params, result in zip(grid, results):
+            if result is None: continue
+            if isinstance(result, list):
+                # The Series of a batch path
+                category = getattr(result[0], "category", category)
+                items = [(x.name, x) for x in result]
+            else:
+                category = getattr(result, "category", category)
+                items = result.items() if isinstance(result, DataFrame) else [(result.name, result)]
+            for name, values in items:
+                if name in columns:
+                    name = "_".join([f"{name}"] + [f"{v}" for v in params.values()])
+                columns[name] = values
+
+    if len(columns) == 0: return
+    df = DataFrame(columns)
+    df.name = f"{kind.upper()}sweep_{len(grid)}"
+    df.category = category
+    return df
@@ -9,7 +9,7 @@ from .decreasing import decreasing
 from .dpo import dpo
 from .increasing import increasing
 from .long_run import long_run
-from .psar import psar
+from .psar import psar, psar_grid
 from .qstick import qstick
 from .short_run import short_run
 from .tsignals import tsignals
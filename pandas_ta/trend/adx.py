@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
-from pandas import DataFrame
+from pandas_ta.backend import DataFrame
 from pandas_ta.overlap import ma
 from pandas_ta.volatility import atr
-from pandas_ta.utils import get_drift, get_offset, verify_series, zero
+from pandas_ta.utils import get_drift, get_offset, verify_series, zero_clip
 
 
 def adx(high, low, close, length=None, lensig=None, scalar=None, mamode=None, drift=None, offset=None, **kwargs):
@@ -29,8 +29,8 @@ def adx(high, low, close, length=None, lensig=None, scalar=None, mamode=None, dr
     pos = ((up > dn) & (up > 0)) * up
     neg = ((dn > up) & (dn > 0)) * dn
 
-    pos = pos.apply(zero)
-    neg = neg.apply(zero)
+    pos = zero_clip(pos)
+    neg = zero_clip(neg)
 
     k = scalar / atr_
     dmp = k * ma(mamode, pos, length=length)
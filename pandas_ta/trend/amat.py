@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas import DataFrame
+from pandas_ta.backend import DataFrame
 from .long_run import long_run
 from .short_run import short_run
 from pandas_ta.overlap import ma
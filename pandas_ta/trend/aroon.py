@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
-from pandas import DataFrame
+from pandas_ta.backend import DataFrame
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
-from pandas_ta.utils import recent_maximum_index, recent_minimum_index
+from pandas_ta.utils import get_offset, rolling_extremes, verify_series
 
 
 def aroon(high, low, length=None, scalar=None, talib=None, offset=None, **kwargs):
@@ -23,8 +22,7 @@ def aroon(high, low, length=None, scalar=None, talib=None, offset=None, **kwargs
         aroon_down, aroon_up = AROON(high, low, length)
         aroon_osc = AROONOSC(high, low, length)
     else:
-        periods_from_hh = high.rolling(length + 1).apply(recent_maximum_index, raw=True)
-        periods_from_ll = low.rolling(length + 1).apply(recent_minimum_index, raw=True)
+        _, _, periods_from_hh, periods_from_ll = rolling_extremes(high, low, length + 1, positions=True)
 
         aroon_up = aroon_down = scalar
         aroon_up *= 1 - (periods_from_hh / length)
@@ -80,13 +78,12 @@ Calculation:
     Default Inputs:
         length=1, scalar=100
 
-    recent_maximum_index(x): return int(np.argmax(x[::-1]))
-    recent_minimum_index(x): return int(np.argmin(x[::-1]))
+    # Periods since the latest highest high and lowest low, in one pass
+    _, _, periods_from_hh, periods_from_ll = utils.rolling_extremes(
+        high, low, length + 1, positions=True
+    )
 
-    periods_from_hh = high.rolling(length + 1).apply(recent_maximum_index, raw=True)
     AROON_UP = scalar * (1 - (periods_from_hh / length))
-
-    periods_from_ll = low.rolling(length + 1).apply(recent_minimum_index, raw=True)
     AROON_DN = scalar * (1 - (periods_from_ll / length))
 
     AROON_OSC = AROON_UP - AROON_DN
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from numpy import exp as npExp
-from pandas import DataFrame
+from pandas_ta.backend import DataFrame
 from pandas_ta.utils import get_offset, verify_series
 
 
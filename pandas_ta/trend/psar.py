@@ -1,87 +1,105 @@
 # -*- coding: utf-8 -*-
+from itertools import product
+
+from numpy import array, float64, full, int64, zeros
 from numpy import nan as npNaN
-from pandas import DataFrame, Series
-from pandas_ta.utils import get_offset, verify_series, zero
+from pandas_ta.backend import DataFrame, Series
+from pandas_ta.utils import get_offset, njit, verify_series, zero
 
 
-def psar(high, low, close=None, af0=None, af=None, max_af=None, offset=None, **kwargs):
-    """Indicator: Parabolic Stop and Reverse (PSAR)"""
-    # Validate Arguments
-    high = verify_series(high)
-    low = verify_series(low)
-    af = float(af) if af and af > 0 else 0.02
-    af0 = float(af0) if af0 and af0 > 0 else af
-    max_af = float(max_af) if max_af and max_af > 0 else 0.2
-    offset = get_offset(offset)
+@njit(cache=True)
+def _psar(high, low, sar0, falling0, af0, af, max_af):
+    """PSAR of k (af0, af, max_af) triples in one pass over the bars.
+    Compiled when numba is installed."""
+    m, k = high.shape[0], af0.shape[0]
+    long, short = full((m, k), npNaN), full((m, k), npNaN)
+    _af = full((m, k), npNaN)
+    reversal = zeros((m, k), dtype=int64)
+    _af[0] = af0
 
-    def _falling(high, low, drift:int=1):
-        """Returns the last -DM value"""
-        # Not to be confused with ta.falling()
-        up = high - high.shift(drift)
-        dn = low.shift(drift) - low
-        _dmn = (((dn > up) & (dn > 0)) * dn).apply(zero).iloc[-1]
-        return _dmn > 0
-
-    # Falling if the first NaN -DM is positive
-    falling = _falling(high.iloc[:2], low.iloc[:2])
-    if falling:
-        sar = high.iloc[0]
-        ep = low.iloc[0]
-    else:
-        sar = low.iloc[0]
-        ep = high.iloc[0]
+    sar, acc = full(k, sar0), af.copy()
+    ep = full(k, low[0] if falling0 else high[0])
+    falling = full(k, falling0)
 
-    if close is not None:
-        close = verify_series(close)
-        sar = close.iloc[0]
+    for row in range(1, m):
+        high_, low_ = high[row], low[row]
+        for j in range(k):
+            _sar = sar[j] + acc[j] * (ep[j] - sar[j])
 
-    long = Series(npNaN, index=high.index)
-    short = long.copy()
-    reversal = Series(0, index=high.index)
-    _af = long.copy()
-    _af.iloc[0:2] = af0
+            if falling[j]:
+                reverse = high_ > _sar
 
-    # Calculate Result
-    m = high.shape[0]
-    for row in range(1, m):
-        high_ = high.iloc[row]
-        low_ = low.iloc[row]
+                if low_ < ep[j]:
+                    ep[j] = low_
+                    acc[j] = min(acc[j] + af0[j], max_af[j])
+
+                _sar = max(high[row - 1], high[max(row - 2, 0)], _sar)
+            else:
+                reverse = low_ < _sar
+
+                if high_ > ep[j]:
+                    ep[j] = high_
+                    acc[j] = min(acc[j] + af0[j], max_af[j])
+
+                _sar = min(low[row - 1], low[max(row - 2, 0)], _sar)
+
+            if reverse:
+                _sar = ep[j]
+                acc[j] = af0[j]
+                falling[j] = not falling[j] # Must come before next line
+                ep[j] = low_ if falling[j] else high_
 
-        if falling:
-            _sar = sar + af * (ep - sar)
-            reverse = high_ > _sar
+            sar[j] = _sar # Update SAR
 
-            if low_ < ep:
-                ep = low_
-                af = min(af + af0, max_af)
+            # Seperate long/short sar based on falling
+            if falling[j]:
+                short[row, j] = _sar
+            else:
+                long[row, j] = _sar
 
-            _sar = max(high.iloc[row - 1], high.iloc[row - 2], _sar)
-        else:
-            _sar = sar + af * (ep - sar)
-            reverse = low_ < _sar
+            _af[row, j] = acc[j]
+            reversal[row, j] = int(reverse)
 
-            if high_ > ep:
-                ep = high_
-                af = min(af + af0, max_af)
+    return long, short, _af, reversal
 
-            _sar = min(low.iloc[row - 1], low.iloc[row - 2], _sar)
 
-        if reverse:
-            _sar = ep
-            af = af0
-            falling = not falling # Must come before next line
-            ep = low_ if falling else high_
+def _psar_start(high, low, close=None):
+    """Initial SAR and direction, shared by every parameter triple."""
+    # Falling if the first NaN -DM is positive, rising with one bar
+    falling = False
+    if high.shape[0] > 1:
+        up = high.iloc[1] - high.iloc[0]
+        dn = low.iloc[0] - low.iloc[1]
+        falling = bool(dn > up and zero(dn) > 0)
+
+    sar = high.iloc[0] if falling else low.iloc[0]
+    if close is not None:
+        sar = close.iloc[0]
+    return float(sar), falling
 
-        sar = _sar # Update SAR
 
-        # Seperate long/short sar based on falling
-        if falling:
-            short.iloc[row] = sar
-        else:
-            long.iloc[row] = sar
+def psar(high, low, close=None, af0=None, af=None, max_af=None, offset=None, **kwargs):
+    """Indicator: Parabolic Stop and Reverse (PSAR)"""
+    # Validate Arguments
+    high = verify_series(high)
+    low = verify_series(low)
+    af = float(af) if af and af > 0 else 0.02
+    af0 = float(af0) if af0 and af0 > 0 else af
+    max_af = float(max_af) if max_af and max_af > 0 else 0.2
+    offset = get_offset(offset)
+    if close is not None:
+        close = verify_series(close)
 
-        _af.iloc[row] = af
-        reversal.iloc[row] = int(reverse)
+    # Calculate Result
+    sar, falling = _psar_start(high, low, close)
+    long, short, _af, reversal = _psar(
+        high.to_numpy(dtype=float64), low.to_numpy(dtype=float64), sar, falling,
+        array([af0]), array([af]), array([max_af])
+    )
+    long = Series(long[:, 0], index=high.index)
+    short = Series(short[:, 0], index=high.index)
+    _af = Series(_af[:, 0], index=high.index)
+    reversal = Series(reversal[:, 0], index=high.index)
 
     # Offset
     if offset != 0:
@@ -117,6 +135,62 @@ def psar(high, low, close=None, af0=None, af=None, max_af=None, offset=None, **k
     return psardf
 
 
+def psar_grid(high, low, close=None, af0=None, af=None, max_af=None, offset=None, **kwargs):
+    """Indicator: Parabolic Stop and Reverse (PSAR) Grid"""
+    # Validate Arguments
+    high = verify_series(high)
+    low = verify_series(low)
+    offset = get_offset(offset)
+    if close is not None:
+        close = verify_series(close)
+
+    def _values(x):
+        if x is None or not hasattr(x, "__iter__"):
+            return [x]
+        return list(x)
+
+    triples = []
+    for af0_, af_, max_af_ in product(_values(af0), _values(af), _values(max_af)):
+        af_ = float(af_) if af_ and af_ > 0 else 0.02
+        af0_ = float(af0_) if af0_ and af0_ > 0 else af_
+        max_af_ = float(max_af_) if max_af_ and max_af_ > 0 else 0.2
+        if (af0_, af_, max_af_) not in triples:
+            triples.append((af0_, af_, max_af_))
+    af0_, af_, max_af_ = (array(x, dtype=float64) for x in zip(*triples))
+
+    # Calculate Result
+    sar, falling = _psar_start(high, low, close)
+    long, short, _af, reversal = _psar(
+        high.to_numpy(dtype=float64), low.to_numpy(dtype=float64), sar, falling,
+        af0_, af_, max_af_
+    )
+
+    # Prepare DataFrame to return
+    data = {}
+    for j, (af0_, af_, max_af_) in enumerate(triples):
+        _params = f"_{af0_}_{max_af_}" if af_ == af0_ else f"_{af0_}_{af_}_{max_af_}"
+        data[f"PSARl{_params}"] = long[:, j]
+        data[f"PSARs{_params}"] = short[:, j]
+        data[f"PSARaf{_params}"] = _af[:, j]
+        data[f"PSARr{_params}"] = reversal[:, j]
+    psardf = DataFrame(data, index=high.index)
+
+    # Offset
+    if offset != 0:
+        psardf = psardf.shift(offset)
+
+    # Handle fills
+    if "fillna" in kwargs:
+        psardf.fillna(kwargs["fillna"], inplace=True)
+    if "fill_method" in kwargs:
+        psardf.fillna(method=kwargs["fill_method"], inplace=True)
+
+    psardf.name = f"PSARgrid_{len(triples)}"
+    psardf.category = "trend"
+
+    return psardf
+
+
 psar.__doc__ = \
 """Parabolic Stop and Reverse (psar)
 
@@ -156,3 +230,35 @@ Kwargs:
 Returns:
     pd.DataFrame: long, short, af, and reversal columns.
 """
+
+
+psar_grid.__doc__ = \
+"""Parabolic Stop and Reverse Grid (psar_grid)
+
+Evaluates PSAR for every combination of the given af0, af and max_af values in
+a single pass over the bars, i.e. for parameter optimizations. Each triple
+returns the same four columns as psar(). Triples where af differs from af0
+are suffixed with all three values to keep their names unique.
+
+Calculation:
+    Default Inputs:
+        af0=af, af=0.02, max_af=0.2
+
+    See psar()
+
+Args:
+    high (pd.Series): Series of 'high's
+    low (pd.Series): Series of 'low's
+    close (pd.Series, optional): Series of 'close's. Optional
+    af0 (float, list): Initial Acceleration Factor(s). Default: af
+    af (float, list): Acceleration Factor(s). Default: 0.02
+    max_af (float, list): Maximum Acceleration Factor(s). Default: 0.2
+    offset (int): How many periods to offset the result. Default: 0
+
+Kwargs:
+    fillna (value, optional): pd.DataFrame.fillna(value)
+    fill_method (value, optional): Type of fill method
+
+Returns:
+    pd.DataFrame: long, short, af, and reversal columns of each triple.
+"""
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from numpy import nan as npNaN
-from pandas import DataFrame
+from pandas_ta.backend import DataFrame
 from .tsignals import tsignals
 from pandas_ta.utils._signals import cross_value
 from pandas_ta.utils import get_offset, verify_series
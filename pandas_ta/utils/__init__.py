@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
+from ._cache import *
 from ._candles import *
 from ._core import *
 from ._math import *
+from ._numba import *
+from ._plan import *
+from ._rolling import *
 from ._signals import *
 from ._time import *
 from ._metrics import *
@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+from collections import OrderedDict
+from functools import wraps
+from hashlib import sha256
+from inspect import signature
+from os import replace
+from pathlib import Path
+from pickle import dump, HIGHEST_PROTOCOL, load
+from threading import RLock
+
+from numpy import ascontiguousarray, ndarray
+
+from pandas_ta import Imports, version
+from pandas_ta.backend import get_backend
+from ._plan import _detached
+
+
+_active = [None]
+# Keyword arguments of the df.ta accessor that do not change a result
+_POST_PROCESS = {"append", "col_names", "col_numbers", "delimiter", "prefix", "suffix", "timed", "verbose"}
+
+
+class ResultCache:
+    """Result Cache
+
+    Opt-in memoization of indicator results keyed by the content of the input
+    series and the normalized parameters, so that calling ta.rsi(close, 14)
+    twice on identical data computes it once. Both the functions of the
+    package and the df.ta methods consult the active cache. Results are
+    evicted in least recently used order once their values exceed max_bytes.
+    With a path, results are also pickled to disk and reused by later
+    sessions with the same version of the package, TA Lib and numba.
+
+    Example:
+    >>> with ta.ResultCache(max_bytes=256 * 2 ** 20) as cache:
+    ...     rsi_ = ta.rsi(df["close"], 14)
+    ...     rsi_ = ta.rsi(df["close"], 14)
+    >>> cache.hits, cache.misses
+    (1, 1)
+
+    Or for the whole session:
+    >>> ta.set_cache(ta.ResultCache(path="~/.pandas_ta/cache"))
+
+    Args:
+        max_bytes (int): Memory budget of the cached results. Default: 256 MiB
+        path (str, optional): Directory to persist results to. Default: None
+
+    Attributes:
+        hits (int): Number of results reused from memory or disk.
+        misses (int): Number of results computed.
+        evictions (int): Number of results evicted from memory.
+        nbytes (int): Bytes of the results held in memory.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 2 ** 20, path: str = None):
+        self.max_bytes = int(max_bytes)
+        self.path = Path(path).expanduser() if path is not None else None
+        if self.path is not None:
+            self.path.mkdir(parents=True, exist_ok=True)
+        self.entries = OrderedDict()
+        self.hits = self.misses = self.evictions = self.nbytes = 0
+        self._previous = []
+        self._lock = RLock()
+
+    def __enter__(self):
+        self._previous.append(_active[0])
+        _active[0] = self
+        return self
+
+    def __exit__(self, *exc):
+        _active[0] = self._previous.pop()
+        return False
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def clear(self, disk: bool = False) -> None:
+        """Forgets the results in memory and, if disk is True, on disk."""
+        with self._lock:
+            self.entries.clear()
+            self.nbytes = 0
+        if disk and self.path is not None:
+            [x.unlink() for x in self.path.glob("*.pkl")]
+
+    def evaluate(self, fn, args: tuple, kwargs: dict):
+        """Returns fn(*args, **kwargs) from the cache or computes it."""
+        key = _key(fn, args, kwargs)
+        if key is None:
+            return fn(*args, **kwargs)
+
+        result = self._get(key)
+        if result is None:
+            result = fn(*args, **kwargs)
+            with self._lock:
+                self.misses += 1
+            if result is not None:
+                self._set(key, result, persist=True)
+        return _detached(result)
+
+    def stats(self) -> dict:
+        """Hit and miss statistics of the cache."""
+        calls = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / calls if calls > 0 else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "nbytes": self.nbytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def summary(self) -> str:
+        return f"{self.hits} hits, {self.misses} misses, {len(self.entries)} results in {self.nbytes} bytes"
+
+    def _get(self, key: str):
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+        if self.path is None:
+            return None
+
+        file = self.path / f"{key}.pkl"
+        try:
+            with open(file, "rb") as f:
+                result, attrs = load(f)
+        except (OSError, EOFError, ValueError, AttributeError, ImportError):
+            return None
+        _restore_attrs(result, attrs)
+        with self._lock:
+            self.hits += 1
+        self._set(key, result, persist=False)
+        return result
+
+    def _set(self, key: str, result, persist: bool) -> None:
+        size = _nbytes(result)
+        if size <= self.max_bytes:
+            with self._lock:
+                if key in self.entries:
+                    self.nbytes -= self.entries.pop(key)[1]
+                self.entries[key] = (result, size)
+                self.nbytes += size
+                while self.nbytes > self.max_bytes:
+                    _, (_, evicted) = self.entries.popitem(last=False)
+                    self.nbytes -= evicted
+                    self.evictions += 1
+
+        if persist and self.path is not None:
+            file = self.path / f"{key}.pkl"
+            partial = file.with_suffix(".tmp")
+            try:
+                with open(partial, "wb") as f:
+                    dump((result, _attrs(result)), f, protocol=HIGHEST_PROTOCOL)
+                replace(partial, file)
+            except (OSError, TypeError, AttributeError):
+                partial.unlink(missing_ok=True)
+
+
+def active_cache():
+    """Returns the active ResultCache or None."""
+    return _active[0]
+
+
+def set_cache(cache: ResultCache = None) -> None:
+    """Activates cache for all threads. None disables caching."""
+    _active[0] = cache
+
+
+def cached(fn):
+    """Decorator for indicators whose results may be reused by the active
+    ResultCache. Without an active cache it calls fn as is."""
+    sig = signature(fn)
+
+    @wraps(fn)
+    def _cached(*args, **kwargs):
+        cache = _active[0]
+        if cache is None:
+            return fn(*args, **kwargs)
+        try:
+            bound = sig.bind(*args, **kwargs)
+        except TypeError:
+            return fn(*args, **kwargs)
+        bound.apply_defaults()
+        return cache.evaluate(fn, bound.args, bound.kwargs)
+
+    _cached.__signature__ = sig
+    return _cached
+
+
+# PRIVATE
+_ATTRS = ("name", "category")
+
+
+def _attrs(result) -> list:
+    """The name and category of a result, which pickle does not keep for
+    DataFrames."""
+    items = result if isinstance(result, tuple) else (result,)
+    return [{a: getattr(x, a) for a in _ATTRS if hasattr(x, a)} for x in items]
+
+
+def _restore_attrs(result, attrs: list) -> None:
+    items = result if isinstance(result, tuple) else (result,)
+    for x, attrs_ in zip(items, attrs):
+        for a, v in attrs_.items():
+            setattr(x, a, v)
+
+
+def _fingerprint(x, h) -> bool:
+    """Feeds the content of x to the hash h. Returns False when x can not be
+    keyed by its content."""
+    if x is None or isinstance(x, (bool, int, float, str)):
+        h.update(f"{type(x).__name__}:{x!r};".encode())
+    elif isinstance(x, (tuple, list)):
+        h.update(f"{type(x).__name__}[{len(x)}];".encode())
+        return all(_fingerprint(_, h) for _ in x)
+    elif isinstance(x, dict):
+        h.update(f"dict[{len(x)}];".encode())
+        return all(_fingerprint(k, h) and _fingerprint(v, h) for k, v in sorted(x.items(), key=repr))
+    elif isinstance(x, ndarray):
+        if x.dtype.hasobject:
+            return False
+        h.update(f"ndarray:{x.dtype.str}:{x.shape};".encode())
+        if x.dtype.kind in "mM":
+            x = x.view("i8")
+        h.update(memoryview(ascontiguousarray(x)).cast("B"))
+    elif getattr(x, "ndim", None) == 2 and hasattr(x, "columns"):
+        h.update(f"DataFrame:{len(x.columns)};".encode())
+        return all(_fingerprint(c, h) and _fingerprint(x[c], h) for c in x.columns)
+    elif getattr(x, "ndim", None) == 1 and hasattr(x, "to_numpy"):
+        # Series by name, index and values
+        h.update(f"Series:{x.name!r};".encode())
+        index = x.index
+        if type(index).__name__ == "RangeIndex":
+            h.update(f"RangeIndex:{index.start}:{index.stop}:{index.step};".encode())
+        elif getattr(index, "tz", None) is not None:
+            h.update(f"tz:{index.tz};".encode())
+            if not _fingerprint(index.tz_convert(None).to_numpy(), h):
+                return False
+        elif not _fingerprint(index.to_numpy(), h):
+            return False
+        return _fingerprint(x.to_numpy(), h)
+    else:
+        return False
+    return True
+
+
+def _key(fn, args: tuple, kwargs: dict):
+    """Content address of the call fn(*args, **kwargs) or None. The version
+    of the package and whether TA Lib and numba are available are part of
+    the address, since they change the results."""
+    h = sha256()
+    h.update(f"{fn.__module__}.{fn.__qualname__}:{get_backend()};".encode())
+    h.update(f"{version};talib={Imports['talib']};numba={Imports['numba']};".encode())
+    kwargs = {k: v for k, v in kwargs.items() if k not in _POST_PROCESS}
+    if not _fingerprint(args, h) or not _fingerprint(kwargs, h):
+        return None
+    return h.hexdigest()
+
+
+def _nbytes(result) -> int:
+    """Bytes of the values of a result."""
+    if isinstance(result, tuple):
+        return sum(_nbytes(x) for x in result)
+    if hasattr(result, "memory_usage"):
+        usage = result.memory_usage(index=False)
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+    return 0
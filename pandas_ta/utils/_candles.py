@@ -1,9 +1,125 @@
 # -*- coding: utf-8 -*-
-from pandas import Series
+from numpy import abs as npAbs
+from numpy import append as npAppend
+from numpy import cumsum as npCumsum
+from numpy import float64, full, maximum, minimum
+from numpy import nan as npNaN
+from numpy import ndarray
+from numpy import where as npWhere
+from pandas_ta.backend import Series
 
 from ._core import non_zero_range
 
 
+# TA Lib's default candle settings: the range, the number of previous candles
+# averaged (0 for the candle itself) and the factor of the average
+CANDLE_SETTINGS = {
+    "BodyLong": ("RealBody", 10, 1.0),
+    "BodyVeryLong": ("RealBody", 10, 3.0),
+    "BodyShort": ("RealBody", 10, 1.0),
+    "BodyDoji": ("HighLow", 10, 0.1),
+    "ShadowLong": ("RealBody", 0, 1.0),
+    "ShadowVeryLong": ("RealBody", 0, 2.0),
+    "ShadowShort": ("Shadows", 10, 1.0),
+    "ShadowVeryShort": ("HighLow", 10, 0.1),
+    "Near": ("HighLow", 5, 0.2),
+    "Far": ("HighLow", 5, 0.6),
+    "Equal": ("HighLow", 5, 0.05),
+}
+
+
+class Candles:
+    """Candles
+
+    The features candle patterns are expressed in, computed once for all
+    patterns over float64 arrays: the real body, the shadows, the range, the
+    color, gaps and the averages of CANDLE_SETTINGS. Features are indexed by
+    how many candles back they are, so body(2) is the body two candles
+    before each candle, NaN where there is none.
+
+    Args:
+        open_, high, low, close (pd.Series or np.ndarray): The candles.
+    """
+
+    def __init__(self, open_, high, low, close):
+        self._features = {
+            "o": _array(open_), "h": _array(high),
+            "l": _array(low), "c": _array(close),
+        }
+        o, h, l, c = (self._features[k] for k in "ohlc")
+        top, bottom = maximum(o, c), minimum(o, c)
+        upper, lower = h - top, bottom - l
+        self._features.update({
+            "body": npAbs(c - o), "range": h - l,
+            "color": npWhere(c >= o, 1.0, -1.0),
+            "top": top, "bottom": bottom, "upper": upper, "lower": lower,
+            "shadows": upper + lower,
+        })
+        self.size = c.shape[0]
+        self._shifted = {}
+
+    def feature(self, name: str, k: int = 0) -> ndarray:
+        """The feature of the candle k candles back."""
+        key = (name, k)
+        if key not in self._shifted:
+            self._shifted[key] = _shift(self._features[name], k)
+        return self._shifted[key]
+
+    def o(self, k: int = 0): return self.feature("o", k)
+    def h(self, k: int = 0): return self.feature("h", k)
+    def l(self, k: int = 0): return self.feature("l", k)
+    def c(self, k: int = 0): return self.feature("c", k)
+    def body(self, k: int = 0): return self.feature("body", k)
+    def color(self, k: int = 0): return self.feature("color", k)
+    def top(self, k: int = 0): return self.feature("top", k)
+    def bottom(self, k: int = 0): return self.feature("bottom", k)
+    def upper(self, k: int = 0): return self.feature("upper", k)
+    def lower(self, k: int = 0): return self.feature("lower", k)
+    def range(self, k: int = 0): return self.feature("range", k)
+
+    def gap_up(self, k: int, j: int) -> ndarray:
+        """The real body k candles back is above the one j candles back."""
+        return self.bottom(k) > self.top(j)
+
+    def gap_down(self, k: int, j: int) -> ndarray:
+        """The real body k candles back is below the one j candles back."""
+        return self.top(k) < self.bottom(j)
+
+    def candle_gap_up(self, k: int, j: int) -> ndarray:
+        """The candle k candles back is above the one j candles back."""
+        return self.l(k) > self.h(j)
+
+    def candle_gap_down(self, k: int, j: int) -> ndarray:
+        """The candle k candles back is below the one j candles back."""
+        return self.h(k) < self.l(j)
+
+    def average(self, setting: str, k: int, start: int) -> ndarray:
+        """The average of setting for the candle k candles back. Like TA
+        Lib, the totals of the previous candles are summed from the start
+        index onwards, so that the values match it exactly. NaN before
+        start."""
+        key = (setting, k, start)
+        if key in self._shifted:
+            return self._shifted[key]
+
+        kind, period, factor = CANDLE_SETTINGS[setting]
+        x = self._features[_RANGES[kind]]
+        divisor = 2.0 if kind == "Shadows" else 1.0
+        m, j = self.size, start - k
+        if period == 0:
+            result = _shift(factor * x / divisor, k)
+            result[:start] = npNaN
+        else:
+            result = full(m, npNaN)
+            if j - period >= 0 and start < m:
+                # total of candle j + 1 = total of candle j + x[j] - x[j - period]
+                diffs = x[j:m - k - 1] - x[j - period:m - k - 1 - period]
+                totals = npCumsum(npAppend(x[j - period:j], diffs))[period - 1:]
+                result[start:] = factor * (totals / period) / divisor
+        self._shifted[key] = result
+        return result
+
+
 def candle_color(open_: Series, close: Series) -> Series:
     color = close.copy().astype(int)
     color[close >= open_] = 1
@@ -17,3 +133,20 @@ def high_low_range(high: Series, low: Series) -> Series:
 
 def real_body(open_: Series, close: Series) -> Series:
     return non_zero_range(close, open_)
+
+
+# PRIVATE
+_RANGES = {"RealBody": "body", "HighLow": "range", "Shadows": "shadows"}
+
+
+def _array(x) -> ndarray:
+    return x.to_numpy(dtype=float64) if hasattr(x, "to_numpy") else x.astype(float64)
+
+
+def _shift(x: ndarray, k: int) -> ndarray:
+    """x k positions later, NaN before."""
+    if k == 0:
+        return x
+    result = full(x.shape[0], npNaN)
+    result[k:] = x[:-k]
+    return result
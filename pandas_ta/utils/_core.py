@@ -4,8 +4,7 @@ from pathlib import Path
 from sys import float_info as sflt
 
 from numpy import argmax, argmin
-import cudf
-from cudf import DataFrame, Series
+from pandas_ta.backend import DataFrame, Series, to_backend
 from pandas_ta import Imports
 
 # Compatibility: cudf doesn't have is_datetime64_any_dtype, use alternative check
@@ -62,10 +61,8 @@ def is_percent(x: int or float) -> bool:
 def non_zero_range(high: Series, low: Series) -> Series:
     """Returns the difference of two series and adds epsilon to any zero values.  This occurs commonly in crypto data when 'high' = 'low'."""
     diff = high - low
-    # cudf: any() returns scalar, not Series
-    if diff.eq(0).any():
-        diff = diff + sflt.epsilon
-    return diff
+    # Only the zero values, so that a value does not depend on later values
+    return diff.where(diff != 0, sflt.epsilon)
 
 
 def recent_maximum_index(x):
@@ -145,7 +142,10 @@ def unsigned_differences(series: Series, amount: int = None, **kwargs) -> Series
 
 
 def verify_series(series: Series, min_length: int = None) -> Series:
-    """If a cuDF Series and it meets the min_length of the indicator return it."""
+    """If a Series and it meets the min_length of the indicator return it.
+    Arrays, lists and Series of another backend are converted to a Series of
+    the active backend (see pandas_ta.backend)."""
     has_length = min_length is not None and isinstance(min_length, int)
+    series = to_backend(series)
     if series is not None and isinstance(series, Series):
         return None if has_length and len(series) < min_length else series
\ No newline at end of file
@@ -5,22 +5,28 @@ from operator import mul
 from sys import float_info as sflt
 from typing import List, Optional, Tuple
 
-from numpy import ones, triu
+from numpy import float64, full, ones, triu
 from numpy import all as npAll
 from numpy import append as npAppend
 from numpy import array as npArray
+from numpy import asarray as npAsarray
+from numpy import convolve as npConvolve
 from numpy import corrcoef as npCorrcoef
+from numpy import cumsum as npCumsum
 from numpy import dot as npDot
 from numpy import fabs as npFabs
 from numpy import exp as npExp
+from numpy import isnan as npIsnan
 from numpy import log as npLog
 from numpy import nan as npNaN
 from numpy import ndarray as npNdArray
 from numpy import seterr
 from numpy import sqrt as npSqrt
 from numpy import sum as npSum
+from numpy import where as npWhere
+from numpy.fft import irfft, rfft
 
-from cudf import DataFrame, Series
+from pandas_ta.backend import DataFrame, Series
 
 from pandas_ta import Imports
 from ._core import verify_series
@@ -201,11 +207,76 @@ def weights(w: npNdArray):
     return _dot
 
 
+# Windows longer than this are convolved by FFT
+FFT_LENGTH = 400
+
+
+def weighted_window(x: npNdArray, w: npNdArray, fft: bool = None) -> npNdArray:
+    """Weighted Window
+
+    The dot product of the weights w with every window of len(w) values of
+    x, the oldest value first, like x.rolling(len(w)).apply(weights(w)) but
+    as a single convolution. Windows with NaNs are NaN.
+    """
+    return weighted_windows(x, [w], fft=fft)[0]
+
+
+def weighted_windows(x: npNdArray, ws: List[npNdArray], fft: bool = None) -> List[npNdArray]:
+    """Weighted Windows
+
+    weighted_window of x for each of the weights in ws, i.e. the weights of
+    several lengths. Short windows are convolved directly in O(n * length)
+    and long ones by FFT in O(n log n), where the transform of x is shared
+    by all of them. fft forces either method. FFT results are exact up to
+    rounding relative to the largest value of x.
+    """
+    x = npAsarray(x, dtype=float64)
+    ws = [npAsarray(w, dtype=float64) for w in ws]
+    m = x.shape[0]
+
+    nans = npIsnan(x)
+    if nans.any():
+        x = npWhere(nans, 0.0, x)
+        nans = npCumsum(npAppend(0, nans))
+    else:
+        nans = None
+
+    long_ = [w.shape[0] for w in ws if w.shape[0] > FFT_LENGTH]
+    if fft is not None:
+        long_ = [w.shape[0] for w in ws] if fft else []
+    if len(long_) > 0 and m > 0:
+        # One transform of x, centered to limit the rounding, for all
+        shift = x.mean()
+        size = 1 << (m + max(long_) - 2).bit_length()
+        xf = rfft(x - shift, size)
+
+    results = []
+    for w in ws:
+        length = w.shape[0]
+        result = full(m, npNaN)
+        if 0 < length <= m:
+            if length in long_:
+                wx = irfft(xf * rfft(w[::-1], size), size)
+                result[length - 1:] = wx[length - 1:m] + shift * w.sum()
+            else:
+                result[length - 1:] = npConvolve(x, w[::-1], "valid")
+            if nans is not None:
+                result[length - 1:][nans[length:] > nans[:m - length + 1]] = npNaN
+        results.append(result)
+    return results
+
+
 def zero(x: Tuple[int, float]) -> Tuple[int, float]:
     """If the value is close to zero, then return zero. Otherwise return itself."""
     return 0 if abs(x) < sflt.epsilon else x
 
 
+def zero_clip(x: Series) -> Series:
+    """Vectorized zero for a Series: the values close to zero become zero and
+    the rest, NaN included, are kept. Same as x.apply(zero)."""
+    return x.mask(x.abs() < sflt.epsilon, 0)
+
+
 # TESTING
 
 
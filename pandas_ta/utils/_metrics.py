@@ -4,7 +4,8 @@ from typing import Tuple
 from numpy import log as npLog
 from numpy import nan as npNaN
 from numpy import sqrt as npSqrt
-from pandas import Series, Timedelta
+from pandas import Timedelta
+from pandas_ta.backend import Series
 
 from ._core import verify_series
 from ._time import total_time
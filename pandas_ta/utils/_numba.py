@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+from pandas_ta import Imports
+
+if Imports["numba"]:
+    from numba import njit
+else:
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit when numba is not installed. The decorated
+        kernel runs as plain Python over NumPy arrays.
+
+        >>> @njit(cache=True)
+        ... def _kernel(x):
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+from functools import wraps
+from inspect import signature
+from threading import local, RLock
+
+
+_state = local()
+_UNKEYED = object()
+
+
+class SharedPlan:
+    """Shared Plan
+
+    Evaluation plan for a Strategy that expands every indicator into the
+    primitive sub-computations it is built from (atr, ema, hl2, rma, sma,
+    true_range, ...) and evaluates each primitive only once. Each node of the
+    plan is keyed by (function, input series, parameters); indicators sharing
+    a node reuse its result instead of recomputing it.
+
+    Primitives opt in with the @shared decorator. Outside of an active plan
+    they behave exactly as before. A plan may also be entered by worker
+    threads while it is active; their nodes are shared with the plan and it
+    is only cleared when the outermost block exits.
+
+    Example:
+    >>> with SharedPlan() as plan:
+    ...     kc_ = ta.kc(df["high"], df["low"], df["close"])
+    ...     natr_ = ta.natr(df["high"], df["low"], df["close"])
+    >>> plan.hits, plan.misses
+
+    Attributes:
+        nodes (dict): Evaluated nodes keyed by (function, inputs, params).
+        hits (int): Number of times a node was reused.
+        misses (int): Number of nodes evaluated.
+    """
+
+    def __init__(self):
+        self.columns = {}
+        self.nodes = {}
+        self.hits = 0
+        self.misses = 0
+        self._depth = 0
+        self._lock = RLock()
+
+    def __enter__(self):
+        if not hasattr(_state, "plans"):
+            _state.plans = []
+        _state.plans.append(self)
+        with self._lock:
+            self._depth += 1
+        return self
+
+    def __exit__(self, *exc):
+        _state.plans.remove(self)
+        with self._lock:
+            self._depth -= 1
+            if self._depth == 0:
+                self.columns.clear()
+                self.nodes.clear()
+        return False
+
+    def column(self, df, name: str):
+        """Returns the same column object of df for the life of the plan so
+        that nodes keyed by their inputs match across indicators."""
+        with self._lock:
+            frames = self.columns.setdefault(name, [])
+            for frame, column in frames:
+                if frame is df:
+                    return column
+            frames.append((df, df[name]))
+            return frames[-1][1]
+
+    def invalidate(self, name: str) -> None:
+        """Forgets the memoized columns of a name, i.e. after it has been
+        overwritten."""
+        with self._lock:
+            self.columns.pop(name, None)
+
+    def evaluate(self, fn, args: tuple, kwargs: dict):
+        """Evaluates the node fn(*args, **kwargs) or reuses its result."""
+        key = _node_key(fn, args, kwargs)
+        if key is None:
+            return fn(*args, **kwargs)
+
+        with self._lock:
+            node = self.nodes.get(key)
+            if node is not None:
+                self.hits += 1
+        if node is None:
+            # Evaluated outside of the lock so that threads do not wait on
+            # each other. Keep the inputs alive so their ids can not be
+            # recycled.
+            node = (fn(*args, **kwargs), args, kwargs)
+            with self._lock:
+                node = self.nodes.setdefault(key, node)
+                self.misses += 1
+        return _detached(node[0])
+
+    def summary(self) -> str:
+        return f"{self.misses} nodes evaluated, {self.hits} reused"
+
+
+def active_plan():
+    """Returns the innermost active SharedPlan or None."""
+    plans = getattr(_state, "plans", None)
+    return plans[-1] if plans else None
+
+
+def shared(fn=None, **defaults):
+    """Decorator for primitives whose results can be shared by a SharedPlan.
+
+    The keyword arguments are the defaults the primitive substitutes for None
+    arguments, so that atr(h, l, c) and atr(h, l, c, length=14) are the same
+    node.
+
+    >>> @shared(length=14, drift=1, offset=0)
+    ... def atr(high, low, close, length=None, drift=None, offset=None, **kwargs):
+    """
+    if fn is None:
+        return lambda fn_: shared(fn_, **defaults)
+    sig = signature(fn)
+
+    @wraps(fn)
+    def _shared(*args, **kwargs):
+        plan = active_plan()
+        if plan is None:
+            return fn(*args, **kwargs)
+        try:
+            bound = sig.bind(*args, **kwargs)
+        except TypeError:
+            return fn(*args, **kwargs)
+        bound.apply_defaults()
+        for name, value in defaults.items():
+            if bound.arguments.get(name) is None:
+                bound.arguments[name] = value
+        return plan.evaluate(fn, bound.args, bound.kwargs)
+
+    _shared.__signature__ = sig
+    return _shared
+
+
+# PRIVATE
+def _detached(result):
+    """Copy of a node result so callers may modify it in place."""
+    if isinstance(result, tuple):
+        return tuple(_detached(x) for x in result)
+    if result is None or not hasattr(result, "copy"):
+        return result
+    copy = result.copy()
+    for attr in ("name", "category"):
+        if hasattr(result, attr):
+            setattr(copy, attr, getattr(result, attr))
+    return copy
+
+
+def _hashable(x):
+    """Normalized, hashable form of an argument. Series and DataFrames are
+    keyed by identity. Returns _UNKEYED when x can not be keyed."""
+    if x is None or isinstance(x, (bool, int, float, str)):
+        return x
+    if hasattr(x, "shape") and hasattr(x, "index"):
+        return ("id", id(x))
+    if isinstance(x, (tuple, list)):
+        items = tuple(_hashable(_) for _ in x)
+        return _UNKEYED if any(_ is _UNKEYED for _ in items) else items
+    return _UNKEYED
+
+
+def _node_key(fn, args: tuple, kwargs: dict):
+    key = _hashable(args + tuple(sorted(kwargs.items())))
+    if key is _UNKEYED:
+        return None
+    return (fn.__module__, fn.__qualname__, key)
@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+from numpy import arange, argsort, empty, float64, full, int64, isnan
+from numpy import array as npArray
+from numpy import nan as npNaN
+from numpy import searchsorted, sqrt, zeros
+from numpy.lib.stride_tricks import sliding_window_view
+
+from pandas_ta import Imports
+from pandas_ta.backend import Series
+from ._numba import njit
+from ._plan import shared
+
+
+@njit(cache=True)
+def _rolling_extremes(high, low, length, min_periods):
+    """Rolling maximum of high, minimum of low and the periods since each,
+    over float64 arrays, with a monotonic deque of indices per side. Every
+    index enters and leaves a deque once, so the pass is O(n). Ties keep
+    the most recent index. NaNs are skipped like pandas' rolling. Compiled
+    when numba is installed."""
+    m = high.shape[0]
+    highest, lowest = full(m, npNaN), full(m, npNaN)
+    since_highest, since_lowest = full(m, npNaN), full(m, npNaN)
+
+    # Deques as arrays with head and tail pointers
+    hq, lq = empty(m, dtype=int64), empty(m, dtype=int64)
+    hq_head = hq_tail = lq_head = lq_tail = 0
+    h_count = l_count = 0
+    for i in range(m):
+        h, l = high[i], low[i]
+        if h == h:
+            h_count += 1
+            while hq_tail > hq_head and high[hq[hq_tail - 1]] <= h:
+                hq_tail -= 1
+            hq[hq_tail] = i
+            hq_tail += 1
+        if l == l:
+            l_count += 1
+            while lq_tail > lq_head and low[lq[lq_tail - 1]] >= l:
+                lq_tail -= 1
+            lq[lq_tail] = i
+            lq_tail += 1
+
+        start = i - length + 1
+        if start > 0:
+            if high[start - 1] == high[start - 1]:
+                h_count -= 1
+            if low[start - 1] == low[start - 1]:
+                l_count -= 1
+        while hq_tail > hq_head and hq[hq_head] < start:
+            hq_head += 1
+        while lq_tail > lq_head and lq[lq_head] < start:
+            lq_head += 1
+
+        if h_count >= min_periods and hq_tail > hq_head:
+            j = hq[hq_head]
+            highest[i], since_highest[i] = high[j], i - j
+        if l_count >= min_periods and lq_tail > lq_head:
+            j = lq[lq_head]
+            lowest[i], since_lowest[i] = low[j], i - j
+    return highest, lowest, since_highest, since_lowest
+
+
+@shared
+def rolling_extremes(high: Series, low: Series = None, length: int = None, min_periods: int = None, positions: bool = False) -> tuple:
+    """Rolling Extremes
+
+    The highest high and the lowest low of the last length periods in a
+    single O(n) pass, like high.rolling(length, min_periods).max() and
+    low.rolling(length, min_periods).min(). With positions, also the
+    periods since the highest high and the lowest low, the latest if tied,
+    like rolling(length).apply(recent_maximum_index). Low defaults to high.
+    Without numba, max and min without positions are left to pandas.
+
+    Returns:
+        tuple: highest, lowest and, if positions, the periods since the
+            highest and the lowest, as pd.Series.
+    """
+    low = high if low is None else low
+    length = int(length) if length and length > 0 else 14
+    min_periods = int(min_periods) if min_periods is not None else length
+
+    if not Imports["numba"] and not positions:
+        highest = high.rolling(length, min_periods=min_periods).max()
+        lowest = low.rolling(length, min_periods=min_periods).min()
+        return highest, lowest
+
+    result = _rolling_extremes(
+        high.to_numpy(dtype=float64), low.to_numpy(dtype=float64),
+        length, max(min_periods, 1)
+    )
+    result = tuple(Series(x, index=high.index) for x in result)
+    return result if positions else result[:2]
+
+
+@njit(cache=True)
+def _select(counts, top, k):
+    """The rank of the k-th (from 0) value counted by a Fenwick tree."""
+    pos, step, n = 0, top, counts.shape[0] - 1
+    while step > 0:
+        if pos + step <= n and counts[pos + step] <= k:
+            pos += step
+            k -= counts[pos]
+        step >>= 1
+    return pos
+
+
+@njit(cache=True)
+def _two_sum(s, c, y):
+    """s + y and the compensation c plus its rounding error (Neumaier)."""
+    t = s + y
+    if abs(s) >= abs(y):
+        c += (s - t) + y
+    else:
+        c += (y - t) + s
+    return t, c
+
+
+@njit(cache=True)
+def _rolling_order_stats(x, ranks, values, length, min_periods, qs, median, mad):
+    """Rolling quantiles, median and mean absolute deviation over float64
+    arrays. The window is a Fenwick tree of counts and sums over the ranks
+    of the values, so adding or removing a value and selecting the k-th
+    value are O(log n) and every statistic comes from the same pass.
+    Quantiles interpolate linearly and NaNs are skipped like pandas'
+    rolling; the mean absolute deviation is NaN for windows with a NaN like
+    rolling(length).apply(mad). Compiled when numba is installed."""
+    m, n, k = x.shape[0], values.shape[0], qs.shape[0]
+    counts, sums = zeros(n + 1, dtype=int64), zeros(n + 1, dtype=float64)
+    errors = zeros(n + 1, dtype=float64)
+    result = full((m, k + 2), npNaN)
+    top = 1
+    while top * 2 <= n:
+        top *= 2
+
+    # Sums of the values less their median to limit rounding
+    center = values[n // 2] if n > 0 else 0.0
+    nobs = nans = 0
+    total = total_error = 0.0
+    for i in range(m):
+        for j, sign in ((i, 1), (i - length, -1)):
+            if j < 0: continue
+            if x[j] != x[j]:
+                nans += sign
+                continue
+            v = x[j] - center
+            nobs += sign
+            total, total_error = _two_sum(total, total_error, sign * v)
+            r = ranks[j] + 1
+            while r <= n:
+                counts[r] += sign
+                sums[r], errors[r] = _two_sum(sums[r], errors[r], sign * v)
+                r += r & -r
+
+        if nobs < min_periods or nobs == 0: continue
+        for t in range(k):
+            f = qs[t] * (nobs - 1)
+            lo = int(f)
+            low = values[_select(counts, top, lo)]
+            if f == lo:
+                result[i, t] = low
+            else:
+                high = values[_select(counts, top, lo + 1)]
+                result[i, t] = low + (high - low) * (f - lo)
+        if median:
+            mid = nobs // 2
+            if nobs % 2:
+                result[i, k] = values[_select(counts, top, mid)]
+            else:
+                result[i, k] = (values[_select(counts, top, mid)] + values[_select(counts, top, mid - 1)]) / 2
+        if mad and nans == 0:
+            # sum |x - mean| from the count and sum of the values <= mean
+            window = total + total_error
+            mean = window / nobs
+            r = searchsorted(values, mean + center, side="right")
+            below, below_sum = 0, 0.0
+            while r > 0:
+                below += counts[r]
+                below_sum += sums[r] + errors[r]
+                r -= r & -r
+            result[i, k + 1] = (window - 2 * below_sum - mean * (nobs - 2 * below)) / nobs
+    return result
+
+
+def _rolling_mad(x, length, min_periods):
+    """Rolling mean absolute deviation with NumPy, over windows of at most
+    2 ** 20 values at a time."""
+    m = x.shape[0]
+    result = full(m, npNaN)
+    for i in range(min(length - 1, m)):
+        if (~isnan(x[:i + 1])).sum() >= min_periods:
+            w = x[:i + 1]
+            result[i] = abs(w - w.mean()).mean()
+    if m >= length:
+        windows = sliding_window_view(x, length)
+        step = max(2 ** 20 // length, 1)
+        for start in range(0, windows.shape[0], step):
+            w = windows[start:start + step]
+            result[length - 1 + start:length - 1 + start + w.shape[0]] = abs(w - w.mean(axis=1)[:, None]).mean(axis=1)
+        if min_periods < length:
+            # NaN windows are kept when they have min_periods values
+            result[length - 1:][(~isnan(windows)).sum(axis=1) < min_periods] = npNaN
+    return result
+
+
+@shared
+def rolling_order_stats(x: Series, length: int = None, q: tuple = None, min_periods: int = None, median: bool = False, mad: bool = False) -> tuple:
+    """Rolling Order Statistics
+
+    Any number of rolling quantiles, the rolling median and the rolling mean
+    absolute deviation of x in a single pass, like
+    x.rolling(length, min_periods).quantile(q) for each q,
+    x.rolling(length, min_periods).median() and
+    x.rolling(length, min_periods).apply(mad). The window is kept in a
+    Fenwick tree over the ranks of x, so each step is O(log n) regardless of
+    how many statistics are requested. Without numba, the quantiles and the
+    median are left to pandas and the mean absolute deviation to NumPy.
+
+    The tree keeps compensated sums of x less its overall median m, so the
+    mean absolute deviation of a window w is within about
+    eps * (max|w| + length * max|w - m|) of the exact value. That is more
+    precise than the two pass rolling apply for a series that stays near
+    its level, e.g. 1e6 +- 0.01, while a window far from m, as in a series
+    trending over decades of price, may lose up to about 1e-9 relative.
+
+    Returns:
+        tuple: a pd.Series per quantile of q, then the median and the mean
+            absolute deviation if requested.
+    """
+    length = int(length) if length and length > 0 else 30
+    min_periods = max(int(min_periods) if min_periods is not None else length, 1)
+    q = tuple(float(_) for _ in (q if isinstance(q, (list, tuple)) else [q] if q is not None else []))
+
+    values = x.to_numpy(dtype=float64)
+    if not Imports["numba"]:
+        rolling = x.rolling(length, min_periods=min_periods)
+        result = [rolling.quantile(_) for _ in q]
+        result += [rolling.median()] if median else []
+        result += [Series(_rolling_mad(values, length, min_periods), index=x.index)] if mad else []
+        return tuple(result)
+
+    order = argsort(values, kind="stable")
+    ranks = empty(order.shape[0], dtype=int64)
+    ranks[order] = arange(order.shape[0])
+    present = values[order[:(~isnan(values)).sum()]]
+
+    columns = _rolling_order_stats(
+        values, ranks, present, length, min_periods,
+        npArray(q, dtype=float64).reshape(-1), median, mad
+    )
+    picked = list(range(len(q))) + ([len(q)] if median else []) + ([len(q) + 1] if mad else [])
+    return tuple(Series(columns[:, j], index=x.index) for j in picked)
+
+
+@njit(cache=True)
+def _window_moments(x, start, end):
+    """Count, mean and central moment sums of the non NaN values of
+    x[start:end], in two passes."""
+    n, total = 0, 0.0
+    for j in range(start, end):
+        if x[j] == x[j]:
+            n += 1
+            total += x[j]
+    mean = total / n if n > 0 else 0.0
+    m2 = m3 = m4 = 0.0
+    for j in range(start, end):
+        if x[j] == x[j]:
+            d = x[j] - mean
+            m2 += d * d
+            m3 += d * d * d
+            m4 += d * d * d * d
+    return n, mean, m2, m3, m4
+
+
+@njit(cache=True)
+def _rolling_moments(x, length, min_periods, ddof):
+    """Rolling mean, variance, skew and kurtosis over a float64 array from
+    the running central moment sums of the window (Welford), updated as
+    values enter and leave it. The sums are recomputed from the window
+    every length removals and whenever a removal cancels most of the
+    variance, i.e. when a distant price level leaves the window, so rounding
+    can not accumulate. NaNs are skipped and windows of one repeated value
+    have no spread, like pandas' rolling. Compiled when numba is installed."""
+    m = x.shape[0]
+    mean_, variance = full(m, npNaN), full(m, npNaN)
+    skew, kurtosis = full(m, npNaN), full(m, npNaN)
+
+    n, mean, m2, m3, m4 = 0, 0.0, 0.0, 0.0, 0.0
+    same, previous, removed = 0, npNaN, 0
+    for i in range(m):
+        v = x[i]
+        if v == v:
+            # Welford's update of the central moment sums
+            n += 1
+            delta = v - mean
+            dn = delta / n
+            dn2, t = dn * dn, delta * dn * (n - 1)
+            mean += dn
+            m4 += t * dn2 * (n * n - 3 * n + 3) + 6 * dn2 * m2 - 4 * dn * m3
+            m3 += t * dn * (n - 2) - 3 * dn * m2
+            m2 += t
+            same = same + 1 if v == previous else 1
+            previous = v
+
+        j = i - length
+        if j >= 0 and x[j] == x[j]:
+            v, before = x[j], m2
+            if n == 1:
+                n, mean, m2, m3, m4 = 0, 0.0, 0.0, 0.0, 0.0
+            else:
+                # The update above in reverse
+                mean = mean + (mean - v) / (n - 1)
+                delta = v - mean
+                dn = delta / n
+                dn2, t = dn * dn, delta * dn * (n - 1)
+                m2 -= t
+                m3 -= t * dn * (n - 2) - 3 * dn * m2
+                m4 -= t * dn2 * (n * n - 3 * n + 3) + 6 * dn2 * m2 - 4 * dn * m3
+                n -= 1
+            removed += 1
+            if removed >= length or m2 < 1e-4 * before:
+                n, mean, m2, m3, m4 = _window_moments(x, j + 1, i + 1)
+                removed = 0
+
+        if n < min_periods or n == 0: continue
+        mean_[i] = mean
+        constant = same >= n
+        if n > ddof:
+            variance[i] = 0.0 if n == 1 or constant else max(m2 / (n - ddof), 0.0)
+        b = m2 / n
+        if n >= 3:
+            if constant:
+                skew[i] = 0.0
+            elif b > 1e-14:
+                skew[i] = sqrt(n * (n - 1.0)) * (m3 / n) / ((n - 2) * b * sqrt(b))
+        if n >= 4:
+            if constant:
+                kurtosis[i] = -3.0
+            elif b > 1e-14:
+                k = (n * n - 1.0) * (m4 / n) / (b * b) - 3.0 * (n - 1.0) ** 2
+                kurtosis[i] = k / ((n - 2.0) * (n - 3.0))
+    return mean_, variance, skew, kurtosis
+
+
+@shared
+def rolling_moments(x: Series, length: int = None, min_periods: int = None, ddof: int = 1) -> tuple:
+    """Rolling Moments
+
+    The rolling mean, variance, skew and kurtosis of x from a single pass,
+    like x.rolling(length, min_periods).mean(), .var(ddof), .skew() and
+    .kurt(). The central moment sums are updated as values enter and leave
+    the window and recomputed from it when a removal would cancel them, so
+    a window after a jump in price level, i.e. 11 to 1e9, keeps its
+    precision where the running sums of pandas do not. Without numba, the
+    moments are left to pandas.
+
+    Returns:
+        tuple: mean, variance, skew and kurtosis as pd.Series.
+    """
+    length = int(length) if length and length > 0 else 30
+    min_periods = max(int(min_periods) if min_periods is not None else length, 1)
+    ddof = int(ddof) if ddof is not None else 1
+
+    if not Imports["numba"]:
+        rolling = x.rolling(length, min_periods=min_periods)
+        return rolling.mean(), rolling.var(ddof), rolling.skew(), rolling.kurt()
+
+    result = _rolling_moments(x.to_numpy(dtype=float64), length, min_periods, ddof)
+    return tuple(Series(_, index=x.index) for _ in result)
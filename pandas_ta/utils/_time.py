@@ -2,8 +2,15 @@
 from datetime import datetime
 from time import localtime, perf_counter
 from typing import Tuple
+from warnings import catch_warnings, simplefilter
 
-from cudf import DataFrame
+from numpy import cumsum, empty, empty_like, flatnonzero, float64, isnan
+from numpy import nan as npNaN
+from numpy import ndarray, where
+
+from pandas_ta import Imports
+from pandas_ta.backend import DataFrame
+from ._numba import njit
 # Note: cudf uses datetime64 for timestamps, Timestamp is from pandas
 try:
     from pandas import Timestamp  # For compatibility with existing code
@@ -13,6 +20,26 @@ except:
 from pandas_ta import EXCHANGE_TZ, RATE
 
 
+@njit(cache=True)
+def _session_cumsum(x, ids):
+    """Cumulative sums of the columns of x restarting with every session,
+    over float64 arrays, skipping NaNs like groupby(ids).cumsum(). Compiled
+    when numba is installed."""
+    m, k = x.shape
+    result = empty_like(x)
+    totals = empty(k, dtype=float64)
+    for i in range(m):
+        if i == 0 or ids[i] != ids[i - 1]:
+            totals[:] = 0.0
+        for j in range(k):
+            if x[i, j] == x[i, j]:
+                totals[j] += x[i, j]
+                result[i, j] = totals[j]
+            else:
+                result[i, j] = npNaN
+    return result
+
+
 def df_dates(df: DataFrame, dates: Tuple[str, list] = None) -> DataFrame:
     """Yields the DataFrame with the given dates"""
     if dates is None: return None
@@ -101,6 +128,39 @@ def total_time(df: DataFrame, tf: str = "years") -> float:
     return TimeFrame["years"]
 
 
+def session_cumsum(x: ndarray, ids: ndarray) -> ndarray:
+    """Cumulative sums of an array, or of the columns of a 2D array, that
+    restart with every session of session_ids(). NaNs are skipped like
+    groupby(ids).cumsum()."""
+    x = x.astype(float64)
+    columns = x if x.ndim == 2 else x.reshape(-1, 1)
+    if Imports["numba"]:
+        result = _session_cumsum(columns, ids)
+    else:
+        # One cumulative sum less the total before each session
+        nans = isnan(columns)
+        totals = cumsum(where(nans, 0.0, columns), axis=0)
+        starts = flatnonzero(ids[1:] != ids[:-1]) + 1
+        before = empty((starts.size + 1, columns.shape[1]), dtype=float64)
+        before[0], before[1:] = 0.0, totals[starts - 1]
+        result = totals - before[_segments(ids)]
+        result[nans] = npNaN
+    return result if x.ndim == 2 else result[:, 0]
+
+
+def session_ids(index, anchor: str = "D") -> ndarray:
+    """The session of every row of a DatetimeIndex, numbered from 0 and
+    incremented wherever the period of the anchor (a Timeseries Offset
+    Alias like "D", "W" or "M") changes, in local time. Sessions are the
+    contiguous runs of a period, so the index is expected in datetime order.
+    df.ta.sessions(anchor) keeps them with the DataFrame."""
+    with catch_warnings():
+        # The timezone is dropped for the local period of each row
+        simplefilter("ignore", UserWarning)
+        periods = index.to_period(anchor).asi8
+    return _segments(periods)
+
+
 def to_utc(df: DataFrame) -> DataFrame:
     """Either localizes the DataFrame Index to UTC or it applies
     tz_convert to set the Index to UTC.
@@ -113,6 +173,16 @@ def to_utc(df: DataFrame) -> DataFrame:
     return df
 
 
+# PRIVATE
+def _segments(keys: ndarray) -> ndarray:
+    """Numbers the runs of equal keys from 0."""
+    ids = empty(keys.shape[0], dtype=int)
+    if ids.shape[0] > 0:
+        ids[0] = 0
+        cumsum(keys[1:] != keys[:-1], out=ids[1:])
+    return ids
+
+
 # Aliases
 mtd = df_month_to_date
 qtd = df_quarter_to_date
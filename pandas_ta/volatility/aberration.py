@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 # from numpy import sqrt as npsqrt
-from pandas import DataFrame
+from pandas_ta.backend import DataFrame
 from .atr import atr
 from pandas_ta.overlap import hlc3, sma
 from pandas_ta.utils import get_offset, verify_series
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas import DataFrame
+from pandas_ta.backend import DataFrame
 from pandas_ta.overlap import ma
 from pandas_ta.utils import get_drift, get_offset, non_zero_range, verify_series
 
@@ -2,9 +2,10 @@
 from .true_range import true_range
 from pandas_ta import Imports
 from pandas_ta.overlap import ma
-from pandas_ta.utils import get_drift, get_offset, verify_series
+from pandas_ta.utils import get_drift, get_offset, shared, verify_series
 
 
+@shared(length=14, mamode="rma", talib=True, drift=1, offset=0)
 def atr(high, low, close, length=None, mamode=None, talib=None, drift=None, offset=None, **kwargs):
     """Indicator: Average True Range (ATR)"""
     # Validate arguments
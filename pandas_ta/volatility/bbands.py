@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
-from cudf import DataFrame
+from numpy import sqrt as npsqrt
+from pandas_ta.backend import DataFrame
 from pandas_ta import Imports
 from pandas_ta.overlap import ma
-from pandas_ta.statistics import stdev
-from pandas_ta.utils import get_offset, non_zero_range, tal_ma, verify_series
+from pandas_ta.utils import get_offset, non_zero_range, rolling_moments, tal_ma, verify_series
 
 
 def bbands(close, length=None, std=None, ddof=0, mamode=None, talib=None, offset=None, **kwargs):
@@ -24,11 +24,11 @@ def bbands(close, length=None, std=None, ddof=0, mamode=None, talib=None, offset
         from talib import BBANDS
         upper, mid, lower = BBANDS(close, length, std, std, tal_ma(mamode))
     else:
-        standard_deviation = stdev(close=close, length=length, ddof=ddof)
-        deviations = std * standard_deviation
-        # deviations = std * standard_deviation.loc[standard_deviation.first_valid_index():,]
+        # The mean and the standard deviation from a single pass
+        mean, variance = rolling_moments(close, length, ddof=ddof)[:2]
+        deviations = std * npsqrt(variance)
 
-        mid = ma(mamode, close, length=length, **kwargs)
+        mid = mean if mamode == "sma" else ma(mamode, close, length=length, **kwargs)
         lower = mid - deviations
         upper = mid + deviations
 
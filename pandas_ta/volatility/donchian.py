@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
-from pandas import DataFrame
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.backend import DataFrame
+from pandas_ta.utils import get_offset, rolling_extremes, verify_series
 
 
 def donchian(high, low, lower_length=None, upper_length=None, offset=None, **kwargs):
@@ -18,8 +18,11 @@ def donchian(high, low, lower_length=None, upper_length=None, offset=None, **kwa
     if high is None or low is None: return
 
     # Calculate Result
-    lower = low.rolling(lower_length, min_periods=lower_min_periods).min()
-    upper = high.rolling(upper_length, min_periods=upper_min_periods).max()
+    if lower_length == upper_length and lower_min_periods == upper_min_periods:
+        upper, lower = rolling_extremes(high, low, lower_length, lower_min_periods)
+    else:
+        _, lower = rolling_extremes(low, low, lower_length, lower_min_periods)
+        upper, _ = rolling_extremes(high, high, upper_length, upper_min_periods)
     mid = 0.5 * (lower + upper)
 
     # Handle fills
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from numpy import sqrt as npSqrt
-from pandas import DataFrame, Series
+from pandas_ta.backend import DataFrame, Series
 from pandas_ta.utils import get_offset, verify_series
 
 
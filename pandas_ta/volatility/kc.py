@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas import DataFrame
+from pandas_ta.backend import DataFrame
 from .true_range import true_range
 from pandas_ta.overlap import ma
 from pandas_ta.utils import get_offset, high_low_range, verify_series
@@ -1,10 +1,11 @@
 # -*- coding: utf-8 -*-
 from numpy import nan as npNaN
-from pandas import concat
+from pandas_ta.backend import concat
 from pandas_ta import Imports
-from pandas_ta.utils import get_drift, get_offset, non_zero_range, verify_series
+from pandas_ta.utils import get_drift, get_offset, non_zero_range, shared, verify_series
 
 
+@shared(talib=True, drift=1, offset=0)
 def true_range(high, low, close, talib=None, drift=None, offset=None, **kwargs):
     """Indicator: True Range"""
     # Validate arguments
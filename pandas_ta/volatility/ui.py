@@ -23,9 +23,9 @@ def ui(close, length=None, scalar=None, offset=None, **kwargs):
     everget = kwargs.pop("everget", False)
     if everget:
         # Everget uses SMA instead of SUM for calculation
-        ui = (sma(d2, length) / length).apply(npsqrt)
+        ui = npsqrt(sma(d2, length) / length)
     else:
-        ui = (d2.rolling(length).sum() / length).apply(npsqrt)
+        ui = npsqrt(d2.rolling(length).sum() / length)
 
     # Offset
     if offset != 0:
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas import DataFrame
+from pandas_ta.backend import DataFrame
 from .obv import obv
 from pandas_ta.overlap import ma
 from pandas_ta.trend import long_run, short_run
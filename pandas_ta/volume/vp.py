@@ -1,8 +1,111 @@
 # -*- coding: utf-8 -*-
-from numpy import array_split
-from numpy import mean
-from pandas import cut, concat, DataFrame
-from pandas_ta.utils import signed_series, verify_series
+from numpy import abs as npAbs
+from numpy import arange, argsort, bincount, empty, errstate, float64, floor
+from numpy import full, inf, isnan, linspace, log10, maximum, minimum, modf
+from numpy import nan as npNaN
+from numpy import rint, unique, where, zeros
+from pandas_ta.backend import DataFrame
+from pandas_ta.utils import verify_series
+
+
+def _ranks(groups, n_groups):
+    """The position of every row within its group, in order of appearance."""
+    order = argsort(groups, kind="stable")
+    starts = bincount(groups, minlength=n_groups).cumsum()
+    starts[1:], starts[0] = starts[:-1], 0
+    ranks = empty(groups.shape[0], dtype=groups.dtype)
+    ranks[order] = arange(groups.shape[0]) - starts[groups[order]]
+    return ranks
+
+
+def _chunks(groups, n_groups, width):
+    """The chronological range of every row, split like np.array_split of
+    each group into width ranges: the first size % width ranges are one row
+    longer."""
+    sizes = bincount(groups, minlength=n_groups)[groups]
+    rank = _ranks(groups, n_groups)
+    q, r = sizes // width, sizes % width
+    head = r * (q + 1)
+    with errstate(divide="ignore", invalid="ignore"):
+        tail = r + (rank - head) // maximum(q, 1)
+    return where(rank < head, rank // (q + 1), tail)
+
+
+def _round_frac(x, precision):
+    """Rounds like the interval labels of pd.cut: to precision decimals, or
+    to precision significant digits of fractions."""
+    frac, whole = modf(x)
+    with errstate(divide="ignore", invalid="ignore"):
+        digits = where(whole == 0, -floor(log10(npAbs(frac))) - 1 + precision, precision)
+    scale = 10.0 ** where((x == 0) | isnan(x), 0, digits)
+    return where(x == 0, x, rint(x * scale) / scale)
+
+
+def _price_bins(price, groups, n_groups, width, precision=2):
+    """Equal width price ranges of every group, right closed and including
+    the lowest price like pd.cut(price, width, include_lowest=True). Returns
+    the range of every row (-1 if NaN) and the left and right labels of the
+    ranges of every group."""
+    valid = ~isnan(price)
+    lowest, highest = full(n_groups, inf), full(n_groups, -inf)
+    minimum.at(lowest, groups[valid], price[valid])
+    maximum.at(highest, groups[valid], price[valid])
+
+    flat = lowest == highest
+    pad = where(lowest != 0, 0.001 * npAbs(lowest), 0.001)
+    lowest, highest = where(flat, lowest - pad, lowest), where(flat, highest + pad, highest)
+    edges = linspace(lowest, highest, width + 1, axis=1)
+    edges[:, 0] -= where(flat, 0, (highest - lowest) * 0.001)
+
+    # Estimate each range from the step, then settle it against the edges
+    g = where(valid, groups, 0)
+    step = (edges[:, -1] - edges[:, 0]) / width
+    with errstate(invalid="ignore"):
+        bins = floor((price - edges[g, 0]) / step[g])
+    bins = minimum(maximum(where(valid, bins, 0), 0), width - 1).astype(int)
+    for _ in range(width):
+        lower = (bins > 0) & (price <= edges[g, bins])
+        higher = (bins < width - 1) & (price > edges[g, bins + 1])
+        if not (lower.any() or higher.any()): break
+        bins += higher.astype(int) - lower
+    bins[~valid] = -1
+
+    # Labels at the least precision that keeps the edges distinct
+    labels, pending = empty(edges.shape), full(n_groups, True)
+    for p in range(precision, 20):
+        rounded = _round_frac(edges[pending], p)
+        distinct = (rounded[:, 1:] > rounded[:, :-1]).all(axis=1)
+        rounded[:, 0] -= 10.0 ** -p
+        labels[pending] = rounded
+        pending[pending] = ~distinct
+        if not pending.any(): break
+    return bins, labels[:, :-1], labels[:, 1:]
+
+
+def _value_area(total, value_area):
+    """The range of highest volume (point of control) and the adjacent ranges
+    holding value_area of the volume of each profile, grown from the point of
+    control towards the greater volume of the next range below or above."""
+    n_groups, width = total.shape
+    rows = arange(n_groups)
+    poc = total.argmax(axis=1)
+    target = value_area * total.sum(axis=1)
+
+    lo, hi = poc.copy(), poc.copy()
+    volume = total[rows, poc]
+    for _ in range(width - 1):
+        grow = volume < target
+        if not grow.any(): break
+        below = where(lo > 0, total[rows, maximum(lo - 1, 0)], -1)
+        above = where(hi < width - 1, total[rows, minimum(hi + 1, width - 1)], -1)
+        up, down = grow & (above >= below), grow & (above < below)
+        hi, lo = hi + up, lo - down
+        volume = volume + where(up, above, 0) + where(down, below, 0)
+
+    ranges = arange(width)
+    poc = ranges == poc[:, None]
+    area = (ranges >= lo[:, None]) & (ranges <= hi[:, None])
+    return poc, area
 
 
 def vp(close, volume, width=None, **kwargs):
@@ -11,54 +114,107 @@ def vp(close, volume, width=None, **kwargs):
     width = int(width) if width and width > 0 else 10
     close = verify_series(close, width)
     volume = verify_series(volume, width)
-    sort_close = kwargs.pop("sort_close", False)
+    value_area = kwargs.pop("value_area", None)
+    value_area = float(value_area) if value_area and 0 < value_area <= 1 else None
+    sort_close = kwargs.pop("sort_close", False) or value_area is not None
+    anchor = kwargs.pop("anchor", None)
+    by = kwargs.pop("by", None)
 
     if close is None or volume is None: return
 
     # Setup
-    signed_price = signed_series(close, 1)
-    pos_volume = volume * signed_price[signed_price > 0]
-    pos_volume.name = volume.name
-    neg_volume = -volume * signed_price[signed_price < 0]
-    neg_volume.name = volume.name
-    vp = concat([close, pos_volume, neg_volume], axis=1)
-
-    close_col = f"{vp.columns[0]}"
+    close_col = f"{close.name}"
     high_price_col = f"high_{close_col}"
     low_price_col = f"low_{close_col}"
     mean_price_col = f"mean_{close_col}"
 
-    volume_col = f"{vp.columns[1]}"
+    volume_col = f"{volume.name}"
     pos_volume_col = f"pos_{volume_col}"
     neg_volume_col = f"neg_{volume_col}"
     total_volume_col = f"total_{volume_col}"
-    vp.columns = [close_col, pos_volume_col, neg_volume_col]
+
+    price = close.to_numpy(dtype=float64)
+    volume_ = volume.to_numpy(dtype=float64)
+    m = price.shape[0]
+
+    # Profiles: one per symbol of 'by' and per session of 'anchor'
+    keys, codes = {}, zeros(m, dtype=int)
+    symbols, n_symbols = zeros(m, dtype=int), 1
+    if by is not None:
+        by_name = f"{getattr(by, 'name', None) or 'by'}"
+        by = by.to_numpy() if hasattr(by, "to_numpy") else by
+        keys[by_name], symbols = unique(by, return_inverse=True)
+        codes, n_symbols = symbols, len(keys[by_name])
+    if isinstance(anchor, int) and anchor > 0:
+        sessions = _ranks(symbols, n_symbols) // anchor
+        keys["session"] = arange(sessions.max() + 1)
+    elif isinstance(anchor, str):
+        keys["session"], sessions = unique(close.index.to_period(anchor), return_inverse=True)
+    else:
+        anchor = None
+    if anchor is not None:
+        codes = codes * len(keys["session"]) + sessions
+    profiles, groups = unique(codes, return_inverse=True)
+    n_groups = profiles.shape[0]
+
+    # Signed volume: volume of rising (or first) closes and of falling closes
+    # of each symbol, like signed_series(close, 1)
+    order = argsort(symbols, kind="stable")
+    prev, cur = order[:-1], order[1:]
+    same = symbols[cur] == symbols[prev]
+    change = full(m, npNaN)
+    change[cur[same]] = price[cur[same]] - price[prev[same]]
+    has_volume = ~isnan(volume_)
+    pos_mask = has_volume & ~(change <= 0)
+    neg_mask = has_volume & (change < 0)
 
     # sort_close: Sort by close before splitting into ranges. Default: False
     # If False, it sorts by date index or chronological versus by price
-
     if sort_close:
-        vp[mean_price_col] = vp[close_col]
-        vpdf = vp.groupby(cut(vp[close_col], width, include_lowest=True, precision=2)).agg({
-            mean_price_col: mean,
-            pos_volume_col: sum,
-            neg_volume_col: sum,
-        })
-        vpdf[low_price_col] = [x.left for x in vpdf.index]
-        vpdf[high_price_col] = [x.right for x in vpdf.index]
-        vpdf = vpdf.reset_index(drop=True)
-        vpdf = vpdf[[low_price_col, mean_price_col, high_price_col, pos_volume_col, neg_volume_col]]
+        bins, low_price, high_price = _price_bins(price, groups, n_groups, width)
+        low_price, high_price = low_price.ravel(), high_price.ravel()
     else:
-        vp_ranges = array_split(vp, width)
-        result = ({
-            low_price_col: r[close_col].min(),
-            mean_price_col: r[close_col].mean(),
-            high_price_col: r[close_col].max(),
-            pos_volume_col: r[pos_volume_col].sum(),
-            neg_volume_col: r[neg_volume_col].sum(),
-        } for r in vp_ranges)
-        vpdf = DataFrame(result)
-    vpdf[total_volume_col] = vpdf[pos_volume_col] + vpdf[neg_volume_col]
+        bins = _chunks(groups, n_groups, width)
+    ids = groups * width + bins
+    size = n_groups * width
+
+    has_price = bins >= 0
+    counted = has_price & ~isnan(price)
+    count = bincount(ids[counted], minlength=size)
+    with errstate(divide="ignore", invalid="ignore"):
+        mean_price = bincount(ids[counted], weights=price[counted], minlength=size) / count
+    if not sort_close:
+        low_price, high_price = full(size, inf), full(size, -inf)
+        minimum.at(low_price, ids[counted], price[counted])
+        maximum.at(high_price, ids[counted], price[counted])
+        low_price[count == 0], high_price[count == 0] = npNaN, npNaN
+
+    pos_mask, neg_mask = pos_mask & has_price, neg_mask & has_price
+    pos_volume = bincount(ids[pos_mask], weights=volume_[pos_mask], minlength=size)
+    neg_volume = bincount(ids[neg_mask], weights=volume_[neg_mask], minlength=size)
+
+    vpdf = {}
+    if len(keys):
+        # The symbol and session of each profile from its code
+        n_sessions = len(keys.get("session", [0]))
+        if by is not None:
+            vpdf[by_name] = keys[by_name][profiles // n_sessions].repeat(width)
+        if anchor is not None:
+            vpdf["session"] = keys["session"][profiles % n_sessions].repeat(width)
+        vpdf["bin"] = arange(size) % width
+    vpdf[low_price_col] = low_price
+    vpdf[mean_price_col] = mean_price
+    vpdf[high_price_col] = high_price
+    vpdf[pos_volume_col] = pos_volume
+    vpdf[neg_volume_col] = neg_volume
+    vpdf[total_volume_col] = pos_volume + neg_volume
+    if value_area is not None:
+        poc, area = _value_area(vpdf[total_volume_col].reshape(n_groups, width), value_area)
+        vpdf[f"poc_{close_col}"] = poc.ravel()
+        vpdf[f"va_{close_col}"] = area.ravel()
+    vpdf = DataFrame(vpdf)
+    if len(keys):
+        vpdf = vpdf.set_index([*keys.keys(), "bin"])
 
     # Handle fills
     if "fillna" in kwargs:
@@ -76,8 +232,13 @@ def vp(close, volume, width=None, **kwargs):
 vp.__doc__ = \
 """Volume Profile (VP)
 
-Calculates the Volume Profile by slicing price into ranges.
-Note: Value Area is not calculated.
+Calculates the Volume Profile by slicing price into ranges. Every row is
+assigned its range in one vectorized pass (a bin search against the range
+edges, or the np.array_split positions) and the ranges are summed with
+np.bincount, so many profiles cost about as much as one: per session or
+every n bars with 'anchor', and per symbol of a long DataFrame with 'by'.
+With 'value_area', the Point of Control and the Value Area of each profile
+are flagged.
 
 Sources:
     https://stockcharts.com/school/doku.php?id=chart_school:technical_indicators:volume_by_price
@@ -89,16 +250,22 @@ Calculation:
     Default Inputs:
         width=10
 
-    vp = pd.concat([close, pos_volume, neg_volume], axis=1)
+    pos_volume = volume where close rises (or is the first), else 0
+    neg_volume = volume where close falls, else 0
     if sort_close:
-        vp_ranges = cut(vp[close_col], width)
+        vp_ranges = pd.cut(close, width, include_lowest=True)
         result = ({range_left, mean_close, range_right, pos_volume, neg_volume} foreach range in vp_ranges
     else:
-        vp_ranges = np.array_split(vp, width)
+        vp_ranges = np.array_split(close, width)
         result = ({low_close, mean_close, high_close, pos_volume, neg_volume} foreach range in vp_ranges
     vpdf = pd.DataFrame(result)
     vpdf['total_volume'] = vpdf['pos_volume'] + vpdf['neg_volume']
 
+    if value_area:
+        POC = argmax(total_volume)
+        VA = POC, then the next range below or above with the greater
+            total_volume until VA holds value_area * sum(total_volume)
+
 Args:
     close (pd.Series): Series of 'close's
     volume (pd.Series): Series of 'volume's
@@ -109,7 +276,17 @@ Kwargs:
     fill_method (value, optional): Type of fill method
     sort_close (value, optional): Whether to sort by close before splitting
         into ranges. Default: False
+    value_area (float, optional): The share of volume of the Value Area,
+        i.e. 0.7. Adds the boolean columns 'poc_close' and 'va_close' and
+        implies sort_close. Default: None
+    anchor (str | int, optional): A profile per period of the DatetimeIndex,
+        i.e. "D" for sessions or "W" for weeks, or per every 'anchor' bars.
+        Default: None
+    by (pd.Series, optional): The symbol of each row of a long DataFrame of
+        many symbols, a profile per symbol. Default: None
 
 Returns:
-    pd.DataFrame: New feature generated.
+    pd.DataFrame: low, mean and high close, pos, neg and total volume of
+        each range. With 'by' or 'anchor', indexed by the symbol, the
+        session and the range of each profile.
 """
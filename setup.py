@@ -13,6 +13,7 @@ setup(
         "pandas_ta.overlap",
         "pandas_ta.performance",
         "pandas_ta.statistics",
+        "pandas_ta.stream",
         "pandas_ta.trend",
         "pandas_ta.utils",
         "pandas_ta.utils.data",
@@ -56,7 +57,7 @@ setup(
     # $ pip install -e .[dev,test]
     extras_require={
         "dev": [
-            "alphaVantage-api", "matplotlib", "mplfinance", "scipy",
+            "alphaVantage-api", "matplotlib", "mplfinance", "numba", "scipy",
             "sklearn", "statsmodels", "stochastic",
             "talib", "tqdm", "vectorbt", "yfinance",
         ],
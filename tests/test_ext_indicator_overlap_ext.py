@@ -167,6 +167,11 @@ class TestOverlapExtension(TestCase):
         self.assertIsInstance(self.data, DataFrame)
         self.assertEqual(self.data.columns[-1], "VWAP_D")
 
+        # Sessions are computed once per DataFrame and index
+        self.assertIs(self.data.ta.sessions("w"), self.data.ta.sessions("W"))
+        self.data.ta.vwap(anchor=["D", "W"], bands=1, append=True)
+        self.assertEqual(self.data.columns[-1], "VWAPU_W_1.0")
+
     def test_vwma_ext(self):
         self.data.ta.vwma(append=True)
         self.assertIsInstance(self.data, DataFrame)
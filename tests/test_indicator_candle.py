@@ -50,6 +50,19 @@ class TestCandle(TestCase):
         result = pandas_ta.cdl_pattern(self.open, self.high, self.low, self.close, name=["doji", "inside"])
         self.assertIsInstance(result, DataFrame)
 
+    def test_cdl_pattern_native(self):
+        names = [n for n in pandas_ta.CDL_PATTERN_NAMES if n not in ["doji", "inside"]]
+        result = pandas_ta.cdl_pattern(self.open, self.high, self.low, self.close, name=names, talib=False)
+        self.assertIsInstance(result, DataFrame)
+        self.assertEqual(len(result.columns), len(names))
+
+        expected = pandas_ta.cdl_pattern(self.open, self.high, self.low, self.close, name=names)
+        pdt.assert_frame_equal(result, expected)
+
+        result = pandas_ta.cdl_pattern(self.open, self.high, self.low, self.close, name="morningstar", penetration=0.5, talib=False)
+        expected = tal.CDLMORNINGSTAR(self.open, self.high, self.low, self.close, penetration=0.5)
+        pdt.assert_series_equal(result["CDL_MORNINGSTAR"], expected.astype(float), check_names=False)
+
     def test_cdl_doji(self):
         result = pandas_ta.cdl_doji(self.open, self.high, self.low, self.close)
         self.assertIsInstance(result, Series)
@@ -1,7 +1,7 @@
 from .config import error_analysis, sample_data, CORRELATION, CORRELATION_THRESHOLD, VERBOSE
 from .context import pandas_ta
 
-from unittest import TestCase, skip
+from unittest import TestCase
 import pandas.testing as pdt
 from pandas import DataFrame, Series
 
@@ -484,12 +484,11 @@ class TestMomentum(TestCase):
             except Exception as ex:
                 error_analysis(result.iloc[:, 0], CORRELATION, ex, newline=False)
 
-    @skip
     def test_td_seq(self):
-        """TS Sequential: Working but SLOW implementation"""
         result = pandas_ta.td_seq(self.close)
         self.assertIsInstance(result, DataFrame)
         self.assertEqual(result.name, "TD_SEQ")
+        pdt.assert_index_equal(result.index, self.close.index)
 
     def test_trix(self):
         result = pandas_ta.trix(self.close)
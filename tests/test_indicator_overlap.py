@@ -1,7 +1,10 @@
 from .config import CORRELATION, CORRELATION_THRESHOLD, error_analysis, sample_data, VERBOSE
 from .context import pandas_ta
 
+from importlib import import_module
 from unittest import TestCase
+from unittest.mock import patch
+import numpy.testing as npt
 import pandas.testing as pdt
 from pandas import DataFrame, Series
 
@@ -139,6 +142,31 @@ class TestOverlap(TestCase):
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "KAMA_10_2_30")
 
+    def test_kernels(self):
+        # numba compiled kernels and their plain Python fallbacks agree
+        calls = {
+            "hilo": (["_hilo"], lambda: pandas_ta.hilo(self.high, self.low, self.close)),
+            "hwma": (["_hwma"], lambda: pandas_ta.hwma(self.close)),
+            "jma": (["_jma"], lambda: pandas_ta.jma(self.close)),
+            "kama": (["_kama"], lambda: pandas_ta.kama(self.close)),
+            "linreg": (["_linreg"], lambda: pandas_ta.linreg(self.close, detailed=True)),
+            "mcgd": (["_mcgd"], lambda: pandas_ta.mcgd(self.close, c=0.6)),
+            "ssf": (["_ssf2", "_ssf3"], lambda: pandas_ta.ssf(self.close, poles=3).to_frame().join(pandas_ta.ssf(self.close))),
+            "supertrend": (["_supertrend"], lambda: pandas_ta.supertrend(self.high, self.low, self.close)),
+            "vidya": (["_vidya"], lambda: pandas_ta.vidya(self.close)),
+        }
+        for name, (kernels, call) in calls.items():
+            module = import_module(f"pandas_ta.overlap.{name}")
+            fallbacks = {k: getattr(module, k) for k in kernels}
+            fallbacks = {k: getattr(v, "py_func", v) for k, v in fallbacks.items()}
+            result = call()
+            with patch.multiple(module, **fallbacks):
+                expected = call()
+            if isinstance(result, DataFrame):
+                pdt.assert_frame_equal(result, expected)
+            else:
+                pdt.assert_series_equal(result, expected)
+
     def test_jma(self):
         result = pandas_ta.jma(self.close)
         self.assertIsInstance(result, Series)
@@ -208,6 +236,17 @@ class TestOverlap(TestCase):
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "LRb_14")
 
+    def test_linreg_detailed(self):
+        result = pandas_ta.linreg(self.close, detailed=True)
+        self.assertIsInstance(result, DataFrame)
+        self.assertEqual(result.name, "LR_14")
+        self.assertEqual(list(result.columns), ["LR_14", "LRm_14", "LRb_14", "LRa_14", "LRr_14", "LRt_14"])
+
+        for kwargs in [{}, {"slope": True}, {"intercept": True}, {"angle": True}, {"r": True}]:
+            expected = pandas_ta.linreg(self.close, **kwargs)
+            pdt.assert_series_equal(result[expected.name], expected, check_names=False)
+        pdt.assert_series_equal(result["LRt_14"], pandas_ta.linreg(self.close, tsf=True), check_names=False)
+
     def test_linreg_r(self):
         result = pandas_ta.linreg(self.close, r=True)
         self.assertIsInstance(result, Series)
@@ -250,6 +289,13 @@ class TestOverlap(TestCase):
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "MCGD_10")
 
+        # Each value follows from the previous McGinley value
+        close = self.close.to_numpy()
+        expected = [close[0]]
+        for x in close[1:]:
+            expected.append(expected[-1] + (x - expected[-1]) / (10 * (x / expected[-1]) ** 4))
+        npt.assert_allclose(result, expected, rtol=1e-12)
+
     def test_midpoint(self):
         result = pandas_ta.midpoint(self.close, talib=False)
         self.assertIsInstance(result, Series)
@@ -413,6 +459,21 @@ class TestOverlap(TestCase):
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "VWAP_D")
 
+        result = pandas_ta.vwap(self.high, self.low, self.close, self.volume, anchor=["D", "W", "M"], bands=[1, 2])
+        self.assertIsInstance(result, DataFrame)
+        self.assertEqual(result.name, "VWAP_D_W_M")
+        self.assertEqual(list(result.columns[:5]), ["VWAP_D", "VWAPL_D_1.0", "VWAPU_D_1.0", "VWAPL_D_2.0", "VWAPU_D_2.0"])
+
+        typical_price = pandas_ta.hlc3(self.high, self.low, self.close)
+        months = self.volume.index.to_period("M")
+        volume = self.volume.groupby(months).cumsum()
+        expected = (typical_price * self.volume).groupby(months).cumsum() / volume
+        pdt.assert_series_equal(result["VWAP_M"], expected, check_names=False)
+        pdt.assert_series_equal(result["VWAP_W"], pandas_ta.vwap(self.high, self.low, self.close, self.volume, anchor="W"), check_names=False)
+
+        variance = (typical_price ** 2 * self.volume).groupby(months).cumsum() / volume - expected ** 2
+        pdt.assert_series_equal(result["VWAPU_M_2.0"], expected + 2 * variance.clip(lower=0) ** 0.5, check_names=False, rtol=1e-6)
+
     def test_vwma(self):
         result = pandas_ta.vwma(self.close, self.volume)
         self.assertIsInstance(result, Series)
@@ -59,6 +59,12 @@ class TestStatistics(TestCase):
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "QTL_30_0.5")
 
+        result = pandas_ta.quantile(self.close, q=[0.05, 0.25, 0.5, 0.75, 0.95])
+        self.assertIsInstance(result, DataFrame)
+        self.assertEqual(result.name, "QTL_30")
+        self.assertEqual(list(result.columns), ["QTL_30_0.05", "QTL_30_0.25", "QTL_30_0.5", "QTL_30_0.75", "QTL_30_0.95"])
+        pdt.assert_series_equal(result["QTL_30_0.25"], self.close.rolling(30).quantile(0.25), check_names=False)
+
     def test_skew(self):
         result = pandas_ta.skew(self.close)
         self.assertIsInstance(result, Series)
@@ -175,6 +175,27 @@ class TestTrend(TestCase):
             except Exception as ex:
                 error_analysis(psar, CORRELATION, ex)
 
+    def test_psar_short(self):
+        for rows in [1, 2]:
+            result = pandas_ta.psar(self.high.iloc[:rows], self.low.iloc[:rows], self.close.iloc[:rows])
+            self.assertIsInstance(result, DataFrame)
+            self.assertEqual(result.shape, (rows, 4))
+            self.assertEqual(result.iloc[0, 2], 0.02)
+
+    def test_psar_grid(self):
+        result = pandas_ta.psar_grid(self.high, self.low, af0=[0.01, 0.02], af=0.02, max_af=[0.2, 0.3])
+        self.assertIsInstance(result, DataFrame)
+        self.assertEqual(result.name, "PSARgrid_4")
+        self.assertEqual(result.shape[1], 16)
+
+        for af0, max_af in [(0.01, 0.2), (0.02, 0.2), (0.01, 0.3), (0.02, 0.3)]:
+            expected = pandas_ta.psar(self.high, self.low, af0=af0, af=0.02, max_af=max_af)
+            columns = [f"PSARl_{af0}_{max_af}", f"PSARs_{af0}_{max_af}", f"PSARaf_{af0}_{max_af}", f"PSARr_{af0}_{max_af}"]
+            if af0 != 0.02:
+                columns = [c.replace(f"_{af0}_", f"_{af0}_0.02_") for c in columns]
+            expected.columns = columns
+            pdt.assert_frame_equal(result[columns], expected)
+
     def test_qstick(self):
         result = pandas_ta.qstick(self.open, self.close)
         self.assertIsInstance(result, Series)
@@ -3,7 +3,7 @@ from .context import pandas_ta
 
 from unittest import TestCase, skip
 import pandas.testing as pdt
-from pandas import DataFrame, Series
+from pandas import cut, DataFrame, Series
 
 import talib as tal
 
@@ -174,3 +174,37 @@ class TestVolume(TestCase):
         result = pandas_ta.vp(self.close, self.volume_)
         self.assertIsInstance(result, DataFrame)
         self.assertEqual(result.name, "VP_10")
+
+        result = pandas_ta.vp(self.close, self.volume_, sort_close=True)
+        ranges = cut(self.close, 10, include_lowest=True, precision=2)
+        # Unchanged closes are neither pos nor neg volume
+        changed = self.close.diff() != 0
+        expected = self.volume_[changed].groupby(ranges[changed]).sum()
+        self.assertEqual(list(result["low_close"]), [x.left for x in expected.index])
+        self.assertEqual(list(result["high_close"]), [x.right for x in expected.index])
+        pdt.assert_series_equal(result["total_volume"], expected.reset_index(drop=True), check_names=False)
+
+    def test_vp_profiles(self):
+        result = pandas_ta.vp(self.close, self.volume_, 12, anchor="Y", value_area=0.7)
+        self.assertIsInstance(result, DataFrame)
+        self.assertEqual(list(result.index.names), ["session", "bin"])
+        for session, profile in result.groupby(level="session"):
+            year = self.close.index.to_period("Y") == session
+            expected = pandas_ta.vp(self.close[year], self.volume_[year], 12, sort_close=True)
+            self.assertEqual(list(profile["low_close"]), list(expected["low_close"]))
+            self.assertEqual(list(profile["total_volume"]), list(expected["total_volume"]))
+
+            total, area = profile["total_volume"], profile["va_close"]
+            self.assertEqual(profile["poc_close"].sum(), 1)
+            self.assertEqual(total[profile["poc_close"]].iloc[0], total.max())
+            self.assertGreaterEqual(total[area].sum(), 0.7 * total.sum())
+
+        # Many symbols of a long DataFrame at once
+        symbol = Series(["A", "B"], name="symbol").sample(self.close.size, replace=True, random_state=1)
+        symbol.index = self.close.index
+        result = pandas_ta.vp(self.close, self.volume_, 5, by=symbol, anchor=100)
+        self.assertEqual(list(result.index.names), ["symbol", "session", "bin"])
+        for name in ["A", "B"]:
+            rows = (symbol == name).to_numpy()
+            expected = pandas_ta.vp(self.close[rows], self.volume_[rows], 5, anchor=100)
+            pdt.assert_frame_equal(result.xs(name, level="symbol"), expected)
@@ -0,0 +1,104 @@
+from .config import sample_data
+from .context import pandas_ta
+
+from unittest import TestCase
+from unittest.mock import patch
+import pandas.testing as pdt
+from pandas import concat, DataFrame
+
+
+class TestPanel(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.data = sample_data
+        cls.data.columns = cls.data.columns.str.lower()
+        ohlcv = cls.data[["open", "high", "low", "close", "volume"]].astype(float)
+        # Two symbols of the same history and a ragged one
+        cls.frames = {
+            "A": ohlcv.copy(),
+            "B": ohlcv * 1.5,
+            "C": ohlcv.iloc[1000:] * 0.5,
+        }
+        cls.strategy = pandas_ta.Strategy("Panel", [
+            {"kind": "sma", "length": 20},
+            {"kind": "ema", "length": 50},
+            {"kind": "rsi"},
+            {"kind": "sma", "close": "RSI_14", "length": 5, "prefix": "RSI"},
+            {"kind": "macd", "fast": 8, "slow": 21},
+            {"kind": "bbands", "length": 20},
+            {"kind": "variance", "length": 10},
+            {"kind": "stdev"},
+            {"kind": "zscore", "length": 20},
+            {"kind": "atr", "mamode": "ema"},
+            {"kind": "obv"},
+            {"kind": "cci"},
+            {"kind": "bbands", "mamode": "wma"},
+        ])
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.frames
+        del cls.strategy
+        del cls.data
+
+    def setUp(self):
+        # The column-wise kernels are the native implementations
+        self.talib = patch.dict(pandas_ta.Imports, {"talib": False})
+        self.talib.start()
+
+    def tearDown(self):
+        self.talib.stop()
+
+    def expected(self, frame, *args, **kwargs):
+        if len(args) == 0:
+            args = (pandas_ta.Strategy("Panel", [dict(x) for x in self.strategy.ta]),)
+        return frame.copy().ta.strategy(*args, append=False, executor="serial", **kwargs)
+
+    def test_panel_dict(self):
+        result = pandas_ta.panel_strategy(self.frames, self.strategy, append=False)
+        self.assertIsInstance(result, dict)
+        self.assertEqual(list(result.keys()), ["A", "B", "C"])
+
+        for symbol, frame in self.frames.items():
+            expected = self.expected(frame)
+            self.assertEqual(sorted(result[symbol].columns), sorted(expected.columns))
+            pdt.assert_frame_equal(result[symbol][expected.columns], expected, check_dtype=False, check_exact=True)
+
+        frames = {k: v.copy() for k, v in self.frames.items()}
+        result = pandas_ta.panel_strategy(frames, self.strategy)
+        self.assertIs(result, frames)
+        self.assertIn("RSI_SMA_5", frames["C"].columns)
+        self.assertIn("CCI_14_0.015", frames["C"].columns)
+
+    def test_panel_long(self):
+        long = concat(self.frames, names=["symbol", "date"])
+        expected = pandas_ta.panel_strategy(self.frames, self.strategy, append=False)
+
+        result = pandas_ta.panel_strategy(long, self.strategy, by="symbol", append=False)
+        self.assertIsInstance(result, DataFrame)
+        self.assertEqual(result.shape[0], long.shape[0])
+        for symbol in self.frames:
+            pdt.assert_frame_equal(
+                result.xs(symbol, level="symbol")[expected[symbol].columns],
+                expected[symbol], check_dtype=False, check_exact=True
+            )
+
+        long = long.reset_index("symbol")
+        result = pandas_ta.panel_strategy(long, self.strategy, by="symbol")
+        self.assertIs(result, long)
+        pdt.assert_series_equal(
+            long.loc[long["symbol"] == "C", "MACD_8_21_9"],
+            expected["C"]["MACD_8_21_9"], check_names=False, check_exact=True
+        )
+
+        self.assertRaises(ValueError, pandas_ta.panel_strategy, long, self.strategy, by="ticker")
+
+    def test_panel_category(self):
+        categories = {k: list(v) for k, v in pandas_ta.Category.items()}
+        result = pandas_ta.panel_strategy(self.frames, "volatility", append=False, exclude=["hwc"])
+
+        for symbol, frame in self.frames.items():
+            expected = self.expected(frame, "volatility", exclude=["hwc"])
+            self.assertEqual(sorted(result[symbol].columns), sorted(expected.columns))
+            pdt.assert_frame_equal(result[symbol][expected.columns], expected, check_dtype=False, check_exact=True)
+        self.assertEqual(pandas_ta.Category, categories)
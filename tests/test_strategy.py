@@ -7,7 +7,10 @@ from .config import sample_data
 from .context import pandas_ta
 
 from unittest import skip, skipUnless, TestCase
+from warnings import catch_warnings, simplefilter
 from pandas import DataFrame
+from pandas.errors import PerformanceWarning
+import pandas.testing as pdt
 
 # Strategy Testing Parameters
 cores = cpu_count()
@@ -202,6 +205,77 @@ class TestStrategyMethods(TestCase):
     def test_momentum_category(self):
         self.category = "Momentum"
         self.data.ta.strategy(self.category, verbose=verbose, timed=strategy_timed)
+        self.assertIn("TD_SEQ_UP", self.data.columns)
+        # Excluded indicators are not removed from the Category itself
+        self.assertIn("td_seq", pandas_ta.Category["momentum"])
+
+    def test_momentum_persistent_executor(self):
+        self.category = "Momentum with a Persistent Executor"
+
+        with pandas_ta.StrategyExecutor(cores) as executor:
+            self.data.ta.strategy("Momentum", executor=executor, verbose=verbose, timed=strategy_timed)
+            self.assertTrue(executor.running)
+
+            # The workers are reused by the next call
+            pool = executor.pool
+            momentum = self.data[["open", "high", "low", "close", "volume"]].copy()
+            momentum.ta.strategy("Momentum", executor=executor, verbose=verbose, timed=strategy_timed)
+            self.assertIs(executor.pool, pool)
+        self.assertFalse(executor.running)
+
+    def test_momentum_transports(self):
+        self.category = "Momentum with Pickle and Shared Memory Transports"
+
+        momentum = self.data[["open", "high", "low", "close", "volume"]].copy()
+        with pandas_ta.StrategyExecutor(cores, transport="pickle") as executor:
+            momentum.ta.strategy("Momentum", executor=executor, verbose=verbose, timed=strategy_timed)
+
+        with pandas_ta.StrategyExecutor(cores, transport="shm") as executor:
+            self.data.ta.strategy("Momentum", executor=executor, verbose=verbose, timed=strategy_timed)
+
+        pdt.assert_frame_equal(self.data[momentum.columns], momentum)
+
+    def test_momentum_thread_executor(self):
+        self.category = "Momentum with a Thread Executor"
+
+        momentum = self.data[["open", "high", "low", "close", "volume"]].copy()
+        momentum.ta.strategy("Momentum", executor="serial", verbose=verbose, timed=strategy_timed)
+        self.data.ta.strategy("Momentum", executor="thread", verbose=verbose, timed=strategy_timed)
+
+        pdt.assert_frame_equal(self.data[momentum.columns], momentum)
+
+    def test_momentum_no_append(self):
+        self.category = "Momentum without Appending"
+
+        columns = list(self.data.columns)
+        result = self.data.ta.strategy("Momentum", append=False, verbose=verbose, timed=strategy_timed)
+        self.assertEqual(list(self.data.columns), columns)
+        self.assertIsInstance(result, DataFrame)
+        self.assertGreater(result.shape[1], 1)
+        self.assertTrue(result.index.equals(self.data.index))
+
+        self.data.ta.strategy("Momentum", verbose=verbose, timed=strategy_timed)
+        pdt.assert_frame_equal(self.data[result.columns], result)
+
+    def test_momentum_update(self):
+        self.category = "Momentum Update"
+
+        ohlcv = self.data[["open", "high", "low", "close", "volume"]]
+        history, new_rows = ohlcv.iloc[:-5].copy(), ohlcv.iloc[-5:].copy()
+        history.ta.strategy("Momentum", executor="serial", verbose=verbose, timed=strategy_timed)
+        updated = history.ta.update(new_rows.iloc[:3], "Momentum")
+        state = updated._ta_stream[1]
+        updated = updated.ta.update(new_rows.iloc[3:], "Momentum")
+        self.assertIs(updated._ta_stream[1], state)
+        self.assertEqual(updated.shape[0], ohlcv.shape[0])
+
+        self.data.ta.strategy("Momentum", executor="serial", verbose=verbose, timed=strategy_timed)
+        expected = self.data[updated.columns].iloc[-5:]
+        # The indicators with a Stream are exact, the others are recalculated
+        # on a tail of the history
+        streamed = ["MACD_12_26_9", "MACDh_12_26_9", "MACDs_12_26_9", "RSI_14", "RSX_14", "STOCHk_14_3_3", "STOCHd_14_3_3", "WILLR_14"]
+        pdt.assert_frame_equal(updated[streamed].iloc[-5:], expected[streamed], check_exact=True)
+        pdt.assert_frame_equal(updated.iloc[-5:], expected, check_exact=False, rtol=1e-8)
 
     # @skip
     def test_overlap_category(self):
@@ -242,6 +316,29 @@ class TestStrategyMethods(TestCase):
         self.data.ta.strategy(verbose=verbose, timed=strategy_timed)
         self.data.ta.cores = cores
 
+    def test_all_no_performance_warning(self):
+        self.category = "All without PerformanceWarning"
+
+        cores = self.data.ta.cores
+        self.data.ta.cores = 0
+        columns = list(self.data.columns)
+        with catch_warnings():
+            simplefilter("error", PerformanceWarning)
+            self.data.ta.strategy(verbose=verbose, timed=strategy_timed)
+            # Overwriting the columns keeps their order
+            self.data.ta.strategy(verbose=verbose, timed=strategy_timed)
+        self.assertEqual(list(self.data.columns[:len(columns)]), columns)
+        self.data.ta.cores = cores
+
+    # @skipUnless(verbose, "verbose mode only")
+    def test_all_no_shared_plan(self):
+        self.category = "All with No Shared Plan"
+
+        cores = self.data.ta.cores
+        self.data.ta.cores = 0
+        self.data.ta.strategy(shared=False, verbose=verbose, timed=strategy_timed)
+        self.data.ta.cores = cores
+
     # @skipUnless(verbose, "verbose mode only")
     def test_custom_no_multiprocessing(self):
         self.category = "Custom A with No Multiprocessing"
@@ -0,0 +1,191 @@
+from .config import sample_data
+from .context import pandas_ta
+
+from time import perf_counter
+from unittest import TestCase
+import numpy.testing as npt
+import pandas.testing as pdt
+from pandas import concat, date_range
+
+from pandas_ta import stream
+
+
+class TestStream(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.data = sample_data
+        cls.data.columns = cls.data.columns.str.lower()
+        cls.high = cls.data["high"]
+        cls.low = cls.data["low"]
+        cls.close = cls.data["close"]
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.high
+        del cls.low
+        del cls.close
+        del cls.data
+
+    def setUp(self): pass
+    def tearDown(self): pass
+
+
+    def test_update(self):
+        ema = stream.EMA(length=10)
+        result = [ema.update(x) for x in self.close.tolist()]
+        npt.assert_array_equal(result, pandas_ta.ema(self.close, length=10))
+        self.assertEqual(ema.count, self.close.size)
+        self.assertEqual(ema.value, result[-1])
+
+        ema.reset()
+        self.assertEqual(ema.count, 0)
+        npt.assert_array_equal(ema.batch_update(self.close), result)
+
+    def test_adx(self):
+        for mamode in ["rma", "ema", "sma"]:
+            expected = pandas_ta.adx(self.high, self.low, self.close, mamode=mamode)
+            npt.assert_array_equal(stream.ADX(mamode=mamode).batch_update(self.high, self.low, self.close), expected)
+
+    def test_atr(self):
+        npt.assert_array_equal(stream.ATR().batch_update(self.high, self.low, self.close), pandas_ta.atr(self.high, self.low, self.close))
+        for mamode in ["rma", "ema", "sma"]:
+            expected = pandas_ta.atr(self.high, self.low, self.close, mamode=mamode, talib=False, percent=True)
+            result = stream.ATR(mamode=mamode, talib=False, percent=True).batch_update(self.high, self.low, self.close)
+            npt.assert_array_equal(result, expected)
+
+    def test_bbands(self):
+        npt.assert_array_equal(stream.BBANDS().batch_update(self.close), pandas_ta.bbands(self.close))
+        npt.assert_array_equal(stream.BBANDS(20, talib=False).batch_update(self.close), pandas_ta.bbands(self.close, 20, talib=False))
+        self.assertRaises(ValueError, stream.BBANDS, mamode="ema")
+
+    def test_ema(self):
+        npt.assert_array_equal(stream.EMA().batch_update(self.close), pandas_ta.ema(self.close))
+        npt.assert_array_equal(stream.EMA(talib=False).batch_update(self.close), pandas_ta.ema(self.close, talib=False))
+        npt.assert_array_equal(stream.EMA(talib=False, sma=False).batch_update(self.close), pandas_ta.ema(self.close, talib=False, sma=False))
+
+    def test_hwma(self):
+        npt.assert_array_equal(stream.HWMA().batch_update(self.close), pandas_ta.hwma(self.close))
+
+    def test_jma(self):
+        npt.assert_array_equal(stream.JMA().batch_update(self.close), pandas_ta.jma(self.close))
+        npt.assert_array_equal(stream.JMA(20, 40).batch_update(self.close), pandas_ta.jma(self.close, 20, 40))
+
+    def test_kama(self):
+        npt.assert_array_equal(stream.KAMA().batch_update(self.close), pandas_ta.kama(self.close))
+
+    def test_macd(self):
+        npt.assert_array_equal(stream.MACD().batch_update(self.close), pandas_ta.macd(self.close))
+        npt.assert_array_equal(stream.MACD(talib=False).batch_update(self.close), pandas_ta.macd(self.close, talib=False))
+
+    def test_mcgd(self):
+        npt.assert_array_equal(stream.MCGD().batch_update(self.close), pandas_ta.mcgd(self.close))
+
+    def test_psar(self):
+        npt.assert_array_equal(stream.PSAR().batch_update(self.high, self.low), pandas_ta.psar(self.high, self.low))
+        npt.assert_array_equal(stream.PSAR().batch_update(self.high[:1], self.low[:1]), pandas_ta.psar(self.high[:1], self.low[:1]))
+        expected = pandas_ta.psar(self.high, self.low, af0=0.01, af=0.03, max_af=0.3)
+        npt.assert_array_equal(stream.PSAR(0.01, 0.03, 0.3).batch_update(self.high, self.low), expected)
+
+    def test_rma(self):
+        npt.assert_array_equal(stream.RMA().batch_update(self.close), pandas_ta.rma(self.close))
+
+    def test_rsi(self):
+        npt.assert_array_equal(stream.RSI().batch_update(self.close), pandas_ta.rsi(self.close))
+        npt.assert_array_equal(stream.RSI(talib=False, drift=2).batch_update(self.close), pandas_ta.rsi(self.close, talib=False, drift=2))
+
+    def test_rsx(self):
+        npt.assert_array_equal(stream.RSX().batch_update(self.close), pandas_ta.rsx(self.close))
+
+    def test_sma(self):
+        npt.assert_array_equal(stream.SMA().batch_update(self.close), pandas_ta.sma(self.close))
+        npt.assert_array_equal(stream.SMA(talib=False).batch_update(self.close), pandas_ta.sma(self.close, talib=False))
+        expected = pandas_ta.sma(self.close, talib=False, min_periods=3)
+        npt.assert_array_equal(stream.SMA(talib=False, min_periods=3).batch_update(self.close), expected)
+
+    def test_ssf(self):
+        npt.assert_array_equal(stream.SSF().batch_update(self.close), pandas_ta.ssf(self.close))
+        npt.assert_array_equal(stream.SSF(poles=3).batch_update(self.close), pandas_ta.ssf(self.close, poles=3))
+
+    def test_stdev(self):
+        npt.assert_array_equal(stream.STDEV().batch_update(self.close), pandas_ta.stdev(self.close))
+        npt.assert_array_equal(stream.STDEV(talib=False).batch_update(self.close), pandas_ta.stdev(self.close, talib=False))
+
+    def test_stoch(self):
+        for mamode in ["sma", "ema", "rma"]:
+            # stoch starts at the first valid %K
+            expected = pandas_ta.stoch(self.high, self.low, self.close, mamode=mamode).reindex(self.close.index)
+            npt.assert_array_equal(stream.STOCH(mamode=mamode).batch_update(self.high, self.low, self.close), expected)
+
+    def test_supertrend(self):
+        expected = pandas_ta.supertrend(self.high, self.low, self.close)
+        npt.assert_array_equal(stream.SUPERTREND().batch_update(self.high, self.low, self.close), expected)
+
+    def test_t3(self):
+        npt.assert_array_equal(stream.T3().batch_update(self.close), pandas_ta.t3(self.close))
+        npt.assert_array_equal(stream.T3(talib=False).batch_update(self.close), pandas_ta.t3(self.close, talib=False))
+
+    def test_td_seq(self):
+        for show_all in [True, False]:
+            expected = pandas_ta.td_seq(self.close, show_all=show_all)
+            npt.assert_array_equal(stream.TD_SEQ(show_all).batch_update(self.close), expected)
+
+    def test_vidya(self):
+        npt.assert_array_equal(stream.VIDYA().batch_update(self.close), pandas_ta.vidya(self.close))
+
+    def test_willr(self):
+        npt.assert_array_equal(stream.WILLR().batch_update(self.high, self.low, self.close), pandas_ta.willr(self.high, self.low, self.close))
+        expected = pandas_ta.willr(self.high, self.low, self.close, talib=False)
+        npt.assert_array_equal(stream.WILLR(talib=False).batch_update(self.high, self.low, self.close), expected)
+
+    def test_strategy_stream(self):
+        custom = pandas_ta.Strategy("Stream", [
+            {"kind": "ema", "length": 8},
+            {"kind": "sma", "length": 10},
+            {"kind": "ema", "close": "SMA_10", "length": 5, "prefix": "SMA"},
+            {"kind": "jma"},
+            {"kind": "rsx", "col_names": ("RSX",)},
+            {"kind": "td_seq"},
+            {"kind": "macd", "col_names": ("MACD", "MACD_H", "MACD_S")},
+            {"kind": "tos_stdevall"},
+        ])
+        ohlcv = self.data[["open", "high", "low", "close", "volume"]]
+        state = stream.StrategyStream(ohlcv.iloc[:-6], custom)
+        self.assertEqual(state.streams, ["ema", "sma", "ema", "jma", "rsx", "td_seq", "macd"])
+        self.assertEqual(state.tails, {"TOS_STDEVALL_LR": None})
+
+        # Each update has the values of the strategy on the history so far
+        for end in [-5, -2, None]:
+            rows = ohlcv.iloc[:end]
+            result = state.update(rows.iloc[state.rows:])
+            expected = rows.ta.strategy(custom, append=False).iloc[-result.shape[0]:]
+            self.assertEqual(list(result.columns), list(rows.columns) + list(expected.columns))
+            pdt.assert_frame_equal(result[expected.columns], expected, check_exact=True)
+        self.assertEqual(state.rows, ohlcv.shape[0])
+
+    def test_strategy_stream_tail(self):
+        custom = pandas_ta.Strategy("Tail", [{"kind": "mom"}, {"kind": "obv"}, {"kind": "atr"}])
+        ohlcv = self.data[["open", "high", "low", "close", "volume"]]
+        state = stream.StrategyStream(ohlcv.iloc[:-5], custom)
+        self.assertEqual(state.streams, ["atr"])
+        # mom forgets all but its last bars, obv none
+        self.assertEqual(state.tails, {"MOM_10": 64, "OBV": None})
+
+        result = state.update(ohlcv.iloc[-5:])
+        expected = ohlcv.ta.strategy(custom, append=False).iloc[-5:]
+        pdt.assert_frame_equal(result[expected.columns], expected, check_exact=True)
+
+    def test_strategy_stream_speed(self):
+        # A history of four samples, an update only sees a tail of it
+        ohlcv = concat([self.data[["open", "high", "low", "close", "volume"]]] * 4)
+        ohlcv.index = date_range(self.data.index[0], periods=ohlcv.shape[0], freq="B")
+        state = stream.StrategyStream(ohlcv.iloc[:-3], "Momentum")
+
+        seconds = []
+        for i in range(-3, 0):
+            start = perf_counter()
+            state.update(ohlcv.iloc[i:i + 1 or None])
+            seconds.append(perf_counter() - start)
+
+        start = perf_counter()
+        ohlcv.ta.strategy("Momentum", append=False)
+        self.assertLess(min(seconds), (perf_counter() - start) / 4)
@@ -1,13 +1,22 @@
 from .config import sample_data
 from .context import pandas_ta
 
+from contextlib import ExitStack
+from importlib import import_module
+from itertools import product
+from tempfile import TemporaryDirectory
+from time import perf_counter
 from unittest import skip, TestCase
 from unittest.mock import patch
 
 import numpy as np
 import numpy.testing as npt
-from pandas import DataFrame, Series
+import pandas.testing as pdt
+from pandas import DataFrame, date_range, Series
 from pandas.api.types import is_datetime64_ns_dtype, is_datetime64tz_dtype
+from pandas.core.groupby import GroupBy, SeriesGroupBy
+from pandas.core.window.expanding import Expanding
+from pandas.core.window.rolling import Rolling
 
 
 data = {
@@ -96,6 +105,31 @@ class TestUtilities(TestCase):
         result = self.utils.above_value(self.crosseddf["a"], self.crosseddf["zero"])
         self.assertIsNone(result)
 
+    def test_backend(self):
+        backend = pandas_ta.backend
+        close = self.data["close"]
+        previous = backend.get_backend()
+        self.assertIn(previous, backend.BACKENDS)
+        self.assertRaises(ValueError, backend.set_backend, "gpu")
+
+        try:
+            backend.set_backend("numpy")
+            result = pandas_ta.sma(close.to_numpy(), length=10)
+            self.assertIsInstance(result, np.ndarray)
+            npt.assert_array_equal(result, pandas_ta.sma(close, length=10))
+
+            macd_ = pandas_ta.macd(close.to_numpy())
+            self.assertIsInstance(macd_, np.ndarray)
+            self.assertEqual(macd_.shape, (close.size, 3))
+
+            backend.set_backend("pandas")
+            result = pandas_ta.sma(close.to_numpy(), length=10)
+            self.assertIsInstance(result, Series)
+            self.assertIsInstance(result, backend.Series)
+            self.assertIsInstance(backend.DataFrame({"a": [1]}), DataFrame)
+        finally:
+            backend.set_backend(previous)
+
     def test_below(self):
         result = self.utils.below(self.crosseddf["zero"], self.crosseddf["a"])
         self.assertIsInstance(result, Series)
@@ -263,6 +297,246 @@ class TestUtilities(TestCase):
         npt.assert_array_equal(self.utils.pascals_triangle(n=5, weighted=True), array_5w)
         npt.assert_array_equal(self.utils.pascals_triangle(n=5, weighted=True, inverse=True), array_5iw)
 
+    def test_result_cache(self):
+        close = self.data["close"]
+        expected = pandas_ta.rsi(close, 14)
+
+        with self.utils.ResultCache() as cache:
+            self.assertIs(self.utils.active_cache(), cache)
+            result = pandas_ta.rsi(close, 14)
+            # Positional and keyword arguments are the same entry
+            cached = pandas_ta.rsi(close, length=14)
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+            pdt.assert_series_equal(cached, expected)
+            self.assertIsNot(cached, result)
+
+            # Different content is a different entry
+            pandas_ta.rsi(close * 2, 14)
+            self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+            # The accessor shares the entries of the functions
+            self.data.ta.rsi(length=14, close=close)
+            self.assertEqual(cache.hits, 2)
+        self.assertIsNone(self.utils.active_cache())
+
+        # Least recently used results are evicted beyond max_bytes
+        with self.utils.ResultCache(max_bytes=3 * close.memory_usage(index=False)) as cache:
+            for length in range(10, 15):
+                pandas_ta.sma(close, length)
+            self.assertEqual((len(cache), cache.evictions), (3, 2))
+
+        with TemporaryDirectory() as path:
+            with self.utils.ResultCache(path=path):
+                expected = pandas_ta.macd(close)
+            with self.utils.ResultCache(path=path) as cache:
+                result = pandas_ta.macd(close)
+                self.assertEqual((cache.hits, cache.misses), (1, 0))
+            pdt.assert_frame_equal(result, expected)
+            self.assertEqual(result.name, expected.name)
+
+            # Not reused by another version or without TA Lib or numba
+            with patch.object(self.utils._cache, "version", "0.0.0"), self.utils.ResultCache(path=path) as cache:
+                pandas_ta.macd(close)
+                self.assertEqual((cache.hits, cache.misses), (0, 1))
+            for name in ["talib", "numba"]:
+                with patch.dict(pandas_ta.Imports, {name: not pandas_ta.Imports[name]}), self.utils.ResultCache(path=path) as cache:
+                    pandas_ta.macd(close)
+                    self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+    def test_rolling_extremes(self):
+        high, low = self.data["high"].copy(), self.data["low"].copy()
+        high.iloc[50], low.iloc[60] = np.nan, np.nan
+        high.iloc[100:110] = high.iloc[100]
+
+        for length, min_periods in [(1, None), (14, None), (20, 5)]:
+            expected = [
+                high.rolling(length, min_periods=min_periods).max(),
+                low.rolling(length, min_periods=min_periods).min(),
+                high.rolling(length, min_periods=min_periods).apply(self.utils.recent_maximum_index, raw=True),
+                low.rolling(length, min_periods=min_periods).apply(self.utils.recent_minimum_index, raw=True),
+            ]
+            result = self.utils.rolling_extremes(high, low, length, min_periods, positions=True)
+            self.assertEqual(len(result), 4)
+            # argmax takes NaNs for the maximum, so partial windows differ
+            n = 4 if min_periods is None else 2
+            for result_, expected_ in zip(result[:n], expected[:n]):
+                pdt.assert_series_equal(result_, expected_, check_names=False)
+
+            with patch.dict(pandas_ta.Imports, {"numba": False}):
+                result = self.utils.rolling_extremes(high, low, length, min_periods)
+            self.assertEqual(len(result), 2)
+            pdt.assert_series_equal(result[0], expected[0], check_names=False)
+            pdt.assert_series_equal(result[1], expected[1], check_names=False)
+
+    def test_rolling_order_stats(self):
+        close = self.data["close"].copy()
+        close.iloc[50] = np.nan
+        close.iloc[100:110] = close.iloc[100]
+        q = [0.05, 0.25, 0.5, 0.75, 0.95]
+
+        def mad(x):
+            return np.fabs(x - x.mean()).mean()
+
+        for length, min_periods in [(1, None), (30, None), (20, 5)]:
+            rolling = close.rolling(length, min_periods=min_periods)
+            expected = [rolling.quantile(x) for x in q] + [rolling.median(), rolling.apply(mad, raw=True)]
+            for numba in [True, False]:
+                with patch.dict(pandas_ta.Imports, {"numba": numba and pandas_ta.Imports["numba"]}):
+                    result = self.utils.rolling_order_stats(close, length, q, min_periods, median=True, mad=True)
+                self.assertEqual(len(result), 7)
+                for result_, expected_ in zip(result[:6], expected[:6]):
+                    pdt.assert_series_equal(result_, expected_, check_names=False, check_exact=True)
+                pdt.assert_series_equal(result[6], expected[6], check_names=False)
+
+    def test_rolling_moments(self):
+        close = self.data["close"].copy()
+        close.iloc[50] = np.nan
+        close.iloc[100:110] = close.iloc[100]
+
+        for length, min_periods, ddof in [(1, None, 1), (30, None, 1), (20, 5, 0)]:
+            rolling = close.rolling(length, min_periods=min_periods)
+            expected = [rolling.mean(), rolling.var(ddof), rolling.skew(), rolling.kurt()]
+            for numba in [True, False]:
+                with patch.dict(pandas_ta.Imports, {"numba": numba and pandas_ta.Imports["numba"]}):
+                    result = self.utils.rolling_moments(close, length, min_periods, ddof)
+                self.assertEqual(len(result), 4)
+                for result_, expected_ in zip(result, expected):
+                    pdt.assert_series_equal(result_, expected_, check_names=False, rtol=1e-6, atol=1e-6)
+
+        # A small oscillation after a large price level is not cancelled away
+        x = Series(np.r_[np.full(50, 1e9), 1e9 + np.tile([0.0, 1.0], 50)])
+        mean, variance = self.utils.rolling_moments(x, 10)[:2]
+        expected = (x.iloc[-10:] - 1e9).var()
+        self.assertAlmostEqual(variance.iloc[-1], expected, places=9)
+        self.assertTrue((variance.dropna() >= 0).all())
+
+    def test_select_executor(self):
+        self.assertEqual(pandas_ta.select_executor(500, 10, cores=8), "serial")
+        self.assertEqual(pandas_ta.select_executor(5000, 200, cores=8), "thread")
+        self.assertEqual(pandas_ta.select_executor(10 ** 6, 200, cores=8), "process")
+        self.assertEqual(pandas_ta.select_executor(10 ** 6, 200, cores=1), "serial")
+
+    def test_shared_plan(self):
+        high, low, close = self.data["high"], self.data["low"], self.data["close"]
+        expected = pandas_ta.natr(high, low, close, talib=False)
+
+        with self.utils.SharedPlan() as plan:
+            pandas_ta.atr(high, low, close, mamode="ema")
+            result = pandas_ta.natr(high, low, close, talib=False)
+            self.assertIs(self.utils.active_plan(), plan)
+            self.assertGreaterEqual(plan.hits, 1)
+
+            # Callers may modify a shared result without affecting the node
+            atr_ = pandas_ta.atr(high, low, close)
+            atr_ *= 0
+            self.assertFalse(pandas_ta.atr(high, low, close).eq(0).all())
+
+        self.assertIsNone(self.utils.active_plan())
+        self.assertIsInstance(result, Series)
+        self.assertEqual(result.name, expected.name)
+        npt.assert_array_equal(result, expected)
+
+    def test_session_cumsum(self):
+        index = date_range("2021-01-01 22:00", periods=200, freq="37min", tz="US/Eastern")
+        x = Series(np.random.default_rng(7).random(200), index=index)
+        x[[0, 5, 90]] = np.nan
+
+        for anchor in ["D", "W", "H"]:
+            ids = self.utils.session_ids(index, anchor)
+            self.assertEqual(ids[0], 0)
+            self.assertTrue((np.diff(ids) >= 0).all())
+            expected = x.groupby(index.tz_localize(None).to_period(anchor)).cumsum()
+            npt.assert_allclose(self.utils.session_cumsum(x.to_numpy(), ids), expected, rtol=1e-12)
+            with patch.dict(pandas_ta.Imports, {"numba": False}):
+                npt.assert_allclose(self.utils.session_cumsum(x.to_numpy(), ids), expected, rtol=1e-12)
+
+        columns = np.column_stack([x, 2 * x])
+        result = self.utils.session_cumsum(columns, self.utils.session_ids(index))
+        npt.assert_allclose(result[:, 1], 2 * result[:, 0])
+
+    def test_sweep(self):
+        high, low, close = self.data["high"], self.data["low"], self.data["close"]
+
+        result = pandas_ta.sweep("rsi", close, length=range(2, 21), talib=False)
+        self.assertIsInstance(result, DataFrame)
+        self.assertEqual(result.name, "RSIsweep_19")
+        self.assertEqual(result.shape, (close.size, 19))
+        for length in (2, 14, 20):
+            npt.assert_array_equal(result[f"RSI_{length}"], pandas_ta.rsi(close, length, talib=False))
+
+        # Without a batch path, the primitives are shared: hlc3 of cci
+        with self.utils.SharedPlan() as plan:
+            result = pandas_ta.sweep("cci", high, low, close, length=range(2, 21), talib=False)
+            self.assertGreaterEqual(plan.hits, 18)
+        pdt.assert_series_equal(result["CCI_20_0.015"], pandas_ta.cci(high, low, close, 20, talib=False), check_names=False)
+
+        result = pandas_ta.sweep("bbands", close, length=[10, 20], std=[1.5, 2.0], talib=False)
+        self.assertEqual(result.shape[1], 20)
+        expected = pandas_ta.bbands(close, length=20, std=1.5, talib=False)
+        pdt.assert_frame_equal(result[expected.columns], expected)
+
+        result = pandas_ta.sweep("stoch", high, low, close, d=range(2, 5), smooth_k=[3, 5])
+        self.assertEqual(result.name, "STOCHsweep_6")
+        expected = pandas_ta.stoch(high, low, close, d=4, smooth_k=5)
+        pdt.assert_frame_equal(result[expected.columns].loc[expected.index], expected)
+
+        # Columns the indicator names alike are suffixed with the swept values
+        result = pandas_ta.sweep("rsi", close, scalar=[1, 100], talib=False)
+        self.assertEqual(list(result.columns), ["RSI_14", "RSI_14_100"])
+        self.assertRaises(ValueError, pandas_ta.sweep, "rsx2", close, length=[2, 3])
+
+    def test_sweep_batch(self):
+        high, low, close = self.data["high"], self.data["low"], self.data["close"]
+        # NaNs, a constant run and negative values
+        x = close - close.mean()
+        x.iloc[100:110], x.iloc[500:520] = np.nan, 3.0
+        sweep = import_module("pandas_ta.sweep")
+
+        for kind, args, kwargs, single in [
+            ("sma", (x,), {"length": [1, 2, 10, 50], "talib": False}, pandas_ta.sma),
+            ("rsi", (x,), {"length": range(1, 30), "talib": False}, pandas_ta.rsi),
+            ("rsi", (x,), {"length": [2, 14], "drift": [1, 2], "talib": False}, None),
+            ("atr", (high, low, close), {"length": range(1, 30), "talib": False}, pandas_ta.atr),
+            ("bbands", (x,), {"length": [2, 5, 20], "std": [1, 2.5], "talib": False}, pandas_ta.bbands),
+            ("stoch", (high, low, close), {"k": [5, 14], "d": range(2, 5), "smooth_k": [1, 3]}, pandas_ta.stoch),
+        ]:
+            result = pandas_ta.sweep(kind, *args, **kwargs)
+            with patch.dict(sweep._BATCH, clear=True):
+                expected = pandas_ta.sweep(kind, *args, **kwargs)
+            pdt.assert_frame_equal(result, expected, check_exact=True)
+            self.assertEqual((result.name, result.category), (expected.name, expected.category))
+
+            # The swept drifts name their columns alike
+            if single is None: continue
+            swept = [k for k, v in kwargs.items() if not isinstance(v, bool)]
+            for values in product(*[kwargs[k] for k in swept]):
+                expected = single(*args, **{**kwargs, **dict(zip(swept, values))})
+                expected = expected.to_frame() if isinstance(expected, Series) else expected
+                columns = [x for x in expected.columns if x in result.columns]
+                pdt.assert_frame_equal(result.loc[expected.index, columns], expected[columns], check_exact=True, check_freq=False)
+
+    def test_sweep_speed(self):
+        high, low, close = self.data["high"], self.data["low"], self.data["close"]
+        lengths = range(2, 101)
+
+        def best(fn):
+            seconds = []
+            for _ in range(3):
+                begin = perf_counter()
+                fn()
+                seconds.append(perf_counter() - begin)
+            return min(seconds)
+
+        for kind, args, kwargs, single in [
+            ("sma", (close,), {"talib": False}, pandas_ta.sma),
+            ("rsi", (close,), {"talib": False}, pandas_ta.rsi),
+            ("atr", (high, low, close), {"talib": False}, pandas_ta.atr),
+        ]:
+            pandas_ta.sweep(kind, *args, length=lengths, **kwargs)
+            sweep = best(lambda: pandas_ta.sweep(kind, *args, length=lengths, **kwargs))
+            loop = best(lambda: DataFrame({n: single(*args, length=n, **kwargs) for n in lengths}))
+            self.assertLess(sweep, loop, kind)
+
     def test_symmetric_triangle(self):
         npt.assert_array_equal(self.utils.symmetric_triangle(), np.array([1,1]))
         npt.assert_array_equal(self.utils.symmetric_triangle(weighted=True), np.array([0.5, 0.5]))
@@ -289,6 +563,25 @@ class TestUtilities(TestCase):
         self.assertEqual(self.utils.tal_ma("mama"), 7)
         self.assertEqual(self.utils.tal_ma("t3"), 8)
 
+    def test_weighted_window(self):
+        x = self.data["close"].to_numpy(dtype=float).copy()
+        x[100] = np.nan
+        ws = [np.arange(1, 11), self.utils.fibonacci(n=20, weighted=True), np.random.rand(500)]
+        expected = [
+            Series(x).rolling(w.size).apply(self.utils.weights(w), raw=True).to_numpy()
+            for w in ws
+        ]
+
+        npt.assert_allclose(self.utils.weighted_window(x, ws[0]), expected[0], rtol=1e-12)
+        for fft in [None, False, True]:
+            results = self.utils.weighted_windows(x, ws, fft=fft)
+            self.assertEqual(len(results), len(ws))
+            for result, expected_ in zip(results, expected):
+                npt.assert_allclose(result, expected_, rtol=1e-10)
+
+        result = self.utils.weighted_window(x[:5], ws[0])
+        self.assertTrue(np.isnan(result).all())
+
     def test_zero(self):
         self.assertEqual(self.utils.zero(-0.0000000000000001), 0)
         self.assertEqual(self.utils.zero(0), 0)
@@ -299,6 +592,34 @@ class TestUtilities(TestCase):
         self.assertNotEqual(self.utils.zero(0.000000000000001), 0)
         self.assertNotEqual(self.utils.zero(1), 0)
 
+    def test_zero_clip(self):
+        x = Series([-1e-16, 0.0, -0.0, 1e-16, -1e-15, 1e-15, 1.0, np.nan])
+        result = self.utils.zero_clip(x)
+        pdt.assert_series_equal(result, x.apply(self.utils.zero))
+
+    def test_no_elementwise_apply(self):
+        # Indicators are vectorized, so none of them calls back into Python
+        # for each element
+        def elementwise(*args, **kwargs):
+            raise AssertionError("element-wise apply")
+
+        skipped = ["above", "above_value", "below", "below_value", "cross", "cross_value"]
+        indicators = [x for x in self.data.ta.indicators(as_list=True) if x not in skipped]
+        calls = [(x, {}) for x in indicators]
+        calls += [("slope", {"as_angle": True, "to_degrees": True}), ("ui", {"everget": True})]
+
+        targets = [
+            (Series, "apply"), (Series, "map"), (DataFrame, "apply"),
+            (Rolling, "apply"), (Expanding, "apply"),
+            (GroupBy, "apply"), (SeriesGroupBy, "apply"),
+        ]
+        with ExitStack() as stack:
+            for target, method in targets:
+                stack.enter_context(patch.object(target, method, elementwise))
+            for name, kwargs in calls:
+                with self.subTest(name):
+                    getattr(self.data.ta, name)(talib=False, **kwargs)
+
     def test_get_drift(self):
         for s in [0, None, "", [], {}]:
             self.assertIsInstance(self.utils.get_drift(s), int)